@@ -23,7 +23,9 @@ Indicators live in the shared `Indicators/` package one level up, at
 config-driven: this bot asks for a value by passing a symbol + timeframe + params, e.g.
 `supertrend_value(symbol="SOXL", bar_size="15 mins", atr_period=10, multiplier=3.0, ...)`
 and `dema_value(symbol=..., bar_size=..., period=200, ...)`. Here we pass the already-fetched
-`bars=` so the Supertrend and DEMA indicators share a single IBKR historical pull per symbol.
+`bars=` so the Supertrend and DEMA indicators share a single IBKR historical pull per symbol;
+the pull is converted once into a columnar `BarSeries`, so every indicator reads the same
+price columns instead of re-extracting them from the bar objects.
 
 Core entry gate (config `dema_filter`, enabled by default): BUY only when the Supertrend is
 bullish AND price is above the DEMA (default 200) — longs only when close > DEMA, shorts only
@@ -112,6 +114,9 @@ for _p in (_SHARED_ROOT, _BOT_DIR):
     if _p not in sys.path:
         sys.path.insert(0, _p)
 
+from Indicators.bar_series import BarSeries               # noqa: E402
+from Indicators.cache import indicator_cache              # noqa: E402
+from Indicators.data_hub import MarketDataHub, PacingScheduler, hist_request  # noqa: E402
 from Indicators.trend.supertrend import supertrend_value  # noqa: E402
 from Indicators.dema import dema_value                     # noqa: E402
 from Indicators.trend.adx import adx_value                 # noqa: E402
@@ -145,28 +150,13 @@ def round_to_tick(price: float, tick: float = 0.01) -> float:
     return round(round(price / tick) * tick, 6)
 
 
-# ───────────────────────── rate limiter ─────────────────────────
-class RateLimiter:
-    def __init__(self, min_interval=2.0):
-        self.min_interval = float(min_interval)
-        self._last = 0.0
-
-    def acquire(self, ib: IB):
-        import time as _t
-        wait = self.min_interval - (_t.monotonic() - self._last)
-        if wait > 0:
-            try:
-                ib.sleep(wait)
-            except Exception:
-                _t.sleep(wait)
-        self._last = _t.monotonic()
-
-
 # ───────────────────────── the bot ─────────────────────────
 class SupertrendBot:
-    def __init__(self, cfg: dict, base_dir: str):
+    def __init__(self, cfg: dict, base_dir: str, hub: MarketDataHub | None = None):
         self.cfg = cfg
         self.base = base_dir
+        # process-wide MarketDataHub shared by the strategy threads of main() (None = own pulls)
+        self.hub = hub
         self.host = cfg.get("host", "127.0.0.1")
         self.port = int(cfg.get("port", 4002))
         self.client_id = int(cfg.get("client_id", 40))
@@ -359,7 +349,10 @@ class SupertrendBot:
         # marketable when hit (required outside RTH where stop-market orders reject).
         self.stop_limit_offset_pct = float(cfg.get("stop_limit_offset_pct", 0.003))
 
-        self.rate = RateLimiter(float(cfg.get("hist_min_interval_sec", 2.0)))
+        # with a hub every thread draws on ONE pacing budget (the hub's) instead of its own;
+        # either way requests are paced by IB's historical-data rules (PacingScheduler)
+        self.rate = (hub.pacer if hub is not None
+                     else PacingScheduler(float(cfg.get("hist_min_interval_sec", 0.25))))
         self.ib: IB | None = None
         self._conn_ok = True          # False between IB error 1100 (lost) and 1102 (restored)
         self._farm_wake_needed = False  # set on 1102 -> re-wake the data farm on next manage tick
@@ -371,6 +364,25 @@ class SupertrendBot:
         # steals the data line WITHOUT dropping the socket or sending 1100 (Error 162 timeouts),
         # which is exactly the "bot doesn't resume after phone interruption" symptom.
         self.data_fail_reconnect_cycles = int(cfg.get("data_fail_reconnect_cycles", 4))
+        # Rolling history per contract: pulled in full (hist_duration) once, then topped up each
+        # bar with a short request that overlaps the last buffered bar. A top-up that does not
+        # overlap (a gap: session start, weekend, stalled data), a new ET day and any reconnect
+        # re-pull in full. hist_topup=false pulls the full history every bar as before.
+        self.hist_topup = bool(cfg.get("hist_topup", True))
+        self._bar_buf: dict[tuple, tuple] = {}   # (symbol, exchange) -> (ET day seeded, bars)
+        # Concurrent evaluation (off by default): at each bar close fetch EVERY symbol's history
+        # at once on this bot's asyncio loop (at most eval_concurrency pulls in flight, each still
+        # paced), then decide symbol by symbol on the fetched bars. A symbol whose history is not
+        # in by eval_deadline_sec after the bar close is evaluated in turn, once its fetch lands.
+        self.concurrent_eval = bool(cfg.get("concurrent_eval", False))
+        self.eval_concurrency = max(1, int(cfg.get("eval_concurrency", 4)))
+        self.eval_deadline_sec = float(cfg.get("eval_deadline_sec", 20.0))
+        # Stop fills between bars are booked the moment IB reports them (orderStatusEvent /
+        # execDetailsEvent) instead of on the next heartbeat; _watch_stops stays as a watchdog.
+        # Fills arriving mid-evaluation are left to manage_symbol (it checks the stop in line).
+        self.event_fills = bool(cfg.get("event_fills", True))
+        self._idle = False                       # True only while the run loop naps between ticks
+        self._fill_lat: list[float] = []         # seconds from a stop fill to its booking
         self.contracts: dict[str, object] = {}
         self._on_contracts: dict[str, object] = {}   # OVERNIGHT-venue contracts (24H), cached
         self.positions: dict[str, dict] = {}     # symbol -> live position state
@@ -474,6 +486,12 @@ class SupertrendBot:
             self.ib.disconnectedEvent += self._on_disconnected
         except Exception:
             pass
+        if self.event_fills:
+            try:
+                self.ib.orderStatusEvent += self._on_order_status
+                self.ib.execDetailsEvent += self._on_exec_details
+            except Exception:
+                pass
 
     def _on_error(self, *args):
         code = args[1] if len(args) > 1 else None
@@ -488,6 +506,33 @@ class SupertrendBot:
     def _on_disconnected(self):
         self.log("API socket disconnected — will reconnect on next tick")
 
+    def _on_order_status(self, trade):
+        if trade.orderStatus.status == "Filled":
+            self._on_stop_fill(trade)
+
+    def _on_exec_details(self, trade, fill):
+        # the execution can arrive before the orderStatus that says Filled, and
+        # trade.remaining() only moves with orderStatus: judge it by the executions received
+        filled = sum(float(f.execution.shares) for f in trade.fills)
+        if trade.orderStatus.status == "Filled" or filled >= float(trade.order.totalQuantity):
+            self._on_stop_fill(trade)
+
+    def _on_stop_fill(self, trade):
+        """Book a protective stop that just filled, if the bot is between ticks (during an
+        evaluation manage_symbol sees the fill itself and must not have its position closed
+        under it)."""
+        if not self._idle:
+            return
+        try:
+            for symbol, p in list(self.positions.items()):
+                st = p.get("st")
+                if st is not None and (st is trade or (
+                        st.order.permId and st.order.permId == trade.order.permId)):
+                    self._book_stop_fill(symbol, p, "event")
+                    return
+        except Exception as e:
+            self.log(f"stop-fill event error: {e}")
+
     def _connect_once(self) -> bool:
         """(Re)open a FRESH IB client and connect. A new IB() per attempt is deliberate:
         reconnecting on the object whose socket was just dropped often fails with
@@ -498,6 +543,7 @@ class SupertrendBot:
         except Exception:
             pass
         self.ib = IB()                          # fresh client, bound to this thread's loop
+        self._bar_buf.clear()                   # re-seed every history buffer on the new session
         self._wire_events()
         self.ib.connect(self.host, self.port, clientId=self.client_id, account=self.account or "")
         try:
@@ -545,6 +591,7 @@ class SupertrendBot:
         """After connectivity is restored (1102), the HMDS data farm often needs one throwaway
         request to wake; then re-adopt the live position/stop in case anything changed."""
         self._farm_wake_needed = False
+        self._bar_buf.clear()          # 1101 = restored WITH data loss: re-seed the history
         try:
             if self.contracts:
                 self.hist(next(iter(self.contracts.values())))   # throwaway pull to wake HMDS
@@ -674,7 +721,7 @@ class SupertrendBot:
             return self._ticks[symbol]
         tick = 0.01
         try:
-            self.rate.acquire(self.ib)
+            self.rate.acquire(self.ib, priority=True)    # prices an order: ahead of history pulls
             cds = self.ib.reqContractDetails(contract)
             if cds and getattr(cds[0], "minTick", 0):
                 tick = float(cds[0].minTick)
@@ -683,27 +730,142 @@ class SupertrendBot:
         self._ticks[symbol] = tick
         return tick
 
-    def _hist_one(self, contract):
-        """Single reqHistoricalData pull (bounded timeout so a stall fails fast)."""
-        self.rate.acquire(self.ib)
+    def _hist_one(self, contract, duration=None):
+        """Single reqHistoricalData pull (bounded timeout so a stall fails fast) of `duration`
+        (default hist_duration). With a hub, an identical pull another strategy thread just
+        made (or has in flight) is shared instead of sent again. A held symbol's pull (its
+        exit decision) is paced ahead of the others."""
+        duration = duration or self.hist_duration
+        urgent = getattr(contract, "symbol", "") in self.positions
         try:
-            return self.ib.reqHistoricalData(contract, "", self.hist_duration, self.bar_size,
-                                             "TRADES", self.use_rth, 1,
-                                             timeout=self.hist_timeout_sec) or []
+            if self.hub is not None:
+                return self.hub.historical(self.ib, contract, duration, self.bar_size, "TRADES",
+                                           self.use_rth, timeout=self.hist_timeout_sec,
+                                           priority=urgent)
+            self.rate.acquire(self.ib, hist_request(contract, duration, self.bar_size, "TRADES",
+                                                    self.use_rth), urgent)
+            return self.ib.reqHistoricalData(contract, "", duration, self.bar_size, "TRADES",
+                                             self.use_rth, 1, timeout=self.hist_timeout_sec) or []
         except Exception as e:
             self.log(f"hist error {getattr(contract, 'symbol', '?')}: {e}")
             return []
 
+    async def _hist_one_async(self, contract, duration=None):
+        """_hist_one() as a coroutine (reqHistoricalDataAsync), for the concurrent evaluation."""
+        duration = duration or self.hist_duration
+        urgent = getattr(contract, "symbol", "") in self.positions
+        try:
+            if self.hub is not None:
+                return await self.hub.historical_async(
+                    self.ib, contract, duration, self.bar_size, "TRADES", self.use_rth,
+                    timeout=self.hist_timeout_sec, priority=urgent)
+            await self.rate.acquire_async(
+                hist_request(contract, duration, self.bar_size, "TRADES", self.use_rth), urgent)
+            return await self.ib.reqHistoricalDataAsync(
+                contract, "", duration, self.bar_size, "TRADES", self.use_rth, 1,
+                timeout=self.hist_timeout_sec) or []
+        except Exception as e:
+            self.log(f"hist error {getattr(contract, 'symbol', '?')}: {e}")
+            return []
+
+    def _topup_duration(self) -> str:
+        """Duration of a buffer top-up: ~3 bars, enough to reach back to the last buffered bar
+        (the forming bar of the previous evaluation) when evaluating once per bar."""
+        bs = self._bar_seconds()
+        if bs >= 24 * 3600:
+            return f"{max(3, math.ceil(3 * bs / 86400))} D"
+        return f"{min(86400, max(3 * bs, 600))} S"
+
+    @staticmethod
+    def _topup(buf, new):
+        """`buf` with its bars from new[0]'s time on replaced by `new` (the re-sent forming bar
+        is now complete, later ones are new), trimmed back to len(buf) bars. None if `new` does
+        not overlap the end of `buf` -- a gap the top-up cannot fill."""
+        if not buf or not new:
+            return None
+        t0 = new[0].date
+        if not (buf[0].date <= t0 <= buf[-1].date) or new[-1].date < buf[-1].date:
+            return None
+        i = len(buf)
+        while i and buf[i - 1].date >= t0:
+            i -= 1
+        merged = buf[:i] + list(new)
+        return merged[len(merged) - len(buf):]
+
+    def _buffer_request(self, contract):
+        """(buffer key, top-up duration) for `contract`; the duration is None when its buffer
+        has to be (re-)seeded with a full hist_duration pull."""
+        key = (getattr(contract, "symbol", ""), getattr(contract, "exchange", ""))
+        held = self._bar_buf.get(key)
+        if held is not None and held[0] == now_et().date():
+            return key, self._topup_duration()
+        return key, None
+
+    def _buffer_absorb(self, key, topup, new):
+        """Fold the pulled bars `new` into buffer `key`: merged onto the held bars for a top-up
+        (None if it left a gap), else they (re-)seed the buffer."""
+        today = now_et().date()
+        if topup is not None:
+            bars = self._topup(self._bar_buf[key][1], new)
+            if bars is not None:
+                self._bar_buf[key] = (today, bars)
+            return bars
+        bars = list(new)
+        if bars:
+            self._bar_buf[key] = (today, bars)
+        else:
+            self._bar_buf.pop(key, None)
+        return bars
+
+    def _hist_buffered(self, contract):
+        """`contract`'s history from its rolling buffer: a short top-up merged onto the bars
+        already held, or a full hist_duration pull to seed / re-seed it."""
+        if not self.hist_topup:
+            return self._hist_one(contract)
+        key, topup = self._buffer_request(contract)
+        if topup is not None:
+            bars = self._buffer_absorb(key, topup, self._hist_one(contract, topup))
+            if bars is not None:
+                return bars
+        return self._buffer_absorb(key, None, self._hist_one(contract))
+
+    async def _hist_buffered_async(self, contract):
+        """_hist_buffered() as a coroutine."""
+        if not self.hist_topup:
+            return await self._hist_one_async(contract)
+        key, topup = self._buffer_request(contract)
+        if topup is not None:
+            bars = self._buffer_absorb(key, topup, await self._hist_one_async(contract, topup))
+            if bars is not None:
+                return bars
+        return self._buffer_absorb(key, None, await self._hist_one_async(contract))
+
     def hist(self, contract):
-        bars = self._hist_one(contract)
+        bars = self._hist_buffered(contract)
         # 24H: the SMART feed only covers 04:00-20:00; the IBKR OVERNIGHT venue carries the
         # 20:00-04:00 session. Merge both into one continuous series so the Supertrend/DEMA
         # (and logging) keep running overnight.
         if self.market_hours == "24H":
             onc = self._overnight_contract(contract)
             if onc is not None:
-                bars = self._merge_bars(bars, self._hist_one(onc))
+                bars = self._merge_bars(bars, self._hist_buffered(onc))
+        return self._session_bars(bars)
+
+    async def _hist_async(self, contract):
+        """hist() as a coroutine (the OVERNIGHT contract must already be qualified)."""
+        bars = await self._hist_buffered_async(contract)
+        if self.market_hours == "24H":
+            onc = self._on_contracts.get(getattr(contract, "symbol", ""))
+            if onc is not None:
+                bars = self._merge_bars(bars, await self._hist_buffered_async(onc))
+        return self._session_bars(bars)
+
+    def _session_bars(self, bars):
         bars = self._filter_session(bars)   # RTH/ETH filter; 24H = no filter (keep all)
+        # columnar once: every indicator helper below reads these columns. The session label
+        # keys the shared indicator cache, so another thread's RTH/ETH cut of the same bars
+        # never answers this one's call.
+        bars = BarSeries.from_bars(bars, session=self.market_hours)
         if bars:
             self._cycle_data_ok = True   # signal to the run-loop data watchdog
         return bars
@@ -1017,7 +1179,7 @@ class SupertrendBot:
             (p["side"] == LONG and last_px <= p["stop"]) or
             (p["side"] == SHORT and last_px >= p["stop"]))
         if native_filled:
-            self.close_position(symbol, float(st.orderStatus.avgFillPrice or p["stop"]), "MR_STOP")
+            self.close_position(symbol, self._avg_fill_price(st, p["stop"]), "MR_STOP")
             return
         if synth_hit:
             self.log(f"{symbol} MR synthetic stop hit: {p['side']} px {last_px:.2f} "
@@ -1654,9 +1816,9 @@ class SupertrendBot:
                 self.log(f"{symbol} trail SHORT stop -> {new_stop:.2f} ({tag})")
                 p["stop"] = new_stop
 
-    def manage_symbol(self, symbol):
+    def manage_symbol(self, symbol, bars=None):
         contract = self.contracts[symbol]
-        bars = self.hist(contract)
+        bars = self.hist(contract) if bars is None else bars
         state = self.st_state(symbol, bars)
         if state is None:
             return
@@ -1750,7 +1912,7 @@ class SupertrendBot:
                 (p["side"] == SHORT and last_px >= p["stop"]))
             if native_filled or synth_hit:
                 if native_filled:
-                    self.close_position(symbol, float(st.orderStatus.avgFillPrice or p["stop"]), "STOP")
+                    self._book_stop_fill(symbol, p, "bar")
                     p = None
                 else:
                     self.log(f"{symbol} SYNTHETIC stop hit: {p['side']} px {last_px:.2f} "
@@ -1864,12 +2026,118 @@ class SupertrendBot:
 
     def _watch_stops(self):
         """Cheap between-bars check (no history pull): catch a server-side stop that filled so
-        the CSV/state update isn't delayed until the next bar evaluation."""
+        the CSV/state update isn't delayed until the next bar evaluation. With event_fills the
+        fill is normally booked already; this is the watchdog for a missed event."""
         for symbol in list(self.positions):
             p = self.positions.get(symbol)
             if p and p.get("st") is not None and p["st"].orderStatus.status == "Filled":
-                exit_px = float(p["st"].orderStatus.avgFillPrice or p["stop"])
-                self.close_position(symbol, exit_px, "STOP")
+                self._book_stop_fill(symbol, p, "watchdog" if self.event_fills else "poll")
+
+    def _book_stop_fill(self, symbol, p, via):
+        """Close `symbol`'s position on its filled native stop and log how long after the
+        fill (IB's execution time) it was booked."""
+        st = p["st"]
+        self.close_position(symbol, self._avg_fill_price(st, p["stop"]), "STOP")
+        lat = self._fill_latency(st)
+        if lat is not None:
+            self._fill_lat.append(lat)
+            self.log(f"{symbol} stop fill booked {lat:.2f}s after the fill ({via})")
+
+    @staticmethod
+    def _avg_fill_price(trade, default):
+        """`trade`'s average fill price. A fill booked from its execDetails event can arrive
+        before the orderStatus that carries avgFillPrice, so until then it is the
+        share-weighted average of the executions received so far; `default` if there are none."""
+        px = float(trade.orderStatus.avgFillPrice or 0)
+        if px:
+            return px
+        execs = [f.execution for f in trade.fills]
+        shares = sum(float(e.shares) for e in execs)
+        if shares <= 0:
+            return float(default)
+        return sum(float(e.price) * float(e.shares) for e in execs) / shares
+
+    @staticmethod
+    def _fill_latency(trade):
+        """Seconds since `trade`'s last execution, or None if IB reported no fill time."""
+        try:
+            t = trade.fills[-1].time
+            return max(0.0, (datetime.now(t.tzinfo) - t).total_seconds())
+        except (AttributeError, IndexError, TypeError):
+            return None
+
+    async def _prefetch_async(self, symbols, budget):
+        sem = asyncio.Semaphore(self.eval_concurrency)
+
+        async def one(symbol):
+            async with sem:
+                return symbol, await self._hist_async(self.contracts[symbol])
+
+        tasks = {asyncio.ensure_future(one(s)): s for s in symbols}
+        done, pending = await asyncio.wait(tasks, timeout=budget)
+        out = {}
+        for t in done:
+            if not t.cancelled() and t.exception() is None:
+                (symbol, bars) = t.result()
+                out[symbol] = bars
+        # not cancelled: a cancelled task would leave its IB request live (no
+        # cancelHistoricalData) and the re-pull would wait out the identical-request rule
+        return out, {tasks[t]: t for t in pending}
+
+    def _prefetch(self, symbols, budget):
+        """({symbol: session bars} fetched concurrently (eval_concurrency at a time) within
+        `budget` seconds, {symbol: fetch still in flight at the deadline}). A symbol in
+        neither failed and is pulled again in turn."""
+        if self.market_hours == "24H":
+            for symbol in symbols:      # qualify the OVERNIGHT contracts before going async
+                self._overnight_contract(self.contracts[symbol])
+        return self.ib.run(self._prefetch_async(symbols, budget))
+
+    def _late_bars(self, symbol, task):
+        """The bars of `symbol`'s prefetch that missed the deadline, once they arrive (its
+        request is not sent again); None if it failed, so the symbol is pulled in turn."""
+        try:
+            return self.ib.run(task)[1]
+        except Exception as e:
+            self.log(f"late fetch error {symbol}: {e}")
+            return None
+
+    def _eval_cycle(self, close_sod=None):
+        """Evaluate every symbol once. With concurrent_eval, all histories are fetched first
+        (concurrently, bounded by eval_deadline_sec after the bar close at `close_sod`, ET
+        seconds of day); the decisions and orders then run symbol by symbol as before. Logs
+        the cycle's fetch / decide latency."""
+        import time as _t
+        t0 = _t.monotonic()
+        fetched, late = {}, {}
+        if self.concurrent_eval and len(self.symbols) > 1:
+            budget = self.eval_deadline_sec
+            if close_sod is not None:
+                now = now_et()
+                budget -= (now.hour * 3600 + now.minute * 60 + now.second - close_sod) % 86400
+            try:
+                (fetched, late) = self._prefetch(self.symbols, max(1.0, budget))
+            except Exception as e:
+                self.log(f"concurrent fetch error: {e}")
+        t1 = _t.monotonic()
+        for symbol in self.symbols:
+            try:
+                bars = fetched.get(symbol)
+                if symbol in late:
+                    bars = self._late_bars(symbol, late[symbol])
+                self.manage_symbol(symbol, bars)
+            except Exception as e:
+                self.log(f"manage error {symbol}: {e}")
+        t2 = _t.monotonic()
+        if self.concurrent_eval:
+            lag = ""
+            if close_sod is not None:
+                now = now_et()
+                lag = (now.hour * 3600 + now.minute * 60 + now.second - close_sod) % 86400
+                lag = f", {lag}s after bar close"
+            self.log(f"eval cycle: {len(self.symbols)} symbols, fetch {t1 - t0:.2f}s, "
+                     f"decide {t2 - t1:.2f}s{lag}"
+                     + (f"; late (awaited in turn): {','.join(late)}" if late else ""))
 
     def run(self):
         if not self.connect():
@@ -1918,21 +2186,19 @@ class SupertrendBot:
 
                 now = now_et()
                 sod = now.hour * 3600 + now.minute * 60 + now.second
+                close_sod = None
                 if gate:
                     cur_bar = int((sod - buf) // bar_secs)   # bar considered closed & data-ready
                     do_eval = cur_bar != self._last_eval_bar
                     if do_eval:
                         self._last_eval_bar = cur_bar
+                        close_sod = cur_bar * bar_secs
                 else:
                     do_eval = True
 
                 if do_eval:
                     self._cycle_data_ok = False
-                    for symbol in self.symbols:
-                        try:
-                            self.manage_symbol(symbol)
-                        except Exception as e:
-                            self.log(f"manage error {symbol}: {e}")
+                    self._eval_cycle(close_sod)
                     # DATA WATCHDOG: socket up but no symbol returned data for several bar-evals
                     # (a competing login stealing the data line sends Error 162 timeouts WITHOUT
                     # dropping the socket or firing 1100) -> force a full session reset.
@@ -1957,8 +2223,23 @@ class SupertrendBot:
                     nap = max(2, min(self.poll, to_next))
                 else:
                     nap = self.poll
-                self.ib.sleep(nap)
+                self._idle = True           # stop-fill events are booked during the nap
+                try:
+                    self.ib.sleep(nap)
+                finally:
+                    self._idle = False
         finally:
+            st = indicator_cache.stats()
+            self.log(f"indicator cache: {st.hits} hits / {st.misses} misses "
+                     f"({st.hit_rate:.0%}), {st.size}/{st.maxsize} entries")
+            if self.hub is not None:
+                self.log(self.hub.summary())
+            if isinstance(self.rate, PacingScheduler):
+                self.log(self.rate.summary())
+            if self._fill_lat:
+                lat = sorted(self._fill_lat)
+                self.log(f"stop fills booked: {len(lat)}, median {lat[len(lat) // 2]:.2f}s, "
+                         f"max {lat[-1]:.2f}s after the fill")
             self.disconnect()
 
 
@@ -1977,6 +2258,10 @@ def main():
     with open(cfg_path, "r", encoding="utf-8-sig") as f:
         cfg = json.load(f)
 
+    # The indicator cache is shared by every strategy thread (a repeat *_value call on the same
+    # bars is answered without recomputing), so its size is a top-level setting read once here.
+    indicator_cache.configure(maxsize=cfg.get("indicator_cache_size"))
+
     strategies = cfg.get("strategies")
     # `strategies` may be either a flat LIST (legacy) or an OBJECT with "stocks" and "futures"
     # sections. For the object form, futures strategies are tagged sec_type=FUT unless they
@@ -1991,6 +2276,12 @@ def main():
         strategies = stock_strats + fut_strats
     if strategies:
         threads = []
+        # One MarketDataHub for all the strategy threads: identical history pulls (e.g. several
+        # blocks on the same symbol + bar size) are made once per bar and shared, and every
+        # pull draws on one pacing budget. "data_hub": false = each thread pulls on its own.
+        hub = (MarketDataHub(pacer=PacingScheduler(float(cfg.get("hist_min_interval_sec", 0.25))),
+                             ttl=float(cfg.get("data_hub_ttl_sec", 30.0)))
+               if cfg.get("data_hub", True) else None)
         allowed_accounts = [str(a).strip() for a in cfg.get("accounts", []) if a is not None]
         default_account = str(cfg.get("default_account", "")).strip()
         client_id_base = int(cfg.get("client_id_base", cfg.get("client_id", 40)))
@@ -2009,7 +2300,7 @@ def main():
             merged["client_id"] = int(strat.get("client_id", int(client_id_base) + int(i)))
             name = merged.get("name") or merged.get("account") or f"supertrend_{i}"
             print(f"Starting strategy {name} account={merged['account']} clientId={merged['client_id']}")
-            thread = threading.Thread(target=lambda cfg=merged: SupertrendBot(cfg, base).run(),
+            thread = threading.Thread(target=lambda cfg=merged: SupertrendBot(cfg, base, hub).run(),
                                        name=name, daemon=True)
             threads.append(thread)
             thread.start()
@@ -11,7 +11,7 @@ the package root (everything is re-exported here for convenience)::
 
 Indicators are organised into category subpackages:
 
-    trend/        supertrend, adx, parabolic_sar, halftrend, ichimoku
+    trend/        supertrend, adx, choppiness, parabolic_sar, halftrend, ichimoku
     momentum/     rsi, macd, squeeze_momentum, stochastic, stoch_rsi, wavetrend, cci,
                   awesome_oscillator
     volatility/   atr, bollinger_bands, keltner_channels, donchian_channels, williams_vix_fix
@@ -22,37 +22,58 @@ Indicators are organised into category subpackages:
     sessions/     killzones (ICT)
 
 Shared building blocks live at the package root: ``market_data`` (history fetch),
-``moving_average`` (sma / ema / wma / rma / hma / stdev + ma_value), and ``dema``.
+``bar_series`` (``BarSeries``, columnar bars every ``*_value`` helper accepts as ``bars=``),
+``cache`` (``indicator_cache``, the LRU that answers a repeat ``*_value`` call on the same
+``bars=``), ``data_hub`` (``MarketDataHub``, history requests shared by the strategy
+threads of one process), ``moving_average`` (sma / ema / wma / rma / hma / stdev +
+ma_value), ``rolling`` (O(n) window highest / lowest / sum / mean / stdev / wma / linreg
+kernels), and ``dema``.
 
 Each indicator exposes two layers:
   * a pure-math function (e.g. ``supertrend``, ``rsi``, ``macd``) on price lists, and
   * a config-driven ``*_value`` helper that takes a symbol + timeframe + params (and an
     `ib` to fetch with, or pre-fetched `bars`) and returns the value on the last bar.
 
+The indicators a bot evaluates every bar (Supertrend, DEMA, ADX, RSI, MACD, CHOP, ATR and
+the sma/ema/rma building blocks) also have a streaming ``*State`` class: seed it once with
+the history, then ``update(bar)`` per new completed bar in O(1) instead of recomputing the
+whole series; ``result()`` returns the same ``*Result`` as the ``*_value`` helper.
+
 Pure-Python (no numpy/pandas); ib_async is imported lazily only when fetching data.
+Research sweeps can opt in to NumPy implementations of the core series (sma / ema / rma /
+dema, atr, supertrend, adx, rsi, macd, bollinger_bands, choppiness, vwap, obv) through
+``Indicators.backend`` (``set_backend("numpy")`` or ``INDICATORS_BACKEND=numpy``), which
+falls back to these functions where NumPy is not installed.
 """
 from __future__ import annotations
 
 # --- shared building blocks (package root) ---
+from .bar_series import BarSeries
+from .cache import CacheStats, IndicatorCache, indicator_cache
+from .data_hub import MarketDataHub
 from .market_data import default_duration, fetch_bars
-from .moving_average import (MAResult, ema, hma, ma_value, rma, sma, stdev, wma)
-from .dema import DemaResult, dema, dema_value
+from .moving_average import (EMAState, MAResult, RMAState, SMAState, ema, hma, ma_value,
+                             rma, sma, stdev, wma)
+from .rolling import (RollingMax, RollingMin, rolling_linreg, rolling_max, rolling_mean,
+                      rolling_min, rolling_stdev, rolling_sum, rolling_wma)
+from .dema import DEMAState, DemaResult, dema, dema_value
 
 # --- trend ---
-from .trend import (ADXResult, HalfTrendResult, IchimokuResult, SARResult,
-                    SupertrendResult, adx, adx_value, halftrend, halftrend_value,
+from .trend import (ADXResult, ADXState, CHOPResult, ChopState, HalfTrendResult,
+                    IchimokuResult, SARResult, SupertrendResult, SupertrendState, adx,
+                    adx_value, choppiness, choppiness_value, halftrend, halftrend_value,
                     ichimoku, ichimoku_value, parabolic_sar, parabolic_sar_value,
                     supertrend, supertrend_value)
 
 # --- momentum ---
-from .momentum import (AOResult, CCIResult, MACDResult, RSIResult, SqueezeResult,
-                       StochResult, WaveTrendResult, ao_value, awesome_oscillator,
+from .momentum import (AOResult, CCIResult, MACDResult, MACDState, RSIResult, RSIState,
+                       SqueezeResult, StochResult, WaveTrendResult, ao_value, awesome_oscillator,
                        cci, cci_value, macd, macd_value, rsi, rsi_value,
                        squeeze_momentum, squeeze_value, stochastic, stochastic_value,
                        stoch_rsi, stoch_rsi_value, wavetrend, wavetrend_value)
 
 # --- volatility ---
-from .volatility import (ATRResult, BollingerResult, DonchianResult, KeltnerResult,
+from .volatility import (ATRResult, ATRState, BollingerResult, DonchianResult, KeltnerResult,
                          WVFResult, atr, atr_value, bollinger_bands, bollinger_value,
                          donchian_channels, donchian_value, keltner_channels,
                          keltner_value, true_range, williams_vix_fix, williams_vix_fix_value)
@@ -78,25 +99,30 @@ from .sessions import DEFAULT_ZONES, KillzoneResult, killzone_at, killzone_value
 
 __all__ = [
     # shared
-    "fetch_bars", "default_duration",
+    "fetch_bars", "default_duration", "BarSeries",
+    "indicator_cache", "IndicatorCache", "CacheStats", "MarketDataHub",
     "sma", "ema", "wma", "rma", "hma", "stdev", "ma_value", "MAResult",
-    "dema", "dema_value", "DemaResult",
+    "SMAState", "EMAState", "RMAState",
+    "rolling_max", "rolling_min", "RollingMax", "RollingMin",
+    "rolling_sum", "rolling_mean", "rolling_stdev", "rolling_wma", "rolling_linreg",
+    "dema", "dema_value", "DemaResult", "DEMAState",
     # trend
-    "supertrend", "supertrend_value", "SupertrendResult",
-    "adx", "adx_value", "ADXResult",
+    "supertrend", "supertrend_value", "SupertrendResult", "SupertrendState",
+    "adx", "adx_value", "ADXResult", "ADXState",
+    "choppiness", "choppiness_value", "CHOPResult", "ChopState",
     "parabolic_sar", "parabolic_sar_value", "SARResult",
     "halftrend", "halftrend_value", "HalfTrendResult",
     "ichimoku", "ichimoku_value", "IchimokuResult",
     # momentum
-    "rsi", "rsi_value", "RSIResult",
-    "macd", "macd_value", "MACDResult",
+    "rsi", "rsi_value", "RSIResult", "RSIState",
+    "macd", "macd_value", "MACDResult", "MACDState",
     "squeeze_momentum", "squeeze_value", "SqueezeResult",
     "stochastic", "stochastic_value", "stoch_rsi", "stoch_rsi_value", "StochResult",
     "wavetrend", "wavetrend_value", "WaveTrendResult",
     "cci", "cci_value", "CCIResult",
     "awesome_oscillator", "ao_value", "AOResult",
     # volatility
-    "atr", "true_range", "atr_value", "ATRResult",
+    "atr", "true_range", "atr_value", "ATRResult", "ATRState",
     "bollinger_bands", "bollinger_value", "BollingerResult",
     "keltner_channels", "keltner_value", "KeltnerResult",
     "donchian_channels", "donchian_value", "DonchianResult",
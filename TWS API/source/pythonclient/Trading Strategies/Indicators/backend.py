@@ -0,0 +1,89 @@
+"""Backend selection for the core indicator math — pure Python by default, NumPy opt-in.
+
+The indicator functions are pure Python so the package bundles cleanly into a PyInstaller
+one-file exe. Research code that sweeps thousands of (symbol, timeframe, params)
+combinations can switch the core series to the NumPy implementations in
+``numpy_backend`` and call them through this module::
+
+    from Indicators import backend
+    backend.set_backend("numpy")        # or INDICATORS_BACKEND=numpy in the environment
+    line, signal, hist = backend.macd(closes)
+
+Covered: sma, ema, rma, dema, true_range, atr, supertrend, adx, rsi, macd,
+bollinger_bands, choppiness, vwap, obv (same signatures as the pure functions).
+
+``INDICATORS_BACKEND`` is read once at import; ``set_backend()`` switches at run time. Both
+take "python", "numpy" or "auto" (NumPy when installed). Without NumPy the selection falls
+back to "python"; ``get_backend()`` says which one is active.
+
+The return types follow the backend: lists with None during the warmup from "python",
+float64 arrays with NaN from "numpy". Call through the module (``backend.rsi(...)``), since
+``from Indicators.backend import rsi`` binds the backend active at that moment.
+"""
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+
+ENV_VAR = "INDICATORS_BACKEND"
+BACKENDS = ("python", "numpy", "auto")
+FUNCTIONS = ("sma", "ema", "rma", "dema", "true_range", "atr", "supertrend", "adx", "rsi",
+             "macd", "bollinger_bands", "choppiness", "vwap", "obv")
+
+_impl = None
+_name = None
+
+
+def numpy_available() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _python_impl():
+    from .dema import dema
+    from .momentum.macd import macd
+    from .momentum.rsi import rsi
+    from .moving_average import ema, rma, sma
+    from .trend.adx import adx
+    from .trend.choppiness import choppiness
+    from .trend.supertrend import supertrend
+    from .volatility.atr import atr, true_range
+    from .volatility.bollinger_bands import bollinger_bands
+    from .volume.obv import obv
+    from .volume.vwap import vwap
+    return SimpleNamespace(sma=sma, ema=ema, rma=rma, dema=dema, true_range=true_range,
+                           atr=atr, supertrend=supertrend, adx=adx, rsi=rsi, macd=macd,
+                           bollinger_bands=bollinger_bands, choppiness=choppiness,
+                           vwap=vwap, obv=obv)
+
+
+def set_backend(name="auto") -> str:
+    """Select "python", "numpy" or "auto" and return the backend now active ("numpy" falls
+    back to "python" when NumPy is not installed)."""
+    global _impl, _name
+    name = str(name or "python").strip().lower()
+    if name not in BACKENDS:
+        raise ValueError(f"unknown indicator backend {name!r} (use python|numpy|auto)")
+    if name != "python" and numpy_available():
+        from . import numpy_backend
+        (_impl, _name) = (numpy_backend, "numpy")
+    else:
+        (_impl, _name) = (_python_impl(), "python")
+    return _name
+
+
+def get_backend() -> str:
+    """Name of the active backend: "python" or "numpy"."""
+    return _name
+
+
+def __getattr__(name):
+    if name in FUNCTIONS:
+        return getattr(_impl, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+set_backend(os.environ.get(ENV_VAR, "python"))
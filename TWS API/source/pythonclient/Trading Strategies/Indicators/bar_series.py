@@ -0,0 +1,169 @@
+"""Columnar bars — the OHLCV columns extracted once and shared by every indicator.
+
+Each ``*_value`` helper needs columns of its bars (``highs``, ``lows``, ``closes`` ...). Given
+the plain list of bars from reqHistoricalData every helper rebuilds them with
+``[b.close for b in bars]``; a bot that evaluates several indicators on the same bars converts
+them once instead and passes the ``BarSeries`` as ``bars=``::
+
+    bars = BarSeries.from_bars(ib.reqHistoricalData(...))   # or fetch_bars(..., series=True)
+    st = supertrend_value(bars=bars)
+    d = dema_value(bars=bars, period=200)
+
+A ``BarSeries`` keeps open / high / low / close / volume in ``array('d')`` columns plus a list
+of the bar timestamps. It stands in for the bar list: ``len()``, truthiness, indexing and
+iteration give ``Bar`` rows (.date .open .high .low .close .volume). It is append-only
+(``append(bar)``), and a slice is a view over the same columns (no copy until a column of the
+view is asked for). ``session`` labels the bar-session filter the bars were cut to ("RTH" /
+"ETH" / "24H", None if unknown); a slice keeps it, and the indicator cache keys on it.
+
+``column(bars, name)`` is what the helpers call: the column of a BarSeries, or the attribute
+taken from every bar of a plain list.
+
+Pure-Python (no numpy/pandas) so it bundles cleanly into a PyInstaller one-file exe.
+"""
+from __future__ import annotations
+
+from array import array
+from collections import namedtuple
+from operator import attrgetter
+
+Bar = namedtuple("Bar", "date open high low close volume")
+
+COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+class BarSeries:
+    """Append-only columnar OHLCV bars; a slice is a read-only view of the same columns."""
+
+    __slots__ = ("_cols", "_dates", "_start", "_stop", "session")
+
+    def __init__(self, session=None):
+        self._cols = {name: array("d") for name in COLUMNS}
+        self._dates = []
+        self._start = 0
+        self._stop = None       # None: the whole series (grows with append); int: a view
+        self.session = session  # the bar-session filter the bars were cut to ("RTH" / "ETH" ...)
+
+    @classmethod
+    def from_bars(cls, bars, session=None):
+        """A BarSeries of `bars` (objects with .open/.high/.low/.close, and optionally .volume
+        and .date) labelled `session`; a BarSeries is returned as is, or as a view carrying
+        `session` if it is labelled otherwise."""
+        if isinstance(bars, BarSeries):
+            if session is None or bars.session == session:
+                return bars
+            view = bars[:]
+            view.session = session
+            return view
+        series = cls(session)
+        series.extend(bars)
+        return series
+
+    def extend(self, bars):
+        """Append every bar of `bars`."""
+        if self._stop is not None:
+            raise TypeError("cannot append to a BarSeries view")
+        bars = bars if isinstance(bars, (list, tuple)) else list(bars)
+        cols = self._cols
+        for name in ("open", "high", "low", "close"):
+            cols[name].extend(map(attrgetter(name), bars))
+        cols["volume"].extend([getattr(b, "volume", 0.0) or 0.0 for b in bars])
+        self._dates.extend([getattr(b, "date", None) for b in bars])
+
+    def append(self, bar):
+        """Append one bar (an object with .open/.high/.low/.close, optionally .volume/.date)."""
+        if self._stop is not None:
+            raise TypeError("cannot append to a BarSeries view")
+        cols = self._cols
+        cols["open"].append(bar.open)
+        cols["high"].append(bar.high)
+        cols["low"].append(bar.low)
+        cols["close"].append(bar.close)
+        cols["volume"].append(getattr(bar, "volume", 0.0) or 0.0)
+        self._dates.append(getattr(bar, "date", None))
+
+    def _bounds(self):
+        return self._start, len(self._dates) if self._stop is None else self._stop
+
+    def __len__(self):
+        (start, stop) = self._bounds()
+        return stop - start
+
+    def __getitem__(self, key):
+        (start, stop) = self._bounds()
+        if isinstance(key, slice):
+            (first, last, step) = key.indices(stop - start)
+            if step != 1:
+                raise ValueError("BarSeries slices must be contiguous (step 1)")
+            view = BarSeries.__new__(BarSeries)
+            view._cols = self._cols
+            view._dates = self._dates
+            view._start = start + first
+            view._stop = start + max(first, last)
+            view.session = self.session
+            return view
+        i = key + (stop - start) if key < 0 else key
+        if not 0 <= i < stop - start:
+            raise IndexError("BarSeries index out of range")
+        i += start
+        cols = self._cols
+        return Bar(self._dates[i], cols["open"][i], cols["high"][i], cols["low"][i],
+                   cols["close"][i], cols["volume"][i])
+
+    def __iter__(self):
+        (start, stop) = self._bounds()
+        cols = self._cols
+        return map(Bar, self._dates[start:stop], *(cols[name][start:stop] for name in COLUMNS))
+
+    def __repr__(self):
+        (start, stop) = self._bounds()
+        span = f", {self._dates[start]} .. {self._dates[stop - 1]}" if stop > start else ""
+        return f"BarSeries({stop - start} bars{span})"
+
+    def column(self, name):
+        """The `name` column ("open" | "high" | "low" | "close" | "volume") as an array('d').
+        For a whole series this is the live column itself (read it, do not modify it); for a
+        view it is a copy of the view's range. "date" gives a list of the timestamps."""
+        if name == "date":
+            return self.dates
+        col = self._cols[name]
+        if self._start == 0 and self._stop is None:
+            return col
+        (start, stop) = self._bounds()
+        return col[start:stop]
+
+    @property
+    def opens(self):
+        return self.column("open")
+
+    @property
+    def highs(self):
+        return self.column("high")
+
+    @property
+    def lows(self):
+        return self.column("low")
+
+    @property
+    def closes(self):
+        return self.column("close")
+
+    @property
+    def volumes(self):
+        return self.column("volume")
+
+    @property
+    def dates(self):
+        (start, stop) = self._bounds()
+        return self._dates[start:stop]
+
+
+def column(bars, name):
+    """The `name` column ("open" | "high" | "low" | "close" | "volume" | "date") of `bars` for
+    the pure-math functions: a BarSeries column as is, else a list of that attribute of every
+    bar (volume defaulting to 0.0 when a bar has none)."""
+    if isinstance(bars, BarSeries):
+        return bars.column(name)
+    if name == "volume":
+        return [getattr(b, "volume", 0.0) for b in bars]
+    return list(map(attrgetter(name), bars))
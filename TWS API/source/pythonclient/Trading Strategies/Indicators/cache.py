@@ -0,0 +1,152 @@
+"""Indicator-result cache — one evaluation per (series, indicator, params), however many callers.
+
+A bot evaluating a symbol often asks for the same indicator twice on the same bars (the
+regime gate and the ADX filter both call ``adx_value``; the logging pass and the entry
+filters both call ``rsi_value``/``macd_value``). Every ``*_value`` helper is wrapped with
+``cached``, so a repeat call with the same pre-fetched ``bars=`` and the same params returns
+the result computed the first time — no change at the call sites.
+
+The key is (helper, the call's symbol / bar_size / params, series fingerprint). The
+fingerprint is the bar count, the first bar's time and the last bar (time + OHLCV), so a new
+bar, a re-pull of a longer history or an update of the forming bar is a different key, plus
+the bars' own session label (``BarSeries.from_bars(bars, session="RTH")``): the same bars cut
+to another session filter by another strategy thread are another key.
+
+The cache is a bounded LRU shared by the process (``indicator_cache``); ``stats()`` reports
+hits / misses. ``INDICATORS_CACHE_SIZE`` (read once at import, default 256) sets its size and
+0 turns it off. Calls that fetch their own history (``bars=None``) are never cached. A cached
+result is returned to every caller as the same object: treat it as read-only.
+
+Pure-Python (no numpy/pandas) so it bundles cleanly into a PyInstaller one-file exe.
+"""
+from __future__ import annotations
+
+import functools
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+ENV_VAR = "INDICATORS_CACHE_SIZE"
+DEFAULT_SIZE = 256
+
+# the fetch arguments: irrelevant to the result once bars= is given
+_FETCH_ARGS = frozenset(("ib", "bars", "duration", "use_rth", "what", "exchange", "currency",
+                         "throttle"))
+
+
+@dataclass
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+def series_fingerprint(bars):
+    """(session, count, first bar time, last bar time + OHLCV) of `bars` — a list of bars or
+    a BarSeries (a list has no session). Only the forming last bar changes in place between
+    polls."""
+    session = getattr(bars, "session", None)
+    n = len(bars)
+    if not n:
+        return (session, 0)
+    (first, last) = (bars[0], bars[-1])
+    return (session, n, getattr(first, "date", None), getattr(last, "date", None), last.open,
+            last.high, last.low, last.close, getattr(last, "volume", None))
+
+
+class IndicatorCache:
+    """Bounded LRU of indicator results with hit / miss counters (thread-safe)."""
+
+    def __init__(self, maxsize=DEFAULT_SIZE):
+        self.maxsize = max(0, int(maxsize))
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, *, maxsize=None):
+        """Resize the cache (0 disables it). The cache is process-wide: configure it once, at
+        startup, not per strategy thread."""
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = max(0, int(maxsize))
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def lookup(self, key):
+        """(True, result) on a hit, (False, None) on a miss."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def store(self, key, value):
+        with self._lock:
+            if not self.maxsize:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self.hits, misses=self.misses, size=len(self._entries),
+                              maxsize=self.maxsize)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _env_size():
+    try:
+        return int(os.environ.get(ENV_VAR, DEFAULT_SIZE))
+    except ValueError:
+        return DEFAULT_SIZE
+
+
+indicator_cache = IndicatorCache(_env_size())
+
+
+def cached(fn):
+    """Wrap a ``*_value(symbol, bar_size, *, ..., bars=None, ...)`` helper with
+    ``indicator_cache``. The undecorated helper stays reachable as ``__wrapped__``."""
+    name = f"{fn.__module__}.{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        bars = kwargs.get("bars")
+        cache = indicator_cache
+        if bars is None or not cache.maxsize:
+            return fn(*args, **kwargs)
+        params = tuple(sorted((k, v) for (k, v) in kwargs.items() if k not in _FETCH_ARGS))
+        key = (name, args, params, series_fingerprint(bars))
+        try:
+            (hit, value) = cache.lookup(key)
+        except TypeError:               # an unhashable param (e.g. a list): compute uncached
+            return fn(*args, **kwargs)
+        if hit:
+            return value
+        value = fn(*args, **kwargs)
+        cache.store(key, value)
+        return value
+
+    return wrapper
@@ -0,0 +1,457 @@
+"""Process-wide market-data hub — one history request per (contract, bar size, what, session).
+
+A bot process that runs several strategy threads (each with its own IB connection) asks for
+the same history many times per bar: four Supertrend blocks on SOXL pull the same 15-min bars
+at the same bar close. ``MarketDataHub.historical()`` stands in for ``reqHistoricalData``:
+
+  * identical requests are de-duplicated — while one thread's request is in flight, the
+    others asking for the same (contract, bar_size, what, use_rth) wait for its bars instead
+    of sending their own; a result is then served to later askers for ``ttl`` seconds, but
+    never across a bar boundary (a request after the bar close always sees the closed bar);
+  * a request is served by an earlier one covering at least the same duration, cut to its
+    own span (a "5 D" ask served from a "30 D" pull gets the last 5 sessions), so a caller
+    gets the same bars whichever thread asked first;
+  * every request that does go out takes its turn from ONE pacing budget (``pacer``), shared
+    by all the threads instead of one blind limiter per thread -- a flat ``Pacer`` or a
+    ``PacingScheduler`` modelling IBKR's historical-data pacing rules;
+  * ``stats()`` counts the requests sent and the ones saved (served from a recent result or
+    joined to one in flight).
+
+The request is sent on the asking thread's own ``ib`` (ib_async clients are bound to their
+thread's event loop), and waiting threads keep their loop running via ``ib.sleep``.
+``historical_async()`` is the same for a coroutine on that loop (a bot fetching all its
+symbols concurrently).
+"""
+from __future__ import annotations
+
+import asyncio
+import datetime as _dt
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+_UNIT_SECONDS = {"S": 1, "D": 86400, "W": 7 * 86400, "M": 30 * 86400, "Y": 365 * 86400}
+
+
+def bar_seconds(bar_size) -> int:
+    """Length of a bar size in seconds ('15 mins' -> 900, '1 day' -> 86400); 0 if unknown."""
+    b = str(bar_size).lower().strip()
+    try:
+        n = int(b.split()[0])
+    except (ValueError, IndexError):
+        return 0
+    for (unit, secs) in (("sec", 1), ("min", 60), ("hour", 3600), ("day", 86400),
+                         ("week", 7 * 86400), ("month", 30 * 86400)):
+        if unit in b:
+            return n * secs
+    return 0
+
+
+def duration_seconds(duration) -> int:
+    """Span of an IBKR duration string ('3600 S', '30 D', '1 Y') in seconds; 0 if unknown."""
+    try:
+        (n, unit) = str(duration).strip().split()
+        return int(float(n) * _UNIT_SECONDS[unit.upper()])
+    except (ValueError, KeyError):
+        return 0
+
+
+def contract_key(contract) -> tuple:
+    """Identity of a contract for de-duplication (the venue matters: SMART and OVERNIGHT
+    history of one stock differ)."""
+    g = getattr
+    return (g(contract, "conId", 0) or g(contract, "symbol", ""), g(contract, "secType", ""),
+            g(contract, "exchange", ""), g(contract, "currency", ""),
+            g(contract, "lastTradeDateOrContractMonth", ""))
+
+
+def hist_request(contract, duration, bar_size, what="TRADES", use_rth=True) -> tuple:
+    """Identity of a history request for pacing: (contract key, duration, bar size, what
+    to show, RTH only)."""
+    return (contract_key(contract), str(duration), str(bar_size), str(what).upper(),
+            bool(use_rth))
+
+
+class Pacer:
+    """Thread-safe minimum interval between requests: each caller reserves the next free slot
+    under a lock, then waits for it on its own ib (so its event loop keeps running) or, from
+    a coroutine, with ``await acquire_async()``. ``request`` and ``priority`` are accepted
+    for the ``PacingScheduler`` interface and ignored."""
+
+    def __init__(self, min_interval=2.0):
+        self.min_interval = float(min_interval)
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Seconds until the slot reserved for this caller."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.min_interval
+        return slot - now
+
+    def acquire(self, ib=None, request=None, priority=False):
+        wait = self._reserve()
+        if wait > 0:
+            _sleep(ib, wait)
+
+    async def acquire_async(self, request=None, priority=False):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+@dataclass
+class PacingStats:
+    requests: int = 0          # requests let through
+    delayed: int = 0           # of those, held back by a pacing rule
+    waited: float = 0.0        # seconds held back, in total
+    max_wait: float = 0.0
+    priority: int = 0          # order-critical requests let through
+    priority_max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.waited / self.requests if self.requests else 0.0
+
+
+class PacingScheduler:
+    """Pacing modelled on IBKR's historical-data (HMDS) rules instead of one flat interval.
+
+    A request goes out as soon as every rule allows it:
+
+      * ``min_interval`` between any two requests (a floor against IB's soft throttling);
+      * no identical history request (``hist_request()``) within ``identical_sec`` (15 s);
+      * at most ``per_contract_max`` requests for one contract, venue and what-to-show
+        within ``per_contract_sec`` (IB: six or more within 2 s is a violation);
+      * at most ``window_max`` small-bar requests (bars of ``small_bar_sec`` or less; a
+        BID_ASK request counts twice) in any ``window_sec`` (60 per 10 minutes). The last
+        ``priority_reserve`` of them are kept for order-critical requests.
+
+    Nothing is reserved ahead: a waiting caller re-checks when the binding rule lapses, so
+    requests for other contracts go out meanwhile, and while an order-critical caller
+    (``priority=True``) waits for the shared budget the others hold back. Requests without a ``request`` identity
+    (contract details, scanners) only take the interval. ``stats()`` / ``summary()`` report
+    how long callers were held back."""
+
+    def __init__(self, min_interval=0.25, identical_sec=15.0, per_contract_max=5,
+                 per_contract_sec=2.0, window_max=60, window_sec=600.0, small_bar_sec=30,
+                 priority_reserve=5, clock=time.monotonic):
+        self.min_interval = float(min_interval)
+        self.identical_sec = float(identical_sec)
+        self.per_contract_max = max(1, int(per_contract_max))
+        self.per_contract_sec = float(per_contract_sec)
+        self.window_max = max(1, int(window_max))
+        self.window_sec = float(window_sec)
+        self.small_bar_sec = int(small_bar_sec)
+        self.priority_reserve = max(0, min(int(priority_reserve), self.window_max - 1))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last = None                           # time of the last request let through
+        self._identical: dict[tuple, float] = {}    # request -> when it went out
+        self._contract: dict[tuple, deque] = {}     # (contract, what) -> recent send times
+        self._window: deque = deque()               # (time, weight) of small-bar requests
+        self._urgent: set = set()                   # order-critical callers held by the budget
+        self._stats = PacingStats()
+
+    def acquire(self, ib=None, request=None, priority=False):
+        """Wait (on `ib`, so its event loop keeps running) until `request` may go out."""
+        (token, held_since) = (object(), None)
+        try:
+            while True:
+                wait = self._admit(request, priority, held_since, token)
+                if wait <= 0:
+                    return
+                if held_since is None:
+                    held_since = self._clock()
+                _sleep(ib, wait)
+        finally:
+            self._release(token)
+
+    async def acquire_async(self, request=None, priority=False):
+        (token, held_since) = (object(), None)
+        try:
+            while True:
+                wait = self._admit(request, priority, held_since, token)
+                if wait <= 0:
+                    return
+                if held_since is None:
+                    held_since = self._clock()
+                await asyncio.sleep(wait)
+        finally:
+            self._release(token)
+
+    def _release(self, token):
+        with self._lock:
+            self._urgent.discard(token)
+
+    def _weight(self, request) -> int:
+        bs = bar_seconds(request[2])
+        if not 0 < bs <= self.small_bar_sec:
+            return 0
+        return 2 if request[3] == "BID_ASK" else 1
+
+    def _admit(self, request, priority, held_since, token) -> float:
+        """0.0 once `request` has been let through (and recorded), else the seconds until
+        the binding rule lapses. `held_since`: when the caller was first held back."""
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            # `shared`: the budget every request draws on; `own`: rules of this request alone
+            shared = 0.0 if self._last is None else self._last + self.min_interval - now
+            (own, weight) = (0.0, 0)
+            if request is not None:
+                seen = self._identical.get(request)
+                if seen is not None:
+                    own = seen + self.identical_sec - now
+                sent = self._contract.get((request[0], request[3]))
+                if sent is not None and len(sent) >= self.per_contract_max:
+                    own = max(own, sent[-self.per_contract_max] + self.per_contract_sec - now)
+                weight = self._weight(request)
+                if weight:
+                    cap = self.window_max - (0 if priority else self.priority_reserve)
+                    used = sum(w for (_, w) in self._window)
+                    for (t, w) in self._window:
+                        if used + weight <= cap:
+                            break
+                        used -= w
+                        shared = max(shared, t + self.window_sec - now)
+            if priority:
+                # while only the shared budget holds it back, the other callers wait
+                if 0 < shared and own < shared:
+                    self._urgent.add(token)
+                else:
+                    self._urgent.discard(token)
+            elif self._urgent:
+                shared = max(shared, 0.05)          # order-critical callers go first
+            wait = max(shared, own)
+            if wait > 0:
+                return wait
+            self._urgent.discard(token)
+            self._last = now
+            if request is not None:
+                self._identical[request] = now
+                self._contract.setdefault((request[0], request[3]), deque()).append(now)
+                if weight:
+                    self._window.append((now, weight))
+            held = 0.0 if held_since is None else now - held_since
+            s = self._stats
+            s.requests += 1
+            s.waited += held
+            s.max_wait = max(s.max_wait, held)
+            if held > 0:
+                s.delayed += 1
+            if priority:
+                s.priority += 1
+                s.priority_max_wait = max(s.priority_max_wait, held)
+            return 0.0
+
+    def _prune(self, now):
+        for (req, t) in list(self._identical.items()):
+            if now - t >= self.identical_sec:
+                del self._identical[req]
+        for (key, sent) in list(self._contract.items()):
+            while sent and now - sent[0] >= self.per_contract_sec:
+                sent.popleft()
+            if not sent:
+                del self._contract[key]
+        while self._window and now - self._window[0][0] >= self.window_sec:
+            self._window.popleft()
+
+    def stats(self) -> PacingStats:
+        with self._lock:
+            s = self._stats
+            return PacingStats(s.requests, s.delayed, s.waited, s.max_wait, s.priority,
+                               s.priority_max_wait)
+
+    def summary(self) -> str:
+        s = self.stats()
+        return (f"pacing: {s.requests} requests, {s.delayed} held back "
+                f"(mean {s.mean_wait:.2f}s, max {s.max_wait:.1f}s)"
+                + (f"; {s.priority} order-critical (max {s.priority_max_wait:.1f}s)"
+                   if s.priority else ""))
+
+
+def _day(t):
+    """The calendar date of a bar time (a datetime, or the date of a daily bar)."""
+    return t.date() if isinstance(t, _dt.datetime) else t
+
+
+def _sleep(ib, secs):
+    try:
+        ib.sleep(secs)
+    except Exception:
+        time.sleep(secs)
+
+
+@dataclass
+class HubStats:
+    sent: int = 0          # requests that went to IBKR
+    cached: int = 0        # served from a recent result
+    joined: int = 0        # waited on an identical request in flight
+    failed: int = 0        # requests that raised
+
+    @property
+    def saved(self) -> int:
+        return self.cached + self.joined
+
+
+class _Entry:
+    __slots__ = ("span", "bars", "fetched", "done")
+
+    def __init__(self, span):
+        self.span = span
+        self.bars = None
+        self.fetched = 0.0
+        self.done = threading.Event()
+
+
+class MarketDataHub:
+    """Shared history requests for every strategy thread of a process (see module doc)."""
+
+    def __init__(self, min_interval=2.0, ttl=30.0, pacer=None):
+        self.pacer = pacer or Pacer(min_interval)
+        self.ttl = float(ttl)
+        self._entries: dict[tuple, _Entry] = {}
+        self._lock = threading.Lock()
+        self._stats = HubStats()
+
+    def historical(self, ib, contract, duration, bar_size, what="TRADES", use_rth=True,
+                   timeout=None, priority=False):
+        """The bars of reqHistoricalData(contract, "", duration, bar_size, what, use_rth, 1)
+        as a list — from a recent or in-flight identical request when there is one, else
+        requested on `ib` after waiting for the shared pacing budget (`priority`: ahead of
+        the other waiters). Raises what the request raises."""
+        (key, span) = self._request_key(contract, duration, bar_size, what, use_rth)
+        while True:
+            (state, entry) = self._claim(key, span, bar_seconds(bar_size))
+            if state == "cached":
+                return self._serve(entry.bars, duration, span, bar_size)
+            if state == "joined":
+                while not entry.done.wait(0):
+                    _sleep(ib, 0.05)
+                if self._joined(entry):
+                    return self._serve(entry.bars, duration, span, bar_size)
+                continue                    # that request raised: send our own
+            try:
+                self.pacer.acquire(ib, hist_request(contract, duration, bar_size, what, use_rth),
+                                   priority)
+                kwargs = {} if timeout is None else {"timeout": timeout}
+                bars = ib.reqHistoricalData(contract, "", duration, bar_size, what, use_rth, 1,
+                                            **kwargs)
+            except BaseException:
+                self._settle(key, entry, None)
+                raise
+            return self._settle(key, entry, bars or [])
+
+    async def historical_async(self, ib, contract, duration, bar_size, what="TRADES",
+                               use_rth=True, timeout=None, priority=False):
+        """``historical()`` for a coroutine on `ib`'s loop (reqHistoricalDataAsync)."""
+        (key, span) = self._request_key(contract, duration, bar_size, what, use_rth)
+        while True:
+            (state, entry) = self._claim(key, span, bar_seconds(bar_size))
+            if state == "cached":
+                return self._serve(entry.bars, duration, span, bar_size)
+            if state == "joined":
+                while not entry.done.is_set():
+                    await asyncio.sleep(0.05)
+                if self._joined(entry):
+                    return self._serve(entry.bars, duration, span, bar_size)
+                continue
+            try:
+                await self.pacer.acquire_async(
+                    hist_request(contract, duration, bar_size, what, use_rth), priority)
+                kwargs = {} if timeout is None else {"timeout": timeout}
+                bars = await ib.reqHistoricalDataAsync(contract, "", duration, bar_size, what,
+                                                       use_rth, 1, **kwargs)
+            except BaseException:
+                self._settle(key, entry, None)
+                raise
+            return self._settle(key, entry, bars or [])
+
+    @staticmethod
+    def _request_key(contract, duration, bar_size, what, use_rth):
+        return ((contract_key(contract), str(bar_size), str(what), bool(use_rth)),
+                duration_seconds(duration))
+
+    def _claim(self, key, span, bs):
+        """("cached", entry) for a fresh result covering `span`, ("joined", entry) for such a
+        request in flight, else ("send", entry) with a new in-flight entry for the caller."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.span >= span:
+                if not entry.done.is_set():
+                    self._stats.joined += 1
+                    return "joined", entry
+                if self._fresh(entry, bs):
+                    self._stats.cached += 1
+                    return "cached", entry
+            entry = _Entry(span)
+            self._entries[key] = entry
+            return "send", entry
+
+    def _joined(self, entry) -> bool:
+        """True if the joined request delivered bars; else un-count the join."""
+        if entry.bars is not None:
+            return True
+        with self._lock:
+            self._stats.joined -= 1
+        return False
+
+    def _settle(self, key, entry, bars):
+        """Record the outcome of the caller's request (bars None: it raised), release the
+        threads waiting on it and return the caller's copy of the bars."""
+        with self._lock:
+            if bars is None:
+                self._stats.failed += 1
+            else:
+                self._stats.sent += 1
+                bars = list(bars)
+                (entry.bars, entry.fetched) = (bars, time.time())
+            # never hand a failed or empty pull to the others
+            if not bars and self._entries.get(key) is entry:
+                del self._entries[key]
+        entry.done.set()
+        return None if bars is None else list(bars)
+
+    def _fresh(self, entry, bs):
+        now = time.time()
+        if now - entry.fetched > self.ttl:
+            return False
+        # within one bar: a result from before the bar close lacks the closed bar
+        return not (0 < bs < 86400) or int(now // bs) == int(entry.fetched // bs)
+
+    @staticmethod
+    def _serve(bars, duration, span, bar_size=None):
+        """`bars` cut to the request's own span, back from the last bar: seconds for an
+        " S" top-up, the last N sessions for "N D" of intraday bars (as IBKR counts them),
+        else calendar days. Bars without usable dates are served whole."""
+        if not bars:
+            return []
+        unit = str(duration).strip().upper()[-1:]
+        last = bars[-1].date
+        try:
+            if unit == "S":
+                return [b for b in bars if (last - b.date).total_seconds() <= span]
+            if unit == "D" and 0 < bar_seconds(bar_size) < 86400:
+                sessions = span // 86400
+                days = sorted({_day(b.date) for b in bars})[-sessions:]
+                return [b for b in bars if _day(b.date) >= days[0]]
+            days = span // 86400
+            return [b for b in bars if (_day(last) - _day(b.date)).days < days]
+        except (AttributeError, TypeError, IndexError):
+            return list(bars)
+
+    def stats(self) -> HubStats:
+        with self._lock:
+            s = self._stats
+            return HubStats(sent=s.sent, cached=s.cached, joined=s.joined, failed=s.failed)
+
+    def summary(self) -> str:
+        s = self.stats()
+        asked = s.sent + s.saved
+        return (f"data hub: {s.sent} history requests sent, {s.saved} saved "
+                f"({s.cached} recent + {s.joined} in flight) of {asked}"
+                + (f", {s.failed} failed" if s.failed else ""))
@@ -6,7 +6,7 @@ DEMA reacts faster than a plain EMA/SMA of the same period because the second EM
 subtracts most of the lag. Pure-Python (no numpy/pandas) so it bundles cleanly into a
 PyInstaller one-file exe, mirroring the Supertrend indicator next to it.
 
-Two layers (same pattern as supertrend.py):
+Three layers (same pattern as supertrend.py):
 
 1. Pure math: ``dema(values, period)`` -> list aligned to `values`.
 2. Config-driven value: ``dema_value(...)`` — give it a symbol + timeframe + period (and an
@@ -17,6 +17,9 @@ Two layers (same pattern as supertrend.py):
        res.value   # the DEMA value
        float(res)  # also the DEMA value
 
+3. Streaming state: ``DEMAState(period)`` — seed once with the history, then ``update(bar)``
+   per new completed bar in O(1); ``result()`` is what dema_value returns for that bar.
+
 Both EMAs are seeded at the first value (EMA/Wilder-style warmup), so allow ~2x the period
 of warmup bars before relying on DEMA as a trend filter (e.g. DEMA(200) -> feed ~400+ bars).
 """
@@ -24,8 +27,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from .bar_series import column
+from .cache import cached
 from .market_data import fetch_bars
-from .moving_average import ema   # canonical EMA lives in moving_average.py
+from .moving_average import EMAState, ema   # canonical EMA lives in moving_average.py
 
 
 def dema(values, period):
@@ -49,6 +54,38 @@ class DemaResult:
         return float(self.value)
 
 
+class DEMAState:
+    """Streaming dema(): after update(bars[i]) `value` equals dema(closes, period)[i]."""
+
+    def __init__(self, period=200):
+        self.period = int(period)
+        self.e1 = EMAState(period)
+        self.e2 = EMAState(period)
+        self.count = 0
+        self.value = None
+        self.bar = None
+
+    def seed(self, bars):
+        for bar in bars:
+            self.update(bar)
+        return self
+
+    def update(self, bar):
+        e1 = self.e1.update(bar.close)
+        e2 = self.e2.update(e1)
+        self.value = 2.0 * e1 - e2 if e1 is not None and e2 is not None else None
+        self.count += 1
+        self.bar = bar
+        return self.value
+
+    def result(self):
+        """DemaResult on the last updated bar, or None (as dema_value)."""
+        if self.count < 2 or self.value is None:
+            return None
+        return DemaResult(value=self.value, close=self.bar.close, time=self.bar.date)
+
+
+@cached
 def dema_value(symbol=None, bar_size="15 mins", *, period=200, ib=None, bars=None,
                duration=None, use_rth=True, what="TRADES", exchange="SMART",
                currency="USD", throttle=None, completed=True):
@@ -64,7 +101,7 @@ def dema_value(symbol=None, bar_size="15 mins", *, period=200, ib=None, bars=Non
     i = len(bars) - (2 if completed else 1)
     if i < 1:
         return None
-    series = dema([b.close for b in bars], period)
+    series = dema(column(bars, "close"), period)
     val = series[i] if 0 <= i < len(series) else None
     if val is None:
         return None
@@ -22,6 +22,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 from ..volatility.atr import atr
 
@@ -71,6 +73,7 @@ class ATRStopResult:
         return float(self.value)
 
 
+@cached
 def atr_trailing_stop_value(symbol=None, bar_size="15 mins", *, period=10, mult=3.0, ib=None,
                             bars=None, duration=None, use_rth=True, what="TRADES",
                             exchange="SMART", currency="USD", throttle=None, completed=True):
@@ -82,9 +85,9 @@ def atr_trailing_stop_value(symbol=None, bar_size="15 mins", *, period=10, mult=
             raise ValueError("atr_trailing_stop_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     stop, bull = atr_trailing_stop(highs, lows, closes, period, mult)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or stop[i] is None:
@@ -20,6 +20,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 from ..volatility.atr import atr
 
@@ -71,6 +73,7 @@ class ChandelierResult:
         return float(self.value)
 
 
+@cached
 def chandelier_value(symbol=None, bar_size="15 mins", *, length=22, mult=3.0, use_close=True,
                      ib=None, bars=None, duration=None, use_rth=True, what="TRADES",
                      exchange="SMART", currency="USD", throttle=None, completed=True):
@@ -82,9 +85,9 @@ def chandelier_value(symbol=None, bar_size="15 mins", *, length=22, mult=3.0, us
             raise ValueError("chandelier_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     stop, direction = chandelier_exit(highs, lows, closes, length, mult, use_close)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or stop[i] is None:
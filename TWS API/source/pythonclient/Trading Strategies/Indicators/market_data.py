@@ -5,10 +5,14 @@ passing a symbol + timeframe), or a strategy can fetch once and pass `bars=` to
 indicators to avoid duplicate IBKR requests.
 
 `ib_async` is imported lazily inside fetch_bars() so the pure-math indicators stay importable
-(and unit-testable) without a broker connection.
+(and unit-testable) without a broker connection. ``fetch_bars(..., series=True)`` returns the
+bars as a columnar ``BarSeries`` (see bar_series.py), which every ``*_value`` helper accepts
+as ``bars=`` without re-extracting the price columns.
 """
 from __future__ import annotations
 
+from .bar_series import BarSeries
+
 
 def default_duration(bar_size: str) -> str:
     """A reasonable reqHistoricalData duration for a given bar size."""
@@ -25,10 +29,11 @@ def default_duration(bar_size: str) -> str:
 
 
 def fetch_bars(ib, symbol, bar_size="15 mins", *, duration=None, use_rth=True,
-               what="TRADES", exchange="SMART", currency="USD", throttle=None):
+               what="TRADES", exchange="SMART", currency="USD", throttle=None, series=False):
     """Qualify `symbol` and pull historical bars via ib_async. `throttle`, if given, is a
     no-arg callable invoked right before the request (e.g. a rate limiter). Returns the
-    bars list (possibly empty); never raises for a data error."""
+    bars list (possibly empty), or a BarSeries of them with ``series=True``; never raises
+    for a data error."""
     from ib_async import Stock
     if duration is None:
         duration = default_duration(bar_size)
@@ -43,6 +48,7 @@ def fetch_bars(ib, symbol, bar_size="15 mins", *, duration=None, use_rth=True,
         except Exception:
             pass
     try:
-        return ib.reqHistoricalData(contract, "", duration, bar_size, what, use_rth, 1) or []
+        bars = ib.reqHistoricalData(contract, "", duration, bar_size, what, use_rth, 1) or []
     except Exception:
-        return []
+        bars = []
+    return BarSeries.from_bars(bars) if series else bars
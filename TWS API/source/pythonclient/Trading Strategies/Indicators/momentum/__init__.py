@@ -11,8 +11,8 @@
 """
 from .awesome_oscillator import AOResult, ao_value, awesome_oscillator
 from .cci import CCIResult, cci, cci_value
-from .macd import MACDResult, macd, macd_value
-from .rsi import RSIResult, rsi, rsi_value
+from .macd import MACDResult, MACDState, macd, macd_value
+from .rsi import RSIResult, RSIState, rsi, rsi_value
 from .squeeze_momentum import SqueezeResult, squeeze_momentum, squeeze_value
 from .stochastic import (StochResult, stochastic, stochastic_value, stoch_rsi,
                          stoch_rsi_value)
@@ -21,8 +21,8 @@ from .wavetrend import WaveTrendResult, wavetrend, wavetrend_value
 __all__ = [
     "AOResult", "ao_value", "awesome_oscillator",
     "CCIResult", "cci", "cci_value",
-    "MACDResult", "macd", "macd_value",
-    "RSIResult", "rsi", "rsi_value",
+    "MACDResult", "MACDState", "macd", "macd_value",
+    "RSIResult", "RSIState", "rsi", "rsi_value",
     "SqueezeResult", "squeeze_momentum", "squeeze_value",
     "StochResult", "stochastic", "stochastic_value", "stoch_rsi", "stoch_rsi_value",
     "WaveTrendResult", "wavetrend", "wavetrend_value",
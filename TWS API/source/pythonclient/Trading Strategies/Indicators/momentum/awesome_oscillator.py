@@ -17,6 +17,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 from ..moving_average import sma
 
@@ -46,6 +48,7 @@ class AOResult:
         return float(self.value)
 
 
+@cached
 def ao_value(symbol=None, bar_size="15 mins", *, fast=5, slow=34, ib=None, bars=None,
              duration=None, use_rth=True, what="TRADES", exchange="SMART", currency="USD",
              throttle=None, completed=True):
@@ -56,9 +59,9 @@ def ao_value(symbol=None, bar_size="15 mins", *, fast=5, slow=34, ib=None, bars=
             raise ValueError("ao_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     series = awesome_oscillator(highs, lows, fast, slow)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or series[i] is None:
@@ -7,7 +7,7 @@
 Defaults fast=12, slow=26, signal=9 (classic). EMA is the shared moving_average.ema (seeded
 at the first value), so allow some warmup before relying on the values.
 
-Two layers (same pattern as the other indicators):
+Three layers (same pattern as the other indicators):
 
 1. Pure math: ``macd(closes, fast, slow, signal)`` -> (macd_line, signal_line, histogram).
 2. Config-driven value: ``macd_value(...)`` -> MACDResult on the last completed bar, e.g.::
@@ -17,14 +17,19 @@ Two layers (same pattern as the other indicators):
        res.positive   # histogram > 0 (macd above signal)
        res.rising     # histogram > previous bar's histogram
 
+3. Streaming state: ``MACDState(fast, slow, signal)`` -> ``update(bar)`` per new completed
+   bar in O(1), ``result()`` is what macd_value returns for that bar.
+
 Pure-Python (no numpy/pandas) so it bundles cleanly into a PyInstaller one-file exe.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
-from ..moving_average import ema
+from ..moving_average import EMAState, ema
 
 
 def macd(closes, fast=12, slow=26, signal=9):
@@ -58,6 +63,48 @@ class MACDResult:
         return float(self.hist)
 
 
+class MACDState:
+    """Streaming macd(): after update(bars[i]) `macd`/`signal`/`hist` equal the macd()
+    series at i."""
+
+    def __init__(self, fast=12, slow=26, signal=9):
+        self.ema_fast = EMAState(fast)
+        self.ema_slow = EMAState(slow)
+        self.ema_signal = EMAState(signal)
+        self.count = 0
+        self.macd = None
+        self.signal = None
+        self.hist = None
+        self.prev_hist = None
+        self.bar = None
+
+    def seed(self, bars):
+        for bar in bars:
+            self.update(bar)
+        return self
+
+    def update(self, bar):
+        fast = self.ema_fast.update(bar.close)
+        slow = self.ema_slow.update(bar.close)
+        self.macd = fast - slow if fast is not None and slow is not None else None
+        self.signal = self.ema_signal.update(self.macd)
+        self.prev_hist = self.hist
+        self.hist = self.macd - self.signal if self.macd is not None and self.signal is not None else None
+        self.count += 1
+        self.bar = bar
+        return self.hist
+
+    def result(self):
+        """MACDResult on the last updated bar, or None (as macd_value)."""
+        if self.count < 2 or self.macd is None or self.signal is None or self.hist is None:
+            return None
+        prev_hist = self.prev_hist if self.prev_hist is not None else 0.0
+        return MACDResult(macd=self.macd, signal=self.signal, hist=self.hist,
+                          positive=self.hist > 0, rising=self.hist > prev_hist,
+                          close=self.bar.close, time=self.bar.date)
+
+
+@cached
 def macd_value(symbol=None, bar_size="15 mins", *, fast=12, slow=26, signal=9, ib=None,
                bars=None, duration=None, use_rth=True, what="TRADES", exchange="SMART",
                currency="USD", throttle=None, completed=True):
@@ -68,7 +115,7 @@ def macd_value(symbol=None, bar_size="15 mins", *, fast=12, slow=26, signal=9, i
             raise ValueError("macd_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    closes = [b.close for b in bars]
+    closes = column(bars, "close")
     macd_line, signal_line, hist = macd(closes, fast, slow, signal)
     i = len(bars) - (2 if completed else 1)
     if i < 1:
@@ -4,7 +4,7 @@ Wilder's RSI: average gains / losses are smoothed with Wilder's method (seeded w
 SMA of the first `period` changes), matching TradingView's ta.rsi. RSI = 100 - 100/(1+RS),
 RS = avg_gain / avg_loss (RSI = 100 when there are no losses in the window).
 
-Two layers (same pattern as the other indicators):
+Three layers (same pattern as the other indicators):
 
 1. Pure math: ``rsi(closes, period)`` -> list aligned to `closes` (None during warmup).
 2. Config-driven value: ``rsi_value(...)`` — symbol + timeframe + period (and an `ib` to
@@ -15,15 +15,27 @@ Two layers (same pattern as the other indicators):
        res.overbought    # value >= overbought level (default 70)
        res.oversold      # value <= oversold level (default 30)
 
+3. Streaming state: ``RSIState(period)`` -> ``update(bar)`` per new completed bar in O(1),
+   ``result()`` is what rsi_value returns for that bar.
+
 Pure-Python (no numpy/pandas) so it bundles cleanly into a PyInstaller one-file exe.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 
 
+def _to_rsi(ag, al):
+    if al == 0:
+        return 100.0 if ag > 0 else 50.0   # flat or only-gains window
+    rs = ag / al
+    return 100.0 - 100.0 / (1.0 + rs)
+
+
 def rsi(closes, period=14):
     """Wilder RSI series aligned to `closes`; None for the first `period` bars."""
     period = int(period)
@@ -38,20 +50,14 @@ def rsi(closes, period=14):
         gains[i] = ch if ch > 0 else 0.0
         losses[i] = -ch if ch < 0 else 0.0
 
-    def to_rsi(ag, al):
-        if al == 0:
-            return 100.0 if ag > 0 else 50.0   # flat or only-gains window
-        rs = ag / al
-        return 100.0 - 100.0 / (1.0 + rs)
-
     avg_gain = sum(gains[1:period + 1]) / period
     avg_loss = sum(losses[1:period + 1]) / period
-    out[period] = to_rsi(avg_gain, avg_loss)
+    out[period] = _to_rsi(avg_gain, avg_loss)
     alpha = 1.0 / period
     for i in range(period + 1, n):
         avg_gain = avg_gain + alpha * (gains[i] - avg_gain)
         avg_loss = avg_loss + alpha * (losses[i] - avg_loss)
-        out[i] = to_rsi(avg_gain, avg_loss)
+        out[i] = _to_rsi(avg_gain, avg_loss)
     return out
 
 
@@ -67,6 +73,57 @@ class RSIResult:
         return float(self.value)
 
 
+class RSIState:
+    """Streaming rsi(): after update(bars[i]) `value` equals rsi(closes, period)[i]."""
+
+    def __init__(self, period=14):
+        self.period = int(period)
+        self.count = 0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.value = None
+        self.bar = None
+
+    def seed(self, bars):
+        for bar in bars:
+            self.update(bar)
+        return self
+
+    def update(self, bar):
+        period = self.period
+        i = self.count
+        self.count += 1
+        prev, self.bar = self.bar, bar
+        if period <= 0 or i == 0:
+            return None
+        ch = bar.close - prev.close
+        gain = ch if ch > 0 else 0.0
+        loss = -ch if ch < 0 else 0.0
+        if i < period:
+            self.avg_gain += gain
+            self.avg_loss += loss
+        elif i == period:
+            # the SMA seed of the first `period` changes
+            self.avg_gain = (self.avg_gain + gain) / period
+            self.avg_loss = (self.avg_loss + loss) / period
+            self.value = _to_rsi(self.avg_gain, self.avg_loss)
+        else:
+            alpha = 1.0 / period
+            self.avg_gain = self.avg_gain + alpha * (gain - self.avg_gain)
+            self.avg_loss = self.avg_loss + alpha * (loss - self.avg_loss)
+            self.value = _to_rsi(self.avg_gain, self.avg_loss)
+        return self.value
+
+    def result(self, overbought=70.0, oversold=30.0):
+        """RSIResult on the last updated bar, or None (as rsi_value)."""
+        if self.count < 2 or self.value is None:
+            return None
+        return RSIResult(value=self.value, overbought=self.value >= overbought,
+                         oversold=self.value <= oversold, close=self.bar.close,
+                         time=self.bar.date)
+
+
+@cached
 def rsi_value(symbol=None, bar_size="15 mins", *, period=14, overbought=70.0, oversold=30.0,
               ib=None, bars=None, duration=None, use_rth=True, what="TRADES",
               exchange="SMART", currency="USD", throttle=None, completed=True):
@@ -77,7 +134,7 @@ def rsi_value(symbol=None, bar_size="15 mins", *, period=14, overbought=70.0, ov
             raise ValueError("rsi_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    closes = [b.close for b in bars]
+    closes = column(bars, "close")
     series = rsi(closes, period)
     i = len(bars) - (2 if completed else 1)
     if i < 1:
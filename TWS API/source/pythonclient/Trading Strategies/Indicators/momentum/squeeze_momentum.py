@@ -34,7 +34,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
+from ..rolling import rolling_linreg, rolling_max, rolling_min, rolling_stdev
 
 
 def _sma_series(values, n):
@@ -52,20 +55,6 @@ def _sma_series(values, n):
     return out
 
 
-def _stdev_series(values, n):
-    """Population standard deviation (divides by n), matching TradingView's ta.stdev."""
-    out = [None] * len(values)
-    if n <= 0:
-        return out
-    for i in range(len(values)):
-        if i >= n - 1:
-            window = values[i - n + 1:i + 1]
-            m = sum(window) / n
-            var = sum((x - m) ** 2 for x in window) / n
-            out[i] = var ** 0.5
-    return out
-
-
 def _true_range_series(highs, lows, closes):
     tr = [highs[0] - lows[0]]
     for i in range(1, len(closes)):
@@ -73,49 +62,6 @@ def _true_range_series(highs, lows, closes):
     return tr
 
 
-def _highest_series(values, n):
-    out = [None] * len(values)
-    for i in range(len(values)):
-        if i >= n - 1:
-            out[i] = max(values[i - n + 1:i + 1])
-    return out
-
-
-def _lowest_series(values, n):
-    out = [None] * len(values)
-    for i in range(len(values)):
-        if i >= n - 1:
-            out[i] = min(values[i - n + 1:i + 1])
-    return out
-
-
-def _linreg_endpoint(seq):
-    """Value of the least-squares regression line at the most recent point of `seq`
-    (oldest..newest) — i.e. Pine's linreg(src, len, 0) / the LSMA endpoint."""
-    L = len(seq)
-    sum_x = sum_y = sum_xx = sum_xy = 0.0
-    for x in range(L):
-        y = seq[x]
-        sum_x += x
-        sum_y += y
-        sum_xx += x * x
-        sum_xy += x * y
-    denom = L * sum_xx - sum_x * sum_x
-    slope = (L * sum_xy - sum_x * sum_y) / denom if denom else 0.0
-    intercept = (sum_y - slope * sum_x) / L
-    return intercept + slope * (L - 1)
-
-
-def _linreg_series(values, n):
-    out = [None] * len(values)
-    for i in range(len(values)):
-        if i >= n - 1:
-            window = values[i - n + 1:i + 1]
-            if all(v is not None for v in window):
-                out[i] = _linreg_endpoint(window)
-    return out
-
-
 def squeeze_momentum(highs, lows, closes, length=20, mult=2.0, length_kc=20,
                      mult_kc=1.5, use_true_range=True):
     """Compute the LazyBear Squeeze Momentum series. Returns a dict of lists aligned to the
@@ -127,7 +73,7 @@ def squeeze_momentum(highs, lows, closes, length=20, mult=2.0, length_kc=20,
     `mult` is accepted but unused (see module note); BB dev uses `mult_kc`, as in the source."""
     n = len(closes)
     basis = _sma_series(closes, length)
-    stdev = _stdev_series(closes, length)
+    stdev = rolling_stdev(closes, length)
     # LazyBear original: BB deviation uses the KC multiplier (mult is unused).
     upper_bb = [None] * n
     lower_bb = [None] * n
@@ -159,14 +105,14 @@ def squeeze_momentum(highs, lows, closes, length=20, mult=2.0, length_kc=20,
         sqz_off[i] = off
         no_sqz[i] = (not on) and (not off)
 
-    hh = _highest_series(highs, length_kc)
-    ll = _lowest_series(lows, length_kc)
+    hh = rolling_max(highs, length_kc)
+    ll = rolling_min(lows, length_kc)
     src = [None] * n
     for i in range(n):
         if hh[i] is not None and ll[i] is not None and ma[i] is not None:
             midline = ((hh[i] + ll[i]) / 2.0 + ma[i]) / 2.0
             src[i] = closes[i] - midline
-    val = _linreg_series(src, length_kc)
+    val = rolling_linreg(src, length_kc)
 
     return {"val": val, "sqz_on": sqz_on, "sqz_off": sqz_off, "no_sqz": no_sqz}
 
@@ -189,6 +135,7 @@ class SqueezeResult:
         return float(self.value)
 
 
+@cached
 def squeeze_value(symbol=None, bar_size="15 mins", *, length=20, mult=2.0, length_kc=20,
                   mult_kc=1.5, use_true_range=True, ib=None, bars=None, duration=None,
                   use_rth=True, what="TRADES", exchange="SMART", currency="USD",
@@ -205,9 +152,9 @@ def squeeze_value(symbol=None, bar_size="15 mins", *, length=20, mult=2.0, lengt
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
     if len(bars) < 2 * length_kc + length + 2:
         return None
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     res = squeeze_momentum(highs, lows, closes, length, mult, length_kc, mult_kc, use_true_range)
     i = len(bars) - (2 if completed else 1)
     if i < 1:
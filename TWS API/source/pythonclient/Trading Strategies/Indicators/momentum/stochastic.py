@@ -19,7 +19,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
+from ..rolling import rolling_max, rolling_min
 from .rsi import rsi
 
 
@@ -39,10 +42,12 @@ def _sma(values, period):
 def _raw_stoch(highs, lows, closes, period):
     n = len(closes)
     out = [None] * n
+    hhs = rolling_max(highs, period)
+    lls = rolling_min(lows, period)
     for i in range(n):
-        if i >= period - 1:
-            hh = max(highs[i - period + 1:i + 1])
-            ll = min(lows[i - period + 1:i + 1])
+        if hhs[i] is not None:
+            hh = hhs[i]
+            ll = lls[i]
             rng = hh - ll
             out[i] = 100.0 * (closes[i] - ll) / rng if rng else 0.0
     return out
@@ -59,14 +64,15 @@ def stochastic(highs, lows, closes, k_period=14, smooth_k=3, d_period=3):
 def _stoch_of_series(values, period):
     n = len(values)
     out = [None] * n
+    # None wherever the window still holds a None (the RSI warmup)
+    hhs = rolling_max(values, period)
+    lls = rolling_min(values, period)
     for i in range(n):
-        if i >= period - 1:
-            window = [v for v in values[i - period + 1:i + 1] if v is not None]
-            if len(window) == period:
-                hh = max(window)
-                ll = min(window)
-                rng = hh - ll
-                out[i] = 100.0 * (values[i] - ll) / rng if rng else 0.0
+        if hhs[i] is not None:
+            hh = hhs[i]
+            ll = lls[i]
+            rng = hh - ll
+            out[i] = 100.0 * (values[i] - ll) / rng if rng else 0.0
     return out
 
 
@@ -96,6 +102,7 @@ class StochResult:
         return float(self.k)
 
 
+@cached
 def stochastic_value(symbol=None, bar_size="15 mins", *, k_period=14, smooth_k=3, d_period=3,
                      overbought=80.0, oversold=20.0, ib=None, bars=None, duration=None,
                      use_rth=True, what="TRADES", exchange="SMART", currency="USD",
@@ -107,9 +114,9 @@ def stochastic_value(symbol=None, bar_size="15 mins", *, k_period=14, smooth_k=3
             raise ValueError("stochastic_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     k, d = stochastic(highs, lows, closes, k_period, smooth_k, d_period)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or k[i] is None or d[i] is None:
@@ -118,6 +125,7 @@ def stochastic_value(symbol=None, bar_size="15 mins", *, k_period=14, smooth_k=3
                        close=closes[i], time=bars[i].date)
 
 
+@cached
 def stoch_rsi_value(symbol=None, bar_size="15 mins", *, rsi_period=14, stoch_period=14,
                     smooth_k=3, smooth_d=3, overbought=80.0, oversold=20.0, ib=None, bars=None,
                     duration=None, use_rth=True, what="TRADES", exchange="SMART",
@@ -129,7 +137,7 @@ def stoch_rsi_value(symbol=None, bar_size="15 mins", *, rsi_period=14, stoch_per
             raise ValueError("stoch_rsi_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    closes = [b.close for b in bars]
+    closes = column(bars, "close")
     k, d = stoch_rsi(closes, rsi_period, stoch_period, smooth_k, smooth_d)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or k[i] is None or d[i] is None:
@@ -24,6 +24,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 from ..moving_average import ema, sma
 
@@ -61,6 +63,7 @@ class WaveTrendResult:
         return float(self.wt1)
 
 
+@cached
 def wavetrend_value(symbol=None, bar_size="15 mins", *, channel_len=10, average_len=21,
                     overbought=60.0, oversold=-60.0, ib=None, bars=None, duration=None,
                     use_rth=True, what="TRADES", exchange="SMART", currency="USD",
@@ -72,9 +75,9 @@ def wavetrend_value(symbol=None, bar_size="15 mins", *, channel_len=10, average_
             raise ValueError("wavetrend_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    closes = [b.close for b in bars]
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
+    closes = column(bars, "close")
+    highs = column(bars, "high")
+    lows = column(bars, "low")
     wt1, wt2 = wavetrend(highs, lows, closes, channel_len, average_len)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or wt1[i] is None or wt2[i] is None:
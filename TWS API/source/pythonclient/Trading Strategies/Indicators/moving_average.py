@@ -8,6 +8,10 @@ Canonical home for the basic moving-average math used across the indicator libra
     rma(values, period)   Wilder's smoothing (seeded with the SMA of the first `period`),
                           matching TradingView's ta.rma (used by RSI / ATR)
 
+wma / hma / stdev run on the O(n) kernels of ``rolling``, and sma / ema / rma have streaming
+counterparts ``SMAState`` / ``EMAState`` / ``RMAState``, updated in O(1) per new value for
+bots that keep the indicators of a symbol alive between bars.
+
 Plus a config-driven ``ma_value(...)`` that returns the moving average of one symbol/timeframe
 on the last completed bar, with `ma_type` selecting sma | ema | wma | rma | dema, e.g.::
 
@@ -19,9 +23,13 @@ Pure-Python (no numpy/pandas) so it bundles cleanly into a PyInstaller one-file
 from __future__ import annotations
 
 import math
+from collections import deque
 from dataclasses import dataclass
 
+from .bar_series import column
+from .cache import cached
 from .market_data import fetch_bars
+from .rolling import rolling_stdev, rolling_wma
 
 
 def sma(values, period):
@@ -59,18 +67,7 @@ def ema(values, period):
 
 def wma(values, period):
     """Linearly weighted moving average (most recent bar weighted highest)."""
-    period = int(period)
-    out = [None] * len(values)
-    if period <= 0:
-        return out
-    denom = period * (period + 1) / 2.0
-    for i in range(len(values)):
-        if i >= period - 1:
-            s = 0.0
-            for k in range(period):
-                s += values[i - period + 1 + k] * (k + 1)
-            out[i] = s / denom
-    return out
+    return rolling_wma(values, period)
 
 
 def rma(values, period):
@@ -100,36 +97,94 @@ def hma(values, period):
         return out
     half = max(1, period // 2)
     sq = max(1, int(math.isqrt(period)))
-    w_half = wma(values, half)
-    w_full = wma(values, period)
+    w_half = rolling_wma(values, half)
+    w_full = rolling_wma(values, period)
     diff = [None] * n
     for i in range(n):
         if w_half[i] is not None and w_full[i] is not None:
             diff[i] = 2.0 * w_half[i] - w_full[i]
-    denom = sq * (sq + 1) / 2.0
-    for i in range(n):
-        if i >= sq - 1:
-            window = diff[i - sq + 1:i + 1]
-            if all(v is not None for v in window):
-                s = 0.0
-                for k in range(sq):
-                    s += window[k] * (k + 1)
-                out[i] = s / denom
-    return out
+    # None until the sqrt(n) window is past the warmup of diff
+    return rolling_wma(diff, sq)
 
 
 def stdev(values, period):
     """Population standard deviation (divides by period), matching TradingView ta.stdev."""
-    period = int(period)
-    out = [None] * len(values)
-    if period <= 0:
-        return out
-    for i in range(len(values)):
-        if i >= period - 1:
-            window = values[i - period + 1:i + 1]
-            m = sum(window) / period
-            out[i] = (sum((x - m) ** 2 for x in window) / period) ** 0.5
-    return out
+    return rolling_stdev(values, period)
+
+
+# --- streaming state: one update() per new value, O(1) ---------------------------------
+# After feeding values[0..i] the state's `value` equals the batch function's out[i].
+
+class SMAState:
+    """Streaming sma(): `value` is the mean of the last `period` values (None before)."""
+
+    def __init__(self, period):
+        self.period = int(period)
+        self.window = deque()
+        self.run = 0.0
+        self.value = None
+
+    def update(self, v):
+        if self.period <= 0:
+            return None
+        self.run += v
+        self.window.append(v)
+        if len(self.window) > self.period:
+            self.run -= self.window.popleft()
+        if len(self.window) == self.period:
+            self.value = self.run / self.period
+        return self.value
+
+
+class EMAState:
+    """Streaming ema(): alpha = 2/(period+1), seeded at the first value; a None value
+    repeats the previous EMA."""
+
+    def __init__(self, period):
+        self.period = int(period)
+        self.alpha = 2.0 / (self.period + 1.0)
+        self.count = 0
+        self.value = None
+
+    def update(self, v):
+        if self.period < 1:
+            return None
+        prev = self.value
+        if self.count == 0:
+            self.value = v
+        else:
+            if v is None:
+                v = prev
+            self.value = prev + self.alpha * (v - prev)
+        self.count += 1
+        return self.value
+
+
+class RMAState:
+    """Streaming rma(): Wilder smoothing seeded with the SMA of the first `period` values
+    (None before the seed)."""
+
+    def __init__(self, period):
+        self.period = int(period)
+        self.count = 0
+        self.total = 0
+        self.value = None
+
+    def update(self, v):
+        if self.period <= 0:
+            return None
+        self.count += 1
+        if self.count < self.period:
+            self.total += v
+        elif self.count == self.period:
+            self.total += v
+            self.value = self.total / self.period
+        else:
+            prev = self.value
+            if v is None:
+                v = prev
+            self.value = prev + (1.0 / self.period) * (v - prev)
+        return self.value
 
 
 @dataclass
@@ -144,6 +199,7 @@ class MAResult:
         return float(self.value)
 
 
+@cached
 def ma_value(symbol=None, bar_size="15 mins", *, period=20, ma_type="ema", ib=None, bars=None,
              duration=None, use_rth=True, what="TRADES", exchange="SMART", currency="USD",
              throttle=None, completed=True):
@@ -156,7 +212,7 @@ def ma_value(symbol=None, bar_size="15 mins", *, period=20, ma_type="ema", ib=No
             raise ValueError("ma_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    closes = [b.close for b in bars]
+    closes = column(bars, "close")
     t = str(ma_type).lower()
     if t == "sma":
         series = sma(closes, period)
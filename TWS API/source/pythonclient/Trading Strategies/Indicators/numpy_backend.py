@@ -0,0 +1,316 @@
+"""NumPy implementations of the core indicator math — opt-in, for research sweeps.
+
+The same series as the pure-Python functions, computed on float64 arrays:
+
+    sma / ema / rma / dema            moving_average.py, dema.py
+    true_range / atr                  volatility/atr.py
+    supertrend                        trend/supertrend.py
+    adx                               trend/adx.py
+    rsi                               momentum/rsi.py
+    macd                              momentum/macd.py
+    bollinger_bands                   volatility/bollinger_bands.py
+    choppiness                        trend/choppiness.py
+    vwap / obv                        volume/vwap.py, volume/obv.py
+
+Same signatures and tuple shapes as the originals; inputs are any float sequences (lists or
+arrays, without gaps — a None volume counts as 0 as in the originals) and every series is a
+float64 array with NaN where the Python version has None. Supertrend's trend is an int array.
+
+The recursive smoothers (EMA, Wilder's RMA, the ADX sums) are linear recurrences
+y[t] = d*y[t-1] + b*x[t], evaluated blockwise in closed form with a cumulative sum (see
+``_recurrence``). Supertrend's band ratchet depends on its own previous value and the trend
+flip on the bands, so that part stays a scalar loop on top of the vectorised ATR.
+
+Do not import this module directly in bots: select it through ``Indicators.backend`` so
+the package still works (in pure Python) where NumPy is not installed.
+"""
+from __future__ import annotations
+
+import math
+import operator
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _array(values):
+    # a copy unless already a float64 array: a view of a BarSeries array('d') column would
+    # pin its buffer and make the next append() raise BufferError
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    return np.array(values, dtype=np.float64)
+
+
+def _recurrence(x, d, b, y0):
+    """y[t] = d*y[t-1] + b*x[t] for t = 0..len(x)-1, with y[-1] = y0.
+
+    Within a block y[t] = d^(t+1) * (y0 + b * sum_k x[k] / d^(k+1)), a cumulative sum; the
+    block length keeps d^-len below 1e100 so the scaled terms cannot overflow. A NaN in x
+    makes the rest of the output NaN (the ADX smoothing relies on that, as adx.py stops at a
+    None DX)."""
+    n = len(x)
+    y = np.empty(n)
+    if n == 0:
+        return y
+    if d == 0.0:
+        y[:] = b * x
+        nans = np.flatnonzero(np.isnan(x))
+        if len(nans):
+            y[nans[0]:] = np.nan
+        return y
+    block = max(1, min(n, int(100.0 / -math.log10(d))))
+    powers = d ** np.arange(1, block + 1)
+    prev = y0
+    for start in range(0, n, block):
+        chunk = x[start:start + block]
+        m = len(chunk)
+        pw = powers[:m]
+        y[start:start + m] = pw * (prev + b * np.cumsum(chunk / pw))
+        prev = y[start + m - 1]
+    return y
+
+
+def _window_sums(x, period):
+    """out[i] = sum(x[i-period+1..i]) for i >= period-1, from one cumulative sum of the
+    values centred on their mean (keeps the prefix sums small for drifting prices)."""
+    center = x.mean()
+    c = np.concatenate(([0.0], np.cumsum(x - center)))
+    return c[period:] - c[:-period] + period * center
+
+
+# --- moving averages --------------------------------------------------------------------
+
+def sma(values, period):
+    """Simple moving average; NaN before index period-1."""
+    period = int(period)
+    x = _array(values)
+    out = np.full(len(x), np.nan)
+    if period <= 0 or len(x) < period:
+        return out
+    out[period - 1:] = _window_sums(x, period) / period
+    return out
+
+
+def ema(values, period):
+    """EMA, alpha = 2/(period+1), seeded at the first value."""
+    period = int(period)
+    x = _array(values)
+    out = np.full(len(x), np.nan)
+    if len(x) == 0 or period < 1:
+        return out
+    alpha = 2.0 / (period + 1.0)
+    out[0] = x[0]
+    out[1:] = _recurrence(x[1:], 1.0 - alpha, alpha, x[0])
+    return out
+
+
+def rma(values, period):
+    """Wilder's smoothing seeded with the SMA of the first `period` values (ta.rma)."""
+    period = int(period)
+    x = _array(values)
+    out = np.full(len(x), np.nan)
+    if period <= 0 or len(x) < period:
+        return out
+    seed = x[:period].sum() / period
+    out[period - 1] = seed
+    out[period:] = _recurrence(x[period:], 1.0 - 1.0 / period, 1.0 / period, seed)
+    return out
+
+
+def dema(values, period):
+    """DEMA = 2*EMA - EMA(EMA)."""
+    e1 = ema(values, period)
+    return 2.0 * e1 - ema(e1, period)
+
+
+# --- volatility -------------------------------------------------------------------------
+
+def true_range(highs, lows, closes):
+    """True Range (first bar = high - low)."""
+    h, l, c = _array(highs), _array(lows), _array(closes)
+    tr = h - l
+    if len(tr) > 1:
+        pc = c[:-1]
+        tr[1:] = np.maximum(tr[1:], np.maximum(np.abs(h[1:] - pc), np.abs(l[1:] - pc)))
+    return tr
+
+
+def atr(highs, lows, closes, period=14):
+    """Wilder ATR; NaN before index period-1."""
+    return rma(true_range(highs, lows, closes), period)
+
+
+def bollinger_bands(closes, length=20, mult=2.0):
+    """(basis, upper, lower): SMA +/- mult * population stdev."""
+    length = int(length)
+    x = _array(closes)
+    basis = sma(x, length)
+    sd = np.full(len(x), np.nan)
+    if 0 < length <= len(x):
+        sd[length - 1:] = sliding_window_view(x, length).std(axis=1)
+    return basis, basis + mult * sd, basis - mult * sd
+
+
+# --- trend ------------------------------------------------------------------------------
+
+def supertrend(highs, lows, closes, atr_period=10, mult=3.0):
+    """(trend, line) as trend/supertrend.py: trend +1 / -1, line the active band."""
+    h, l, c = _array(highs), _array(lows), _array(closes)
+    n = len(c)
+    if n == 0:
+        return np.ones(0, dtype=int), np.zeros(0)
+    tr = true_range(h, l, c)
+    # Wilder smoothing seeded at the first value (supertrend._rma)
+    a = np.empty(n)
+    a[0] = tr[0]
+    a[1:] = _recurrence(tr[1:], 1.0 - 1.0 / atr_period, 1.0 / atr_period, tr[0])
+    hl2 = (h + l) / 2.0
+    basic_up = (hl2 - mult * a).tolist()
+    basic_dn = (hl2 + mult * a).tolist()
+    cl = c.tolist()
+    trend = [1] * n
+    line = [0.0] * n
+    up = basic_up[0]
+    dn = basic_dn[0]
+    line[0] = up
+    pt = 1
+    for i in range(1, n):
+        pc = cl[i - 1]
+        bu = basic_up[i]
+        bd = basic_dn[i]
+        if bu > up or pc < up:
+            up = bu
+        if bd < dn or pc > dn:
+            dn = bd
+        if pt == -1 and cl[i] > dn:
+            pt = 1
+        elif pt == 1 and cl[i] < up:
+            pt = -1
+        trend[i] = pt
+        line[i] = up if pt == 1 else dn
+    return np.array(trend), np.array(line)
+
+
+def adx(highs, lows, closes, period=14):
+    """(plus_di, minus_di, adx) as trend/adx.py; NaN during warmup."""
+    period = int(period)
+    h, l, c = _array(highs), _array(lows), _array(closes)
+    n = len(c)
+    plus_di = np.full(n, np.nan)
+    minus_di = np.full(n, np.nan)
+    adx_out = np.full(n, np.nan)
+    if period <= 0 or n < period + 1:
+        return plus_di, minus_di, adx_out
+    up = h[1:] - h[:-1]
+    dn = l[:-1] - l[1:]
+    plus_dm = np.where((up > dn) & (up > 0), up, 0.0)
+    minus_dm = np.where((dn > up) & (dn > 0), dn, 0.0)
+    tr = true_range(h, l, c)[1:]
+    d = 1.0 - 1.0 / period
+    # Wilder sums over bars 1..period, then s[i] = s[i-1] - s[i-1]/period + x[i]
+    sums = []
+    for x in (tr, plus_dm, minus_dm):
+        s = np.empty(n - period)
+        s[0] = x[:period].sum()
+        s[1:] = _recurrence(x[period:], d, 1.0, s[0])
+        sums.append(s)
+    (s_tr, s_pdm, s_mdm) = sums
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ok = s_tr != 0
+        pdi = np.where(ok, 100.0 * s_pdm / s_tr, np.nan)
+        mdi = np.where(ok, 100.0 * s_mdm / s_tr, np.nan)
+        denom = pdi + mdi
+        dx = np.where(denom != 0, 100.0 * np.abs(pdi - mdi) / denom, 0.0)
+    dx[~ok] = np.nan
+    plus_di[period:] = pdi
+    minus_di[period:] = mdi
+    first = period * 2 - 1
+    if first < n:
+        seed = dx[:period].sum() / period
+        adx_out[first] = seed
+        adx_out[first + 1:] = _recurrence(dx[period:], (period - 1.0) / period, 1.0 / period, seed)
+    return plus_di, minus_di, adx_out
+
+
+def choppiness(highs, lows, closes, period=14):
+    """Choppiness Index; NaN for the first `period` bars."""
+    period = int(period)
+    h, l, c = _array(highs), _array(lows), _array(closes)
+    n = len(c)
+    out = np.full(n, np.nan)
+    if period <= 1 or n < period + 1:
+        return out
+    sum_tr = _window_sums(true_range(h, l, c), period)[1:]
+    rng = (sliding_window_view(h, period).max(axis=1) - sliding_window_view(l, period).min(axis=1))[1:]
+    ok = (rng > 0) & (sum_tr > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[period:] = np.where(ok, 100.0 * np.log10(sum_tr / rng) / math.log10(period), np.nan)
+    return out
+
+
+# --- momentum ---------------------------------------------------------------------------
+
+def rsi(closes, period=14):
+    """Wilder RSI; NaN for the first `period` bars."""
+    period = int(period)
+    x = _array(closes)
+    n = len(x)
+    out = np.full(n, np.nan)
+    if period <= 0 or n < period + 1:
+        return out
+    ch = np.diff(x)
+    gains = np.maximum(ch, 0.0)
+    losses = np.maximum(-ch, 0.0)
+    alpha = 1.0 / period
+    ag = np.empty(n - period)
+    al = np.empty(n - period)
+    ag[0] = gains[:period].sum() / period
+    al[0] = losses[:period].sum() / period
+    ag[1:] = _recurrence(gains[period:], 1.0 - alpha, alpha, ag[0])
+    al[1:] = _recurrence(losses[period:], 1.0 - alpha, alpha, al[0])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # flat or only-gains window: 100 if there were gains, else 50 (rsi._to_rsi)
+        out[period:] = np.where(al == 0, np.where(ag > 0, 100.0, 50.0), 100.0 - 100.0 / (1.0 + ag / al))
+    return out
+
+
+def macd(closes, fast=12, slow=26, signal=9):
+    """(macd_line, signal_line, histogram)."""
+    macd_line = ema(closes, fast) - ema(closes, slow)
+    signal_line = ema(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+# --- volume -----------------------------------------------------------------------------
+
+def vwap(highs, lows, closes, volumes, session_ids=None):
+    """VWAP, cumulated per session when `session_ids` is given (reset when it changes)."""
+    h, l, c = _array(highs), _array(lows), _array(closes)
+    n = len(c)
+    tp = (h + l + c) / 3.0
+    if n == 0:
+        return tp
+    v = np.nan_to_num(_array(volumes))
+    cum_pv = np.cumsum(tp * v)
+    cum_v = np.cumsum(v)
+    if session_ids is not None:
+        # the ids are arbitrary objects (calendar days): compare them pairwise in C via map
+        sids = list(session_ids)
+        is_start = np.ones(n, dtype=bool)
+        is_start[1:] = np.fromiter(map(operator.ne, sids[1:], sids), dtype=bool, count=n - 1)
+        # the sums cumulated before the first bar of each bar's session
+        before = np.flatnonzero(is_start)[np.cumsum(is_start) - 1] - 1
+        cum_pv = cum_pv - np.where(before >= 0, cum_pv[before], 0.0)
+        cum_v = cum_v - np.where(before >= 0, cum_v[before], 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(cum_v != 0, cum_pv / cum_v, tp)
+
+
+def obv(closes, volumes):
+    """On-balance volume; out[0] = 0."""
+    c = _array(closes)
+    out = np.zeros(len(c))
+    if len(c) > 1:
+        v = np.nan_to_num(_array(volumes))
+        out[1:] = np.cumsum(np.sign(np.diff(c)) * v[1:])
+    return out
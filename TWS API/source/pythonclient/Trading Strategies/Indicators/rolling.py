@@ -0,0 +1,297 @@
+"""Rolling window kernels — shared, reusable by any indicator.
+
+The per-bar statistics of the last `period` values, in O(n) total regardless of the window
+length, instead of re-reducing a ``values[i-period+1:i+1]`` slice per bar:
+
+    rolling_max(values, period)      highest   (TradingView ta.highest)
+    rolling_min(values, period)      lowest    (ta.lowest)
+    rolling_sum(values, period)      sum       (math.sum)
+    rolling_mean(values, period)     mean      (ta.sma)
+    rolling_stdev(values, period)    population standard deviation (ta.stdev)
+    rolling_wma(values, period)      linearly weighted mean, newest weighted highest (ta.wma)
+    rolling_linreg(values, period)   least-squares line at the newest value (ta.linreg(src, len, 0))
+
+out[i] is None before the window is full and while it contains a None (e.g. the warmup of
+an indicator series the statistic is taken of). ``RollingMax`` / ``RollingMin`` are the
+streaming counterparts of the extremes, one ``update(value)`` per new bar.
+
+The extremes keep a monotonic deque of the window's candidates: a value that is beaten by a
+newer one can never be the extreme again, so it is dropped, and the front of the deque is
+always the extreme of the window. Every value enters and leaves the deque once.
+
+The other statistics slide running sums (Welford's update for the variance, sum(y) and
+sum(x*y) for the regression line and the WMA numerator) by the value entering and the one
+leaving the window. The sums are rebuilt from the window every `period` bars, which keeps the
+rounding drift of a long series bounded at O(1) amortised cost.
+
+Pure-Python (no numpy/pandas) so it bundles cleanly into a PyInstaller one-file exe.
+"""
+from __future__ import annotations
+
+from collections import deque
+
+
+def rolling_max(values, period):
+    """Highest of the last `period` values per index; None while the window is incomplete or
+    holds a None."""
+    period = int(period)
+    n = len(values)
+    out = [None] * n
+    if period <= 0:
+        return out
+    window = deque()        # indices, values[] decreasing
+    last_none = -1
+    for i in range(n):
+        v = values[i]
+        if v is None:
+            last_none = i
+        else:
+            while window and values[window[-1]] <= v:
+                window.pop()
+            window.append(i)
+        start = i - period + 1
+        if window and window[0] < start:
+            window.popleft()
+        if start >= 0 and last_none < start:
+            out[i] = values[window[0]]
+    return out
+
+
+def rolling_min(values, period):
+    """Lowest of the last `period` values per index; None while the window is incomplete or
+    holds a None."""
+    period = int(period)
+    n = len(values)
+    out = [None] * n
+    if period <= 0:
+        return out
+    window = deque()        # indices, values[] increasing
+    last_none = -1
+    for i in range(n):
+        v = values[i]
+        if v is None:
+            last_none = i
+        else:
+            while window and values[window[-1]] >= v:
+                window.pop()
+            window.append(i)
+        start = i - period + 1
+        if window and window[0] < start:
+            window.popleft()
+        if start >= 0 and last_none < start:
+            out[i] = values[window[0]]
+    return out
+
+
+class RollingMax:
+    """Streaming rolling_max(): `value` is the highest of the last `period` updates."""
+
+    def __init__(self, period):
+        self.period = int(period)
+        self.count = 0
+        self.window = deque()   # (index, value), values decreasing
+        self.last_none = -1
+        self.value = None
+
+    def update(self, v):
+        i = self.count
+        self.count += 1
+        window = self.window
+        if v is None:
+            self.last_none = i
+        else:
+            while window and window[-1][1] <= v:
+                window.pop()
+            window.append((i, v))
+        start = i - self.period + 1
+        if window and window[0][0] < start:
+            window.popleft()
+        if self.period > 0 and start >= 0 and self.last_none < start:
+            self.value = window[0][1]
+        else:
+            self.value = None
+        return self.value
+
+
+class RollingMin:
+    """Streaming rolling_min(): `value` is the lowest of the last `period` updates."""
+
+    def __init__(self, period):
+        self.period = int(period)
+        self.count = 0
+        self.window = deque()   # (index, value), values increasing
+        self.last_none = -1
+        self.value = None
+
+    def update(self, v):
+        i = self.count
+        self.count += 1
+        window = self.window
+        if v is None:
+            self.last_none = i
+        else:
+            while window and window[-1][1] >= v:
+                window.pop()
+            window.append((i, v))
+        start = i - self.period + 1
+        if window and window[0][0] < start:
+            window.popleft()
+        if self.period > 0 and start >= 0 and self.last_none < start:
+            self.value = window[0][1]
+        else:
+            self.value = None
+        return self.value
+
+
+# --- running-sum statistics -------------------------------------------------------------
+# Each loop slides its sums while the window is clean, and rebuilds them from the window when
+# it becomes clean again after a None and every `period` bars after that (`fresh` counts down).
+
+def rolling_sum(values, period):
+    """Sum of the last `period` values per index; None while the window is incomplete or holds
+    a None."""
+    period = int(period)
+    n = len(values)
+    out = [None] * n
+    if period <= 0:
+        return out
+    last_none = -1
+    fresh = 0
+    total = 0.0
+    for i in range(n):
+        v = values[i]
+        if v is None:
+            last_none = i
+        start = i - period + 1
+        if start < 0 or last_none >= start:
+            fresh = 0
+            continue
+        if fresh == 0:
+            total = sum(values[start:i + 1])
+            fresh = period
+        else:
+            total += v - values[start - 1]
+        fresh -= 1
+        out[i] = total
+    return out
+
+
+def rolling_mean(values, period):
+    """Mean of the last `period` values per index; None while the window is incomplete or
+    holds a None."""
+    period = int(period)
+    return [None if s is None else s / period for s in rolling_sum(values, period)]
+
+
+def rolling_stdev(values, period):
+    """Population standard deviation (divides by period) of the last `period` values per
+    index, matching TradingView ta.stdev; None while the window is incomplete or holds a None."""
+    period = int(period)
+    n = len(values)
+    out = [None] * n
+    if period <= 0:
+        return out
+    last_none = -1
+    fresh = 0
+    mean = m2 = 0.0
+    for i in range(n):
+        v = values[i]
+        if v is None:
+            last_none = i
+        start = i - period + 1
+        if start < 0 or last_none >= start:
+            fresh = 0
+            continue
+        if fresh == 0:
+            window = values[start:i + 1]
+            mean = sum(window) / period
+            m2 = sum((x - mean) ** 2 for x in window)
+            fresh = period
+        else:
+            # Welford, one value in and one out: M2 += (new - old) * (new - mean' + old - mean)
+            old = values[start - 1]
+            new_mean = mean + (v - old) / period
+            m2 += (v - old) * (v - new_mean + old - mean)
+            mean = new_mean
+        fresh -= 1
+        out[i] = (m2 / period) ** 0.5 if m2 > 0.0 else 0.0
+    return out
+
+
+def rolling_wma(values, period):
+    """Linearly weighted mean of the last `period` values per index (the newest weighted
+    `period`, the oldest 1); None while the window is incomplete or holds a None."""
+    period = int(period)
+    n = len(values)
+    out = [None] * n
+    if period <= 0:
+        return out
+    denom = period * (period + 1) / 2.0
+    last_none = -1
+    fresh = 0
+    total = num = 0.0
+    for i in range(n):
+        v = values[i]
+        if v is None:
+            last_none = i
+        start = i - period + 1
+        if start < 0 or last_none >= start:
+            fresh = 0
+            continue
+        if fresh == 0:
+            total = num = 0.0
+            for k in range(period):
+                y = values[start + k]
+                total += y
+                num += y * (k + 1)
+            fresh = period
+        else:
+            # every weight drops by one (-sum of the old window), the new value gets `period`
+            num += period * v - total
+            total += v - values[start - 1]
+        fresh -= 1
+        out[i] = num / denom
+    return out
+
+
+def rolling_linreg(values, period):
+    """Value of the least-squares line through the last `period` values at the newest one
+    (x = 0..period-1, oldest first), i.e. Pine's linreg(src, len, 0) / the LSMA endpoint;
+    None while the window is incomplete or holds a None."""
+    period = int(period)
+    n = len(values)
+    out = [None] * n
+    if period <= 0:
+        return out
+    sum_x = period * (period - 1) / 2.0
+    sum_xx = (period - 1) * period * (2 * period - 1) / 6.0
+    denom = period * sum_xx - sum_x * sum_x
+    last_none = -1
+    fresh = 0
+    sum_y = sum_xy = 0.0
+    for i in range(n):
+        v = values[i]
+        if v is None:
+            last_none = i
+        start = i - period + 1
+        if start < 0 or last_none >= start:
+            fresh = 0
+            continue
+        if fresh == 0:
+            sum_y = sum_xy = 0.0
+            for x in range(period):
+                y = values[start + x]
+                sum_y += y
+                sum_xy += x * y
+            fresh = period
+        else:
+            # every x drops by one (-sum_y of the rest), the new value enters at x = period-1
+            old = values[start - 1]
+            sum_xy += (period - 1) * v - (sum_y - old)
+            sum_y += v - old
+        fresh -= 1
+        slope = (period * sum_xy - sum_x * sum_y) / denom if denom else 0.0
+        intercept = (sum_y - slope * sum_x) / period
+        out[i] = intercept + slope * (period - 1)
+    return out
+
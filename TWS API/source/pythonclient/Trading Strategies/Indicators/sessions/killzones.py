@@ -25,6 +25,7 @@ from dataclasses import dataclass
 from datetime import time
 from zoneinfo import ZoneInfo
 
+from ..cache import cached
 from ..market_data import fetch_bars
 
 ET = ZoneInfo("America/New_York")
@@ -72,6 +73,7 @@ class KillzoneResult:
         return self.active
 
 
+@cached
 def killzone_value(symbol=None, bar_size="15 mins", *, zones=None, ib=None, bars=None,
                    duration=None, use_rth=False, what="TRADES", exchange="SMART",
                    currency="USD", throttle=None, completed=True):
@@ -20,6 +20,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 
 
@@ -63,6 +65,7 @@ class FVGResult:
         return float((self.top + self.bottom) / 2.0)
 
 
+@cached
 def fvg_value(symbol=None, bar_size="15 mins", *, only_unfilled=True, ib=None, bars=None,
               duration=None, use_rth=True, what="TRADES", exchange="SMART", currency="USD",
               throttle=None, completed=True):
@@ -74,9 +77,9 @@ def fvg_value(symbol=None, bar_size="15 mins", *, only_unfilled=True, ib=None, b
             raise ValueError("fvg_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     e = len(bars) - (2 if completed else 1)
     if e < 2:
         return None
@@ -21,6 +21,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 from .pivots import pivot_highs, pivot_lows
 
@@ -76,6 +78,7 @@ class MarketStructureResult:
     time: object = None
 
 
+@cached
 def market_structure_value(symbol=None, bar_size="15 mins", *, left=5, right=5, ib=None,
                            bars=None, duration=None, use_rth=True, what="TRADES",
                            exchange="SMART", currency="USD", throttle=None, completed=True):
@@ -86,9 +89,9 @@ def market_structure_value(symbol=None, bar_size="15 mins", *, left=5, right=5,
             raise ValueError("market_structure_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     events = market_structure(highs, lows, closes, left, right)
     e = len(bars) - (2 if completed else 1)
     if e < 1:
@@ -23,6 +23,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 from .market_structure import market_structure
 
@@ -69,6 +71,7 @@ class OrderBlockResult:
         return float((self.top + self.bottom) / 2.0)
 
 
+@cached
 def order_block_value(symbol=None, bar_size="15 mins", *, left=5, right=5, only_unmitigated=True,
                       ib=None, bars=None, duration=None, use_rth=True, what="TRADES",
                       exchange="SMART", currency="USD", throttle=None, completed=True):
@@ -80,10 +83,10 @@ def order_block_value(symbol=None, bar_size="15 mins", *, left=5, right=5, only_
             raise ValueError("order_block_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    opens = [b.open for b in bars]
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    opens = column(bars, "open")
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     e = len(bars) - (2 if completed else 1)
     if e < 1:
         return None
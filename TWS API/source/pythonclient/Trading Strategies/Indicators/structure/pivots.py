@@ -20,6 +20,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 
 
@@ -63,6 +65,7 @@ class PivotsResult:
     time: object = None
 
 
+@cached
 def pivots_value(symbol=None, bar_size="15 mins", *, left=5, right=5, ib=None, bars=None,
                  duration=None, use_rth=True, what="TRADES", exchange="SMART", currency="USD",
                  throttle=None, completed=True):
@@ -73,9 +76,9 @@ def pivots_value(symbol=None, bar_size="15 mins", *, left=5, right=5, ib=None, b
             raise ValueError("pivots_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     ph = pivot_highs(highs, left, right)
     pl = pivot_lows(lows, left, right)
     e = len(bars) - (2 if completed else 1)
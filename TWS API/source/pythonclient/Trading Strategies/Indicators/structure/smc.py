@@ -29,7 +29,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
+from ..rolling import rolling_max, rolling_min
 from ..volatility.atr import atr, true_range
 
 BULLISH = 1
@@ -53,10 +56,12 @@ def _leg(highs, lows, size):
     n = len(highs)
     out = [0] * n
     cur = 0
+    hhs = rolling_max(highs, size)   # ta.highest(size)
+    lls = rolling_min(lows, size)    # ta.lowest(size)
     for i in range(n):
         if i >= size:
-            hh = max(highs[i - size + 1:i + 1])  # ta.highest(size)
-            ll = min(lows[i - size + 1:i + 1])   # ta.lowest(size)
+            hh = hhs[i]
+            ll = lls[i]
             if highs[i - size] > hh:             # high[size] > highest -> new bearish leg
                 cur = 0
             elif lows[i - size] < ll:            # low[size]  < lowest  -> new bullish leg
@@ -470,6 +475,7 @@ def smc(opens, highs, lows, closes, times, *, swing_length=50, internal_length=5
     )
 
 
+@cached
 def smc_value(symbol=None, bar_size="15 mins", *, swing_length=50, internal_length=5,
               equal_length=3, equal_threshold=0.1, order_block_filter="atr",
               order_block_mitigation="highlow", internal_ob_size=5, swing_ob_size=5,
@@ -487,11 +493,11 @@ def smc_value(symbol=None, bar_size="15 mins", *, swing_length=50, internal_leng
     if e < 1:
         return None
     sub = bars[:e + 1]
-    opens = [b.open for b in sub]
-    highs = [b.high for b in sub]
-    lows = [b.low for b in sub]
-    closes = [b.close for b in sub]
-    times = [b.date for b in sub]
+    opens = column(sub, "open")
+    highs = column(sub, "high")
+    lows = column(sub, "low")
+    closes = column(sub, "close")
+    times = column(sub, "date")
     return smc(opens, highs, lows, closes, times, swing_length=swing_length,
                internal_length=internal_length, equal_length=equal_length,
                equal_threshold=equal_threshold, order_block_filter=order_block_filter,
@@ -21,6 +21,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 from .pivots import pivot_highs, pivot_lows
 
@@ -47,6 +49,7 @@ class SRResult:
     time: object = None
 
 
+@cached
 def support_resistance_value(symbol=None, bar_size="15 mins", *, left=5, right=5, ib=None,
                              bars=None, duration=None, use_rth=True, what="TRADES",
                              exchange="SMART", currency="USD", throttle=None, completed=True):
@@ -57,9 +60,9 @@ def support_resistance_value(symbol=None, bar_size="15 mins", *, left=5, right=5
             raise ValueError("support_resistance_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     supports, resistances = support_resistance(highs, lows, closes, left, right)
     e = len(bars) - (2 if completed else 1)
     if e < 1 or not supports or not resistances:
@@ -5,17 +5,20 @@
     Parabolic SAR  trailing stop / reversal dots
     HalfTrend      low-lag stair-step trend line
     Ichimoku       multi-line cloud system
+    Choppiness     trending vs range-bound (CHOP)
 """
-from .adx import ADXResult, adx, adx_value
+from .adx import ADXResult, ADXState, adx, adx_value
+from .choppiness import CHOPResult, ChopState, choppiness, choppiness_value
 from .halftrend import HalfTrendResult, halftrend, halftrend_value
 from .ichimoku import IchimokuResult, ichimoku, ichimoku_value
 from .parabolic_sar import SARResult, parabolic_sar, parabolic_sar_value
-from .supertrend import SupertrendResult, supertrend, supertrend_value
+from .supertrend import SupertrendResult, SupertrendState, supertrend, supertrend_value
 
 __all__ = [
-    "ADXResult", "adx", "adx_value",
+    "ADXResult", "ADXState", "adx", "adx_value",
+    "CHOPResult", "ChopState", "choppiness", "choppiness_value",
     "HalfTrendResult", "halftrend", "halftrend_value",
     "IchimokuResult", "ichimoku", "ichimoku_value",
     "SARResult", "parabolic_sar", "parabolic_sar_value",
-    "SupertrendResult", "supertrend", "supertrend_value",
+    "SupertrendResult", "SupertrendState", "supertrend", "supertrend_value",
 ]
@@ -9,10 +9,12 @@ Measures trend STRENGTH (ADX) and DIRECTION (+DI vs -DI):
 Rule of thumb: ADX >= 25 is a trending market, < 20 is choppy/range-bound; +DI > -DI is
 bullish direction. Matches the classic Wilder implementation.
 
-Two layers:
+Three layers:
 
 1. Pure math: ``adx(highs, lows, closes, period)`` -> (plus_di, minus_di, adx) lists.
 2. Config-driven value: ``adx_value(...)`` -> ADXResult on the last completed bar.
+3. Streaming state: ``ADXState(period)`` -> ``update(bar)`` per new completed bar in O(1),
+   ``result()`` is what adx_value returns for that bar.
 
 Pure-Python (no numpy/pandas) so it bundles cleanly into a PyInstaller one-file exe.
 """
@@ -20,6 +22,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 
 
@@ -90,6 +94,91 @@ class ADXResult:
         return float(self.value)
 
 
+class ADXState:
+    """Streaming adx(): after update(bars[i]) `plus_di`/`minus_di`/`value` equal
+    plus_di[i]/minus_di[i]/adx[i] of adx() over bars[0..i]."""
+
+    def __init__(self, period=14):
+        self.period = int(period)
+        self.count = 0
+        self.s_tr = 0.0
+        self.s_pdm = 0.0
+        self.s_mdm = 0.0
+        self.dx_seed = []
+        self.plus_di = None
+        self.minus_di = None
+        self.value = None
+        self.broken = False     # adx() stays None for good once a DX is missing
+        self.bar = None
+
+    def seed(self, bars):
+        for bar in bars:
+            self.update(bar)
+        return self
+
+    def update(self, bar):
+        period = self.period
+        i = self.count
+        self.count += 1
+        prev, self.bar = self.bar, bar
+        if period <= 0 or i == 0:
+            return None
+        up = bar.high - prev.high
+        dn = prev.low - bar.low
+        plus_dm = up if (up > dn and up > 0) else 0.0
+        minus_dm = dn if (dn > up and dn > 0) else 0.0
+        tr = max(bar.high - bar.low, abs(bar.high - prev.close), abs(bar.low - prev.close))
+        if i <= period:
+            # seed sums over bars 1..period, summed in order as sum() does
+            self.s_tr += tr
+            self.s_pdm += plus_dm
+            self.s_mdm += minus_dm
+            if i < period:
+                return None
+        else:
+            self.s_tr = self.s_tr - self.s_tr / period + tr
+            self.s_pdm = self.s_pdm - self.s_pdm / period + plus_dm
+            self.s_mdm = self.s_mdm - self.s_mdm / period + minus_dm
+
+        dx = None
+        self.plus_di = self.minus_di = None
+        rng = self.s_tr
+        if rng:
+            pdi = 100.0 * self.s_pdm / rng
+            mdi = 100.0 * self.s_mdm / rng
+            self.plus_di = pdi
+            self.minus_di = mdi
+            denom = pdi + mdi
+            dx = 100.0 * abs(pdi - mdi) / denom if denom else 0.0
+
+        first = period * 2 - 1
+        if i < first:
+            if dx is not None:
+                self.dx_seed.append(dx)
+        elif i == first:
+            if dx is not None:
+                self.dx_seed.append(dx)
+            if len(self.dx_seed) == period:
+                self.value = sum(self.dx_seed) / period
+            else:
+                self.broken = True
+        elif self.broken or dx is None or self.value is None:
+            self.value = None
+            self.broken = True
+        else:
+            self.value = (self.value * (period - 1) + dx) / period
+        return self.value
+
+    def result(self, trend_level=25.0):
+        """ADXResult on the last updated bar, or None (as adx_value)."""
+        if self.count < 2 or self.value is None or self.plus_di is None:
+            return None
+        return ADXResult(value=self.value, plus_di=self.plus_di, minus_di=self.minus_di,
+                         bull=self.plus_di > self.minus_di, trending=self.value >= trend_level,
+                         close=self.bar.close, time=self.bar.date)
+
+
+@cached
 def adx_value(symbol=None, bar_size="15 mins", *, period=14, trend_level=25.0, ib=None,
               bars=None, duration=None, use_rth=True, what="TRADES", exchange="SMART",
               currency="USD", throttle=None, completed=True):
@@ -100,9 +189,9 @@ def adx_value(symbol=None, bar_size="15 mins", *, period=14, trend_level=25.0, i
             raise ValueError("adx_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     pdi, mdi, ax = adx(highs, lows, closes, period)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or i >= len(ax) or ax[i] is None or pdi[i] is None:
@@ -10,19 +10,26 @@ Rule of thumb: CHOP >= ~61.8 = choppy / range-bound (sideways), CHOP <= ~38.2 =
 STRENGTH, CHOP gives range-vs-directional — together they gate a trend-follower to only trade
 when the tape is actually trending.
 
-Two layers (same pattern as the other indicators):
+Three layers (same pattern as the other indicators):
 
 1. Pure math: ``choppiness(highs, lows, closes, period)`` -> list aligned to inputs (None warmup).
 2. Config-driven value: ``choppiness_value(...)`` -> CHOPResult on the last completed bar.
+3. Streaming state: ``ChopState(period)`` -> ``update(bar)`` per new completed bar in O(1)
+   (running TR sum, rolling extremes), ``result()`` is what choppiness_value returns for
+   that bar.
 
 Pure-Python (no numpy/pandas) so it bundles cleanly into a PyInstaller one-file exe.
 """
 from __future__ import annotations
 
 import math
+from collections import deque
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
+from ..rolling import RollingMax, RollingMin, rolling_max, rolling_min, rolling_sum
 
 
 def _true_range(highs, lows, closes):
@@ -41,11 +48,12 @@ def choppiness(highs, lows, closes, period=14):
         return out
     tr = _true_range(highs, lows, closes)
     ln = math.log10(period)
+    sums = rolling_sum(tr, period)
+    his = rolling_max(highs, period)
+    los = rolling_min(lows, period)
     for i in range(period, n):
-        sum_tr = sum(tr[i - period + 1:i + 1])
-        hi = max(highs[i - period + 1:i + 1])
-        lo = min(lows[i - period + 1:i + 1])
-        rng = hi - lo
+        sum_tr = sums[i]
+        rng = his[i] - los[i]
         if rng > 0 and sum_tr > 0:
             out[i] = 100.0 * math.log10(sum_tr / rng) / ln
     return out
@@ -63,6 +71,60 @@ class CHOPResult:
         return float(self.value)
 
 
+class ChopState:
+    """Streaming choppiness(): after update(bars[i]) `value` equals choppiness()[i] (up to
+    float rounding of the running TR sum)."""
+
+    def __init__(self, period=14):
+        self.period = int(period)
+        self.ln = math.log10(self.period) if self.period > 1 else None
+        self.count = 0
+        self.trs = deque()
+        self.highest = RollingMax(self.period)
+        self.lowest = RollingMin(self.period)
+        self.sum_tr = 0.0
+        self.value = None
+        self.bar = None
+
+    def seed(self, bars):
+        for bar in bars:
+            self.update(bar)
+        return self
+
+    def update(self, bar):
+        period = self.period
+        prev, self.bar = self.bar, bar
+        self.count += 1
+        if period <= 1:
+            return None
+        if prev is None:
+            tr = bar.high - bar.low
+        else:
+            tr = max(bar.high - bar.low, abs(bar.high - prev.close), abs(bar.low - prev.close))
+        self.trs.append(tr)
+        hi = self.highest.update(bar.high)
+        lo = self.lowest.update(bar.low)
+        self.sum_tr += tr
+        if len(self.trs) > period:
+            self.sum_tr -= self.trs.popleft()
+        self.value = None
+        # the first value is on bar `period` (the window then skips the first bar's TR)
+        if self.count > period:
+            rng = hi - lo
+            if rng > 0 and self.sum_tr > 0:
+                self.value = 100.0 * math.log10(self.sum_tr / rng) / self.ln
+        return self.value
+
+    def result(self, trend_level=38.2, range_level=61.8):
+        """CHOPResult on the last updated bar, or None (as choppiness_value)."""
+        if self.count < 2 or self.value is None:
+            return None
+        return CHOPResult(value=self.value, choppy=self.value >= range_level,
+                          trending=self.value <= trend_level, close=self.bar.close,
+                          time=self.bar.date)
+
+
+@cached
 def choppiness_value(symbol=None, bar_size="15 mins", *, period=14, trend_level=38.2,
                      range_level=61.8, ib=None, bars=None, duration=None, use_rth=True,
                      what="TRADES", exchange="SMART", currency="USD", throttle=None,
@@ -74,9 +136,9 @@ def choppiness_value(symbol=None, bar_size="15 mins", *, period=14, trend_level=
             raise ValueError("choppiness_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     series = choppiness(highs, lows, closes, period)
     i = len(bars) - (2 if completed else 1)
     if i < 1:
@@ -21,6 +21,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 
 
@@ -102,6 +104,7 @@ class HalfTrendResult:
         return float(self.value)
 
 
+@cached
 def halftrend_value(symbol=None, bar_size="15 mins", *, amplitude=2, ib=None, bars=None,
                     duration=None, use_rth=True, what="TRADES", exchange="SMART",
                     currency="USD", throttle=None, completed=True):
@@ -114,9 +117,9 @@ def halftrend_value(symbol=None, bar_size="15 mins", *, amplitude=2, ib=None, ba
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
     if len(bars) < amplitude + 2:
         return None
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     line, trend = halftrend(highs, lows, closes, amplitude)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or line[i] is None:
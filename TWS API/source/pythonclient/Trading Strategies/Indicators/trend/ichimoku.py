@@ -22,17 +22,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
+from ..rolling import rolling_max, rolling_min
 
 
 def _midpoint(highs, lows, period):
     n = len(highs)
     out = [None] * n
+    hhs = rolling_max(highs, period)
+    lls = rolling_min(lows, period)
     for i in range(n):
-        if i >= period - 1:
-            hh = max(highs[i - period + 1:i + 1])
-            ll = min(lows[i - period + 1:i + 1])
-            out[i] = (hh + ll) / 2.0
+        if hhs[i] is not None:
+            out[i] = (hhs[i] + lls[i]) / 2.0
     return out
 
 
@@ -73,6 +76,7 @@ class IchimokuResult:
         return float(self.kijun)
 
 
+@cached
 def ichimoku_value(symbol=None, bar_size="15 mins", *, conversion=9, base=26, span_b=52,
                    displacement=26, ib=None, bars=None, duration=None, use_rth=True,
                    what="TRADES", exchange="SMART", currency="USD", throttle=None, completed=True):
@@ -83,9 +87,9 @@ def ichimoku_value(symbol=None, bar_size="15 mins", *, conversion=9, base=26, sp
             raise ValueError("ichimoku_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     d = ichimoku(highs, lows, closes, conversion, base, span_b, displacement)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or d["tenkan"][i] is None or d["kijun"][i] is None:
@@ -18,6 +18,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 
 
@@ -77,6 +79,7 @@ class SARResult:
         return float(self.value)
 
 
+@cached
 def parabolic_sar_value(symbol=None, bar_size="15 mins", *, step=0.02, max_step=0.2, ib=None,
                         bars=None, duration=None, use_rth=True, what="TRADES", exchange="SMART",
                         currency="USD", throttle=None, completed=True):
@@ -89,9 +92,9 @@ def parabolic_sar_value(symbol=None, bar_size="15 mins", *, step=0.02, max_step=
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
     if len(bars) < 3:
         return None
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     sar, bull = parabolic_sar(highs, lows, step, max_step)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or sar[i] is None:
@@ -1,6 +1,6 @@
 """Supertrend indicator — shared, reusable by any strategy.
 
-Two layers:
+Three layers:
 
 1. Pure math: ``supertrend(highs, lows, closes, atr_period, mult)`` -> (trend, line).
    trend[i] = +1 bullish / -1 bearish; line[i] = the active Supertrend value (lower band in
@@ -17,12 +17,18 @@ Two layers:
        res.bull    # True if bullish
        float(res)  # also the line value
 
+3. Streaming state: ``SupertrendState(atr_period, multiplier)`` — seed once with the
+   history, then ``update(bar)`` per new completed bar in O(1); ``result()`` is what
+   supertrend_value returns for that bar (no re-computation over the whole history).
+
 Pure-Python (no numpy/pandas) so it bundles cleanly into a PyInstaller one-file exe.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 
 
@@ -96,6 +102,70 @@ class SupertrendResult:
         return float(self.value)
 
 
+class SupertrendState:
+    """Streaming supertrend(): after update(bars[i]) `trend`/`line` equal trend[i]/line[i]
+    of supertrend() over bars[0..i]."""
+
+    def __init__(self, atr_period=10, multiplier=3.0):
+        self.atr_period = atr_period
+        self.mult = multiplier
+        self.count = 0
+        self.atr = None
+        self.up_band = 0.0
+        self.dn_band = 0.0
+        self.trend = 1
+        self.prev_trend = 1
+        self.line = 0.0
+        self.bar = None
+
+    def seed(self, bars):
+        for bar in bars:
+            self.update(bar)
+        return self
+
+    def update(self, bar):
+        high, low, close = bar.high, bar.low, bar.close
+        if self.count == 0:
+            tr = high - low
+            self.atr = tr
+        else:
+            pc = self.bar.close
+            tr = max(high - low, abs(high - pc), abs(low - pc))
+            self.atr = self.atr + (1.0 / self.atr_period) * (tr - self.atr)
+        hl2 = (high + low) / 2.0
+        basic_up = hl2 - self.mult * (self.atr or 0.0)
+        basic_dn = hl2 + self.mult * (self.atr or 0.0)
+        if self.count == 0:
+            self.up_band = basic_up
+            self.dn_band = basic_dn
+            self.trend = 1
+            self.line = basic_up
+        else:
+            pc = self.bar.close
+            up_band, dn_band = self.up_band, self.dn_band
+            self.up_band = basic_up if (basic_up > up_band or pc < up_band) else up_band
+            self.dn_band = basic_dn if (basic_dn < dn_band or pc > dn_band) else dn_band
+            pt = self.trend
+            self.prev_trend = pt
+            if pt == -1 and close > self.dn_band:
+                self.trend = 1
+            elif pt == 1 and close < self.up_band:
+                self.trend = -1
+            self.line = self.up_band if self.trend == 1 else self.dn_band
+        self.count += 1
+        self.bar = bar
+        return self.line
+
+    def result(self):
+        """SupertrendResult on the last updated bar, or None (as supertrend_value)."""
+        if self.count < self.atr_period + 2:
+            return None
+        return SupertrendResult(value=self.line, trend=self.trend, bull=self.trend == 1,
+                                prev_bull=self.prev_trend == 1, close=self.bar.close,
+                                time=self.bar.date)
+
+
+@cached
 def supertrend_value(symbol=None, bar_size="15 mins", *, atr_period=10, multiplier=3.0,
                      ib=None, bars=None, duration=None, use_rth=True, what="TRADES",
                      exchange="SMART", currency="USD", throttle=None, completed=True):
@@ -112,9 +182,9 @@ def supertrend_value(symbol=None, bar_size="15 mins", *, atr_period=10, multipli
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
     if len(bars) < atr_period + 3:
         return None
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     trend, line = supertrend(highs, lows, closes, atr_period, multiplier)
     i = len(bars) - (2 if completed else 1)
     if i < 1:
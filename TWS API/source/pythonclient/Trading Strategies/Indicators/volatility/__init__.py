@@ -6,14 +6,14 @@
     Donchian Channels  highest-high / lowest-low channel (breakout basis)
     Williams Vix Fix   synthetic VIX from price (capitulation / bottom finder)
 """
-from .atr import ATRResult, atr, atr_value, true_range
+from .atr import ATRResult, ATRState, atr, atr_value, true_range
 from .bollinger_bands import BollingerResult, bollinger_bands, bollinger_value
 from .donchian_channels import DonchianResult, donchian_channels, donchian_value
 from .keltner_channels import KeltnerResult, keltner_channels, keltner_value
 from .williams_vix_fix import WVFResult, williams_vix_fix, williams_vix_fix_value
 
 __all__ = [
-    "ATRResult", "atr", "atr_value", "true_range",
+    "ATRResult", "ATRState", "atr", "atr_value", "true_range",
     "BollingerResult", "bollinger_bands", "bollinger_value",
     "DonchianResult", "donchian_channels", "donchian_value",
     "KeltnerResult", "keltner_channels", "keltner_value",
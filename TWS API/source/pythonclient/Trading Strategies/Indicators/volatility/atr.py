@@ -4,7 +4,7 @@ True Range = max(high-low, |high-prev_close|, |low-prev_close|) (first bar = hig
 ATR = Wilder's smoothing of TR (rma, seeded with the SMA of the first `period` TRs),
 matching TradingView's ta.atr.
 
-Two layers (same pattern as the other indicators):
+Three layers (same pattern as the other indicators):
 
 1. Pure math: ``true_range(highs, lows, closes)`` and ``atr(highs, lows, closes, period)``.
 2. Config-driven value: ``atr_value(...)`` -> ATRResult on the last completed bar, e.g.::
@@ -13,14 +13,19 @@ Two layers (same pattern as the other indicators):
        res.value     # the ATR (in price units)
        res.atr_pct   # ATR as a % of close (volatility, comparable across symbols)
 
+3. Streaming state: ``ATRState(period)`` -> ``update(bar)`` per new completed bar in O(1),
+   ``result()`` is what atr_value returns for that bar.
+
 Pure-Python (no numpy/pandas) so it bundles cleanly into a PyInstaller one-file exe.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
-from ..moving_average import rma
+from ..moving_average import RMAState, rma
 
 
 def true_range(highs, lows, closes):
@@ -51,6 +56,40 @@ class ATRResult:
         return float(self.value)
 
 
+class ATRState:
+    """Streaming atr(): after update(bars[i]) `value` equals atr()[i]."""
+
+    def __init__(self, period=14):
+        self.rma = RMAState(period)
+        self.count = 0
+        self.value = None
+        self.bar = None
+
+    def seed(self, bars):
+        for bar in bars:
+            self.update(bar)
+        return self
+
+    def update(self, bar):
+        prev, self.bar = self.bar, bar
+        if prev is None:
+            tr = bar.high - bar.low
+        else:
+            tr = max(bar.high - bar.low, abs(bar.high - prev.close), abs(bar.low - prev.close))
+        self.value = self.rma.update(tr)
+        self.count += 1
+        return self.value
+
+    def result(self):
+        """ATRResult on the last updated bar, or None (as atr_value)."""
+        if self.count < 2 or self.value is None:
+            return None
+        close = self.bar.close
+        atr_pct = (self.value / close * 100.0) if close else 0.0
+        return ATRResult(value=self.value, atr_pct=atr_pct, close=close, time=self.bar.date)
+
+
+@cached
 def atr_value(symbol=None, bar_size="15 mins", *, period=14, ib=None, bars=None,
               duration=None, use_rth=True, what="TRADES", exchange="SMART", currency="USD",
               throttle=None, completed=True):
@@ -61,9 +100,9 @@ def atr_value(symbol=None, bar_size="15 mins", *, period=14, ib=None, bars=None,
             raise ValueError("atr_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     series = atr(highs, lows, closes, period)
     i = len(bars) - (2 if completed else 1)
     if i < 1:
@@ -19,6 +19,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 from ..moving_average import sma, stdev
 
@@ -55,6 +57,7 @@ class BollingerResult:
         return float(self.basis)
 
 
+@cached
 def bollinger_value(symbol=None, bar_size="15 mins", *, length=20, mult=2.0, ib=None, bars=None,
                     duration=None, use_rth=True, what="TRADES", exchange="SMART",
                     currency="USD", throttle=None, completed=True):
@@ -65,7 +68,7 @@ def bollinger_value(symbol=None, bar_size="15 mins", *, length=20, mult=2.0, ib=
             raise ValueError("bollinger_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    closes = [b.close for b in bars]
+    closes = column(bars, "close")
     basis, upper, lower = bollinger_bands(closes, length, mult)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or basis[i] is None:
@@ -18,7 +18,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
+from ..rolling import rolling_max, rolling_min
 
 
 def donchian_channels(highs, lows, length=20):
@@ -26,15 +29,11 @@ def donchian_channels(highs, lows, length=20):
     length = int(length)
     n = len(highs)
     basis = [None] * n
-    upper = [None] * n
-    lower = [None] * n
+    upper = rolling_max(highs, length)
+    lower = rolling_min(lows, length)
     for i in range(n):
-        if i >= length - 1:
-            hh = max(highs[i - length + 1:i + 1])
-            ll = min(lows[i - length + 1:i + 1])
-            upper[i] = hh
-            lower[i] = ll
-            basis[i] = (hh + ll) / 2.0
+        if upper[i] is not None:
+            basis[i] = (upper[i] + lower[i]) / 2.0
     return basis, upper, lower
 
 
@@ -56,6 +55,7 @@ class DonchianResult:
         return float(self.basis)
 
 
+@cached
 def donchian_value(symbol=None, bar_size="15 mins", *, length=20, ib=None, bars=None,
                    duration=None, use_rth=True, what="TRADES", exchange="SMART",
                    currency="USD", throttle=None, completed=True):
@@ -67,9 +67,9 @@ def donchian_value(symbol=None, bar_size="15 mins", *, length=20, ib=None, bars=
             raise ValueError("donchian_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     basis, upper, lower = donchian_channels(highs, lows, length)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or basis[i] is None:
@@ -19,6 +19,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 from ..moving_average import ema
 from .atr import atr
@@ -54,6 +56,7 @@ class KeltnerResult:
         return float(self.basis)
 
 
+@cached
 def keltner_value(symbol=None, bar_size="15 mins", *, length=20, mult=2.0, atr_length=10,
                   ib=None, bars=None, duration=None, use_rth=True, what="TRADES",
                   exchange="SMART", currency="USD", throttle=None, completed=True):
@@ -64,9 +67,9 @@ def keltner_value(symbol=None, bar_size="15 mins", *, length=20, mult=2.0, atr_l
             raise ValueError("keltner_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     basis, upper, lower = keltner_channels(highs, lows, closes, length, mult, atr_length)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or basis[i] is None or upper[i] is None:
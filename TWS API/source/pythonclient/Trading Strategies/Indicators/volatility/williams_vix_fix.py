@@ -22,7 +22,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
+from ..rolling import rolling_max, rolling_mean, rolling_stdev
 
 
 def williams_vix_fix(highs, lows, closes, pd=22, bb_length=20, mult=2.0, lookback=50, ph=0.85):
@@ -32,20 +35,22 @@ def williams_vix_fix(highs, lows, closes, pd=22, bb_length=20, mult=2.0, lookbac
     lookback = int(lookback)
     n = len(closes)
     wvf = [None] * n
+    hcs = rolling_max(closes, pd)
     for i in range(n):
-        if i >= pd - 1:
-            hc = max(closes[i - pd + 1:i + 1])
+        hc = hcs[i]
+        if hc is not None:
             wvf[i] = ((hc - lows[i]) / hc) * 100.0 if hc else 0.0
     upper = [None] * n
     range_high = [None] * n
+    # None wherever the window still holds a None (the wvf warmup)
+    mid = rolling_mean(wvf, bb_length)
+    sd = rolling_stdev(wvf, bb_length)
+    wvf_high = rolling_max(wvf, lookback)
     for i in range(n):
-        if i >= bb_length - 1 and all(wvf[j] is not None for j in range(i - bb_length + 1, i + 1)):
-            window = wvf[i - bb_length + 1:i + 1]
-            m = sum(window) / bb_length
-            sd = (sum((x - m) ** 2 for x in window) / bb_length) ** 0.5
-            upper[i] = m + mult * sd
-        if i >= lookback - 1 and all(wvf[j] is not None for j in range(i - lookback + 1, i + 1)):
-            range_high[i] = max(wvf[i - lookback + 1:i + 1]) * ph
+        if mid[i] is not None:
+            upper[i] = mid[i] + mult * sd[i]
+        if wvf_high[i] is not None:
+            range_high[i] = wvf_high[i] * ph
     return wvf, upper, range_high
 
 
@@ -62,6 +67,7 @@ class WVFResult:
         return float(self.value)
 
 
+@cached
 def williams_vix_fix_value(symbol=None, bar_size="1 day", *, pd=22, bb_length=20, mult=2.0,
                            lookback=50, ph=0.85, ib=None, bars=None, duration=None, use_rth=True,
                            what="TRADES", exchange="SMART", currency="USD", throttle=None,
@@ -73,9 +79,9 @@ def williams_vix_fix_value(symbol=None, bar_size="1 day", *, pd=22, bb_length=20
             raise ValueError("williams_vix_fix_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
     wvf, upper, range_high = williams_vix_fix(highs, lows, closes, pd, bb_length, mult, lookback, ph)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or wvf[i] is None:
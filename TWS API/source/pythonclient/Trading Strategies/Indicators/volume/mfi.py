@@ -19,6 +19,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 
 
@@ -60,6 +62,7 @@ class MFIResult:
         return float(self.value)
 
 
+@cached
 def mfi_value(symbol=None, bar_size="15 mins", *, period=14, overbought=80.0, oversold=20.0,
               ib=None, bars=None, duration=None, use_rth=True, what="TRADES", exchange="SMART",
               currency="USD", throttle=None, completed=True):
@@ -70,10 +73,10 @@ def mfi_value(symbol=None, bar_size="15 mins", *, period=14, overbought=80.0, ov
             raise ValueError("mfi_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
-    volumes = [getattr(b, "volume", 0.0) for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
+    volumes = column(bars, "volume")
     series = mfi(highs, lows, closes, volumes, period)
     i = len(bars) - (2 if completed else 1)
     if i < 1 or series[i] is None:
@@ -15,6 +15,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 
 
@@ -44,6 +46,7 @@ class OBVResult:
         return float(self.value)
 
 
+@cached
 def obv_value(symbol=None, bar_size="15 mins", *, ib=None, bars=None, duration=None,
               use_rth=True, what="TRADES", exchange="SMART", currency="USD", throttle=None,
               completed=True):
@@ -54,8 +57,8 @@ def obv_value(symbol=None, bar_size="15 mins", *, ib=None, bars=None, duration=N
             raise ValueError("obv_value needs bars=..., or ib=... and symbol=...")
         bars = fetch_bars(ib, symbol, bar_size, duration=duration, use_rth=use_rth,
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
-    closes = [b.close for b in bars]
-    volumes = [getattr(b, "volume", 0.0) for b in bars]
+    closes = column(bars, "close")
+    volumes = column(bars, "volume")
     series = obv(closes, volumes)
     i = len(bars) - (2 if completed else 1)
     if i < 1:
@@ -16,6 +16,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ..bar_series import column
+from ..cache import cached
 from ..market_data import fetch_bars
 
 
@@ -60,6 +62,7 @@ class VWAPResult:
         return float(self.value)
 
 
+@cached
 def vwap_value(symbol=None, bar_size="5 mins", *, anchored=True, ib=None, bars=None,
                duration=None, use_rth=True, what="TRADES", exchange="SMART", currency="USD",
                throttle=None, completed=True):
@@ -73,10 +76,10 @@ def vwap_value(symbol=None, bar_size="5 mins", *, anchored=True, ib=None, bars=N
                           what=what, exchange=exchange, currency=currency, throttle=throttle)
     if not bars:
         return None
-    highs = [b.high for b in bars]
-    lows = [b.low for b in bars]
-    closes = [b.close for b in bars]
-    volumes = [getattr(b, "volume", 0.0) for b in bars]
+    highs = column(bars, "high")
+    lows = column(bars, "low")
+    closes = column(bars, "close")
+    volumes = column(bars, "volume")
     sids = [_session_id(b) for b in bars] if anchored else None
     series = vwap(highs, lows, closes, volumes, sids)
     i = len(bars) - (2 if completed else 1)
@@ -124,6 +124,8 @@ if (Test-Path $buildDir) {
 }
 
 Write-Info 'Building intraday_equity.exe with PyInstaller...'
+# The request pacing comes from the shared Indicators package at <Trading Strategies>\Indicators,
+# one level up from this folder, so add that dir to PyInstaller's search path.
 $pyInstallerArgs = @(
     '--clean',
     '--onefile',
@@ -133,6 +135,7 @@ $pyInstallerArgs = @(
     '--copy-metadata', 'aeventkit',
     '--collect-all', 'tzdata',
     '--collect-all', 'openpyxl',
+    '--paths', '..',
     '--distpath', '.\dist',
     '--workpath', '.\build_pi',
     '--specpath', '.\build_pi',
@@ -19,6 +19,7 @@ import asyncio
 import math
 import os
 import threading
+import time
 from datetime import timedelta
 from dataclasses import dataclass, field
 
@@ -26,6 +27,8 @@ from ib_async import IB, Stock, Index, ScannerSubscription, TagValue, StopOrder
 
 import calendar_util as cal
 import equity_order as eo
+from live_bars import LiveBars
+from market_data import HistoryMemo, LineBudget, cumulative_volume, profile_baseline, rvol_profile
 
 
 @dataclass
@@ -100,6 +103,28 @@ class EquityStrategyBase:
         self.window_end = max(p[1] for p in self.windows)
         self.positions: dict[str, Position] = {}
         self._md: dict[str, object] = {}   # base-owned market-data tickers (subscribe once, reuse)
+        # the account's market-data lines, shared by every strategy thread (tickers + streams)
+        self.lines = shared.get("md_lines") or LineBudget(sr.get("market_data_line_cap", 90),
+                                                          cfg.get("live_bars_max", 50))
+        self._md_refused: set = set()
+        # Live intraday bars: today's 1-min / 5-min bars of the watchlist kept current from
+        # 5-second real-time bars (seeded once per symbol at window open) and served by hist()
+        # instead of a paced reqHistoricalData per symbol per poll. Each stream takes a
+        # market-data line from the shared LineBudget (at most shared_risk.live_bars_max
+        # streams across all strategy threads); a block's live_bars_max can lower its own
+        # share. The rest are pulled as before.
+        self.live_bars_enabled = bool(cfg.get("live_bars", True))
+        self.live_bars_max = int(cfg.get("live_bars_max", self.lines.stream_cap))
+        self.live = LiveBars(stale_after=float(cfg.get("live_bars_stale_sec", 30)))
+        self._rtb: dict[str, object] = {}  # symbol -> RealTimeBarList
+        self._live_contracts: dict[str, object] = {}
+        # Watchlist pipeline: each screening stage's history pulls go out concurrently (at
+        # most watchlist_concurrency in flight, each paced by the shared rate limiter) into
+        # the runner's HistoryMemo, which also shares identical pulls across strategies.
+        self.memo = shared.get("hist_memo")
+        self.watchlist_concurrency = max(1, int(cfg.get("watchlist_concurrency", 4)))
+        self._screening = False
+        self._qualified: dict[str, object] = {}
         self._start_equity = float(shared.get("start_equity", 0) or 0)
 
     # ----------------------------------------------------------------- connect
@@ -138,6 +163,7 @@ class EquityStrategyBase:
             return False
 
     def disconnect(self):
+        self.lines.release(self.name)
         try:
             if self.ib and self.ib.isConnected():
                 self.ib.disconnect()
@@ -188,6 +214,10 @@ class EquityStrategyBase:
     def _rebind_after_reconnect(self):
         """Re-link our Position order legs to the refreshed server Trades (by orderId) and
         re-subscribe market data, since the prior session's Trade/Ticker objects are stale."""
+        if self._rtb:                      # the real-time bar streams died with the session
+            self._rtb.clear()
+            self.live.clear()
+            self.start_live_bars(self._live_contracts)
         try:
             self.ib.reqAllOpenOrders()
             self.ib.sleep(1)
@@ -203,7 +233,7 @@ class EquityStrategyBase:
                     if oid in open_by_id:
                         setattr(p, attr, open_by_id[oid])
                 self._md.pop(p.symbol, None)
-                p.ticker = self.get_ticker(p.symbol, p.contract)
+                p.ticker = self.get_ticker(p.symbol, p.contract, force=True)
         except Exception as e:
             self.log(f"rebind after reconnect error: {e}")
 
@@ -274,7 +304,7 @@ class EquityStrategyBase:
             target = eo.round_to_tick(float(tp.order.lmtPrice), tick) if tp is not None else entry
             r_unit = (entry - stop) if entry > stop else entry * self.min_stop_pct
             sector = self.sector_of(symbol, contract)
-            tk = self.get_ticker(symbol, contract)
+            tk = self.get_ticker(symbol, contract, force=True)
             self.positions[ref] = Position(ref, symbol, sector, contract, qty, entry, stop,
                                            target, r_unit, pt=st, tp=tp, st=st,
                                            ticker=tk, high_water=entry)
@@ -291,22 +321,124 @@ class EquityStrategyBase:
 
     # ----------------------------------------------------------------- data
     def hist(self, contract, duration, bar_size, what="TRADES", use_rth=True):
-        """Rate-limited reqHistoricalData wrapper."""
-        self.rate.acquire()
+        """Rate-limited reqHistoricalData wrapper. Today's intraday RTH bars of a streamed
+        symbol come from the live bars instead (no request), and a pull identical to one
+        made (by any strategy) within the pacer's identical-request window, in the same bar,
+        from the shared history memo: IB would only take it after that window."""
+        if duration == "1 D" and what == "TRADES" and use_rth and self._rtb:
+            bars = self.live.bars(getattr(contract, "symbol", ""), bar_size)
+            if bars is not None:
+                return bars
+        key = HistoryMemo.key(contract, duration, bar_size, what, use_rth)
+        if self.memo is not None:
+            bars = self.memo.get(key, None if self._screening else self.rate.identical_sec)
+            if bars is not None:
+                return bars
+        self.rate.acquire(key, ib=self.ib)
         try:
-            return self.ib.reqHistoricalData(contract, "", duration, bar_size, what, use_rth, 1) or []
+            bars = self.ib.reqHistoricalData(contract, "", duration, bar_size, what, use_rth, 1) or []
         except Exception as e:
             self.log(f"hist error {getattr(contract,'symbol','?')}: {e}")
             return []
+        if self.memo is not None:
+            self.memo.put(key, bars)
+        return bars
 
     def qualify(self, symbol):
+        c = self._qualified.get(symbol)
+        if c is not None:
+            return c
         c = Stock(symbol, "SMART", "USD")
         try:
             self.ib.qualifyContracts(c)
+            if getattr(c, "conId", 0):
+                self._qualified[symbol] = c
         except Exception as e:
             self.log(f"qualify error {symbol}: {e}")
         return c
 
+    def qualify_many(self, symbols):
+        """{symbol: contract} for `symbols`, qualified in one batch (ib_async sends the
+        contract-detail requests concurrently); unresolvable symbols are left out."""
+        todo = [Stock(s, "SMART", "USD") for s in dict.fromkeys(symbols) if s not in self._qualified]
+        if todo:
+            try:
+                for c in self.ib.qualifyContracts(*todo):
+                    if c is not None and getattr(c, "conId", 0):
+                        self._qualified[c.symbol] = c
+            except Exception as e:
+                self.log(f"qualify error: {e}")
+        return {s: self._qualified[s] for s in symbols if s in self._qualified}
+
+    # ----------------------------------------------------------------- watchlist pipeline
+    def prefetch(self, requests):
+        """Pull `requests` -- (contract, duration, bar_size, what, use_rth) tuples --
+        concurrently into the shared history memo, where hist() finds them while screening."""
+        if not requests or self.memo is None:
+            return
+        unique = {self.memo.key(*r): r for r in requests}
+        self.ib.run(self._prefetch_async(list(unique.values())))
+
+    async def _prefetch_async(self, requests):
+        sem = asyncio.Semaphore(self.watchlist_concurrency)
+
+        async def one(req):
+            async with sem:
+                await self.memo.fetch_async(self.ib, self.rate, *req, log=self.log)
+
+        await asyncio.gather(*(one(r) for r in requests), return_exceptions=True)
+
+    def screen(self, symbols, stages):
+        """Run `symbols` through the watchlist `stages`, a list of (name, requests, keep):
+        requests(symbol, contract) -> the hist() pulls keep() will make, prefetched for all
+        survivors at once; keep(symbol, contract) -> bool is the stage's filter. A symbol
+        rejected at one stage never costs the later stages' pulls. Logs each stage's
+        fetch / check time and returns the survivors in input order."""
+        t0 = time.monotonic()
+        contracts = self.qualify_many(symbols)
+        alive = [s for s in dict.fromkeys(symbols) if s in contracts]
+        self.log(f"watchlist qualify: {len(alive)} of {len(symbols)} in {time.monotonic() - t0:.1f}s")
+        self._screening = True
+        try:
+            for (name, requests, keep) in stages:
+                t1 = time.monotonic()
+                self.prefetch([r for s in alive for r in requests(s, contracts[s])])
+                t2 = time.monotonic()
+                kept = []
+                for s in alive:
+                    try:
+                        if keep(s, contracts[s]):
+                            kept.append(s)
+                    except Exception as e:
+                        self.log(f"watchlist {name} error {s}: {e}")
+                self.log(f"watchlist {name}: {len(alive)} -> {len(kept)} "
+                         f"(fetch {t2 - t1:.1f}s, check {time.monotonic() - t2:.2f}s)")
+                alive = kept
+        finally:
+            self._screening = False
+        memo = (f"; memo {self.memo.sent} pulled / {self.memo.shared} shared"
+                if self.memo is not None else "")
+        self.log(f"watchlist screened: {len(alive)} of {len(symbols)} in "
+                 f"{time.monotonic() - t0:.1f}s{memo}")
+        return alive
+
+    def adv_requests(self, symbol, contract, days=30):
+        """The pull dollar_adv() makes (none once the day cache has the value)."""
+        if self.cache.get(f"adv:{symbol}") is not None:
+            return []
+        return [(contract, f"{days} D", "1 day", "TRADES", True)]
+
+    def adr_requests(self, contract, period=20):
+        """The pull adr_pct() makes."""
+        return [(contract, f"{period + 4} D", "1 day", "TRADES", True)]
+
+    def rvol_requests(self, contract, premarket=False):
+        """The pull rvol() makes: the lookback (profile not built yet) or today's bars."""
+        use_rth = not premarket
+        if self.cache.get(self._rvol_key(contract.symbol, premarket)) is None:
+            return [(contract, f"{self._rvol_days() + 5} D", "5 mins", "TRADES", use_rth)]
+        return [(contract, "1 D", "5 mins", "TRADES", use_rth)]
+
     def sector_of(self, symbol, contract):
         cached = self.cache.get(f"sector:{symbol}")
         if cached:
@@ -316,7 +448,7 @@ class EquityStrategyBase:
             return self.sector_map[symbol]
         sec = "UNKNOWN"
         try:
-            self.rate.acquire()
+            self.rate.acquire(priority=True, ib=self.ib)     # on the entry path
             cds = self.ib.reqContractDetails(contract)
             if cds:
                 sec = getattr(cds[0], "industry", None) or getattr(cds[0], "category", None) or "UNKNOWN"
@@ -331,7 +463,7 @@ class EquityStrategyBase:
             return cached
         tick = 0.01
         try:
-            self.rate.acquire()
+            self.rate.acquire(priority=True, ib=self.ib)     # prices an order / a stop change
             cds = self.ib.reqContractDetails(contract)
             if cds and getattr(cds[0], "minTick", 0):
                 tick = float(cds[0].minTick)
@@ -404,15 +536,25 @@ class EquityStrategyBase:
             self.log(f"subscribe error: {e}")
             return None
 
-    def get_ticker(self, symbol, contract):
+    def get_ticker(self, symbol, contract, force=False):
         """Subscribe once per symbol and REUSE the same ticker everywhere (signals, VWAP,
         position management) so we never double-subscribe and a cancel can't kill another
-        consumer's feed. All feeds are released together at disconnect()."""
+        consumer's feed. All feeds are released together at disconnect(). Each new feed takes
+        a line from the process-wide LineBudget; None once the account's lines are used up,
+        unless `force` (the feed of an open position)."""
         tk = self._md.get(symbol)
         if tk is None:
+            if not self.lines.claim(self.name, "ticker", symbol, force=force):
+                if symbol not in self._md_refused:
+                    self._md_refused.add(symbol)
+                    self.log(f"market data: line cap of {self.lines.cap} reached; "
+                             f"no ticker for {symbol}")
+                return None
             tk = self.subscribe(contract)
             if tk is not None:
                 self._md[symbol] = tk
+            else:
+                self.lines.release(self.name, "ticker", symbol)
         return tk
 
     def last_price(self, ticker):
@@ -427,6 +569,64 @@ class EquityStrategyBase:
                 return float(v)
         return None
 
+    def start_live_bars(self, contracts):
+        """Stream 5-second real-time bars for up to live_bars_max of `contracts`
+        ({symbol: contract}), within the process-wide stream budget, and seed each with
+        today's 1-min history (one request per symbol, once). Each stream is opened through
+        the shared rate limiter. A symbol whose stream can't be opened, or whose seed comes
+        back empty after the open, keeps using hist() pulls."""
+        if not self.live_bars_enabled:
+            return
+        self._live_contracts = dict(contracts)
+        for sym, c in contracts.items():
+            if sym in self._rtb:
+                continue
+            if len(self._rtb) >= self.live_bars_max or not self.lines.claim(self.name, "bars", sym):
+                self.log(f"live bars: cap reached ({len(self._rtb)} here, "
+                         f"{self.lines.used('bars')} streams / {self.lines.used()} lines in all); "
+                         f"the remaining symbols are polled")
+                break
+            self.live.track(sym)
+            # IB paces a real-time bar request like a 5-second-bar history pull
+            self.rate.acquire(HistoryMemo.key(c, "realtime", "5 secs", "TRADES", True), ib=self.ib)
+            try:
+                rtb = self.ib.reqRealTimeBars(c, 5, "TRADES", True)
+                rtb.updateEvent += self._on_rt_bars
+            except Exception as e:
+                self.live.drop(sym)
+                self.lines.release(self.name, "bars", sym)
+                self.log(f"live bars unavailable for {sym}: {e}")
+                continue
+            self._rtb[sym] = rtb
+            as_of = cal.now_et()
+            seed = self.hist(c, "1 D", "1 min", "TRADES", True)
+            if not seed and as_of >= cal.session_open(as_of):
+                # a failed pull (hist() answers [] on error): seeding nothing would serve the
+                # stream's bars alone from now on and lose the morning, so keep polling it
+                self._stop_live_bars(sym)
+                self.log(f"live bars: no seed history for {sym}; it is polled instead")
+                continue
+            self.live.seed(sym, seed, as_of)
+        if self._rtb:
+            self.log(f"live bars: streaming {len(self._rtb)} symbol(s)")
+
+    def _stop_live_bars(self, sym):
+        """Cancel `sym`'s real-time bar stream and give its line back to the budget."""
+        rtb = self._rtb.pop(sym, None)
+        self.live.drop(sym)
+        self.lines.release(self.name, "bars", sym)
+        if rtb is not None:
+            try:
+                self.ib.cancelRealTimeBars(rtb)
+            except Exception:
+                pass
+
+    def _on_rt_bars(self, bars, has_new_bar):
+        if has_new_bar and bars:
+            b = bars[-1]
+            self.live.update(bars.contract.symbol, b.time, b.open_, b.high, b.low, b.close,
+                             b.volume)
+
     # ----------------------------------------------------------------- scanner
     def scan(self, scan_code, tag_filters=None, rows=50, instrument="STK",
              location="STK.US.MAJOR", stock_type="ALL",
@@ -452,7 +652,7 @@ class EquityStrategyBase:
                 except Exception:
                     pass
             tvs = [TagValue(str(k), str(v)) for k, v in (tag_filters or {}).items()]
-            self.rate.acquire()
+            self.rate.acquire(ib=self.ib)
             out = self.ib.reqScannerData(sub, [], tvs) or []
         except Exception as e:
             self.log(f"scan {scan_code} error: {e}")
@@ -507,39 +707,35 @@ class EquityStrategyBase:
 
     # ----------------------------------------------------------------- RVOL
     def rvol(self, contract, ref_dt, premarket=False):
-        """Relative volume vs a 20-day same-time-of-day baseline. Uses ONLY completed
-        bars up to ref_dt (no look-ahead). Cached per symbol per day."""
-        sym = contract.symbol
-        ckey = f"rvolbase:{'pm' if premarket else 'rth'}:{sym}:{ref_dt.strftime('%H%M')}"
-        baseline = self.cache.get(ckey)
-        days = int(self.cfg.get("rvol_lookback_days", self.cfg.get("min_baseline_days", 20)))
+        """Relative volume: today's cumulative volume up to ref_dt vs the average cumulative
+        volume by the same time of day over the lookback days. Uses ONLY completed 5-min
+        buckets (no look-ahead). The baseline profile (RTH or pre-market) is built from one
+        lookback pull per symbol per day and kept in the day cache (persisted, so a restart
+        reuses it); after that a call is a lookup plus today's bars."""
+        days = self._rvol_days()
         use_rth = not premarket
-        bars = self.hist(contract, f"{days + 5} D", "5 mins", "TRADES", use_rth)
-        if not bars:
-            return None
-        # group bar volume by date, summing only bars up to ref clock time
-        from collections import defaultdict
-        by_day = defaultdict(float)
+        today = ref_dt.strftime("%Y%m%d")
+        pkey = self._rvol_key(contract.symbol, premarket)
+        profile = self.cache.get(pkey)
+        if profile is None:
+            bars = self.hist(contract, f"{days + 5} D", "5 mins", "TRADES", use_rth)
+            if not bars:
+                return None
+            profile = rvol_profile(bars, today, premarket, self.vol_scale)
+            self.cache.put(pkey, profile)
+        else:
+            bars = self.hist(contract, "1 D", "5 mins", "TRADES", use_rth)
         ref_minute = ref_dt.hour * 60 + ref_dt.minute
-        today_key = ref_dt.strftime("%Y%m%d")
-        for b in bars:
-            t = b.date if hasattr(b.date, "hour") else None
-            if t is None:
-                continue
-            day = t.strftime("%Y%m%d")
-            minute = t.hour * 60 + t.minute
-            if premarket:
-                if minute >= 9 * 60 + 30:   # only pre-market portion
-                    continue
-            if minute + 5 <= ref_minute:    # only FULLY-CLOSED 5-min buckets (skip forming bar)
-                by_day[day] += float(b.volume) * self.vol_scale
-        today_vol = by_day.pop(today_key, 0.0)
-        prior = [v for d, v in by_day.items() if v > 0]
-        baseline = sum(prior) / len(prior) if prior else 0.0
+        baseline = profile_baseline(profile, ref_minute)
         if baseline <= 0:
             return None       # missing history -> caller decides (distinct from genuine 0.0)
-        self.cache.put(ckey, baseline)
-        return today_vol / baseline
+        return cumulative_volume(bars, today, ref_minute, premarket, self.vol_scale) / baseline
+
+    def _rvol_days(self):
+        return int(self.cfg.get("rvol_lookback_days", self.cfg.get("min_baseline_days", 20)))
+
+    def _rvol_key(self, symbol, premarket):
+        return f"rvolprof:{'pm' if premarket else 'rth'}:{symbol}:{self._rvol_days()}"
 
     # ----------------------------------------------------------------- sizing
     def resolve_stop(self, entry, structural_stop):
@@ -578,6 +774,13 @@ class EquityStrategyBase:
         sr = self.shared.get("shared_risk", {}).get("regime", {})
         if not sr.get("spy_downtrend_gate", True):
             return True
+        # the runner's shared regime service (one SPY/VIX feed for every strategy thread);
+        # pull our own bars only while its snapshot is stale
+        svc = self.shared.get("regime")
+        if svc is not None:
+            snap = svc.snapshot
+            if snap.fresh(float(sr.get("max_snapshot_age_sec", 60))):
+                return snap.allows(sr.get("spy_max_intraday_drop_pct", 0.005), sr.get("vix_max"))
         try:
             spy = self.shared.get("_spy") or self.qualify("SPY")
             self.shared["_spy"] = spy
@@ -662,7 +865,7 @@ class EquityStrategyBase:
         filled_qty = int(pt.orderStatus.filled or qty)
         r_unit = fill - stop
         self.risk.register_open(order_ref, symbol, sector, filled_qty * r_unit, filled_qty, fill, stop)
-        tk = self.get_ticker(symbol, contract)
+        tk = self.get_ticker(symbol, contract, force=True)
         self.positions[order_ref] = Position(order_ref, symbol, sector, contract, filled_qty,
                                               fill, stop, sig.target, r_unit, pt, tp, st,
                                               ticker=tk, high_water=fill)
@@ -801,6 +1004,7 @@ class EquityStrategyBase:
             watchlist = self.build_watchlist()
             self.log(f"watchlist ({len(watchlist)}): {watchlist[:25]}")
             contracts = {s: self.qualify(s) for s in watchlist}
+            self.start_live_bars(contracts)
 
             flat_time = cal.effective_flatten_time(self.eod_flatten)
             while True:
@@ -0,0 +1,156 @@
+"""Live intraday bars for the Intraday Equity bots, built from IB 5-second real-time bars.
+
+Every poll the strategies ask for today's 1-min / 5-min bars of every watchlist symbol
+(``hist(contract, "1 D", "1 min"|"5 mins", "TRADES", True)``). Pulling them with
+reqHistoricalData costs one paced request per symbol per poll. ``LiveBars`` instead keeps
+them current in memory: each symbol is seeded ONCE with today's 1-min history, then every
+5-second real-time bar (``reqRealTimeBars``) is folded into the forming 1-min and 5-min
+bar. ``bars(symbol, bar_size)`` returns the same list a "1 D" RTH pull would: completed
+bars, then the forming bar last.
+
+Real-time bars that arrive while the seed request is in flight are held and replayed onto
+the seed, skipping those the history already covers. A symbol whose stream has gone quiet
+for ``stale_after`` seconds (a dropped subscription, no entitlement) answers None, and the
+caller falls back to reqHistoricalData.
+
+The bot feeds it from its own event loop (single thread), so there is no locking. Stdlib
+only (PyInstaller-friendly).
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import time
+from dataclasses import dataclass
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover
+    from backports.zoneinfo import ZoneInfo  # type: ignore
+
+ET = ZoneInfo("America/New_York")
+RT_BAR_SECONDS = 5                  # the only size reqRealTimeBars supports
+
+_BAR_SIZES = {"1 min": 60, "2 mins": 120, "3 mins": 180, "5 mins": 300, "10 mins": 600,
+              "15 mins": 900, "30 mins": 1800}
+
+
+@dataclass(frozen=True)
+class LiveBar:
+    """One intraday bar (the BarData fields the strategies read)."""
+    date: _dt.datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+def bar_size_seconds(bar_size) -> int:
+    """Seconds of an intraday bar size this builder can produce ('5 mins' -> 300), else 0."""
+    return _BAR_SIZES.get(str(bar_size).strip(), 0)
+
+
+def _bucket(t: _dt.datetime, secs: int) -> _dt.datetime:
+    """Start of the `secs`-long bar containing `t` (bars align to the hour, as IB's do)."""
+    return t - _dt.timedelta(seconds=(t.minute * 60 + t.second) % secs,
+                             microseconds=t.microsecond)
+
+
+def _fold(bars: list, start, o, h, l, c, v):
+    """Fold one sub-bar (starting in the bar that begins at `start`) into `bars`."""
+    if bars and bars[-1].date == start:
+        b = bars[-1]
+        bars[-1] = LiveBar(start, b.open, max(b.high, h), min(b.low, l), c, b.volume + v)
+    elif not bars or bars[-1].date < start:
+        bars.append(LiveBar(start, o, h, l, c, v))
+    # else: older than the forming bar -> already covered
+
+
+class _Stream:
+    __slots__ = ("bars", "tz", "as_of", "pending", "last_update")
+
+    def __init__(self):
+        self.bars: dict[int, list] = {}
+        self.tz = ET
+        self.as_of = None           # time of the seed request; None = not seeded yet
+        self.pending: list = []     # real-time bars received before the seed
+        self.last_update = 0.0
+
+
+class LiveBars:
+    """Per-symbol 1-min / 5-min (``sizes``, in seconds) bars kept current from real-time bars."""
+
+    def __init__(self, sizes=(60, 300), stale_after=30.0, clock=time.monotonic):
+        self.sizes = tuple(sorted(int(s) for s in sizes))
+        self.stale_after = float(stale_after)
+        self._clock = clock
+        self._streams: dict[str, _Stream] = {}
+
+    def __contains__(self, symbol):
+        return symbol in self._streams
+
+    def __len__(self):
+        return len(self._streams)
+
+    def track(self, symbol):
+        """Start collecting real-time bars for `symbol` (before its seed request goes out)."""
+        self._streams.setdefault(symbol, _Stream())
+
+    def seed(self, symbol, bars, as_of: _dt.datetime):
+        """Seed `symbol` with today's 1-min `bars` as pulled at `as_of`, then replay the
+        real-time bars received meanwhile."""
+        s = self._streams.setdefault(symbol, _Stream())
+        s.bars = {secs: [] for secs in self.sizes}
+        tz = next((b.date.tzinfo for b in bars if isinstance(b.date, _dt.datetime)), ET)
+        s.tz = tz
+        for b in bars:
+            if not isinstance(b.date, _dt.datetime):
+                continue
+            for secs in self.sizes:
+                _fold(s.bars[secs], _bucket(b.date, secs), float(b.open), float(b.high),
+                      float(b.low), float(b.close), float(b.volume or 0))
+        s.as_of = self._local(as_of, tz)
+        s.last_update = self._clock()
+        (pending, s.pending) = (s.pending, [])
+        for args in pending:
+            self.update(symbol, *args)
+
+    def update(self, symbol, t: _dt.datetime, o, h, l, c, v):
+        """Fold the 5-second real-time bar starting at `t` into `symbol`'s bars."""
+        s = self._streams.get(symbol)
+        if s is None:
+            return
+        if s.as_of is None:
+            s.pending.append((t, o, h, l, c, v))
+            return
+        t = self._local(t, s.tz)
+        s.last_update = self._clock()
+        if t + _dt.timedelta(seconds=RT_BAR_SECONDS) <= s.as_of:
+            return                  # entirely inside the seeded history
+        for secs in self.sizes:
+            _fold(s.bars[secs], _bucket(t, secs), float(o), float(h), float(l), float(c),
+                  float(v or 0))
+
+    def bars(self, symbol, bar_size):
+        """`symbol`'s bars of `bar_size` (completed bars, then the forming one), or None if
+        it is not streamed, not seeded, stale, or the size is not built."""
+        s = self._streams.get(symbol)
+        secs = bar_size_seconds(bar_size)
+        if s is None or s.as_of is None or secs not in s.bars:
+            return None
+        if self._clock() - s.last_update > self.stale_after:
+            return None
+        return list(s.bars[secs])
+
+    def drop(self, symbol):
+        self._streams.pop(symbol, None)
+
+    def clear(self):
+        self._streams.clear()
+
+    @staticmethod
+    def _local(t, tz):
+        """`t` in the seeded bars' timezone (naive bars: naive ET wall-clock time)."""
+        if t.tzinfo is None:
+            return t if tz is None else t.replace(tzinfo=tz)
+        return t.astimezone(ET).replace(tzinfo=None) if tz is None else t.astimezone(tz)
@@ -1,39 +1,107 @@
 """Market data utilities for the Intraday Equity bots.
 
-This module provides a simple rate limiter for IB historical and contract
-requests, a file-backed daily cache for shared values, and a placeholder
-auto-detection helper for volume scaling.
+This module provides the request pacing for IB historical and contract
+requests (the shared ``PacingScheduler`` of Indicators/data_hub.py, modelled on IB's
+historical-data pacing rules), the process-wide budget of market-data lines, a file-backed
+daily cache for shared values, a history memo
+that lets the strategies' watchlist builders share identical pulls, the time-of-day volume
+profiles behind RVOL, and a placeholder auto-detection helper for volume scaling.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import sys
 import threading
 import time
 from typing import Any
 
+# The shared Indicators package lives at <Trading Strategies>/Indicators, one level up. From
+# source add that dir to sys.path; when frozen it is bundled (Intraday.ps1 passes --paths ..).
+_SHARED_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if os.path.isdir(os.path.join(_SHARED_ROOT, "Indicators")) and _SHARED_ROOT not in sys.path:
+    sys.path.insert(0, _SHARED_ROOT)
 
-class RateLimiter:
-    def __init__(self, min_interval: float = 2.0):
-        self.min_interval = float(min_interval)
+from Indicators.data_hub import PacingScheduler, bar_seconds  # noqa: E402
+
+
+class RateLimiter(PacingScheduler):
+    """The process-wide pacing of IB requests: the shared ``PacingScheduler``
+    (Indicators/data_hub.py, IB's historical-data rules) with the bots' call signature.
+
+    ``request`` identifies a history pull (``HistoryMemo.key()``: symbol, duration, bar size,
+    what, RTH; a real-time bar stream counts as a "5 secs" pull) for the per-pull rules;
+    without it (contract lookups, scanners) a request only takes ``min_interval``.
+    ``priority=True`` marks the order-critical lookups of an entry or a stop change.
+    ``acquire()`` waits on `ib` (``ib.sleep``, so the thread's event loop keeps processing
+    fills, order statuses and ticks), or blocks the thread without one; ``acquire_async()``
+    waits without blocking the event loop. A pull identical to one within
+    ``identical_sec`` waits that long: answer it from the ``HistoryMemo`` instead."""
+
+    def acquire(self, request: tuple | None = None, priority: bool = False, ib=None) -> None:
+        super().acquire(ib, request, priority)
+
+
+class LineBudget:
+    """The market-data lines held by every strategy thread of the process, against the
+    account's limit: reqMktData tickers (kind "ticker") and reqRealTimeBars streams (kind
+    "bars") alike, since each is a line, and two threads subscribing one symbol take two.
+    At most ``cap`` lines in all, of which at most ``stream_cap`` streams. Thread-safe."""
+
+    def __init__(self, cap: int = 90, stream_cap: int | None = None):
+        self.cap = max(0, int(cap))
+        self.stream_cap = self.cap if stream_cap is None else max(0, min(int(stream_cap), self.cap))
         self._lock = threading.Lock()
-        self._last: float = 0.0
+        self._held: dict[str, set] = {}     # owner -> {(kind, symbol)}
+
+    def claim(self, owner: str, kind: str, symbol: str, force: bool = False) -> bool:
+        """Reserve a `kind` line of `symbol` for `owner`; False if a cap is reached. A line
+        the owner already holds (a re-subscribe after a reconnect) is always granted, and
+        ``force`` records one over the cap (the feed of an open position)."""
+        with self._lock:
+            held = self._held.setdefault(owner, set())
+            if (kind, symbol) in held:
+                return True
+            if not force:
+                if self._used() >= self.cap:
+                    return False
+                if kind == "bars" and self._used("bars") >= self.stream_cap:
+                    return False
+            held.add((kind, symbol))
+            return True
+
+    def release(self, owner: str, kind: str | None = None, symbol: str | None = None) -> None:
+        """Give back `owner`'s `kind` line of `symbol`, or all of its lines."""
+        with self._lock:
+            if kind is None:
+                self._held.pop(owner, None)
+            else:
+                self._held.get(owner, set()).discard((kind, symbol))
 
-    def acquire(self) -> None:
+    def used(self, kind: str | None = None) -> int:
         with self._lock:
-            now = time.monotonic()
-            delta = self.min_interval - (now - self._last)
-            if delta > 0:
-                time.sleep(delta)
-            self._last = time.monotonic()
+            return self._used(kind)
+
+    def _used(self, kind=None) -> int:
+        return sum(1 for held in self._held.values() for (k, _) in held
+                   if kind is None or k == kind)
 
 
 class DailyCache:
+    """Values shared by the strategy threads for the day, persisted to one JSON file so a
+    restart reuses them. Every put() rewrites the file (compact JSON): the serialisation is
+    done under the lock, the write outside it, and a write overtaken by a newer one is
+    skipped."""
+
     def __init__(self, path: str, stamp: str):
         self.path = path
         self.stamp = stamp
         self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
         self._data: dict[str, Any] = {}
+        self._version = 0           # puts so far
+        self._written = 0           # the put whose state is on disk
         self._load()
 
     def _load(self) -> None:
@@ -47,12 +115,16 @@ class DailyCache:
         except Exception:
             self._data = {}
 
-    def _save(self) -> None:
-        try:
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
+    def _save(self, text: str, version: int) -> None:
+        with self._write_lock:
+            if version <= self._written:
+                return
+            try:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    f.write(text)
+                self._written = version
+            except Exception:
+                pass
 
     def get(self, key: str, default: Any = None) -> Any:
         with self._lock:
@@ -61,7 +133,170 @@ class DailyCache:
     def put(self, key: str, value: Any) -> None:
         with self._lock:
             self._data[key] = value
-            self._save()
+            self._version += 1
+            version = self._version
+            text = json.dumps(self._data, ensure_ascii=False, separators=(",", ":"))
+        self._save(text, version)
+
+
+class HistoryMemo:
+    """Historical bars shared by the strategy threads.
+
+    Keyed by (symbol, duration, bar_size, what, use_rth). While the watchlists are built an
+    identical request from another thread is served from the memo (daily bars for `ttl`
+    seconds, intraday bars for `intraday_ttl`) or joins the one in flight instead of going
+    out again. Outside screening, ``put()`` records every pull and ``get(key, max_age)``
+    answers a repeat within `max_age` seconds (the pacer's identical-request window) from
+    the same bar, instead of a request IB would only take after that window. Failed and
+    empty pulls are not kept."""
+
+    def __init__(self, ttl: float = 900.0, intraday_ttl: float = 60.0):
+        self.ttl = float(ttl)
+        self.intraday_ttl = float(intraday_ttl)
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, list] = {}      # key -> [done Event, bars, fetched at, wall time]
+        self.sent = 0
+        self.shared = 0
+
+    @staticmethod
+    def key(contract, duration, bar_size, what="TRADES", use_rth=True) -> tuple:
+        return (getattr(contract, "symbol", ""), str(duration), str(bar_size), str(what).upper(),
+                bool(use_rth))
+
+    def get(self, key, max_age: float | None = None):
+        """The memoised bars of `key` (a copy), or None. With `max_age`, only bars pulled at
+        most that many seconds ago and within the current bar (never missing a bar that
+        has closed since)."""
+        with self._lock:
+            e = self._entries.get(key)
+            if e is None or not e[0].is_set() or not self._fresh(key, e, max_age):
+                return None
+            return list(e[1])
+
+    def put(self, key, bars) -> None:
+        """Record the bars of a pull made outside the memo (empty ones are not kept)."""
+        if not bars:
+            return
+        with self._lock:
+            e = self._entries.get(key)
+            if e is not None and not e[0].is_set():
+                return                              # a fetch in flight will settle it
+            done = threading.Event()
+            done.set()
+            self._entries[key] = [done, list(bars), time.monotonic(), time.time()]
+
+    def _fresh(self, key, e, max_age=None) -> bool:
+        ttl = self.ttl if "day" in key[2] or "week" in key[2] or "month" in key[2] else self.intraday_ttl
+        if max_age is not None:
+            ttl = min(ttl, max_age)
+            bs = bar_seconds(key[2])
+            if 0 < bs < 86400 and int(time.time() // bs) != int(e[3] // bs):
+                return False
+        return time.monotonic() - e[2] <= ttl
+
+    async def fetch_async(self, ib, rate, contract, duration, bar_size, what="TRADES",
+                          use_rth=True, log=None):
+        """Pull one request into the memo on `ib` (reqHistoricalDataAsync, paced by `rate`)
+        unless it is already there or in flight."""
+        key = self.key(contract, duration, bar_size, what, use_rth)
+        with self._lock:
+            e = self._entries.get(key)
+            if e is not None and (not e[0].is_set() or (e[1] and self._fresh(key, e))):
+                self.shared += 1
+                entry = None
+            else:
+                entry = self._entries[key] = [threading.Event(), None, 0.0, 0.0]
+        if entry is None:
+            while not e[0].is_set():
+                await asyncio.sleep(0.05)
+            return
+        bars = None
+        try:
+            if rate is not None:
+                await rate.acquire_async(key)
+            bars = list(await ib.reqHistoricalDataAsync(contract, "", duration, bar_size, what,
+                                                        use_rth, 1) or [])
+        except Exception as ex:
+            if log:
+                log(f"hist error {key[0]}: {ex}")
+        finally:
+            with self._lock:
+                self.sent += 1
+                (entry[1], entry[2], entry[3]) = (bars, time.monotonic(), time.time())
+                if not bars and self._entries.get(key) is entry:
+                    del self._entries[key]
+            entry[0].set()
+
+
+PROFILE_BUCKET_MIN = 5                 # the 5-min bars the RVOL profiles are built from
+RTH_OPEN_MIN = 9 * 60 + 30
+
+
+def _bucket_volumes(bars, premarket, vol_scale, day=None, skip_day=None):
+    """{YYYYMMDD: [volume per 5-min bucket of the day]} of `bars` (only `day` if given,
+    never `skip_day`); pre-market keeps only the buckets before 09:30 ET."""
+    n = 24 * 60 // PROFILE_BUCKET_MIN
+    out: dict[str, list] = {}
+    for b in bars:
+        t = b.date if hasattr(b.date, "hour") else None
+        if t is None:
+            continue
+        d = t.strftime("%Y%m%d")
+        if d == skip_day or (day is not None and d != day):
+            continue
+        minute = t.hour * 60 + t.minute
+        if premarket and minute >= RTH_OPEN_MIN:
+            continue
+        out.setdefault(d, [0.0] * n)[minute // PROFILE_BUCKET_MIN] += float(b.volume) * vol_scale
+    return out
+
+
+def rvol_profile(bars, today, premarket=False, vol_scale=1) -> dict:
+    """Baseline cumulative volume by time of day from 5-min `bars` of the days before
+    `today` (YYYYMMDD): bucket i is the average, over the days that had traded by then, of
+    the volume in the buckets 0..i (i.e. up to minute 5*(i+1) ET).
+
+    Only the session's buckets are kept (it is persisted in the day cache): ``{"start": i0,
+    "cum": [...]}``, the buckets before i0 having no volume yet and those after the last
+    entry repeating it."""
+    n = 24 * 60 // PROFILE_BUCKET_MIN
+    sums, counts = [0.0] * n, [0] * n
+    for vols in _bucket_volumes(bars, premarket, vol_scale, skip_day=today).values():
+        cum = 0.0
+        for i, v in enumerate(vols):
+            cum += v
+            if cum > 0:
+                sums[i] += cum
+                counts[i] += 1
+    cum = [round(s / c, 2) if c else 0.0 for s, c in zip(sums, counts)]
+    start = next((i for (i, c) in enumerate(counts) if c), n)
+    end = n
+    while end - 1 > start and cum[end - 1] == cum[end - 2]:
+        end -= 1
+    return {"start": start, "cum": cum[start:end]}
+
+
+def profile_baseline(profile, ref_minute) -> float:
+    """The profile's baseline for the FULLY-CLOSED buckets before `ref_minute` (minutes
+    since midnight ET); 0.0 before the first bucket closes."""
+    i = ref_minute // PROFILE_BUCKET_MIN - 1
+    if isinstance(profile, list):                  # the full-day form of older day caches
+        profile = {"start": 0, "cum": profile}
+    if not profile:
+        return 0.0
+    (start, cum) = (int(profile.get("start", 0)), profile.get("cum") or [])
+    if i < start or not cum:
+        return 0.0
+    return float(cum[min(i - start, len(cum) - 1)])
+
+
+def cumulative_volume(bars, day, ref_minute, premarket=False, vol_scale=1) -> float:
+    """`day`'s volume in the fully-closed 5-min buckets before `ref_minute` (skips the
+    forming bucket, so no look-ahead)."""
+    vols = _bucket_volumes(bars, premarket, vol_scale, day=day).get(day)
+    if not vols:
+        return 0.0
+    return sum(vols[:max(0, ref_minute // PROFILE_BUCKET_MIN)])
 
 
 def detect_volume_scale(ib) -> int:
@@ -0,0 +1,180 @@
+"""Market-regime service shared by every Intraday Equity strategy thread.
+
+Each strategy's ``regime_ok()`` gates new entries on SPY's intraday drop (and VIX when
+``vix_max`` is set). Pulling both through reqHistoricalData in every thread on every poll
+spends eight paced requests per poll on the same two instruments with four strategies.
+``RegimeService`` does it once for the process: its own thread and IB connection
+(``client_id_base + 91``) stream SPY and VIX with reqMktData, take SPY's session open
+from the first 5-min RTH bar, and publish a ``RegimeSnapshot`` every ``interval``
+seconds. A field the stream leaves empty (delayed data, no index entitlement) is filled
+from a history pull at most every ``fallback_sec``.
+
+The snapshot is immutable and replaced whole, so readers take no lock: they read
+``service.snapshot`` and check ``fresh()``. A stale snapshot (service disconnected or not
+started) tells the strategy to fall back to its own pulls.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+
+import calendar_util as cal
+from market_data import HistoryMemo
+
+
+@dataclass(frozen=True)
+class RegimeSnapshot:
+    spy_open: float | None = None      # first 5-min RTH bar's open
+    spy_last: float | None = None
+    vix: float | None = None
+    as_of: float = 0.0                 # time.monotonic() of the update; 0 = never
+    sources: dict = field(default_factory=dict, compare=False)   # field -> "stream"/"hist"
+
+    @property
+    def spy_change(self) -> float | None:
+        """SPY's move since the session open as a fraction (-0.006 = down 0.6%)."""
+        if not self.spy_open or self.spy_last is None:
+            return None
+        return (self.spy_last - self.spy_open) / self.spy_open
+
+    def fresh(self, max_age: float) -> bool:
+        return self.as_of > 0 and time.monotonic() - self.as_of <= max_age
+
+    def allows(self, max_drop_pct, vix_max=None) -> bool:
+        """The regime gate: False if SPY is down more than `max_drop_pct` since the open or
+        VIX is above `vix_max`. Missing values do not block (as with the per-thread pulls)."""
+        chg = self.spy_change
+        if chg is not None and chg < -abs(max_drop_pct):
+            return False
+        if vix_max and self.vix is not None and self.vix > float(vix_max):
+            return False
+        return True
+
+
+def _price(ticker):
+    """Last usable price of a streaming ticker (last, then the mark, then the close)."""
+    for attr in ("last", "marketPrice", "close"):
+        v = getattr(ticker, attr, None)
+        if callable(v):
+            try:
+                v = v()
+            except Exception:
+                v = None
+        if v is not None and not (isinstance(v, float) and v != v) and v > 0:
+            return float(v)
+    return None
+
+
+class RegimeService:
+    """Background SPY/VIX regime feed (see module doc). ``start()`` / ``stop()``."""
+
+    def __init__(self, shared, client_id, log, with_vix=True, interval=5.0, fallback_sec=60.0):
+        self.shared = shared
+        self.client_id = int(client_id)
+        self.log = log
+        self.with_vix = bool(with_vix)
+        self.interval = float(interval)
+        self.fallback_sec = float(fallback_sec)
+        self.snapshot = RegimeSnapshot()
+        self.ib = None
+        self._spy = self._vix = None
+        self._tk_spy = self._tk_vix = None
+        self._pulled: dict[str, tuple] = {}       # field -> (monotonic time, value)
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ----------------------------------------------------------------- lifecycle
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="regime", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+
+    def run(self):
+        # own event loop BEFORE constructing IB() (same rule as the strategy threads)
+        asyncio.set_event_loop(asyncio.new_event_loop())
+        try:
+            while not self._stop.is_set():
+                if self.ib is None or not self.ib.isConnected():
+                    if not self._connect():
+                        self._stop.wait(30)
+                        continue
+                try:
+                    self.refresh()
+                    self.ib.sleep(self.interval)
+                except Exception as e:
+                    self.log(f"regime service: {type(e).__name__}: {e}")
+                    self._stop.wait(self.interval)
+        finally:
+            try:
+                if self.ib is not None and self.ib.isConnected():
+                    self.ib.disconnect()
+            except Exception:
+                pass
+
+    def _connect(self) -> bool:
+        from ib_async import IB, Index, Stock
+        try:
+            self.ib = IB()
+            self.ib.connect(self.shared.get("host", "127.0.0.1"), int(self.shared.get("port", 7497)),
+                            clientId=self.client_id, account=self.shared.get("default_account") or "")
+            self.ib.reqMarketDataType(int(self.shared.get("market_data_type", 1)))
+            self._spy = Stock("SPY", "SMART", "USD")
+            self.ib.qualifyContracts(self._spy)
+            self._tk_spy = self.ib.reqMktData(self._spy, "", False, False)
+            if self.with_vix:
+                self._vix = Index("VIX", "CBOE")
+                self.ib.qualifyContracts(self._vix)
+                self._tk_vix = self.ib.reqMktData(self._vix, "", False, False)
+            self.log(f"regime service: streaming SPY{' + VIX' if self.with_vix else ''} "
+                     f"(clientId {self.client_id})")
+            return True
+        except Exception as e:
+            self.log(f"regime service: connect failed ({e}); strategies pull their own regime data")
+            return False
+
+    # ----------------------------------------------------------------- update
+    def refresh(self):
+        """Publish a new snapshot from the streams (history for what they lack)."""
+        prev, sources = self.snapshot, {}
+        spy_open = prev.spy_open
+        if spy_open is None and cal.now_et() >= cal.session_open():
+            bars = self._bars(self._spy)
+            if bars:
+                spy_open = float(bars[0].open)
+                sources["spy_open"] = "hist"
+        spy_last = self._value("spy_last", self._tk_spy, self._spy, sources)
+        vix = self._value("vix", self._tk_vix, self._vix, sources) if self.with_vix else None
+        self.snapshot = RegimeSnapshot(spy_open, spy_last, vix, time.monotonic(), sources)
+
+    def _value(self, name, ticker, contract, sources):
+        v = _price(ticker) if ticker is not None else None
+        if v is not None:
+            sources[name] = "stream"
+            return v
+        (at, v) = self._pulled.get(name, (None, None))
+        if at is None or time.monotonic() - at >= self.fallback_sec:
+            bars = self._bars(contract)
+            v = float(bars[-1].close) if bars and bars[-1].close else None
+            self._pulled[name] = (time.monotonic(), v)
+        if v is not None:
+            sources[name] = "hist"
+        return v
+
+    def _bars(self, contract):
+        if contract is None:
+            return []
+        rate = self.shared.get("rate_limiter")
+        if rate is not None:
+            rate.acquire(HistoryMemo.key(contract, "1 D", "5 mins", "TRADES", True), ib=self.ib)
+        try:
+            return self.ib.reqHistoricalData(contract, "", "1 D", "5 mins", "TRADES", True, 1) or []
+        except Exception as e:
+            self.log(f"regime service: {getattr(contract, 'symbol', '?')} history error: {e}")
+            return []
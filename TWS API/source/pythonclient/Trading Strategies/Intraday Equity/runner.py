@@ -31,8 +31,9 @@ if BASE not in sys.path:
     sys.path.insert(0, BASE)
 
 import calendar_util as cal                     # noqa: E402
-from market_data import RateLimiter, DailyCache, detect_volume_scale  # noqa: E402
+from market_data import RateLimiter, DailyCache, HistoryMemo, LineBudget, detect_volume_scale  # noqa: E402
 from portfolio_risk import PortfolioRiskManager, SymbolLock  # noqa: E402
+from regime import RegimeService  # noqa: E402
 from reporting import TradeReporter  # noqa: E402
 from strategies.orb_stocks_in_play import ORBStocksInPlay  # noqa: E402
 from strategies.nr7_compression import NR7Compression      # noqa: E402
@@ -149,8 +150,12 @@ def main():
         "market_data_type": int(cfg.get("market_data_type", 1)),  # 1=live 2=frozen 3=delayed 4=delayed-frozen
         "shared_risk": shared_risk,
         "sector_map": cfg.get("sector_map", {}),
-        "rate_limiter": RateLimiter(min_interval=float(cfg.get("hist_min_interval_sec", 2.0))),
+        "rate_limiter": RateLimiter(min_interval=float(cfg.get("hist_min_interval_sec", 0.25))),
         "cache": DailyCache(os.path.join(BASE, f"cache_{stamp}.json"), stamp),
+        "hist_memo": HistoryMemo(),   # watchlist pulls shared across strategy threads
+        # the account's market-data lines: every thread's tickers and real-time bar streams
+        "md_lines": LineBudget(int(shared_risk.get("market_data_line_cap", 90)),
+                               int(shared_risk.get("live_bars_max", 50))),
         "vol_scale": vol_scale,
         "start_equity": equity,
         "journal": journal,
@@ -159,6 +164,15 @@ def main():
 
     active = cfg.get("active_strategies", [])
     base_id = int(cfg.get("client_id_base", 30))
+    # ONE SPY/VIX regime feed for all strategy threads (own connection, clientId base+91)
+    regime_cfg = shared_risk.get("regime", {})
+    regime = None
+    if regime_cfg.get("spy_downtrend_gate", True) and regime_cfg.get("shared_service", True):
+        regime = RegimeService(shared, base_id + 91, log, with_vix=bool(regime_cfg.get("vix_max")),
+                               interval=float(regime_cfg.get("refresh_sec", 5))).start()
+        shared["regime"] = regime
+        for sym in ("SPY", "VIX") if regime_cfg.get("vix_max") else ("SPY",):
+            shared["md_lines"].claim("regime", "ticker", sym, force=True)
     overrides = ("max_concurrent_tickers", "max_positions_per_sector", "daily_loss_limit_pct",
                  "aggregate_open_risk_pct", "risk_per_trade_pct")
     threads, managers = [], {}
@@ -193,6 +207,9 @@ def main():
 
     for t in threads:
         t.join()
+    if regime is not None:
+        regime.stop()
+    log(shared["rate_limiter"].summary())
     for name, rm in managers.items():
         log(f"[{name}] final risk snapshot: {rm.snapshot()}")
 
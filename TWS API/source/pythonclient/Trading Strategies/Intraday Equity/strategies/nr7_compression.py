@@ -29,30 +29,32 @@ class NR7Compression(EquityStrategyBase):
         adr_min = self.cfg.get("adr_min_pct", 5.0)
         sma_n = int(self.cfg.get("sma_period", 20))
         nr7_n = int(self.cfg.get("nr7_lookback", 7))
-        kept = []
-        for sym in self.scanner_universe():
-            c = self.qualify(sym)
-            bars = self.hist(c, f"{max(sma_n, nr7_n, 25) + 5} D", "1 day", "TRADES", True)
+        daily = f"{max(sma_n, nr7_n, 25) + 5} D"
+        adr_n = int(self.cfg.get("adr_lookback", 20))
+
+        def daily_ok(sym, c):
+            bars = self.hist(c, daily, "1 day", "TRADES", True)
             # only COMPLETED prior sessions (drop today's forming daily bar during RTH)
             bars = [b for b in bars if b.date.strftime("%Y%m%d") < cal.now_et().strftime("%Y%m%d")]
             if len(bars) < max(sma_n, nr7_n) + 1:
-                continue
+                return False
             ref = bars[-1]  # most recent COMPLETED session (the compression day)
             if not ref.close or ref.close < price_min or ref.close > price_max:
-                continue
+                return False
             ranges = [(b.high - b.low) for b in bars[-nr7_n:]]
             if (ref.high - ref.low) > min(ranges):   # ref must be the narrowest
-                continue
-            adrp = self.adr_pct(c, int(self.cfg.get("adr_lookback", 20)))
-            if adrp < adr_min:
-                continue
+                return False
             sma = sum(b.close for b in bars[-sma_n:]) / sma_n
             if ref.close <= sma:
-                continue
+                return False
             advsh = sum(float(b.volume) * self.vol_scale for b in bars[-20:]) / min(20, len(bars))
-            if advsh < adv_min:
-                continue
-            kept.append(sym)
+            return advsh >= adv_min
+
+        kept = self.screen(self.scanner_universe(), [
+            ("daily bars", lambda s, c: [(c, daily, "1 day", "TRADES", True)], daily_ok),
+            ("ADR", lambda s, c: self.adr_requests(c, adr_n),
+             lambda s, c: self.adr_pct(c, adr_n) >= adr_min),
+        ])
         line_cap = int(self.shared.get("shared_risk", {}).get("market_data_line_cap", 90))
         for sym in kept[:line_cap]:
             self.get_ticker(sym, self.qualify(sym))
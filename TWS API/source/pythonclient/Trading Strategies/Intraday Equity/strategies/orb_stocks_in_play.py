@@ -30,32 +30,36 @@ class ORBStocksInPlay(EquityStrategyBase):
         universe = [s for s in self.scanner_universe() if s not in excl]
         line_cap = int(self.shared.get("shared_risk", {}).get("market_data_line_cap", 90))
 
-        kept = []
-        for sym in universe:
-            c = self.qualify(sym)
+        closes = {}
+
+        def price_ok(sym, c):
             day = self.hist(c, "3 D", "1 day", "TRADES", True)
             # prior SESSION pinned by DATE (exclude today's forming daily bar during RTH)
             prior = [b for b in day if b.date.strftime("%Y%m%d") < cal.now_et().strftime("%Y%m%d")]
             if not prior or not prior[-1].close:
-                continue
-            prior_close = prior[-1].close
-            if prior_close < price_min:
-                continue
+                return False
+            closes[sym] = prior[-1].close
+            return closes[sym] >= price_min
+
+        def adv_ok(sym, c):
             # $-ADV in shares terms
-            adv_sh = (self.dollar_adv(sym, c) / prior_close) if prior_close else 0
-            if adv_sh < adv_min:
-                continue
+            return self.dollar_adv(sym, c) / closes[sym] >= adv_min
+
+        def gap_ok(sym, c):
             # opening gap from prior close (uses today's 5-min open)
             bars5 = self.hist(c, "1 D", "5 mins", "TRADES", True)
-            if not bars5:
-                continue
-            gap = (bars5[0].open - prior_close) / prior_close if prior_close else 0
+            return bool(bars5) and (bars5[0].open - closes[sym]) / closes[sym] >= gap_min
+
+        def rvol_ok(sym, c):
             pmr = self.rvol(c, cal.session_open(), premarket=True)
-            rvol_ok = (pmr is None) or (pmr >= rvol_min)   # None = no premarket history -> keep
-            if gap >= gap_min and rvol_ok:
-                kept.append(sym)
-            if len(kept) >= int(self.cfg.get("max_watchlist", 30)):
-                break
+            return pmr is None or pmr >= rvol_min   # None = no premarket history -> keep
+
+        kept = self.screen(universe, [
+            ("daily bars", lambda s, c: [(c, "3 D", "1 day", "TRADES", True)], price_ok),
+            ("ADV", self.adv_requests, adv_ok),
+            ("gap", lambda s, c: [(c, "1 D", "5 mins", "TRADES", True)], gap_ok),
+            ("pre-market RVOL", lambda s, c: self.rvol_requests(c, premarket=True), rvol_ok),
+        ])[:int(self.cfg.get("max_watchlist", 30))]
 
         for sym in kept[:line_cap]:
             self.get_ticker(sym, self.qualify(sym))
@@ -35,27 +35,24 @@ class VWAPPullback(EquityStrategyBase):
         dadv_min = u.get("min_dollar_adv", self.cfg.get("min_dollar_adv", 25_000_000))
         rvol_min = u.get("min_premarket_rvol", self.cfg.get("premarket_rvol_min", 1.5))
         excl = set(self.cfg.get("exclude_symbols", [])) | set(u.get("exclude_symbols", [])) | {"SPY", "QQQ"}
-        kept = []
-        for sym in self.scanner_universe():
-            if sym in excl:
-                continue
-            c = self.qualify(sym)
+
+        def price_ok(sym, c):
             day = self.hist(c, "6 D", "1 day", "TRADES", True)
             # prior SESSION pinned by DATE (exclude today's forming daily bar during RTH)
             prior = [b for b in day if b.date.strftime("%Y%m%d") < cal.now_et().strftime("%Y%m%d")]
             if not prior or not prior[-1].close:
-                continue
-            ref = prior[-1]
-            if ref.close < price_min or ref.close > price_max:
-                continue
-            if self.dollar_adv(sym, c) < dadv_min:
-                continue
+                return False
+            return price_min <= prior[-1].close <= price_max
+
+        def rvol_ok(sym, c):
             pmr = self.rvol(c, cal.session_open(), premarket=True)
-            if pmr is not None and pmr < rvol_min:   # None = no premarket history -> keep
-                continue
-            kept.append(sym)
-            if len(kept) >= int(self.cfg.get("max_watchlist", 30)):
-                break
+            return pmr is None or pmr >= rvol_min   # None = no premarket history -> keep
+
+        kept = self.screen([s for s in self.scanner_universe() if s not in excl], [
+            ("daily bars", lambda s, c: [(c, "6 D", "1 day", "TRADES", True)], price_ok),
+            ("$ADV", self.adv_requests, lambda s, c: self.dollar_adv(s, c) >= dadv_min),
+            ("pre-market RVOL", lambda s, c: self.rvol_requests(c, premarket=True), rvol_ok),
+        ])[:int(self.cfg.get("max_watchlist", 30))]
         line_cap = int(self.shared.get("shared_risk", {}).get("market_data_line_cap", 90))
         for sym in kept[:line_cap]:
             self.get_ticker(sym, self.qualify(sym))
@@ -0,0 +1,145 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Wire-to-callback latency of the threaded EClient (EReader thread + queue +
+run() loop) and of the AsyncEClient. A stub TWS streams TICK_STRING messages
+carrying their send time (perf_counter_ns) and the tickString() callback
+measures how long each one took to reach it.
+
+Usage: python benchmarks/bench_async_latency.py [nTicks]
+"""
+
+import asyncio
+import os
+import socket
+import statistics
+import struct
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ibapi import comm  # noqa: E402
+from ibapi.async_client import AsyncEClient  # noqa: E402
+from ibapi.client import EClient  # noqa: E402
+from ibapi.comm import make_field  # noqa: E402
+from ibapi.message import IN, OUT  # noqa: E402
+from ibapi.server_versions import MIN_SERVER_VER_PROTOBUF  # noqa: E402
+from ibapi.wrapper import EWrapper  # noqa: E402
+
+SERVER_VERSION = MIN_SERVER_VER_PROTOBUF - 1
+TICK_INTERVAL = 0.0002
+
+
+class StubTws(threading.Thread):
+    """Serves one client: handshake, then nTicks time stamped TICK_STRINGs
+    once START_API is received."""
+
+    def __init__(self, nTicks: int):
+        super().__init__(daemon=True)
+        self.nTicks = nTicks
+        self.server = socket.socket()
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+
+    @staticmethod
+    def recvExactly(sock, n: int) -> bytes:
+        buf = b""
+        while len(buf) < n:
+            data = sock.recv(n - len(buf))
+            if not data:
+                raise ConnectionError()
+            buf += data
+        return buf
+
+    def recvMsg(self, sock) -> tuple:
+        (size,) = struct.unpack("!I", self.recvExactly(sock, 4))
+        return comm.read_fields(self.recvExactly(sock, size))
+
+    def run(self):
+        (sock, _) = self.server.accept()
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with sock:
+            self.recvExactly(sock, 4)  # API\0
+            self.recvMsg(sock)
+            sock.sendall(comm.make_initial_msg(make_field(SERVER_VERSION) + make_field("20250102 09:30:00 EST")))
+            while int(self.recvMsg(sock)[0]) != OUT.START_API:
+                pass
+            for _ in range(self.nTicks):
+                text = "".join(make_field(f) for f in (6, 1, 45, time.perf_counter_ns()))
+                sock.sendall(comm.make_msg(IN.TICK_STRING, False, text))
+                time.sleep(TICK_INTERVAL)
+            try:
+                self.recvExactly(sock, 1)  # until the client disconnects
+            except (ConnectionError, OSError):
+                pass
+        self.server.close()
+
+
+class LatencyWrapper(EWrapper):
+    def __init__(self, nTicks: int):
+        EWrapper.__init__(self)
+        self.nTicks = nTicks
+        self.latencies = []
+        self.done = threading.Event()
+
+    def tickString(self, reqId, tickType, value):
+        self.latencies.append(time.perf_counter_ns() - int(value))
+        if len(self.latencies) == self.nTicks:
+            self.done.set()
+
+    def error(self, reqId, errorTime, errorCode, errorString, advancedOrderRejectJson=""):
+        pass
+
+
+def run_threaded(nTicks: int) -> list:
+    tws = StubTws(nTicks)
+    tws.start()
+    wrapper = LatencyWrapper(nTicks)
+    client = EClient(wrapper)
+    client.connect("127.0.0.1", tws.port, 0)
+    thread = threading.Thread(target=client.run, daemon=True)
+    thread.start()
+    wrapper.done.wait(60)
+    client.disconnect()
+    thread.join()
+    return wrapper.latencies
+
+
+def run_async(nTicks: int) -> list:
+    async def main():
+        tws = StubTws(nTicks)
+        tws.start()
+        wrapper = LatencyWrapper(nTicks)
+        client = AsyncEClient(wrapper)
+        await client.connectAsync("127.0.0.1", tws.port, 0, timeout=10)
+        while not wrapper.done.is_set():
+            await asyncio.sleep(0.05)
+        client.disconnect()
+        return wrapper.latencies
+
+    return asyncio.run(main())
+
+
+def report(name: str, latencies: list):
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{name:>10} {statistics.median(latencies) / 1000:>10.1f} "
+        f"{p99 / 1000:>10.1f} {statistics.mean(latencies) / 1000:>10.1f}"
+    )
+
+
+def main():
+    nTicks = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"{nTicks} ticks, one every {TICK_INTERVAL * 1e6:.0f}us, latency in us")
+    print(f"{'client':>10} {'median':>10} {'p99':>10} {'mean':>10}")
+    report("threaded", run_threaded(nTicks))
+    report("asyncio", run_async(nTicks))
+
+
+if __name__ == "__main__":
+    main()
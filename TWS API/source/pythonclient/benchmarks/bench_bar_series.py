@@ -0,0 +1,76 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+One SupertrendBot evaluation (supertrend, dema, adx, rsi, macd, choppiness on the same bars)
+given the plain list of bars versus a BarSeries converted once.
+
+Usage: python benchmarks/bench_bar_series.py [nBars]
+"""
+
+import datetime
+import os
+import random
+import sys
+import time
+from collections import namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trading Strategies"))
+
+from Indicators import (adx_value, choppiness_value, dema_value, macd_value,  # noqa: E402
+                        rsi_value, supertrend_value)
+from Indicators.bar_series import BarSeries  # noqa: E402
+
+BarData = namedtuple("BarData", "date open high low close volume average barCount")
+
+
+def make_bars(n: int):
+    rnd = random.Random(3)
+    bars = []
+    close = 100.0
+    t = datetime.datetime(2025, 1, 2, 9, 30)
+    for _ in range(n):
+        o = close
+        close = max(1.0, o + rnd.gauss(0, 1.5))
+        bars.append(BarData(t, o, max(o, close) + rnd.random(), min(o, close) - rnd.random(),
+                            close, float(rnd.randint(100, 5000)), close, 10))
+        t += datetime.timedelta(minutes=15)
+    return bars
+
+
+def best_of(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def evaluate(bars):
+    supertrend_value(bars=bars, atr_period=10, multiplier=3.0)
+    dema_value(bars=bars, period=200)
+    adx_value(bars=bars, period=14)
+    rsi_value(bars=bars, period=14)
+    macd_value(bars=bars)
+    choppiness_value(bars=bars, period=14)
+
+
+def main():
+    nBars = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    bars = make_bars(nBars)
+
+    tList = best_of(lambda: evaluate(bars))
+    tConvert = best_of(lambda: BarSeries.from_bars(bars))
+    series = BarSeries.from_bars(bars)
+    tSeries = best_of(lambda: evaluate(series))
+
+    print(f"{nBars} bars, six indicators")
+    print(f"list of bars     {tList * 1e3:8.1f}ms")
+    print(f"BarSeries        {tSeries * 1e3:8.1f}ms  (+{tConvert * 1e3:.1f}ms to convert once)")
+    print(f"speedup          {tList / (tSeries + tConvert):8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Sends reqMktData requests to a fake TWS (a local socket that only counts the
+incoming messages) one write per request and with EClient.batch(), with and
+without TCP_NODELAY. The time runs until the fake TWS has received the last
+request.
+
+Usage: python benchmarks/bench_batch_send.py [nRequests]
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ibapi.client import EClient  # noqa: E402
+from ibapi.connection import Connection  # noqa: E402
+from ibapi.contract import Contract  # noqa: E402
+from ibapi.framing import FrameBuffer  # noqa: E402
+from ibapi.server_versions import MAX_CLIENT_VER  # noqa: E402
+from ibapi.wrapper import EWrapper  # noqa: E402
+
+
+class FakeTws:
+    """Accepts one connection and counts the messages received on it."""
+
+    def __init__(self):
+        self.server = socket.socket()
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+        self.nMsgs = 0
+        self.done = threading.Event()
+        self.expected = 0
+
+    def start(self, expected: int):
+        self.expected = expected
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        (sock, _) = self.server.accept()
+        frames = FrameBuffer()
+        with sock:
+            while self.nMsgs < self.expected:
+                view = frames.writable()
+                nRecv = sock.recv_into(view)
+                if nRecv == 0:
+                    break
+                frames.commit(nRecv)
+                for _ in frames.msgs():
+                    self.nMsgs += 1
+        self.done.set()
+        self.server.close()
+
+
+def make_client(port: int, tcpNoDelay) -> EClient:
+    client = EClient(EWrapper())
+    client.conn = Connection("127.0.0.1", port)
+    client.conn.setTcpNoDelay(tcpNoDelay)
+    client.conn.connect()
+    client.serverVersion_ = MAX_CLIENT_VER
+    client.setConnState(EClient.CONNECTED)
+    return client
+
+
+def contracts(nRequests: int) -> list:
+    result = []
+    for i in range(nRequests):
+        contract = Contract()
+        contract.symbol = f"SYM{i}"
+        contract.secType = "STK"
+        contract.exchange = "SMART"
+        contract.currency = "USD"
+        result.append(contract)
+    return result
+
+
+def run(nRequests: int, batched: bool, tcpNoDelay) -> float:
+    tws = FakeTws()
+    tws.start(nRequests)
+    client = make_client(tws.port, tcpNoDelay)
+    toSend = contracts(nRequests)
+
+    t0 = time.perf_counter()
+    if batched:
+        with client.batch():
+            for reqId, contract in enumerate(toSend):
+                client.reqMktData(reqId, contract, "", False, False, [])
+    else:
+        for reqId, contract in enumerate(toSend):
+            client.reqMktData(reqId, contract, "", False, False, [])
+    tws.done.wait(10)
+    elapsed = time.perf_counter() - t0
+
+    assert tws.nMsgs == nRequests, tws.nMsgs
+    client.conn.disconnect()
+    return elapsed
+
+
+def main():
+    nRequests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{nRequests} reqMktData requests")
+    print(f"{'mode':>28} {'req/s':>12}")
+    for batched in (False, True):
+        for tcpNoDelay in (None, True):
+            best = min(run(nRequests, batched, tcpNoDelay) for _ in range(5))
+            mode = ("batch" if batched else "one write/request") + (" +NODELAY" if tcpNoDelay else "")
+            print(f"{mode:>28} {nRequests / best:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
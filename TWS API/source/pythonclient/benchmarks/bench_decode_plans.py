@@ -0,0 +1,95 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Decodes an account update stream (ACCT_VALUE, ACCT_UPDATE_TIME,
+ACCT_DOWNLOAD_END as sent after reqAccountUpdates) with the signature walking
+Decoder.interpretWithSignature() and with the precompiled decode plans used
+by Decoder.interpret().
+
+Usage: python benchmarks/bench_decode_plans.py [nMsgs]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ibapi.decoder import Decoder  # noqa: E402
+from ibapi.message import IN  # noqa: E402
+from ibapi.server_versions import MIN_SERVER_VER_ENCODE_MSG_ASCII7  # noqa: E402
+from ibapi.wrapper import EWrapper  # noqa: E402
+
+KEYS = (
+    "AccruedCash", "AvailableFunds", "BuyingPower", "CashBalance", "EquityWithLoanValue",
+    "ExcessLiquidity", "FullInitMarginReq", "FullMaintMarginReq", "GrossPositionValue",
+    "NetLiquidation", "RealizedPnL", "TotalCashValue", "UnrealizedPnL",
+)
+
+
+class CountingWrapper(EWrapper):
+    def __init__(self):
+        EWrapper.__init__(self)
+        self.count = 0
+
+    def updateAccountValue(self, key: str, val: str, currency: str, accountName: str):
+        self.count += 1
+
+    def updateAccountTime(self, timeStamp: str):
+        self.count += 1
+
+    def accountDownloadEnd(self, accountName: str):
+        self.count += 1
+
+
+def record_stream(nMsgs: int) -> list:
+    """(msgId, fields) as EClient.run() hands them to the decoder"""
+    stream = []
+    i = 0
+    while len(stream) < nMsgs:
+        for key in KEYS:
+            value = f"{100000 + i * 0.37:.2f}".encode()
+            stream.append((IN.ACCT_VALUE, (b"2", key.encode(), value, b"USD", b"DU1234567")))
+        stream.append((IN.ACCT_UPDATE_TIME, (b"1", b"%02d:%02d" % (i // 60 % 24, i % 60))))
+        stream.append((IN.ACCT_DOWNLOAD_END, (b"1", b"DU1234567")))
+        i += 1
+    return stream[:nMsgs]
+
+
+def run_signature(decoder, stream):
+    handleInfos = decoder.msgId2handleInfo
+    for msgId, fields in stream:
+        decoder.interpretWithSignature(fields, handleInfos[msgId])
+
+
+def run_plan(decoder, stream):
+    for msgId, fields in stream:
+        decoder.interpret(fields, msgId)
+
+
+def timeit(fn, stream, repeat: int = 5) -> float:
+    best = None
+    for _ in range(repeat):
+        wrapper = CountingWrapper()
+        decoder = Decoder(wrapper, MIN_SERVER_VER_ENCODE_MSG_ASCII7)
+        t0 = time.perf_counter()
+        fn(decoder, stream)
+        elapsed = time.perf_counter() - t0
+        assert wrapper.count == len(stream)
+        best = elapsed if best is None else min(best, elapsed)
+    return len(stream) / best
+
+
+def main():
+    nMsgs = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    stream = record_stream(nMsgs)
+    before = timeit(run_signature, stream)
+    after = timeit(run_plan, stream)
+    print(f"{nMsgs} account update messages")
+    print(f"interpretWithSignature: {before:>12,.0f} msg/s")
+    print(f"decode plans:           {after:>12,.0f} msg/s  ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
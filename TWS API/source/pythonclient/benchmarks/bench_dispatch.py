@@ -0,0 +1,128 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Hands tick messages from a reader thread to a dispatch thread, as EReader and
+EClient.run() do, through queue.Queue (one put/get per message) and through
+the BatchQueue of the batched dispatch (one putBatch/drain per socket read).
+The dispatch side either only counts the messages (hand-off cost alone) or
+decodes them and calls the wrapper.
+
+Usage: python benchmarks/bench_dispatch.py [nMsgs]
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ibapi import comm  # noqa: E402
+from ibapi.client import EClient  # noqa: E402
+from ibapi.decoder import Decoder  # noqa: E402
+from ibapi.dispatch import BatchQueue  # noqa: E402
+from ibapi.message import IN  # noqa: E402
+from ibapi.server_versions import MIN_SERVER_VER_PROTOBUF  # noqa: E402
+from ibapi.wrapper import EWrapper  # noqa: E402
+
+SERVER_VERSION = MIN_SERVER_VER_PROTOBUF - 1
+MSGS_PER_READ = 40  # about a 4KB socket read of tick messages
+
+
+class CountingWrapper(EWrapper):
+    def __init__(self):
+        EWrapper.__init__(self)
+        self.count = 0
+
+    def tickPrice(self, reqId, tickType, price, attrib):
+        pass
+
+    # every message ends in one tickSize() (TICK_PRICE 1 is followed by its size)
+    def tickSize(self, reqId, tickType, size):
+        self.count += 1
+
+
+def make_reads(nMsgs: int) -> list:
+    msgs = []
+    for i in range(nMsgs):
+        if i % 2:
+            fields = (IN.TICK_PRICE, 6, i % 300, 1, 123.45, 100, 3)
+        else:
+            fields = (IN.TICK_SIZE, 6, i % 300, 0, 200)
+        msgs.append("".join(comm.make_field(f) for f in fields).encode())
+    return [msgs[i : i + MSGS_PER_READ] for i in range(0, nMsgs, MSGS_PER_READ)]
+
+
+def make_client() -> EClient:
+    wrapper = CountingWrapper()
+    client = EClient(wrapper)
+    client.serverVersion_ = SERVER_VERSION
+    client.decoder = Decoder(wrapper, SERVER_VERSION)
+    return client
+
+
+def run_queue(reads, nMsgs: int, decode: bool) -> float:
+    client = make_client()
+    nTaken = 0
+
+    def reader():
+        for msgs in reads:
+            for msg in msgs:
+                client.msg_queue.put(msg)
+
+    t0 = time.perf_counter()
+    thread = threading.Thread(target=reader)
+    thread.start()
+    # the body of EClient.run()
+    while nTaken < nMsgs:
+        try:
+            text = client.msg_queue.get(block=True, timeout=0.2)
+        except queue.Empty:
+            continue
+        nTaken += 1
+        if decode:
+            client.processMsg(text)
+    elapsed = time.perf_counter() - t0
+    thread.join()
+    return elapsed
+
+
+def run_batch_queue(reads, nMsgs: int, decode: bool) -> float:
+    client = make_client()
+    nTaken = 0
+    client.msg_queue = BatchQueue(SERVER_VERSION)
+
+    def reader():
+        for msgs in reads:
+            client.msg_queue.putBatch(list(msgs))
+
+    t0 = time.perf_counter()
+    thread = threading.Thread(target=reader)
+    thread.start()
+    # the body of EClient.runBatched()
+    while nTaken < nMsgs:
+        msgs = client.msg_queue.drain(timeout=0.2)
+        nTaken += len(msgs)
+        if decode:
+            for text in msgs:
+                client.processMsg(text)
+    elapsed = time.perf_counter() - t0
+    thread.join()
+    return elapsed
+
+
+def main():
+    nMsgs = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    reads = make_reads(nMsgs)
+    print(f"{nMsgs} tick messages in reads of {MSGS_PER_READ}, msg/s")
+    print(f"{'':>12} {'hand-off':>12} {'+ decoding':>12}")
+    for name, fn in (("queue.Queue", run_queue), ("BatchQueue", run_batch_queue)):
+        tHandOff = min(fn(reads, nMsgs, False) for _ in range(3))
+        tDecode = min(fn(reads, nMsgs, True) for _ in range(3))
+        print(f"{name:>12} {nMsgs / tHandOff:>12,.0f} {nMsgs / tDecode:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
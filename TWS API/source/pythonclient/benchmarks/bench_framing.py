@@ -0,0 +1,94 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Compares the old EReader framing loop ("buf += data" + comm.read_msg) with
+the FrameBuffer on bursts of tick messages delivered in socket sized chunks.
+
+Usage: python benchmarks/bench_framing.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ibapi import comm  # noqa: E402
+from ibapi.framing import FrameBuffer  # noqa: E402
+from ibapi.message import IN  # noqa: E402
+
+
+def make_burst(burstSize: int) -> bytes:
+    """TICK_PRICE/TICK_SIZE messages until burstSize bytes are reached"""
+    msgs = []
+    total = 0
+    reqId = 0
+    while total < burstSize:
+        reqId += 1
+        if reqId % 2:
+            text = "".join(comm.make_field(f) for f in (IN.TICK_PRICE, 6, reqId, 1, 123.45, 100, 3))
+        else:
+            text = "".join(comm.make_field(f) for f in (IN.TICK_SIZE, 6, reqId, 0, 200))
+        msg = comm.make_initial_msg(text)
+        msgs.append(msg)
+        total += len(msg)
+    return b"".join(msgs)
+
+
+def chunked(stream: bytes, chunkSize: int) -> list:
+    return [stream[i : i + chunkSize] for i in range(0, len(stream), chunkSize)]
+
+
+def run_read_msg(chunks) -> int:
+    nMsgs = 0
+    buf = b""
+    for data in chunks:
+        buf += data
+        while len(buf) > 0:
+            (size, msg, buf) = comm.read_msg(buf)
+            if msg:
+                nMsgs += 1
+            else:
+                break
+    return nMsgs
+
+
+def run_frame_buffer(chunks) -> int:
+    nMsgs = 0
+    frames = FrameBuffer()
+    for data in chunks:
+        frames.feed(data)
+        for _ in frames.msgs():
+            nMsgs += 1
+    return nMsgs
+
+
+def timeit(fn, chunks, repeat: int) -> tuple:
+    best = None
+    nMsgs = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        nMsgs = fn(chunks)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return nMsgs, best
+
+
+def main():
+    print(f"{'burst':>10} {'chunk':>7} {'msgs':>7} {'read_msg msg/s':>16} {'FrameBuffer msg/s':>18} {'speedup':>8}")
+    for burstSize in (64 * 1024, 1024 * 1024, 4 * 1024 * 1024):
+        stream = make_burst(burstSize)
+        for chunkSize in (4096, 65536):
+            chunks = chunked(stream, chunkSize)
+            nOld, tOld = timeit(run_read_msg, chunks, 3)
+            nNew, tNew = timeit(run_frame_buffer, chunks, 3)
+            assert nOld == nNew
+            print(
+                f"{burstSize:>10} {chunkSize:>7} {nNew:>7} {nOld / tOld:>16,.0f} "
+                f"{nNew / tNew:>18,.0f} {tOld / tNew:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
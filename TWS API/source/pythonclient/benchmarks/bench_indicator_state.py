@@ -0,0 +1,94 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Per-bar cost of the indicators SupertrendBot evaluates on every new bar (Supertrend, DEMA,
+ADX, RSI, MACD, CHOP): the *_value helpers recomputed over the whole window of bars versus
+one update() of the streaming *State classes.
+
+Usage: python benchmarks/bench_indicator_state.py [nBars]
+"""
+
+import os
+import random
+import sys
+import time
+from collections import namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trading Strategies"))
+
+from Indicators.dema import DEMAState, dema_value  # noqa: E402
+from Indicators.momentum.macd import MACDState, macd_value  # noqa: E402
+from Indicators.momentum.rsi import RSIState, rsi_value  # noqa: E402
+from Indicators.trend.adx import ADXState, adx_value  # noqa: E402
+from Indicators.trend.choppiness import ChopState, choppiness_value  # noqa: E402
+from Indicators.trend.supertrend import SupertrendState, supertrend_value  # noqa: E402
+
+Bar = namedtuple("Bar", "open high low close date")
+NEW_BARS = 200
+
+
+def make_bars(n: int) -> list:
+    rnd = random.Random(7)
+    bars = []
+    close = 100.0
+    for i in range(n):
+        o = close
+        close = max(1.0, o + rnd.gauss(0, 1.5))
+        bars.append(Bar(o, max(o, close) + rnd.random(), min(o, close) - rnd.random(), close, i))
+    return bars
+
+
+def recompute(window: list):
+    supertrend_value(bars=window, atr_period=10, multiplier=3.0)
+    dema_value(bars=window, period=200)
+    adx_value(bars=window, period=14)
+    rsi_value(bars=window, period=14)
+    macd_value(bars=window)
+    choppiness_value(bars=window, period=14)
+
+
+def make_states(history: list) -> list:
+    return [
+        SupertrendState(10, 3.0).seed(history),
+        DEMAState(200).seed(history),
+        ADXState(14).seed(history),
+        RSIState(14).seed(history),
+        MACDState().seed(history),
+        ChopState(14).seed(history),
+    ]
+
+
+def main():
+    nBars = int(sys.argv[1]) if len(sys.argv) > 1 else 450
+    bars = make_bars(nBars + NEW_BARS)
+
+    best = None
+    for _ in range(3):
+        t0 = time.perf_counter()
+        for k in range(NEW_BARS):
+            # the bot's window: the last nBars bars plus the forming one
+            recompute(bars[k : k + nBars + 1])
+        elapsed = (time.perf_counter() - t0) / NEW_BARS
+        best = elapsed if best is None else min(best, elapsed)
+    tRecompute = best
+
+    best = None
+    for _ in range(3):
+        states = make_states(bars[:nBars])
+        t0 = time.perf_counter()
+        for bar in bars[nBars:]:
+            for state in states:
+                state.update(bar)
+                state.result()
+        elapsed = (time.perf_counter() - t0) / NEW_BARS
+        best = elapsed if best is None else min(best, elapsed)
+    tUpdate = best
+
+    print(f"6 indicators, {nBars} bars of history, cost per new bar")
+    print(f"*_value recompute: {tRecompute * 1e6:>10.1f}us")
+    print(f"*State update:     {tUpdate * 1e6:>10.1f}us  ({tRecompute / tUpdate:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
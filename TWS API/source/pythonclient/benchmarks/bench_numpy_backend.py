@@ -0,0 +1,86 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+The indicator backends side by side: one call of every function covered by
+Indicators.backend over the same bar series, pure Python versus NumPy (inputs passed as
+lists to both, as a sweep over fetched bars would).
+
+Usage: python benchmarks/bench_numpy_backend.py [nBars]
+"""
+
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trading Strategies"))
+
+from Indicators import backend  # noqa: E402
+
+
+def make_bars(n: int):
+    rnd = random.Random(3)
+    highs, lows, closes, volumes, days = [], [], [], [], []
+    close = 100.0
+    day = datetime.date(2025, 1, 2)
+    for i in range(n):
+        o = close
+        close = max(1.0, o + rnd.gauss(0, 1.5))
+        highs.append(max(o, close) + rnd.random())
+        lows.append(min(o, close) - rnd.random())
+        closes.append(close)
+        volumes.append(float(rnd.randint(100, 5000)))
+        if i % 78 == 0:
+            day += datetime.timedelta(days=1)
+        days.append(day)
+    return highs, lows, closes, volumes, days
+
+
+def best_of(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    if not backend.numpy_available():
+        print("NumPy is not installed; nothing to compare")
+        return
+    from Indicators import numpy_backend
+
+    nBars = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    (h, l, c, v, days) = make_bars(nBars)
+    cases = (
+        ("sma(20)", "sma", (c, 20)),
+        ("ema(20)", "ema", (c, 20)),
+        ("rma(14)", "rma", (c, 14)),
+        ("dema(200)", "dema", (c, 200)),
+        ("true_range", "true_range", (h, l, c)),
+        ("atr(14)", "atr", (h, l, c, 14)),
+        ("supertrend(10, 3)", "supertrend", (h, l, c, 10, 3.0)),
+        ("adx(14)", "adx", (h, l, c, 14)),
+        ("rsi(14)", "rsi", (c, 14)),
+        ("macd(12, 26, 9)", "macd", (c, 12, 26, 9)),
+        ("bollinger_bands(20)", "bollinger_bands", (c, 20, 2.0)),
+        ("choppiness(14)", "choppiness", (h, l, c, 14)),
+        ("vwap(sessions)", "vwap", (h, l, c, v, days)),
+        ("obv", "obv", (c, v)),
+    )
+    python = backend._python_impl()
+
+    print(f"{nBars} bars, one call each")
+    print(f"{'indicator':<22}{'python':>12}{'numpy':>12}{'speedup':>10}")
+    for (label, name, args) in cases:
+        tPython = best_of(lambda: getattr(python, name)(*args))
+        tNumpy = best_of(lambda: getattr(numpy_backend, name)(*args))
+        print(f"{label:<22}{tPython * 1e3:>10.1f}ms{tNumpy * 1e3:>10.1f}ms{tPython / tNumpy:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Decodes a mixed stream of protobuf market data messages (TICK_PRICE,
+TICK_SIZE, TICK_GENERIC, TICK_STRING, TICK_BY_TICK, MARKET_DEPTH) as the
+Decoder did before (a new message per parse, every *ProtoBuf callback called)
+and with the pooled messages and skipped default *ProtoBuf callbacks.
+
+Usage: python benchmarks/bench_protobuf_decoding.py [nMsgs]
+"""
+
+import inspect
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ibapi.decoder import Decoder  # noqa: E402
+from ibapi.message import IN  # noqa: E402
+from ibapi.protobuf.MarketDepth_pb2 import MarketDepth as MarketDepthProto  # noqa: E402
+from ibapi.protobuf.TickByTickData_pb2 import TickByTickData as TickByTickDataProto  # noqa: E402
+from ibapi.protobuf.TickGeneric_pb2 import TickGeneric as TickGenericProto  # noqa: E402
+from ibapi.protobuf.TickPrice_pb2 import TickPrice as TickPriceProto  # noqa: E402
+from ibapi.protobuf.TickSize_pb2 import TickSize as TickSizeProto  # noqa: E402
+from ibapi.protobuf.TickString_pb2 import TickString as TickStringProto  # noqa: E402
+from ibapi.server_versions import MAX_CLIENT_VER  # noqa: E402
+from ibapi.wrapper import EWrapper  # noqa: E402
+
+
+class CountingWrapper(EWrapper):
+    def __init__(self):
+        EWrapper.__init__(self)
+        self.count = 0
+
+    def tickPrice(self, reqId, tickType, price, attrib):
+        self.count += 1
+
+    def tickSize(self, reqId, tickType, size):
+        self.count += 1
+
+    def tickGeneric(self, reqId, tickType, value):
+        self.count += 1
+
+    def tickString(self, reqId, tickType, value):
+        self.count += 1
+
+    def tickByTickAllLast(self, reqId, tickType, time, price, size, tickAttribLast, exchange, specialConditions):
+        self.count += 1
+
+    def tickByTickBidAsk(self, reqId, time, bidPrice, askPrice, bidSize, askSize, tickAttribBidAsk):
+        self.count += 1
+
+    def updateMktDepth(self, reqId, position, operation, side, price, size):
+        self.count += 1
+
+
+def record_stream(nMsgs: int) -> list:
+    """(msgId, protobuf) as EClient.run() hands them to the decoder"""
+    rnd = random.Random(7)
+    stream = []
+    for _ in range(nMsgs):
+        reqId = rnd.randint(1, 300)
+        price = round(rnd.uniform(10, 500), 2)
+        size = str(rnd.randint(1, 5000))
+        kind = rnd.random()
+        if kind < 0.35:
+            proto = TickPriceProto(reqId=reqId, tickType=rnd.choice((1, 2, 4)), price=price, size=size, attrMask=0)
+            stream.append((IN.TICK_PRICE, proto))
+        elif kind < 0.6:
+            stream.append((IN.TICK_SIZE, TickSizeProto(reqId=reqId, tickType=rnd.choice((0, 3, 5, 8)), size=size)))
+        elif kind < 0.65:
+            stream.append((IN.TICK_GENERIC, TickGenericProto(reqId=reqId, tickType=49, value=0)))
+        elif kind < 0.7:
+            stream.append((IN.TICK_STRING, TickStringProto(reqId=reqId, tickType=45, value="1700000000")))
+        elif kind < 0.8:
+            proto = TickByTickDataProto(reqId=reqId, tickType=1)
+            proto.historicalTickLast.SetInParent()
+            tick = proto.historicalTickLast
+            (tick.time, tick.price, tick.size, tick.exchange) = (1700000000, price, size, "ARCA")
+            stream.append((IN.TICK_BY_TICK, proto))
+        elif kind < 0.9:
+            proto = TickByTickDataProto(reqId=reqId, tickType=3)
+            proto.historicalTickBidAsk.SetInParent()
+            tick = proto.historicalTickBidAsk
+            (tick.time, tick.priceBid, tick.priceAsk, tick.sizeBid, tick.sizeAsk) = (1700000000, price, price, size, size)
+            stream.append((IN.TICK_BY_TICK, proto))
+        else:
+            proto = MarketDepthProto(reqId=reqId)
+            depth = proto.marketDepthData
+            (depth.position, depth.operation, depth.side, depth.price, depth.size) = (0, 1, 1, price, size)
+            stream.append((IN.MARKET_DEPTH, proto))
+    return [(msgId, proto.SerializeToString()) for (msgId, proto) in stream]
+
+
+def legacy(decoder: Decoder):
+    """A new message per parse and every *ProtoBuf callback called."""
+    decoder.protoBufPool = {}
+    decoder.protoBufCallbacks = {
+        name: getattr(decoder.wrapper, name)
+        for (name, _) in inspect.getmembers(EWrapper, inspect.isfunction)
+        if name.endswith("ProtoBuf")
+    }
+
+
+def timeit(pooled: bool, stream, repeat: int = 7) -> tuple:
+    best = None
+    count = 0
+    for _ in range(repeat):
+        wrapper = CountingWrapper()
+        decoder = Decoder(wrapper, MAX_CLIENT_VER)
+        if not pooled:
+            legacy(decoder)
+        processProtoBuf = decoder.processProtoBuf
+        t0 = time.perf_counter()
+        for msgId, protobuf in stream:
+            processProtoBuf(protobuf, msgId)
+        elapsed = time.perf_counter() - t0
+        count = wrapper.count
+        best = elapsed if best is None else min(best, elapsed)
+    return len(stream) / best, count
+
+
+def main():
+    nMsgs = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    stream = record_stream(nMsgs)
+    (before, nBefore) = timeit(False, stream)
+    (after, nAfter) = timeit(True, stream)
+    assert nBefore == nAfter
+    print(f"{nMsgs} protobuf market data messages, {nAfter} wrapper callbacks")
+    print(f"new message per parse: {before:>12,.0f} msg/s")
+    print(f"pooled messages:       {after:>12,.0f} msg/s  ({after / before:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Rolling window kernels over a long bar series versus the reduction of a list slice per bar
+the indicators used to do:
+  * highest / lowest (monotonic deque) at the window lengths of Donchian (20), SMC swing
+    legs (50) and Ichimoku span B (52);
+  * stdev, WMA and the linreg endpoint (running sums) at 20 and 200 bars;
+plus the ported indicators end to end.
+
+Usage: python benchmarks/bench_rolling.py [nBars]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trading Strategies"))
+
+from Indicators.momentum.squeeze_momentum import squeeze_momentum  # noqa: E402
+from Indicators.rolling import (rolling_linreg, rolling_max, rolling_min,  # noqa: E402
+                                rolling_stdev, rolling_wma)
+from Indicators.trend.ichimoku import ichimoku  # noqa: E402
+from Indicators.volatility.donchian_channels import donchian_channels  # noqa: E402
+
+
+def sliced_max(values, period):
+    out = [None] * len(values)
+    for i in range(period - 1, len(values)):
+        out[i] = max(values[i - period + 1 : i + 1])
+    return out
+
+
+def sliced_min(values, period):
+    out = [None] * len(values)
+    for i in range(period - 1, len(values)):
+        out[i] = min(values[i - period + 1 : i + 1])
+    return out
+
+
+def sliced_stdev(values, period):
+    out = [None] * len(values)
+    for i in range(period - 1, len(values)):
+        window = values[i - period + 1 : i + 1]
+        m = sum(window) / period
+        out[i] = (sum((x - m) ** 2 for x in window) / period) ** 0.5
+    return out
+
+
+def sliced_wma(values, period):
+    out = [None] * len(values)
+    denom = period * (period + 1) / 2.0
+    for i in range(period - 1, len(values)):
+        s = 0.0
+        for k in range(period):
+            s += values[i - period + 1 + k] * (k + 1)
+        out[i] = s / denom
+    return out
+
+
+def sliced_linreg(values, period):
+    out = [None] * len(values)
+    for i in range(period - 1, len(values)):
+        window = values[i - period + 1 : i + 1]
+        sum_x = sum_y = sum_xx = sum_xy = 0.0
+        for x in range(period):
+            y = window[x]
+            sum_x += x
+            sum_y += y
+            sum_xx += x * x
+            sum_xy += x * y
+        denom = period * sum_xx - sum_x * sum_x
+        slope = (period * sum_xy - sum_x * sum_y) / denom if denom else 0.0
+        out[i] = (sum_y - slope * sum_x) / period + slope * (period - 1)
+    return out
+
+
+def best_of(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    nBars = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rnd = random.Random(5)
+    highs, lows = [], []
+    close = 100.0
+    for _ in range(nBars):
+        close = max(1.0, close + rnd.gauss(0, 1.0))
+        highs.append(close + rnd.random())
+        lows.append(close - rnd.random())
+    closes = [(h + l) / 2.0 for h, l in zip(highs, lows)]
+
+    print(f"{nBars} bars, highest high + lowest low per bar")
+    for period in (20, 50, 52):
+        assert sliced_max(highs, period) == rolling_max(highs, period)
+        tSliced = best_of(lambda: (sliced_max(highs, period), sliced_min(lows, period)))
+        tDeque = best_of(lambda: (rolling_max(highs, period), rolling_min(lows, period)))
+        print(f"period {period:>3}: slice {tSliced * 1e3:>8.1f}ms   deque {tDeque * 1e3:>8.1f}ms  ({tSliced / tDeque:.1f}x)")
+
+    print(f"{nBars} closes, rolling statistics (slices timed once)")
+    for (name, slicedFn, kernel) in (("stdev", sliced_stdev, rolling_stdev),
+                                     ("wma", sliced_wma, rolling_wma),
+                                     ("linreg", sliced_linreg, rolling_linreg)):
+        for period in (20, 200):
+            tSliced = best_of(lambda: slicedFn(closes, period), repeat=1)
+            tKernel = best_of(lambda: kernel(closes, period))
+            print(f"{name:>6} {period:>3}: slice {tSliced * 1e3:>8.1f}ms   running {tKernel * 1e3:>8.1f}ms  ({tSliced / tKernel:.1f}x)")
+
+    tDonchian = best_of(lambda: donchian_channels(highs, lows, 20))
+    tIchimoku = best_of(lambda: ichimoku(highs, lows, closes))
+    tSqueeze = best_of(lambda: squeeze_momentum(highs, lows, closes))
+    print(f"donchian_channels(20): {tDonchian * 1e3:>8.1f}ms")
+    print(f"ichimoku(9, 26, 52):   {tIchimoku * 1e3:>8.1f}ms")
+    print(f"squeeze_momentum():    {tSqueeze * 1e3:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Decodes tick messages (TICK_PRICE, TICK_SIZE, TICK_BY_TICK, MARKET_DEPTH) and
+historical bars (text HISTORICAL_DATA and protobuf HistoricalData) with each
+size type of Decoder.setSizeType(). The tick callbacks sum the sizes, the bar
+callback sums the volumes, as indicator code does with them.
+
+Usage: python benchmarks/bench_size_types.py [nMsgs]
+"""
+
+import os
+import random
+import sys
+import time
+
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ibapi.decoder import Decoder  # noqa: E402
+from ibapi.message import IN  # noqa: E402
+from ibapi.protobuf.HistoricalData_pb2 import HistoricalData as HistoricalDataProto  # noqa: E402
+from ibapi.server_versions import MAX_CLIENT_VER  # noqa: E402
+from ibapi.wrapper import EWrapper  # noqa: E402
+
+BARS_PER_MSG = 390
+
+
+class SummingWrapper(EWrapper):
+    def __init__(self):
+        EWrapper.__init__(self)
+        self.total = 0
+
+    def tickPrice(self, reqId, tickType, price, attrib):
+        pass
+
+    def tickSize(self, reqId, tickType, size):
+        self.total += size
+
+    def tickByTickAllLast(self, reqId, tickType, time, price, size, tickAttribLast, exchange, specialConditions):
+        self.total += size
+
+    def tickByTickBidAsk(self, reqId, time, bidPrice, askPrice, bidSize, askSize, tickAttribBidAsk):
+        self.total += bidSize + askSize
+
+    def updateMktDepth(self, reqId, position, operation, side, price, size):
+        self.total += size
+
+    def historicalData(self, reqId, bar):
+        self.total += bar.volume
+
+
+def record_ticks(nMsgs: int) -> list:
+    """(msgId, fields) as EClient.run() hands them to the decoder"""
+    rnd = random.Random(7)
+    stream = []
+    for _ in range(nMsgs):
+        reqId = str(rnd.randint(1, 300)).encode()
+        price = f"{rnd.uniform(10, 500):.2f}".encode()
+        size = str(rnd.randint(1, 5000)).encode()
+        kind = rnd.random()
+        if kind < 0.4:
+            stream.append((IN.TICK_PRICE, (b"6", reqId, rnd.choice((b"1", b"2", b"4")), price, size, b"0")))
+        elif kind < 0.7:
+            stream.append((IN.TICK_SIZE, (b"6", reqId, rnd.choice((b"0", b"3", b"5", b"8")), size)))
+        elif kind < 0.8:
+            stream.append((IN.TICK_BY_TICK, (reqId, b"1", b"1700000000", price, size, b"0", b"ARCA", b"")))
+        elif kind < 0.9:
+            stream.append((IN.TICK_BY_TICK, (reqId, b"3", b"1700000000", price, price, size, size, b"0")))
+        else:
+            stream.append((IN.MARKET_DEPTH, (b"1", reqId, b"0", b"1", b"1", price, size)))
+    return stream
+
+
+def record_bars(nMsgs: int) -> tuple:
+    """text and protobuf HISTORICAL_DATA messages of BARS_PER_MSG one minute bars"""
+    rnd = random.Random(11)
+    textMsgs = []
+    protoMsgs = []
+    for i in range(nMsgs):
+        fields = [str(i).encode(), str(BARS_PER_MSG).encode()]
+        proto = HistoricalDataProto(reqId=i)
+        for j in range(BARS_PER_MSG):
+            date = f"20250102 {9 + j // 60:02d}:{j % 60:02d}:00"
+            close = f"{rnd.uniform(10, 500):.2f}"
+            volume = str(rnd.randint(100, 50000))
+            wap = f"{rnd.uniform(10, 500):.4f}"
+            fields += [f.encode() for f in (date, close, close, close, close, volume, wap, "12")]
+            proto.historicalDataBars.add(
+                date=date, open=float(close), high=float(close), low=float(close),
+                close=float(close), volume=volume, WAP=wap, barCount=12,
+            )
+        textMsgs.append(tuple(fields))
+        protoMsgs.append(proto.SerializeToString())
+    return textMsgs, protoMsgs
+
+
+def timeit(run, sizeType, fast: bool = False, repeat: int = 9) -> float:
+    best = None
+    for _ in range(repeat):
+        decoder = Decoder(SummingWrapper(), MAX_CLIENT_VER)
+        decoder.setFastTickDecoding(fast)
+        decoder.setSizeType(sizeType)
+        t0 = time.perf_counter()
+        run(decoder)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    nMsgs = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    ticks = record_ticks(nMsgs)
+    (textBars, protoBars) = record_bars(max(1, nMsgs // 2000))
+    nBars = len(textBars) * BARS_PER_MSG
+
+    def runTicks(decoder):
+        interpret = decoder.interpret
+        for msgId, fields in ticks:
+            interpret(fields, msgId)
+
+    def runTextBars(decoder):
+        for fields in textBars:
+            decoder.interpret(fields, IN.HISTORICAL_DATA)
+
+    def runProtoBars(decoder):
+        for protobuf in protoBars:
+            decoder.processHistoricalDataMsgProtoBuf(protobuf)
+
+    print(f"{nMsgs} tick messages, {nBars} bars")
+    print(f"{'size type':>10} {'ticks/s':>12} {'fast ticks/s':>13} {'text bars/s':>12} {'proto bars/s':>13}")
+    for sizeType in (Decimal, float, int):
+        tTicks = timeit(runTicks, sizeType)
+        tFastTicks = timeit(runTicks, sizeType, fast=True)
+        tTextBars = timeit(runTextBars, sizeType)
+        tProtoBars = timeit(runProtoBars, sizeType)
+        print(
+            f"{sizeType.__name__:>10} {nMsgs / tTicks:>12,.0f} {nMsgs / tFastTicks:>13,.0f} "
+            f"{nBars / tTextBars:>12,.0f} {nBars / tProtoBars:>13,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
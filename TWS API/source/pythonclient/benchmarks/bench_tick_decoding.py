@@ -0,0 +1,107 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Decodes a mixed stream of text market data messages (TICK_PRICE, TICK_SIZE,
+TICK_GENERIC, TICK_STRING, TICK_BY_TICK, MARKET_DEPTH) with the default
+Decoder and with the fast tick decoding mode.
+
+Usage: python benchmarks/bench_tick_decoding.py [nMsgs]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ibapi.decoder import Decoder  # noqa: E402
+from ibapi.message import IN  # noqa: E402
+from ibapi.server_versions import MAX_CLIENT_VER  # noqa: E402
+from ibapi.wrapper import EWrapper  # noqa: E402
+
+
+class CountingWrapper(EWrapper):
+    def __init__(self):
+        EWrapper.__init__(self)
+        self.count = 0
+
+    def tickPrice(self, reqId, tickType, price, attrib):
+        self.count += 1
+
+    def tickSize(self, reqId, tickType, size):
+        self.count += 1
+
+    def tickGeneric(self, reqId, tickType, value):
+        self.count += 1
+
+    def tickString(self, reqId, tickType, value):
+        self.count += 1
+
+    def tickByTickAllLast(self, reqId, tickType, time, price, size, tickAttribLast, exchange, specialConditions):
+        self.count += 1
+
+    def tickByTickBidAsk(self, reqId, time, bidPrice, askPrice, bidSize, askSize, tickAttribBidAsk):
+        self.count += 1
+
+    def updateMktDepth(self, reqId, position, operation, side, price, size):
+        self.count += 1
+
+
+def record_stream(nMsgs: int) -> list:
+    """(msgId, fields) as EClient.run() hands them to the decoder"""
+    rnd = random.Random(7)
+    stream = []
+    for _ in range(nMsgs):
+        reqId = str(rnd.randint(1, 300)).encode()
+        price = f"{rnd.uniform(10, 500):.2f}".encode()
+        size = str(rnd.randint(1, 5000)).encode()
+        kind = rnd.random()
+        if kind < 0.35:
+            stream.append((IN.TICK_PRICE, (b"6", reqId, rnd.choice((b"1", b"2", b"4")), price, size, b"0")))
+        elif kind < 0.6:
+            stream.append((IN.TICK_SIZE, (b"6", reqId, rnd.choice((b"0", b"3", b"5", b"8")), size)))
+        elif kind < 0.65:
+            stream.append((IN.TICK_GENERIC, (b"6", reqId, b"49", b"0")))
+        elif kind < 0.7:
+            stream.append((IN.TICK_STRING, (b"6", reqId, b"45", b"1700000000")))
+        elif kind < 0.8:
+            stream.append((IN.TICK_BY_TICK, (reqId, b"1", b"1700000000", price, size, b"0", b"ARCA", b"")))
+        elif kind < 0.9:
+            stream.append((IN.TICK_BY_TICK, (reqId, b"3", b"1700000000", price, price, size, size, b"0")))
+        else:
+            stream.append((IN.MARKET_DEPTH, (b"1", reqId, b"0", b"1", b"1", price, size)))
+    return stream
+
+
+def timeit(fast: bool, stream, repeat: int = 5) -> tuple:
+    best = None
+    count = 0
+    for _ in range(repeat):
+        wrapper = CountingWrapper()
+        decoder = Decoder(wrapper, MAX_CLIENT_VER)
+        decoder.setFastTickDecoding(fast)
+        interpret = decoder.interpret
+        t0 = time.perf_counter()
+        for msgId, fields in stream:
+            interpret(fields, msgId)
+        elapsed = time.perf_counter() - t0
+        count = wrapper.count
+        best = elapsed if best is None else min(best, elapsed)
+    return len(stream) / best, count
+
+
+def main():
+    nMsgs = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    stream = record_stream(nMsgs)
+    (before, nBefore) = timeit(False, stream)
+    (after, nAfter) = timeit(True, stream)
+    assert nBefore == nAfter
+    print(f"{nMsgs} market data messages, {nAfter} wrapper callbacks")
+    print(f"default decoding:   {before:>12,.0f} msg/s")
+    print(f"fast tick decoding: {after:>12,.0f} msg/s  ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+asyncio flavour of the EClient. The socket is read by an asyncio protocol on
+the event loop: the bytes land straight in a FrameBuffer and every complete
+message is decoded and handed to the wrapper from there, with no EReader
+thread and no queue in between.
+
+All the EClient request methods are available and must be called from the
+event loop thread. The most common request/answer pairs also have awaitable
+helpers:
+
+    async def main():
+        app = AsyncEClient(MyWrapper())
+        await app.connectAsync("127.0.0.1", 7497, clientId=0)
+        serverTime = await asyncio.wait_for(app.reqCurrentTimeAsync(), 5)
+        bars = await app.reqHistoricalDataAsync(1, contract, "", "1 D", "1 min", "TRADES", 1, 1, [])
+        app.disconnect()
+
+Do not call run(), the event loop is the message loop.
+"""
+
+import asyncio
+import logging
+import socket
+
+from ibapi import comm, decoder
+from ibapi.client import EClient
+from ibapi.const import NO_VALID_ID, MAX_MSG_LEN
+from ibapi.errors import CONNECT_FAIL, BAD_LENGTH, NOT_CONNECTED
+from ibapi.framing import FrameBuffer, MIN_READ_SIZE
+from ibapi.server_versions import MIN_CLIENT_VER, MAX_CLIENT_VER
+from ibapi.utils import BadMessage, ClientException, currentTimeMillis
+
+logger = logging.getLogger(__name__)
+
+
+class RequestError(Exception):
+    """An error message from TWS for a request awaited with one of the
+    AsyncEClient *Async() helpers."""
+
+    def __init__(self, reqId, code, msg):
+        super().__init__(f"request {reqId}: error {code}: {msg}")
+        self.reqId = reqId
+        self.code = code
+        self.msg = msg
+
+
+def isWarning(errorCode: int) -> bool:
+    # 2100..2199 are notifications (farm status, delayed data ...), not failures
+    return 2100 <= errorCode < 2200
+
+
+class AsyncConnection(asyncio.BufferedProtocol):
+    """Plays the part of the Connection (isConnected(), sendMsg(),
+    disconnect(), batching, tracer) on top of an asyncio transport."""
+
+    def __init__(self, client):
+        self.client = client
+        self.transport = None
+        self.frames = FrameBuffer()
+        self.tracer = None
+        self.tcpNoDelay = None
+        self.batch = None
+        self.batchDepth = 0
+
+    # asyncio.BufferedProtocol
+
+    def connection_made(self, transport):
+        self.transport = transport
+        if self.tcpNoDelay is not None:
+            self.setTcpNoDelay(self.tcpNoDelay)
+
+    def get_buffer(self, sizehint):
+        return self.frames.writable(max(sizehint, MIN_READ_SIZE))
+
+    def buffer_updated(self, nbytes):
+        self.frames.commit(nbytes)
+        tracer = self.tracer
+        for msg in self.frames.msgs():
+            if tracer is not None:
+                tracer.received(msg)
+            self.client.msgReceived(msg)
+
+    def connection_lost(self, exc):
+        logger.debug("connection lost %s", exc)
+        self.transport = None
+        self.client.connectionLost(exc)
+
+    # Connection
+
+    def isConnected(self):
+        return self.transport is not None and not self.transport.is_closing()
+
+    def sendMsg(self, msg):
+        if self.batch is not None:
+            self.batch.append(msg)
+            return len(msg)
+        if not self.isConnected():
+            logger.debug("sendMsg attempted while not connected")
+            return 0
+        self.transport.write(msg)
+        if self.tracer is not None:
+            self.tracer.sent(msg)
+        return len(msg)
+
+    def startBatch(self):
+        if self.batchDepth == 0:
+            self.batch = []
+        self.batchDepth += 1
+
+    def endBatch(self) -> int:
+        self.batchDepth -= 1
+        if self.batchDepth > 0:
+            return 0
+        (msgs, self.batch) = (self.batch, None)
+        if not msgs or not self.isConnected():
+            return 0
+        data = b"".join(msgs)
+        self.transport.write(data)
+        if self.tracer is not None:
+            for msg in msgs:
+                self.tracer.sent(msg)
+        return len(data)
+
+    def setTcpNoDelay(self, enabled):
+        self.tcpNoDelay = enabled
+        if self.transport is not None and enabled is not None:
+            sock = self.transport.get_extra_info("socket")
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(enabled))
+
+    def disconnect(self):
+        if self.transport is not None:
+            self.transport.close()
+
+
+class AsyncWrapper:
+    """Passes every callback on to the application wrapper and completes the
+    futures of the pending awaitable requests on the way."""
+
+    def __init__(self, client, wrapper):
+        self.client = client
+        self.wrapper = wrapper
+
+    def __getattr__(self, name):
+        return getattr(self.wrapper, name)
+
+    def error(self, reqId, errorTime, errorCode, errorString, advancedOrderRejectJson=""):
+        self.wrapper.error(reqId, errorTime, errorCode, errorString, advancedOrderRejectJson)
+        if not isWarning(errorCode):
+            self.client.failRequest(reqId, RequestError(reqId, errorCode, errorString))
+
+    def currentTime(self, time):
+        self.wrapper.currentTime(time)
+        self.client.finishRequest("currentTime", time)
+
+    def nextValidId(self, orderId):
+        self.wrapper.nextValidId(orderId)
+        self.client.finishRequest("nextValidId", orderId)
+
+    def contractDetails(self, reqId, contractDetails):
+        self.wrapper.contractDetails(reqId, contractDetails)
+        self.client.addResult(reqId, contractDetails)
+
+    def contractDetailsEnd(self, reqId):
+        self.wrapper.contractDetailsEnd(reqId)
+        self.client.finishRequest(reqId)
+
+    def historicalData(self, reqId, bar):
+        self.wrapper.historicalData(reqId, bar)
+        self.client.addResult(reqId, bar)
+
+    def historicalDataEnd(self, reqId, start, end):
+        self.wrapper.historicalDataEnd(reqId, start, end)
+        self.client.finishRequest(reqId)
+
+
+class AsyncEClient(EClient):
+    def __init__(self, wrapper):
+        # key (reqId or answer name): (future, results)
+        self.pending = {}
+        self.handshake = None
+        EClient.__init__(self, AsyncWrapper(self, wrapper))
+
+    async def connectAsync(self, host, port, clientId, timeout=None):
+        """Connects and waits for the server version, see EClient.connect().
+        timeout:float - seconds to wait for the handshake, None waits forever.
+        Failures are reported through wrapper.error() like connect() does."""
+        try:
+            self.validateInvalidSymbols(host)
+            self.checkConnected()
+        except ClientException as ex:
+            self.wrapper.error(NO_VALID_ID, currentTimeMillis(), ex.code, ex.msg + ex.text)
+            return
+
+        self.host = host
+        self.port = port
+        self.clientId = clientId
+        logger.debug("Connecting to %s:%d w/ id:%d", self.host, self.port, self.clientId)
+
+        loop = asyncio.get_running_loop()
+        self.handshake = loop.create_future()
+
+        def makeConnection():
+            conn = AsyncConnection(self)
+            conn.tracer = self.wireTracer
+            conn.tcpNoDelay = self.tcpNoDelay
+            return conn
+
+        try:
+            (_, self.conn) = await loop.create_connection(makeConnection, self.host, self.port)
+        except OSError:
+            self.wrapper.error(NO_VALID_ID, currentTimeMillis(), CONNECT_FAIL.code(), CONNECT_FAIL.msg())
+            logger.info("could not connect")
+            return
+        self.setConnState(EClient.CONNECTING)
+
+        self.decoder = decoder.Decoder(self.wrapper, None)
+        self.decoder.setFastTickDecoding(self.fastTickDecoding)
+        self.decoder.setSizeType(self.sizeType)
+
+        v100version = "v%d..%d" % (MIN_CLIENT_VER, MAX_CLIENT_VER)
+        if self.connectOptions:
+            v100version = v100version + " " + self.connectOptions
+        self.conn.sendMsg(b"API\0" + comm.make_initial_msg(v100version))
+
+        try:
+            await asyncio.wait_for(self.handshake, timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            self.wrapper.error(NO_VALID_ID, currentTimeMillis(), CONNECT_FAIL.code(), CONNECT_FAIL.msg())
+            logger.info("could not connect")
+            self.disconnect()
+            return
+
+        self.setConnState(EClient.CONNECTED)
+        self.startApi()
+        self.wrapper.connectAck()
+
+    def msgReceived(self, msg: bytes):
+        if self.serverVersion_ is None:
+            # the first message is the answer to the handshake
+            fields = comm.read_fields(msg)
+            if len(fields) == 2:
+                (serverVersion, connTime) = fields
+                self.serverVersion_ = int(serverVersion)
+                self.connTime = connTime
+                self.decoder.serverVersion = self.serverVersion_
+                logger.debug("ANSWER Version:%d time:%s", self.serverVersion_, connTime)
+                if not self.handshake.done():
+                    self.handshake.set_result(None)
+            return
+
+        if len(msg) > MAX_MSG_LEN:
+            self.wrapper.error(
+                NO_VALID_ID, currentTimeMillis(), BAD_LENGTH.code(), f"{BAD_LENGTH.msg()}:{len(msg)}:{msg}"
+            )
+            self.disconnect()
+            return
+
+        try:
+            self.processMsg(msg)
+        except BadMessage:
+            logger.info("BadMessage")
+
+    def connectionLost(self, exc):
+        if self.handshake is not None and not self.handshake.done():
+            self.handshake.set_exception(ConnectionError("connection lost during the handshake"))
+        for key in list(self.pending):
+            self.failRequest(key, ConnectionError(NOT_CONNECTED.msg()))
+        if self.connState != EClient.DISCONNECTED:
+            self.disconnect()
+
+    # awaitable requests
+
+    def startRequest(self, key) -> asyncio.Future:
+        if not self.isConnected():
+            raise ConnectionError(NOT_CONNECTED.msg())
+        if key in self.pending:
+            raise ValueError(f"request {key!r} is already pending")
+        future = asyncio.get_running_loop().create_future()
+        self.pending[key] = (future, [])
+        return future
+
+    async def awaitRequest(self, key, future):
+        """Awaits the future of a startRequest(); a caller that stops waiting
+        (cancelled, e.g. by asyncio.wait_for() timing out) gives up the key so
+        the request can be made again."""
+        try:
+            return await future
+        finally:
+            request = self.pending.get(key)
+            if request is not None and request[0] is future:
+                del self.pending[key]
+
+    def addResult(self, key, result):
+        request = self.pending.get(key)
+        if request is not None:
+            request[1].append(result)
+
+    def finishRequest(self, key, result=None):
+        request = self.pending.pop(key, None)
+        if request is not None and not request[0].done():
+            request[0].set_result(request[1] if result is None else result)
+
+    def failRequest(self, key, exc):
+        request = self.pending.pop(key, None)
+        if request is not None and not request[0].done():
+            request[0].set_exception(exc)
+
+    async def reqCurrentTimeAsync(self) -> int:
+        """TWS reports no error with a request id for this request, so await
+        it with a timeout: asyncio.wait_for(client.reqCurrentTimeAsync(), 5)."""
+        future = self.startRequest("currentTime")
+        self.reqCurrentTime()
+        return await self.awaitRequest("currentTime", future)
+
+    async def reqIdsAsync(self) -> int:
+        """Returns the next valid order id. As with reqCurrentTimeAsync(), no
+        error comes back for this request: await it with a timeout."""
+        future = self.startRequest("nextValidId")
+        self.reqIds(-1)
+        return await self.awaitRequest("nextValidId", future)
+
+    async def reqContractDetailsAsync(self, reqId, contract) -> list:
+        future = self.startRequest(reqId)
+        self.reqContractDetails(reqId, contract)
+        return await self.awaitRequest(reqId, future)
+
+    async def reqHistoricalDataAsync(
+        self, reqId, contract, endDateTime, durationStr, barSizeSetting, whatToShow, useRTH, formatDate, chartOptions
+    ) -> list:
+        """Returns the list of BarData, see EClient.reqHistoricalData()
+        (without keepUpToDate)."""
+        future = self.startRequest(reqId)
+        self.reqHistoricalData(
+            reqId, contract, endDateTime, durationStr, barSizeSetting, whatToShow,
+            useRTH, formatDate, False, chartOptions,
+        )
+        return await self.awaitRequest(reqId, future)
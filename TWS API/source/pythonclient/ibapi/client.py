@@ -10,15 +10,19 @@ It takes care of almost everything:
 The user just needs to override EWrapper methods to receive the answers.
 """
 
+import contextlib
 import logging
 import queue
 import socket
 import sys
 
+from decimal import Decimal
+
 from ibapi import decoder, reader, comm
 from ibapi.comm import make_field, make_field_handle_empty
 from ibapi.common import *  # @UnusedWildImport
-from ibapi.connection import Connection
+from ibapi.connection import Connection, MIN_READ_SIZE, MAX_READ_SIZE
+from ibapi.dispatch import BatchQueue, DEFAULT_MAX_DEPTH, BLOCK
 from ibapi.const import NO_VALID_ID, MAX_MSG_LEN, UNSET_DOUBLE
 from ibapi.contract import Contract
 from ibapi.errors import (
@@ -49,7 +53,7 @@ from ibapi.errors import (
     FAIL_SEND_REQCOMPLETEDORDERS, FAIL_SEND_REQ_WSH_META_DATA, FAIL_SEND_CAN_WSH_META_DATA,
     FAIL_SEND_REQ_WSH_EVENT_DATA, FAIL_SEND_CAN_WSH_EVENT_DATA, FAIL_SEND_REQ_USER_INFO,
     FAIL_SEND_REQCURRTIMEINMILLIS, FAIL_SEND_CANCEL_CONTRACT_DATA, FAIL_SEND_CANCEL_HISTORICAL_TICKS,
-    FAIL_SEND_REQCONFIG, FAIL_SEND_UPDATECONFIG
+    FAIL_SEND_REQCONFIG, FAIL_SEND_UPDATECONFIG, FAIL_SEND_BATCH
 )
 from ibapi.execution import ExecutionFilter
 from ibapi.message import OUT
@@ -161,11 +165,13 @@ from ibapi.server_versions import (
 from ibapi.utils import ClientException, log_
 from ibapi.utils import (
     current_fn_name,
+    log_enabled,
     BadMessage,
     isPegBenchOrder,
     isPegMidOrder,
     isPegBestOrder,
     currentTimeMillis,
+    SIZE_TYPE_CONVERTERS,
 )
 from ibapi.errors import INVALID_SYMBOL
 from ibapi.utils import isAsciiPrintable
@@ -306,6 +312,12 @@ class EClient(object):
         self.decode = None
         self.setConnState(EClient.DISCONNECTED)
         self.connectOptions = None
+        self.recvOptions = {}
+        self.fastTickDecoding = False
+        self.sizeType = Decimal
+        self.wireTracer = None
+        self.tcpNoDelay = None
+        self.batchedDispatch = None
         self.reset()
 
     def reset(self):
@@ -332,16 +344,19 @@ class EClient(object):
 
     def sendMsgProtoBuf(self, msgId: int, msg: bytes):
         full_msg = comm.make_msg_proto(msgId, msg)
-        logger.info("%s %s %s", "SENDING", current_fn_name(1), full_msg)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s %s %s", "SENDING", current_fn_name(1), full_msg)
         self.conn.sendMsg(full_msg)
 
     def sendMsg(self, msgId:int, msg: str):
         useRawIntMsgId = self.serverVersion() >= MIN_SERVER_VER_PROTOBUF
         full_msg = comm.make_msg(msgId, useRawIntMsgId, msg)
-        logger.info("%s %s %s", "SENDING", current_fn_name(1), full_msg)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s %s %s", "SENDING", current_fn_name(1), full_msg)
         self.conn.sendMsg(full_msg)
 
     def logRequest(self, fnName, fnParams):
+        # only called when log_enabled()
         log_(fnName, fnParams, "REQUEST")
 
     def validateInvalidSymbols(self, host):
@@ -386,7 +401,8 @@ class EClient(object):
             self.startApiProtoBuf(startApiRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -413,7 +429,8 @@ class EClient(object):
         if startApiRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -467,6 +484,10 @@ class EClient(object):
             )
 
             self.conn = Connection(self.host, self.port)
+            if self.recvOptions:
+                self.conn.setRecvOptions(**self.recvOptions)
+            self.conn.tracer = self.wireTracer
+            self.conn.tcpNoDelay = self.tcpNoDelay
 
             self.conn.connect()
             self.setConnState(EClient.CONNECTING)
@@ -487,6 +508,8 @@ class EClient(object):
             self.conn.sendMsg(msg2)
 
             self.decoder = decoder.Decoder(self.wrapper, self.serverVersion())
+            self.decoder.setFastTickDecoding(self.fastTickDecoding)
+            self.decoder.setSizeType(self.sizeType)
             fields = []
 
             # sometimes I get news before the server version, thus the loop
@@ -517,6 +540,10 @@ class EClient(object):
 
             self.setConnState(EClient.CONNECTED)
 
+            if self.batchedDispatch is not None:
+                self.msg_queue = BatchQueue(self.serverVersion(), **self.batchedDispatch)
+            elif isinstance(self.msg_queue, BatchQueue):
+                self.msg_queue = queue.Queue()
             self.reader = reader.EReader(self.conn, self.msg_queue)
             self.reader.start()  # start thread
             logger.info("sent startApi")
@@ -534,6 +561,8 @@ class EClient(object):
         sent."""
 
         self.setConnState(EClient.DISCONNECTED)
+        if isinstance(self.msg_queue, BatchQueue):
+            self.msg_queue.close()
         if self.conn is not None:
             logger.info("disconnecting")
             self.conn.disconnect()
@@ -544,9 +573,7 @@ class EClient(object):
         """Call this function to check if there is a connection with TWS"""
 
         connConnected = self.conn and self.conn.isConnected()
-        logger.debug(
-            f"{id(self)} isConn: {self.connState}, connConnected: {str(connConnected)}"
-        )
+        logger.debug("%d isConn: %s, connConnected: %s", id(self), self.connState, connConnected)
         return EClient.CONNECTED == self.connState and connConnected
 
     def keyboardInterrupt(self):
@@ -561,6 +588,97 @@ class EClient(object):
     def setConnectOptions(self, opts):
         self.connectOptions = opts
 
+    def setRecvOptions(self, rcvBufSize=None, minReadSize=MIN_READ_SIZE, maxReadSize=MAX_READ_SIZE):
+        """Tunes the receive path of the next connection, see
+        Connection.setRecvOptions(). The counters are available afterwards
+        through self.conn.recvStats()."""
+        self.recvOptions = dict(
+            rcvBufSize=rcvBufSize, minReadSize=minReadSize, maxReadSize=maxReadSize
+        )
+
+    def setTcpNoDelay(self, enabled):
+        """Sets TCP_NODELAY on the socket, see Connection.setTcpNoDelay().
+        Can be switched while connected."""
+        self.tcpNoDelay = enabled
+        if self.conn is not None:
+            self.conn.setTcpNoDelay(enabled)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Coalesces the requests made by the calling thread inside the
+        with block into as few socket writes as possible:
+
+            with client.batch():
+                for reqId, contract in enumerate(contracts):
+                    client.reqMktData(reqId, contract, "", False, False, [])
+
+        The requests are written out when the block exits (or earlier once
+        MAX_BATCH_SIZE bytes are pending). Batching does not bypass the TWS
+        pacing limits. A write error is reported through wrapper.error()."""
+        conn = self.conn
+        if conn is None:
+            yield
+            return
+
+        conn.startBatch()
+        try:
+            yield
+        finally:
+            try:
+                conn.endBatch()
+            except socket.error as ex:
+                self.wrapper.error(
+                    NO_VALID_ID, currentTimeMillis(), FAIL_SEND_BATCH.code(), FAIL_SEND_BATCH.msg() + str(ex)
+                )
+
+    def setBatchedDispatch(self, enabled: bool = True, maxDepth: int = DEFAULT_MAX_DEPTH, policy: str = BLOCK):
+        """Hands the incoming messages from the EReader thread to run() in
+        whole batches through a BatchQueue (see ibapi.dispatch) instead of
+        one by one through a queue.Queue. run() then dispatches everything
+        pending at each wake-up.
+        maxDepth:int - pending messages before back-pressure applies.
+        policy:str - BLOCK, DROP or COALESCE, what to do past maxDepth.
+        Takes effect at the next connect(). The queue metrics are available
+        through dispatchStats()."""
+        if enabled:
+            # fail now rather than at connect()
+            BatchQueue(0, maxDepth, policy)
+            self.batchedDispatch = dict(maxDepth=maxDepth, policy=policy)
+        else:
+            self.batchedDispatch = None
+
+    def dispatchStats(self):
+        """Queue depth, drop and dispatch lag counters of the batched
+        dispatch, None in the default mode."""
+        if isinstance(self.msg_queue, BatchQueue):
+            return self.msg_queue.stats()
+        return None
+
+    def setWireTracer(self, tracer):
+        """Records the frames sent and received in the given WireTracer (see
+        ibapi.tracer), None stops the recording. Can be switched while
+        connected."""
+        self.wireTracer = tracer
+        if self.conn is not None:
+            self.conn.tracer = tracer
+
+    def setFastTickDecoding(self, enabled: bool):
+        """Selects the decoding mode of the high frequency text messages, see
+        Decoder.setFastTickDecoding(). Can be switched while connected."""
+        self.fastTickDecoding = enabled
+        if self.decoder is not None:
+            self.decoder.setFastTickDecoding(enabled)
+
+    def setSizeType(self, sizeType):
+        """Selects the numeric type of the market data sizes and volumes,
+        Decimal (default), float or int, see Decoder.setSizeType().
+        Can be switched while connected."""
+        if sizeType not in SIZE_TYPE_CONVERTERS:
+            raise ValueError(f"unsupported size type {sizeType!r}")
+        self.sizeType = sizeType
+        if self.decoder is not None:
+            self.decoder.setSizeType(sizeType)
+
     def setOptionalCapabilities(self, optCapab):
         self.optCapab = optCapab
 
@@ -572,9 +690,34 @@ class EClient(object):
         # intended to be overloaded
         pass
 
+    def processMsg(self, text: bytes):
+        """Decodes one incoming message (size prefix removed) and calls the
+        wrapper."""
+        if self.serverVersion() >= MIN_SERVER_VER_PROTOBUF:
+            sMsgId = text[:4]
+            msgId = int.from_bytes(sMsgId, 'big')  
+            text = text[4:]
+        else:
+            sMsgId = text[:text.index(b"\0")]
+            text = text[text.index(b"\0") + len(b"\0"):]
+            msgId = int(sMsgId)
+
+        if msgId > PROTOBUF_MSG_ID:
+            msgId -= PROTOBUF_MSG_ID
+            logger.debug("msgId: %d, protobuf: %s", msgId, text)
+            self.decoder.processProtoBuf(text, msgId)
+        else:
+            fields = comm.read_fields(text)
+            logger.debug("msgId: %d, fields: %s", msgId, fields)
+            self.decoder.interpret(fields, msgId)
+
     def run(self):
         """This is the function that has the message loop."""
 
+        if isinstance(self.msg_queue, BatchQueue):
+            self.runBatched()
+            return
+
         try:
             while self.isConnected() or not self.msg_queue.empty():
                 try:
@@ -592,25 +735,7 @@ class EClient(object):
                         logger.debug("queue.get: empty")
                         self.msgLoopTmo()
                     else:
-
-                        if self.serverVersion() >= MIN_SERVER_VER_PROTOBUF:
-                            sMsgId = text[:4]
-                            msgId = int.from_bytes(sMsgId, 'big')  
-                            text = text[4:]
-                        else:
-                            sMsgId = text[:text.index(b"\0")]
-                            text = text[text.index(b"\0") + len(b"\0"):]
-                            msgId = int(sMsgId)
-
-                        if msgId > PROTOBUF_MSG_ID:
-                            msgId -= PROTOBUF_MSG_ID
-                            logger.debug("msgId: %d, protobuf: %s", msgId, text)
-                            self.decoder.processProtoBuf(text, msgId)
-                        else:
-                            fields = comm.read_fields(text)
-                            logger.debug("msgId: %d, fields: %s", msgId, fields)
-                            self.decoder.interpret(fields, msgId)
-
+                        self.processMsg(text)
                         self.msgLoopRec()
                 except (KeyboardInterrupt, SystemExit):
                     logger.info("detected KeyboardInterrupt, SystemExit")
@@ -619,9 +744,44 @@ class EClient(object):
                 except BadMessage:
                     logger.info("BadMessage")
 
-                logger.debug(
-                    "conn:%d queue.sz:%d", self.isConnected(), self.msg_queue.qsize()
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "conn:%d queue.sz:%d", self.isConnected(), self.msg_queue.qsize()
+                    )
+        finally:
+            self.disconnect()
+
+    def runBatched(self):
+        """run() loop of the batched dispatch: every wake-up dispatches all
+        the messages pending in the BatchQueue."""
+
+        msgQueue = self.msg_queue
+        try:
+            while self.isConnected() or not msgQueue.empty():
+                msgs = msgQueue.drain(timeout=0.2)
+                if not msgs:
+                    logger.debug("queue.drain: empty")
+                    self.msgLoopTmo()
+                    continue
+
+                for text in msgs:
+                    try:
+                        if len(text) > MAX_MSG_LEN:
+                            self.wrapper.error(
+                                NO_VALID_ID,
+                                currentTimeMillis(),
+                                BAD_LENGTH.code(),
+                                f"{BAD_LENGTH.msg()}:{len(text)}:{text}",
+                            )
+                            return
+                        self.processMsg(text)
+                        self.msgLoopRec()
+                    except (KeyboardInterrupt, SystemExit):
+                        logger.info("detected KeyboardInterrupt, SystemExit")
+                        self.keyboardInterrupt()
+                        self.keyboardInterruptHard()
+                    except BadMessage:
+                        logger.info("BadMessage")
         finally:
             self.disconnect()
 
@@ -633,7 +793,8 @@ class EClient(object):
             self.reqCurrentTimeProtoBuf(currentTimeRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -653,7 +814,8 @@ class EClient(object):
         if currentTimeRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -684,7 +846,8 @@ class EClient(object):
             self.setServerLogLevelProtoBuf(setServerLogLevelRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -703,7 +866,8 @@ class EClient(object):
         if setServerLogLevelRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -765,7 +929,8 @@ class EClient(object):
             self.reqMarketDataProtoBuf(marketDataRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(reqId, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -897,7 +1062,8 @@ class EClient(object):
         if marketDataRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = marketDataRequestProto.reqId if marketDataRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -929,7 +1095,8 @@ class EClient(object):
             self.cancelMarketDataProtoBuf(cancelMarketDataProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(reqId, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -956,7 +1123,8 @@ class EClient(object):
         if cancelMarketDataProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelMarketDataProto.reqId if cancelMarketDataProto.HasField('reqId') else NO_VALID_ID
 
@@ -990,7 +1158,8 @@ class EClient(object):
             self.reqMarketDataTypeProtoBuf(marketDataTypeRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -1025,7 +1194,8 @@ class EClient(object):
         if marketDataTypeRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -1045,7 +1215,8 @@ class EClient(object):
             self.reqSmartComponentsProtoBuf(createSmartComponentsRequestProto(reqId, bboExchange))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -1078,7 +1249,8 @@ class EClient(object):
         if smartComponentsRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = smartComponentsRequestProto.reqId if smartComponentsRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -1103,7 +1275,8 @@ class EClient(object):
             self.reqMarketRuleProtoBuf(createMarketRuleRequestProto(marketRuleId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -1129,7 +1302,8 @@ class EClient(object):
         if marketRuleRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -1160,7 +1334,8 @@ class EClient(object):
             self.reqTickByTickDataProtoBuf(tickByTickRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -1218,7 +1393,8 @@ class EClient(object):
         if tickByTickRequestProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = tickByTickRequestProto.reqId if tickByTickRequestProto.HasField('reqId') else NO_VALID_ID
     
@@ -1244,7 +1420,8 @@ class EClient(object):
             self.cancelTickByTickProtoBuf(cancelTickByTickProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -1270,7 +1447,8 @@ class EClient(object):
         if cancelTickByTickProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = cancelTickByTickProto.reqId if cancelTickByTickProto.HasField('reqId') else NO_VALID_ID
     
@@ -1313,7 +1491,8 @@ class EClient(object):
             self.calculateImpliedVolatilityProtoBuf(calculateImpliedVolatilityRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(reqId, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -1389,7 +1568,8 @@ class EClient(object):
         if calculateImpliedVolatilityRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = calculateImpliedVolatilityRequestProto.reqId if calculateImpliedVolatilityRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -1420,7 +1600,8 @@ class EClient(object):
             self.cancelCalculateImpliedVolatilityProtoBuf(cancelCalculateImpliedVolatilityProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(reqId, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -1452,7 +1633,8 @@ class EClient(object):
         if cancelCalculateImpliedVolatilityProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelCalculateImpliedVolatilityProto.reqId if cancelCalculateImpliedVolatilityProto.HasField('reqId') else NO_VALID_ID
 
@@ -1490,7 +1672,8 @@ class EClient(object):
             self.calculateOptionPriceProtoBuf(calculateOptionPriceRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(reqId, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -1566,7 +1749,8 @@ class EClient(object):
         if calculateOptionPriceRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = calculateOptionPriceRequestProto.reqId if calculateOptionPriceRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -1597,7 +1781,8 @@ class EClient(object):
             self.cancelCalculateOptionPriceProtoBuf(cancelCalculateOptionPriceProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(reqId, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -1629,7 +1814,8 @@ class EClient(object):
         if cancelCalculateOptionPriceProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelCalculateOptionPriceProto.reqId if cancelCalculateOptionPriceProto.HasField('reqId') else NO_VALID_ID
 
@@ -1681,7 +1867,8 @@ class EClient(object):
             self.exerciseOptionsProtoBuf(exerciseOptionsRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(reqId, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -1794,7 +1981,8 @@ class EClient(object):
         if exerciseOptionsRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         orderId = exerciseOptionsRequestProto.orderId if exerciseOptionsRequestProto.HasField('orderId') else NO_VALID_ID
 
@@ -1835,7 +2023,8 @@ class EClient(object):
             self.placeOrderProtoBuf(placeOrderRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(orderId, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -2771,7 +2960,8 @@ class EClient(object):
         if placeOrderRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         orderId = placeOrderRequestProto.orderId if placeOrderRequestProto.HasField('orderId') else 0
 
@@ -2858,7 +3048,8 @@ class EClient(object):
             self.cancelOrderProtoBuf(cancelOrderRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -2922,7 +3113,8 @@ class EClient(object):
         if cancelOrderRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         orderId = cancelOrderRequestProto.orderId if cancelOrderRequestProto.HasField('orderId') else 0
 
@@ -2957,7 +3149,8 @@ class EClient(object):
             self.reqOpenOrdersProtoBuf(openOrdersRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -2977,7 +3170,8 @@ class EClient(object):
         if openOrdersRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3008,7 +3202,8 @@ class EClient(object):
             self.reqAutoOpenOrdersProtoBuf(autoOpenOrdersRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3030,7 +3225,8 @@ class EClient(object):
         if autoOpenOrdersRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3057,7 +3253,8 @@ class EClient(object):
             self.reqAllOpenOrdersProtoBuf(allOpenOrdersRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3076,7 +3273,8 @@ class EClient(object):
         if allOpenOrdersRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3102,7 +3300,8 @@ class EClient(object):
             self.reqGlobalCancelProtoBuf(globalCancelRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3144,7 +3343,8 @@ class EClient(object):
         if globalCancelRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3176,7 +3376,8 @@ class EClient(object):
             self.reqIdsProtoBuf(idsRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3195,7 +3396,8 @@ class EClient(object):
         if idsRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3232,7 +3434,8 @@ class EClient(object):
             self.reqAccountUpdatesProtoBuf(createAccountDataRequestProto(subscribe, acctCode))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3262,7 +3465,8 @@ class EClient(object):
         if accountDataRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3339,7 +3543,8 @@ class EClient(object):
             self.reqAccountSummaryProtoBuf(createAccountSummaryRequestProto(reqId, groupName, tags))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3367,7 +3572,8 @@ class EClient(object):
         if accountSummaryRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = accountSummaryRequestProto.reqId if accountSummaryRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -3396,7 +3602,8 @@ class EClient(object):
             self.cancelAccountSummaryProtoBuf(createCancelAccountSummaryRequestProto(reqId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3418,7 +3625,8 @@ class EClient(object):
         if cancelAccountSummaryProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelAccountSummaryProto.reqId if cancelAccountSummaryProto.HasField('reqId') else NO_VALID_ID
 
@@ -3445,7 +3653,8 @@ class EClient(object):
             self.reqPositionsProtoBuf(createPositionsRequestProto())
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3473,7 +3682,8 @@ class EClient(object):
         if positionsRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3498,7 +3708,8 @@ class EClient(object):
             self.cancelPositionsProtoBuf(createCancelPositionsRequestProto())
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3527,7 +3738,8 @@ class EClient(object):
         if cancelPositionsProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3554,7 +3766,8 @@ class EClient(object):
             self.reqPositionsMultiProtoBuf(createPositionsMultiRequestProto(reqId, account, modelCode))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3591,7 +3804,8 @@ class EClient(object):
         if positionsMultiRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = positionsMultiRequestProto.reqId if positionsMultiRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -3616,7 +3830,8 @@ class EClient(object):
             self.cancelPositionsMultiProtoBuf(createCancelPositionsMultiRequestProto(reqId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3648,7 +3863,8 @@ class EClient(object):
         if cancelPositionsMultiProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelPositionsMultiProto.reqId if cancelPositionsMultiProto.HasField('reqId') else NO_VALID_ID
 
@@ -3677,7 +3893,8 @@ class EClient(object):
             self.reqAccountUpdatesMultiProtoBuf(createAccountUpdatesMultiRequestProto(reqId, account, modelCode, ledgerAndNLV))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3716,7 +3933,8 @@ class EClient(object):
         if accountUpdatesMultiRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = accountUpdatesMultiRequestProto.reqId if accountUpdatesMultiRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -3742,7 +3960,8 @@ class EClient(object):
             self.cancelAccountUpdatesMultiProtoBuf(createCancelAccountUpdatesMultiRequestProto(reqId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3774,7 +3993,8 @@ class EClient(object):
         if cancelAccountUpdatesMultiProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelAccountUpdatesMultiProto.reqId if cancelAccountUpdatesMultiProto.HasField('reqId') else NO_VALID_ID
 
@@ -3803,7 +4023,8 @@ class EClient(object):
             self.reqPnLProtoBuf(createPnLRequestProto(reqId, account, modelCode))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3837,7 +4058,8 @@ class EClient(object):
         if pnlRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = pnlRequestProto.reqId if pnlRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -3861,7 +4083,8 @@ class EClient(object):
             self.cancelPnLProtoBuf(createCancelPnLProto(reqId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3888,7 +4111,8 @@ class EClient(object):
         if cancelPnLProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelPnLProto.reqId if cancelPnLProto.HasField('reqId') else NO_VALID_ID
 
@@ -3909,7 +4133,8 @@ class EClient(object):
             self.reqPnLSingleProtoBuf(createPnLSingleRequestProto(reqId, account, modelCode, conid))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3944,7 +4169,8 @@ class EClient(object):
         if pnlSingleRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = pnlSingleRequestProto.reqId if pnlSingleRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -3968,7 +4194,8 @@ class EClient(object):
             self.cancelPnLSingleProtoBuf(createCancelPnLSingleProto(reqId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -3994,7 +4221,8 @@ class EClient(object):
         if cancelPnLSingleProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelPnLSingleProto.reqId if cancelPnLSingleProto.HasField('reqId') else NO_VALID_ID
 
@@ -4033,7 +4261,8 @@ class EClient(object):
             self.reqExecutionsProtoBuf(executionRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4108,7 +4337,8 @@ class EClient(object):
         if executionRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = executionRequestProto.reqId if executionRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -4147,7 +4377,8 @@ class EClient(object):
             self.reqContractDataProtoBuf(contractDataRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4268,7 +4499,8 @@ class EClient(object):
         if contractDataRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = contractDataRequestProto.reqId if contractDataRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -4298,7 +4530,8 @@ class EClient(object):
             self.reqMarketDepthExchangesProtoBuf(marketDepthExchangesRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4324,7 +4557,8 @@ class EClient(object):
         if marketDepthExchangesRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4374,7 +4608,8 @@ class EClient(object):
             self.reqMarketDepthProtoBuf(marketDepthRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4480,7 +4715,8 @@ class EClient(object):
         if marketDepthRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = marketDepthRequestProto.reqId if marketDepthRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -4513,7 +4749,8 @@ class EClient(object):
             self.cancelMarketDepthProtoBuf(cancelMarketDepthProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4551,7 +4788,8 @@ class EClient(object):
         if cancelMarketDepthProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelMarketDepthProto.reqId if cancelMarketDepthProto.HasField('reqId') else NO_VALID_ID
 
@@ -4584,7 +4822,8 @@ class EClient(object):
             self.reqNewsBulletinsProtoBuf(createNewsBulletinsRequestProto(allMsgs))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4606,7 +4845,8 @@ class EClient(object):
         if newsBulletinsRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4628,7 +4868,8 @@ class EClient(object):
             self.cancelNewsBulletinsProtoBuf(createCancelNewsBulletinsProto())
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4647,7 +4888,8 @@ class EClient(object):
         if cancelNewsBulletinsProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4676,7 +4918,8 @@ class EClient(object):
             self.reqManagedAcctsProtoBuf(createManagedAccountsRequestProto())
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4695,7 +4938,8 @@ class EClient(object):
         if managedAccountsRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4727,7 +4971,8 @@ class EClient(object):
             self.reqFAProtoBuf(faRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4755,7 +5000,8 @@ class EClient(object):
         if faRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4787,7 +5033,8 @@ class EClient(object):
             self.replaceFAProtoBuf(faReplaceProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(reqId, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -4821,7 +5068,8 @@ class EClient(object):
         if faReplaceProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = faReplaceProto.reqId if faReplaceProto.HasField('reqId') else NO_VALID_ID
 
@@ -4919,7 +5167,8 @@ class EClient(object):
             self.reqHistoricalDataProtoBuf(historicalDataRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(reqId, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5035,7 +5284,8 @@ class EClient(object):
         if historicalDataRequestProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = historicalDataRequestProto.reqId if historicalDataRequestProto.HasField('reqId') else NO_VALID_ID
     
@@ -5067,7 +5317,8 @@ class EClient(object):
             self.cancelHistoricalDataProtoBuf(cancelHistoricalDataProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5089,7 +5340,8 @@ class EClient(object):
         if cancelHistoricalDataProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = cancelHistoricalDataProto.reqId if cancelHistoricalDataProto.HasField('reqId') else NO_VALID_ID
     
@@ -5122,7 +5374,8 @@ class EClient(object):
             self.reqHeadTimestampProtoBuf(headTimestampRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5173,7 +5426,8 @@ class EClient(object):
         if headTimestampRequestProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = headTimestampRequestProto.reqId if headTimestampRequestProto.HasField('reqId') else NO_VALID_ID
     
@@ -5199,7 +5453,8 @@ class EClient(object):
             self.cancelHeadTimestampProtoBuf(cancelHeadTimestampProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5228,7 +5483,8 @@ class EClient(object):
         if cancelHeadTimestampProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = cancelHeadTimestampProto.reqId if cancelHeadTimestampProto.HasField('reqId') else NO_VALID_ID
     
@@ -5253,7 +5509,8 @@ class EClient(object):
             self.reqHistogramDataProtoBuf(histogramDataRequestProto )
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5303,7 +5560,8 @@ class EClient(object):
         if histogramDataRequestProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = histogramDataRequestProto.reqId if histogramDataRequestProto.HasField('reqId') else NO_VALID_ID
     
@@ -5329,7 +5587,8 @@ class EClient(object):
             self.cancelHistogramDataProtoBuf(cancelHistogramDataProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5356,7 +5615,8 @@ class EClient(object):
         if cancelHistogramDataProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = cancelHistogramDataProto.reqId if cancelHistogramDataProto.HasField('reqId') else NO_VALID_ID
     
@@ -5390,7 +5650,8 @@ class EClient(object):
             self.reqHistoricalTicksProtoBuf(historicalTicksRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5452,7 +5713,8 @@ class EClient(object):
         if historicalTicksRequestProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = historicalTicksRequestProto.reqId if historicalTicksRequestProto.HasField('reqId') else NO_VALID_ID
     
@@ -5482,7 +5744,8 @@ class EClient(object):
             self.reqScannerParametersProtoBuf(createScannerParametersRequestProto())
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5502,7 +5765,8 @@ class EClient(object):
         if scannerParametersRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5533,7 +5797,8 @@ class EClient(object):
             self.reqScannerSubscriptionProtoBuf(createScannerSubscriptionRequestProto(reqId, subscription, scannerSubscriptionOptions, scannerSubscriptionFilterOptions))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5619,7 +5884,8 @@ class EClient(object):
         if scannerSubscriptionRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = scannerSubscriptionRequestProto.reqId if scannerSubscriptionRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -5645,7 +5911,8 @@ class EClient(object):
             self.cancelScannerSubscriptionProtoBuf(createCancelScannerSubscriptionProto(reqId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5668,7 +5935,8 @@ class EClient(object):
         if cancelScannerSubscriptionProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelScannerSubscriptionProto.reqId if cancelScannerSubscriptionProto.HasField('reqId') else NO_VALID_ID
 
@@ -5727,7 +5995,8 @@ class EClient(object):
             self.reqRealTimeBarsProtoBuf(realTimeBarsRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5800,7 +6069,8 @@ class EClient(object):
         if realTimeBarsRequestProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = realTimeBarsRequestProto.reqId if realTimeBarsRequestProto.HasField('reqId') else NO_VALID_ID
     
@@ -5830,7 +6100,8 @@ class EClient(object):
             self.cancelRealTimeBarsProtoBuf(cancelRealTimeBarsProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(reqId, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5856,7 +6127,8 @@ class EClient(object):
         if cancelRealTimeBarsProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = cancelRealTimeBarsProto.reqId if cancelRealTimeBarsProto.HasField('reqId') else NO_VALID_ID
     
@@ -5909,7 +6181,8 @@ class EClient(object):
             self.reqFundamentalsDataProtoBuf(createFundamentalsDataRequestProto(reqId, contract, reportType, fundamentalDataOptions))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -5983,7 +6256,8 @@ class EClient(object):
         if fundamentalsDataRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = fundamentalsDataRequestProto.reqId if fundamentalsDataRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -6011,7 +6285,8 @@ class EClient(object):
             self.cancelFundamentalsDataProtoBuf(createCancelFundamentalsDataProto(reqId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6043,7 +6318,8 @@ class EClient(object):
         if cancelFundamentalsDataProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelFundamentalsDataProto.reqId if cancelFundamentalsDataProto.HasField('reqId') else NO_VALID_ID
 
@@ -6068,7 +6344,8 @@ class EClient(object):
             self.reqNewsProvidersProtoBuf(createNewsProvidersRequestProto())
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6093,7 +6370,8 @@ class EClient(object):
         if newsProvidersRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6119,7 +6397,8 @@ class EClient(object):
             self.reqNewsArticleProtoBuf(createNewsArticleRequestProto(reqId, providerCode, articleId, newsArticleOptions))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6167,7 +6446,8 @@ class EClient(object):
         if newsArticleRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = newsArticleRequestProto.reqId if newsArticleRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -6201,7 +6481,8 @@ class EClient(object):
             self.reqHistoricalNewsProtoBuf(createHistoricalNewsRequestProto(reqId, conId, providerCodes, startDateTime, endDateTime, totalResults, historicalNewsOptions))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6252,7 +6533,8 @@ class EClient(object):
         if historicalNewsRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = historicalNewsRequestProto.reqId if historicalNewsRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -6289,7 +6571,8 @@ class EClient(object):
             self.queryDisplayGroupsProtoBuf(queryDisplayGroupsRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6320,7 +6603,8 @@ class EClient(object):
         if queryDisplayGroupsRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = queryDisplayGroupsRequestProto.reqId if queryDisplayGroupsRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -6350,7 +6634,8 @@ class EClient(object):
             self.subscribeToGroupEventsProtoBuf(subscribeToGroupEventsRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6383,7 +6668,8 @@ class EClient(object):
         if subscribeToGroupEventsRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = subscribeToGroupEventsRequestProto.reqId if subscribeToGroupEventsRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -6418,7 +6704,8 @@ class EClient(object):
             self.updateDisplayGroupProtoBuf(updateDisplayGroupRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6454,7 +6741,8 @@ class EClient(object):
         if updateDisplayGroupRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = updateDisplayGroupRequestProto.reqId if updateDisplayGroupRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -6482,7 +6770,8 @@ class EClient(object):
             self.unsubscribeFromGroupEventsProtoBuf(unsubscribeFromGroupEventsRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6514,7 +6803,8 @@ class EClient(object):
         if unsubscribeFromGroupEventsRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = unsubscribeFromGroupEventsRequestProto.reqId if unsubscribeFromGroupEventsRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -6542,7 +6832,8 @@ class EClient(object):
             self.verifyRequestProtoBuf(verifyRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6588,7 +6879,8 @@ class EClient(object):
         if verifyRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6618,7 +6910,8 @@ class EClient(object):
             self.verifyMessageProtoBuf(verifyMessageRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6653,7 +6946,8 @@ class EClient(object):
         if verifyMessageRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6675,7 +6969,8 @@ class EClient(object):
         """For IB's internal purpose. Allows to provide means of verification
         between the TWS and third party programs."""
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6722,7 +7017,8 @@ class EClient(object):
         """For IB's internal purpose. Allows to provide means of verification
         between the TWS and third party programs."""
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6774,7 +7070,8 @@ class EClient(object):
             self.reqSecDefOptParamsProtoBuf(createSecDefOptParamsRequestProto(reqId, underlyingSymbol, futFopExchange, underlyingSecType, underlyingConId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6814,7 +7111,8 @@ class EClient(object):
         if secDefOptParamsRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = secDefOptParamsRequestProto.reqId if secDefOptParamsRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -6843,7 +7141,8 @@ class EClient(object):
             self.reqSoftDollarTiersProtoBuf(createSoftDollarTiersRequestProto(reqId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6860,7 +7159,8 @@ class EClient(object):
         if softDollarTiersRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = softDollarTiersRequestProto.reqId if softDollarTiersRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -6886,7 +7186,8 @@ class EClient(object):
             self.reqFamilyCodesProtoBuf(createFamilyCodesRequestProto())
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6911,7 +7212,8 @@ class EClient(object):
         if familyCodesRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6934,7 +7236,8 @@ class EClient(object):
             self.reqMatchingSymbolsProtoBuf(createMatchingSymbolsRequestProto(reqId, pattern))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -6967,7 +7270,8 @@ class EClient(object):
         if matchingSymbolsRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = matchingSymbolsRequestProto.reqId if matchingSymbolsRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -6998,7 +7302,8 @@ class EClient(object):
             self.reqCompletedOrdersProtoBuf(completedOrdersRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -7016,7 +7321,8 @@ class EClient(object):
         if completedOrdersRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -7035,7 +7341,8 @@ class EClient(object):
             self.reqWshMetaDataProtoBuf(createWshMetaDataRequestProto(reqId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -7065,7 +7372,8 @@ class EClient(object):
         if wshMetaDataRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = wshMetaDataRequestProto.reqId if wshMetaDataRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -7090,7 +7398,8 @@ class EClient(object):
             self.cancelWshMetaDataProtoBuf(createCancelWshMetaDataProto(reqId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -7116,7 +7425,8 @@ class EClient(object):
         if cancelWshMetaDataProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelWshMetaDataProto.reqId if cancelWshMetaDataProto.HasField('reqId') else NO_VALID_ID
 
@@ -7142,7 +7452,8 @@ class EClient(object):
             self.reqWshEventDataProtoBuf(createWshEventDataRequestProto(reqId, wshEventData))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -7217,7 +7528,8 @@ class EClient(object):
         if wshEventDataRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = wshEventDataRequestProto.reqId if wshEventDataRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -7242,7 +7554,8 @@ class EClient(object):
             self.cancelWshEventDataProtoBuf(createCancelWshEventDataProto(reqId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -7268,7 +7581,8 @@ class EClient(object):
         if cancelWshEventDataProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = cancelWshEventDataProto.reqId if cancelWshEventDataProto.HasField('reqId') else NO_VALID_ID
 
@@ -7290,7 +7604,8 @@ class EClient(object):
             self.reqUserInfoProtoBuf(createUserInfoRequestProto(reqId))
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -7316,7 +7631,8 @@ class EClient(object):
         if userInfoRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         reqId = userInfoRequestProto.reqId if userInfoRequestProto.HasField('reqId') else NO_VALID_ID
 
@@ -7344,7 +7660,8 @@ class EClient(object):
             self.reqCurrentTimeInMillisProtoBuf(currentTimeInMillisRequestProto)
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -7369,7 +7686,8 @@ class EClient(object):
         if currentTimeInMillisRequestProto is None:
             return
 
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
 
         if not self.isConnected():
             self.wrapper.error(NO_VALID_ID, currentTimeMillis(), NOT_CONNECTED.code(), NOT_CONNECTED.msg())
@@ -7395,7 +7713,8 @@ class EClient(object):
         if cancelContractDataProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = cancelContractDataProto.reqId if cancelContractDataProto.HasField('reqId') else NO_VALID_ID
     
@@ -7427,7 +7746,8 @@ class EClient(object):
         if cancelHistoricalTicksProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = cancelHistoricalTicksProto.reqId if cancelHistoricalTicksProto.HasField('reqId') else NO_VALID_ID
     
@@ -7455,7 +7775,8 @@ class EClient(object):
         if configRequestProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = configRequestProto.reqId if configRequestProto.HasField('reqId') else NO_VALID_ID
     
@@ -7483,7 +7804,8 @@ class EClient(object):
         if updateConfigRequestProto is None:
             return
         
-        self.logRequest(current_fn_name(), vars())
+        if log_enabled():
+            self.logRequest(current_fn_name(), vars())
     
         reqId = updateConfigRequestProto.reqId if updateConfigRequestProto.HasField('reqId') else NO_VALID_ID
     
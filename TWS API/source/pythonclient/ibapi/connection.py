@@ -12,6 +12,7 @@ import socket
 import threading
 import logging
 import sys
+import time
 from ibapi.errors import FAIL_CREATE_SOCK
 from ibapi.errors import CONNECT_FAIL
 from ibapi.const import NO_VALID_ID
@@ -21,6 +22,10 @@ from ibapi.utils import currentTimeMillis
 
 logger = logging.getLogger(__name__)
 
+MIN_READ_SIZE = 4096
+MAX_READ_SIZE = 1024 * 1024
+MAX_BATCH_SIZE = 64 * 1024  # a batch is written out early past this size
+
 
 class Connection:
     def __init__(self, host, port):
@@ -29,6 +34,41 @@ class Connection:
         self.socket = None
         self.wrapper = None
         self.lock = threading.Lock()
+        self.rcvBufSize = None  # SO_RCVBUF, None keeps the OS default
+        self.minReadSize = MIN_READ_SIZE
+        self.maxReadSize = MAX_READ_SIZE
+        self.readSize = MIN_READ_SIZE
+        self.recvBuf = bytearray(MIN_READ_SIZE)
+        self.nBytesRecvd = 0
+        self.nRecvCalls = 0
+        self.statsTime = time.monotonic()
+        self.statsBytesRecvd = 0
+        self.statsRecvCalls = 0
+        self.tracer = None  # WireTracer, see EClient.setWireTracer()
+        self.tcpNoDelay = None  # TCP_NODELAY, None keeps the OS default
+        self.batches = threading.local()  # per thread batch, see startBatch()
+
+    def setRecvOptions(self, rcvBufSize=None, minReadSize=MIN_READ_SIZE, maxReadSize=MAX_READ_SIZE):
+        """rcvBufSize:int - kernel receive buffer (SO_RCVBUF) requested when
+            connecting, None keeps the OS default.
+        minReadSize/maxReadSize:int - bounds of the adaptive read size. It
+            doubles every time a read fills it and halves back when reads
+            stay small."""
+        if minReadSize <= 0 or maxReadSize < minReadSize:
+            raise ValueError(f"invalid read sizes {minReadSize}..{maxReadSize}")
+        self.rcvBufSize = rcvBufSize
+        self.minReadSize = minReadSize
+        self.maxReadSize = maxReadSize
+        self.readSize = minReadSize
+
+    def setTcpNoDelay(self, enabled):
+        """enabled:bool - sets TCP_NODELAY, i.e. disables Nagle's algorithm so
+            that small requests are not held back waiting for the ACK of the
+            previous ones. Applied at once if connected, else when connecting.
+            None keeps the OS default."""
+        self.tcpNoDelay = enabled
+        if self.socket is not None and enabled is not None:
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(enabled))
 
     def connect(self):
         try:
@@ -40,6 +80,17 @@ class Connection:
                     NO_VALID_ID, currentTimeMillis(), FAIL_CREATE_SOCK.code(), FAIL_CREATE_SOCK.msg()
                 )
 
+        if self.rcvBufSize:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvBufSize)
+            logger.debug(
+                "SO_RCVBUF requested %d got %d",
+                self.rcvBufSize,
+                self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+            )
+
+        if self.tcpNoDelay is not None:
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(self.tcpNoDelay))
+
         try:
             self.socket.connect((self.host, self.port))
         except socket.error:
@@ -65,26 +116,65 @@ class Connection:
         return self.socket is not None
 
     def sendMsg(self, msg):
-        logger.debug("acquiring lock")
-        self.lock.acquire()
-        logger.debug("acquired lock")
-        if not self.isConnected():
-            logger.debug("sendMsg attempted while not connected, releasing lock")
-            self.lock.release()
+        batch = getattr(self.batches, "msgs", None)
+        if batch is not None:
+            batch.append(msg)
+            self.batches.size += len(msg)
+            if self.batches.size >= MAX_BATCH_SIZE:
+                self.flushBatch()
+            return len(msg)
+
+        return self._sendAll((msg,))
+
+    def startBatch(self):
+        """Until the matching endBatch(), the messages sent by the calling
+        thread are buffered and then written with a single sendall().
+        Batches nest, only the outermost endBatch() writes."""
+        batches = self.batches
+        if getattr(batches, "depth", 0) == 0:
+            batches.msgs = []
+            batches.size = 0
+            batches.depth = 0
+        batches.depth += 1
+
+    def endBatch(self) -> int:
+        """Returns the number of bytes written."""
+        batches = self.batches
+        batches.depth -= 1
+        if batches.depth > 0:
             return 0
         try:
-            nSent = self.socket.send(msg)
-        except socket.error:
-            logger.debug("exception from sendMsg %s", sys.exc_info())
-            raise
+            return self.flushBatch()
         finally:
-            logger.debug("releasing lock")
-            self.lock.release()
-            logger.debug("release lock")
+            batches.msgs = None
 
-        logger.debug("sendMsg: sent: %d", nSent)
+    def flushBatch(self) -> int:
+        """Writes out the messages batched so far by the calling thread."""
+        batches = self.batches
+        msgs = batches.msgs
+        if not msgs:
+            return 0
+        batches.msgs = []
+        batches.size = 0
+        return self._sendAll(msgs)
+
+    def _sendAll(self, msgs) -> int:
+        data = msgs[0] if len(msgs) == 1 else b"".join(msgs)
+        with self.lock:
+            if not self.isConnected():
+                logger.debug("sendMsg attempted while not connected")
+                return 0
+            try:
+                self.socket.sendall(data)
+            except socket.error:
+                logger.debug("exception from sendMsg %s", sys.exc_info())
+                raise
 
-        return nSent
+        if self.tracer is not None:
+            for msg in msgs:
+                self.tracer.sent(msg)
+
+        return len(data)
 
     def recvMsg(self):
         if not self.isConnected():
@@ -111,16 +201,69 @@ class Connection:
 
         return buf
 
-    def _recvAllMsg(self):
-        cont = True
-        allbuf = b""
+    def recvMsgInto(self, buf) -> int:
+        """Reads whatever is available straight into buf (a writable buffer,
+        typically a memoryview) and returns the number of bytes read."""
+        if not self.isConnected():
+            logger.debug("recvMsgInto attempted while not connected")
+            return 0
+        try:
+            nRecv = self.socket.recv_into(buf)
+            self._countRecv(nRecv)
+            # receiving 0 bytes outside a timeout means the connection is either
+            # closed or broken
+            if nRecv == 0:
+                logger.debug("socket either closed or broken, disconnecting")
+                self.disconnect()
+        except socket.timeout:
+            logger.debug("socket timeout from recvMsgInto %s", sys.exc_info())
+            nRecv = 0
+        except socket.error:
+            logger.debug("socket broken, disconnecting")
+            self.disconnect()
+            nRecv = 0
+
+        return nRecv
 
-        while cont and self.isConnected():
-            buf = self.socket.recv(4096)
-            allbuf += buf
-            logger.debug("len %d raw:%s|", len(buf), buf)
+    def recvStats(self) -> dict:
+        """Receive counters. The rates cover the time since the previous
+        call (or since the connection was created)."""
+        now = time.monotonic()
+        elapsed = max(now - self.statsTime, 1e-9)
+        stats = {
+            "bytesRecvd": self.nBytesRecvd,
+            "recvCalls": self.nRecvCalls,
+            "bytesPerSec": (self.nBytesRecvd - self.statsBytesRecvd) / elapsed,
+            "recvCallsPerSec": (self.nRecvCalls - self.statsRecvCalls) / elapsed,
+            "readSize": self.readSize,
+        }
+        self.statsTime = now
+        self.statsBytesRecvd = self.nBytesRecvd
+        self.statsRecvCalls = self.nRecvCalls
+        return stats
+
+    def _countRecv(self, nRecv):
+        self.nBytesRecvd += nRecv
+        self.nRecvCalls += 1
+
+        # a read that fills the request means more is pending: ask for more
+        # next time. Shrink back slowly once the burst is over.
+        if nRecv >= self.readSize:
+            self.readSize = min(self.readSize * 2, self.maxReadSize)
+        elif nRecv < self.readSize // 8:
+            self.readSize = max(self.readSize // 2, self.minReadSize)
+
+    def _recvAllMsg(self):
+        # a single read: the adaptive read size lets a burst come in with few
+        # large reads, and the caller loops anyway. Looping here until a short
+        # read would block for the socket timeout when the data ends exactly
+        # on a read boundary.
+        readSize = self.readSize
+        if len(self.recvBuf) < readSize:
+            self.recvBuf = bytearray(readSize)
 
-            if len(buf) < 4096:
-                cont = False
+        nRecv = self.socket.recv_into(self.recvBuf, readSize)
+        self._countRecv(nRecv)
+        logger.debug("len %d", nRecv)
 
-        return allbuf
+        return bytes(memoryview(self.recvBuf)[:nRecv])
@@ -135,11 +135,118 @@ class HandleInfo(Object):
         return s
 
 
+PRICE_TICK_TO_SIZE_TICK = {
+    TickTypeEnum.BID: TickTypeEnum.BID_SIZE,
+    TickTypeEnum.ASK: TickTypeEnum.ASK_SIZE,
+    TickTypeEnum.LAST: TickTypeEnum.LAST_SIZE,
+    TickTypeEnum.DELAYED_BID: TickTypeEnum.DELAYED_BID_SIZE,
+    TickTypeEnum.DELAYED_ASK: TickTypeEnum.DELAYED_ASK_SIZE,
+    TickTypeEnum.DELAYED_LAST: TickTypeEnum.DELAYED_LAST_SIZE,
+}
+
+# The streaming market data messages are parsed into one reused instance per
+# Decoder, see parseProtoBuf(). Their process*ProtoBuf methods only pass plain
+# values on to the wrapper, nothing of the message outlives the call.
+POOLED_PROTO_BUFS = (
+    TickPriceProto,
+    TickSizeProto,
+    TickGenericProto,
+    TickStringProto,
+    TickOptionComputationProto,
+    TickSnapshotEndProto,
+    TickByTickDataProto,
+    MarketDepthProto,
+    MarketDepthL2Proto,
+    RealTimeBarTickProto,
+    HistoricalDataUpdateProto,
+    PnLProto,
+    PnLSingleProto,
+)
+
+
+def makeStrConverter(encoding):
+    def toStr(field):
+        try:
+            return field.decode(encoding)
+        except UnicodeDecodeError:
+            return field.decode("latin-1")
+
+    return toStr
+
+
+def toDecimal(field):
+    return Decimal(field.decode()) if field else UNSET_DECIMAL
+
+
 class Decoder(Object):
     def __init__(self, wrapper, serverVersion):
         self.wrapper = wrapper
         self.serverVersion = serverVersion
+        self.decodePlans = {}
+        self.decodePlansVersion = None
+        self.fieldToStr = None
+        self.msgId2processFast = {}
+        self.protoBufPool = {protoClass: protoClass() for protoClass in POOLED_PROTO_BUFS}
+        self.protoBufCallbacks = self.discoverProtoBufCallbacks()
+        self.setSizeType(Decimal)
         self.discoverParams()
+        self.compileDecodePlans()
+
+    def discoverProtoBufCallbacks(self) -> dict:
+        """The *ProtoBuf callbacks the wrapper overrides, by name. The EWrapper
+        defaults do nothing, so the others are never called."""
+        callbacks = {}
+        for name, meth in inspect.getmembers(EWrapper, inspect.isfunction):
+            if not name.endswith("ProtoBuf"):
+                continue
+            callback = getattr(self.wrapper, name, None)
+            if callback is not None and getattr(callback, "__func__", None) is not meth:
+                callbacks[name] = callback
+        return callbacks
+
+    def parseProtoBuf(self, protoClass, protobuf, callbackName):
+        """Parses the message and passes it to the wrapper's callbackName if
+        overridden. The pooled instance of POOLED_PROTO_BUFS is reused unless
+        the message goes to the wrapper, which may keep it."""
+        callback = self.protoBufCallbacks.get(callbackName)
+        proto = self.protoBufPool.get(protoClass) if callback is None else None
+        if proto is None:
+            proto = protoClass()
+        # clears the reused instance first
+        proto.ParseFromString(protobuf)
+        if callback is not None:
+            callback(proto)
+        return proto
+
+    def setFastTickDecoding(self, enabled: bool):
+        """Decodes the high frequency text messages (TICK_PRICE, TICK_SIZE,
+        TICK_GENERIC, TICK_STRING, TICK_BY_TICK, MARKET_DEPTH[_L2]) with the
+        index based fast path instead of the generic field iterator. Both
+        modes call the wrapper with the same values."""
+        self.msgId2processFast = self.msgId2processFastAll if enabled else {}
+
+    def isFastTickDecoding(self) -> bool:
+        return bool(self.msgId2processFast)
+
+    def setSizeType(self, sizeType):
+        """Numeric type of the market data sizes and volumes (tick sizes,
+        depth sizes, tick-by-tick and historical tick sizes, bar volume) for
+        both the text and the protobuf messages: Decimal (default), float or
+        int. Unset sizes are UNSET_DECIMAL, UNSET_DOUBLE or UNSET_LONG
+        respectively. int truncates fractional sizes, use it only for
+        instruments traded in whole units. The bar WAP is a price and stays
+        Decimal, as do order, execution and position quantities."""
+        if sizeType not in SIZE_TYPE_CONVERTERS:
+            raise ValueError(f"unsupported size type {sizeType!r}")
+        self.sizeType = sizeType
+        (self.decodeSizeField, self.toSize, self.unsetSize) = SIZE_TYPE_CONVERTERS[sizeType]
+
+    def decodeSize(self, fields):
+        try:
+            s = next(fields)
+        except StopIteration:
+            raise BadMessage("no more fields")
+        return self.decodeSizeField(s)
 
     def processTickPriceMsg(self, fields):
         decode(int, fields)
@@ -147,7 +254,7 @@ class Decoder(Object):
         reqId = decode(int, fields)
         tickType = decode(int, fields)
         price = decode(float, fields)
-        size = decode(Decimal, fields)  # ver 2 field
+        size = self.decodeSize(fields)  # ver 2 field
         attrMask = decode(int, fields)  # ver 3 field
 
         attrib = TickAttrib()
@@ -181,15 +288,12 @@ class Decoder(Object):
             self.wrapper.tickSize(reqId, sizeTickType, size)
 
     def processTickPriceMsgProtoBuf(self, protobuf):
-        tickPriceProto = TickPriceProto()
-        tickPriceProto.ParseFromString(protobuf)
-
-        self.wrapper.tickPriceProtoBuf(tickPriceProto)
+        tickPriceProto = self.parseProtoBuf(TickPriceProto, protobuf, "tickPriceProtoBuf")
 
         reqId = tickPriceProto.reqId if tickPriceProto.HasField('reqId') else NO_VALID_ID
         tickType = tickPriceProto.tickType if tickPriceProto.HasField('tickType') else UNSET_INTEGER
         price = tickPriceProto.price if tickPriceProto.HasField('price') else UNSET_DOUBLE
-        size = Decimal(tickPriceProto.size) if tickPriceProto.HasField('size') else UNSET_DECIMAL
+        size = self.toSize(tickPriceProto.size) if tickPriceProto.HasField('size') else self.unsetSize
         attrMask = tickPriceProto.attrMask if tickPriceProto.HasField('attrMask') else UNSET_INTEGER
         attrib = TickAttrib()
         attrib.canAutoExecute = attrMask & 1 != 0
@@ -198,21 +302,8 @@ class Decoder(Object):
 
         self.wrapper.tickPrice(reqId, tickType, price, attrib)
 
-        sizeTickType = TickTypeEnum.NOT_SET
-        if TickTypeEnum.BID == tickType:
-            sizeTickType = TickTypeEnum.BID_SIZE
-        elif TickTypeEnum.ASK == tickType:
-            sizeTickType = TickTypeEnum.ASK_SIZE
-        elif TickTypeEnum.LAST == tickType:
-            sizeTickType = TickTypeEnum.LAST_SIZE
-        elif TickTypeEnum.DELAYED_BID == tickType:
-            sizeTickType = TickTypeEnum.DELAYED_BID_SIZE
-        elif TickTypeEnum.DELAYED_ASK == tickType:
-            sizeTickType = TickTypeEnum.DELAYED_ASK_SIZE
-        elif TickTypeEnum.DELAYED_LAST == tickType:
-            sizeTickType = TickTypeEnum.DELAYED_LAST_SIZE
-
-        if sizeTickType != TickTypeEnum.NOT_SET:
+        sizeTickType = PRICE_TICK_TO_SIZE_TICK.get(tickType)
+        if sizeTickType is not None:
             self.wrapper.tickSize(reqId, sizeTickType, size)
 
     def processTickSizeMsg(self, fields):
@@ -220,20 +311,17 @@ class Decoder(Object):
 
         reqId = decode(int, fields)
         sizeTickType = decode(int, fields)
-        size = decode(Decimal, fields)
+        size = self.decodeSize(fields)
 
         if sizeTickType != TickTypeEnum.NOT_SET:
             self.wrapper.tickSize(reqId, sizeTickType, size)
 
     def processTickSizeMsgProtoBuf(self, protobuf):
-        tickSizeProto = TickSizeProto()
-        tickSizeProto.ParseFromString(protobuf)
-
-        self.wrapper.tickSizeProtoBuf(tickSizeProto)
+        tickSizeProto = self.parseProtoBuf(TickSizeProto, protobuf, "tickSizeProtoBuf")
 
         reqId = tickSizeProto.reqId if tickSizeProto.HasField('reqId') else NO_VALID_ID
         tickType = tickSizeProto.tickType if tickSizeProto.HasField('tickType') else UNSET_INTEGER
-        size = Decimal(tickSizeProto.size) if tickSizeProto.HasField('size') else UNSET_DECIMAL
+        size = self.toSize(tickSizeProto.size) if tickSizeProto.HasField('size') else self.unsetSize
 
         if tickType != TickTypeEnum.NOT_SET:
             self.wrapper.tickSize(reqId, tickType, size)
@@ -273,10 +361,7 @@ class Decoder(Object):
         )
 
     def processOrderStatusMsgProtoBuf(self, protobuf):
-        orderStatusProto = OrderStatusProto()
-        orderStatusProto.ParseFromString(protobuf)
-
-        self.wrapper.orderStatusProtoBuf(orderStatusProto)
+        orderStatusProto = self.parseProtoBuf(OrderStatusProto, protobuf, "orderStatusProtoBuf")
 
         orderId = orderStatusProto.orderId if orderStatusProto.HasField('orderId') else UNSET_INTEGER
         status = orderStatusProto.status if orderStatusProto.HasField('status') else ""
@@ -395,10 +480,7 @@ class Decoder(Object):
         self.wrapper.openOrder(order.orderId, contract, order, orderState)
 
     def processOpenOrderMsgProtoBuf(self, protobuf):
-        openOrderProto = OpenOrderProto()
-        openOrderProto.ParseFromString(protobuf)
-
-        self.wrapper.openOrderProtoBuf(openOrderProto)
+        openOrderProto = self.parseProtoBuf(OpenOrderProto, protobuf, "openOrderProtoBuf")
 
         orderId = openOrderProto.orderId if openOrderProto.HasField('orderId') else 0
 
@@ -420,10 +502,7 @@ class Decoder(Object):
         self.wrapper.openOrder(orderId, contract, order, orderState);
 
     def processOpenOrdersEndMsgProtoBuf(self, protobuf):
-        openOrdersEndProto = OpenOrdersEndProto()
-        openOrdersEndProto.ParseFromString(protobuf)
-
-        self.wrapper.openOrdersEndProtoBuf(openOrdersEndProto)
+        openOrdersEndProto = self.parseProtoBuf(OpenOrdersEndProto, protobuf, "openOrdersEndProtoBuf")
 
         self.wrapper.openOrderEnd()
 
@@ -473,10 +552,7 @@ class Decoder(Object):
         )
 
     def processPortfolioValueMsgProtoBuf(self, protobuf):
-        portfolioValueProto = PortfolioValueProto()
-        portfolioValueProto.ParseFromString(protobuf)
-
-        self.wrapper.updatePortfolioProtoBuf(portfolioValueProto)
+        portfolioValueProto = self.parseProtoBuf(PortfolioValueProto, protobuf, "updatePortfolioProtoBuf")
 
         # decode contract fields
         if not portfolioValueProto.HasField('contract'):
@@ -618,10 +694,7 @@ class Decoder(Object):
         self.wrapper.contractDetails(reqId, contract)
 
     def processContractDataMsgProtoBuf(self, protobuf):
-        contractDataProto = ContractDataProto()
-        contractDataProto.ParseFromString(protobuf)
-
-        self.wrapper.contractDataProtoBuf(contractDataProto)
+        contractDataProto = self.parseProtoBuf(ContractDataProto, protobuf, "contractDataProtoBuf")
 
         reqId = contractDataProto.reqId if contractDataProto.HasField('reqId') else NO_VALID_ID
 
@@ -705,10 +778,7 @@ class Decoder(Object):
         self.wrapper.bondContractDetails(reqId, contract)
 
     def processBondContractDataMsgProtoBuf(self, protobuf):
-        contractDataProto = ContractDataProto()
-        contractDataProto.ParseFromString(protobuf)
-
-        self.wrapper.bondContractDataProtoBuf(contractDataProto)
+        contractDataProto = self.parseProtoBuf(ContractDataProto, protobuf, "bondContractDataProtoBuf")
 
         reqId = contractDataProto.reqId if contractDataProto.HasField('reqId') else NO_VALID_ID
 
@@ -720,10 +790,7 @@ class Decoder(Object):
         self.wrapper.bondContractDetails(reqId, contractDetails)
 
     def processContractDataEndMsgProtoBuf(self, protobuf):
-        contractDataEndProto = ContractDataEndProto()
-        contractDataEndProto.ParseFromString(protobuf)
-
-        self.wrapper.contractDataEndProtoBuf(contractDataEndProto)
+        contractDataEndProto = self.parseProtoBuf(ContractDataEndProto, protobuf, "contractDataEndProtoBuf")
 
         reqId = contractDataEndProto.reqId if contractDataEndProto.HasField('reqId') else NO_VALID_ID
 
@@ -768,10 +835,7 @@ class Decoder(Object):
         self.wrapper.scannerDataEnd(reqId)
 
     def processScannerDataMsgProtoBuf(self, protobuf):
-        scannerDataProto = ScannerDataProto()
-        scannerDataProto.ParseFromString(protobuf)
-
-        self.wrapper.scannerDataProtoBuf(scannerDataProto)
+        scannerDataProto = self.parseProtoBuf(ScannerDataProto, protobuf, "scannerDataProtoBuf")
 
         reqId = scannerDataProto.reqId if scannerDataProto.HasField('reqId') else NO_VALID_ID
 
@@ -859,20 +923,14 @@ class Decoder(Object):
         self.wrapper.execDetails(reqId, contract, execution)
 
     def processExecutionDataEndMsgProtoBuf(self, protobuf):
-        executionDetailsEndProto = ExecutionDetailsEndProto()
-        executionDetailsEndProto.ParseFromString(protobuf)
-
-        self.wrapper.executionDetailsEndProtoBuf(executionDetailsEndProto)
+        executionDetailsEndProto = self.parseProtoBuf(ExecutionDetailsEndProto, protobuf, "executionDetailsEndProtoBuf")
 
         reqId = executionDetailsEndProto.reqId if executionDetailsEndProto.HasField('reqId') else NO_VALID_ID
 
         self.wrapper.execDetailsEnd(reqId)
 
     def processExecutionDataMsgProtoBuf(self, protobuf):
-        executionDetailsProto = ExecutionDetailsProto()
-        executionDetailsProto.ParseFromString(protobuf)
-
-        self.wrapper.executionDetailsProtoBuf(executionDetailsProto)
+        executionDetailsProto = self.parseProtoBuf(ExecutionDetailsProto, protobuf, "executionDetailsProtoBuf")
 
         reqId = executionDetailsProto.reqId if executionDetailsProto.HasField('reqId') else NO_VALID_ID
 
@@ -907,7 +965,7 @@ class Decoder(Object):
             bar.high = decode(float, fields)
             bar.low = decode(float, fields)
             bar.close = decode(float, fields)
-            bar.volume = decode(Decimal, fields)
+            bar.volume = self.decodeSize(fields)
             bar.wap = decode(Decimal, fields)
 
             if self.serverVersion < MIN_SERVER_VER_SYNT_REALTIME_BARS:
@@ -922,10 +980,7 @@ class Decoder(Object):
             self.wrapper.historicalDataEnd(reqId, startDateStr, endDateStr)
 
     def processHistoricalDataMsgProtoBuf(self, protobuf):
-        historicalDataProto = HistoricalDataProto()
-        historicalDataProto.ParseFromString(protobuf)
-
-        self.wrapper.historicalDataProtoBuf(historicalDataProto)
+        historicalDataProto = self.parseProtoBuf(HistoricalDataProto, protobuf, "historicalDataProtoBuf")
 
         reqId = historicalDataProto.reqId if historicalDataProto.HasField('reqId') else NO_VALID_ID
 
@@ -933,7 +988,7 @@ class Decoder(Object):
             return
 
         for historicalDataBarProto in historicalDataProto.historicalDataBars:
-            bar = decodeHistoricalDataBar(historicalDataBarProto)
+            bar = decodeHistoricalDataBar(historicalDataBarProto, self.toSize)
             self.wrapper.historicalData(reqId, bar)
 
     def processHistoricalDataEndMsg(self, fields):
@@ -944,10 +999,7 @@ class Decoder(Object):
         self.wrapper.historicalDataEnd(reqId, startDateStr, endDateStr)
 
     def processHistoricalDataEndMsgProtoBuf(self, protobuf):
-        historicalDataEndProto = HistoricalDataEndProto()
-        historicalDataEndProto.ParseFromString(protobuf)
-
-        self.wrapper.historicalDataEndProtoBuf(historicalDataEndProto)
+        historicalDataEndProto = self.parseProtoBuf(HistoricalDataEndProto, protobuf, "historicalDataEndProtoBuf")
 
         reqId = historicalDataEndProto.reqId if historicalDataEndProto.HasField('reqId') else NO_VALID_ID
         startDateStr = historicalDataEndProto.startDateStr if historicalDataEndProto.HasField('startDateStr') else ""
@@ -965,21 +1017,18 @@ class Decoder(Object):
         bar.high = decode(float, fields)
         bar.low = decode(float, fields)
         bar.wap = decode(Decimal, fields)
-        bar.volume = decode(Decimal, fields)
+        bar.volume = self.decodeSize(fields)
         self.wrapper.historicalDataUpdate(reqId, bar)
 
     def processHistoricalDataUpdateMsgProtoBuf(self, protobuf):
-        historicalDataUpdateProto = HistoricalDataUpdateProto()
-        historicalDataUpdateProto.ParseFromString(protobuf)
-
-        self.wrapper.historicalDataUpdateProtoBuf(historicalDataUpdateProto)
+        historicalDataUpdateProto = self.parseProtoBuf(HistoricalDataUpdateProto, protobuf, "historicalDataUpdateProtoBuf")
 
         reqId = historicalDataUpdateProto.reqId if historicalDataUpdateProto.HasField('reqId') else NO_VALID_ID
     
         if not historicalDataUpdateProto.HasField('historicalDataBar'):
             return
         
-        bar = decodeHistoricalDataBar(historicalDataUpdateProto.historicalDataBar)
+        bar = decodeHistoricalDataBar(historicalDataUpdateProto.historicalDataBar, self.toSize)
         self.wrapper.historicalDataUpdate(reqId, bar)
 
     def processRealTimeBarMsg(self, fields):
@@ -992,7 +1041,7 @@ class Decoder(Object):
         bar.high = decode(float, fields)
         bar.low = decode(float, fields)
         bar.close = decode(float, fields)
-        bar.volume = decode(Decimal, fields)
+        bar.volume = self.decodeSize(fields)
         bar.wap = decode(Decimal, fields)
         bar.count = decode(int, fields)
 
@@ -1009,10 +1058,7 @@ class Decoder(Object):
         )
 
     def processRealTimeBarMsgProtoBuf(self, protobuf):
-        realTimeBarTickProto = RealTimeBarTickProto()
-        realTimeBarTickProto.ParseFromString(protobuf)
-
-        self.wrapper.realTimeBarTickProtoBuf(realTimeBarTickProto)
+        realTimeBarTickProto = self.parseProtoBuf(RealTimeBarTickProto, protobuf, "realTimeBarTickProtoBuf")
 
         reqId = realTimeBarTickProto.reqId if realTimeBarTickProto.HasField('reqId') else NO_VALID_ID
         time = realTimeBarTickProto.time if realTimeBarTickProto.HasField('time') else 0
@@ -1020,7 +1066,7 @@ class Decoder(Object):
         high = realTimeBarTickProto.high if realTimeBarTickProto.HasField('high') else 0.0
         low = realTimeBarTickProto.low if realTimeBarTickProto.HasField('low') else 0.0
         close = realTimeBarTickProto.close if realTimeBarTickProto.HasField('close') else 0.0
-        volume = Decimal(realTimeBarTickProto.volume) if realTimeBarTickProto.HasField('volume') else UNSET_DECIMAL
+        volume = self.toSize(realTimeBarTickProto.volume) if realTimeBarTickProto.HasField('volume') else self.unsetSize
         wap = Decimal(realTimeBarTickProto.WAP) if realTimeBarTickProto.HasField('WAP') else UNSET_DECIMAL
         count = realTimeBarTickProto.count if realTimeBarTickProto.HasField('count') else 0
 
@@ -1096,10 +1142,7 @@ class Decoder(Object):
         )
 
     def processTickOptionComputationMsgProtoBuf(self, protobuf):
-        tickOptionComputationProto = TickOptionComputationProto()
-        tickOptionComputationProto.ParseFromString(protobuf)
-
-        self.wrapper.tickOptionComputationProtoBuf(tickOptionComputationProto)
+        tickOptionComputationProto = self.parseProtoBuf(TickOptionComputationProto, protobuf, "tickOptionComputationProtoBuf")
 
         reqId = tickOptionComputationProto.reqId if tickOptionComputationProto.HasField('reqId') else NO_VALID_ID
         tickType = tickOptionComputationProto.tickType if tickOptionComputationProto.HasField('tickType') else UNSET_INTEGER
@@ -1151,10 +1194,7 @@ class Decoder(Object):
         self.wrapper.marketDataType(reqId, marketDataType)
 
     def processMarketDataTypeMsgProtoBuf(self, protobuf):
-        marketDataTypeProto = MarketDataTypeProto()
-        marketDataTypeProto.ParseFromString(protobuf)
-
-        self.wrapper.updateMarketDataTypeProtoBuf(marketDataTypeProto)
+        marketDataTypeProto = self.parseProtoBuf(MarketDataTypeProto, protobuf, "updateMarketDataTypeProtoBuf")
 
         reqId = marketDataTypeProto.reqId if marketDataTypeProto.HasField('reqId') else NO_VALID_ID
         marketDataType = marketDataTypeProto.marketDataType if marketDataTypeProto.HasField('marketDataType') else UNSET_INTEGER
@@ -1175,10 +1215,7 @@ class Decoder(Object):
         self.wrapper.commissionAndFeesReport(commissionAndFeesReport)
 
     def processCommissionAndFeesReportMsgProtoBuf(self, protobuf):
-        commissionAndFeesReportProto = CommissionAndFeesReportProto()
-        commissionAndFeesReportProto.ParseFromString(protobuf)
-    
-        self.wrapper.commissionAndFeesReportProtoBuf(commissionAndFeesReportProto)
+        commissionAndFeesReportProto = self.parseProtoBuf(CommissionAndFeesReportProto, protobuf, "commissionAndFeesReportProtoBuf")
     
         commissionAndFeesReport = CommissionAndFeesReport()
         commissionAndFeesReport.execId = commissionAndFeesReportProto.execId if commissionAndFeesReportProto.HasField('execId') else ""
@@ -1219,10 +1256,7 @@ class Decoder(Object):
         self.wrapper.position(account, contract, position, avgCost)
 
     def processPositionMsgProtoBuf(self, protobuf):
-        positionProto = PositionProto()
-        positionProto.ParseFromString(protobuf)
-
-        self.wrapper.positionProtoBuf(positionProto)
+        positionProto = self.parseProtoBuf(PositionProto, protobuf, "positionProtoBuf")
 
         # decode contract fields
         if not positionProto.HasField('contract'):
@@ -1262,10 +1296,7 @@ class Decoder(Object):
         )
 
     def processPositionMultiMsgProtoBuf(self, protobuf):
-        positionMultiProto = PositionMultiProto()
-        positionMultiProto.ParseFromString(protobuf)
-
-        self.wrapper.positionMultiProtoBuf(positionMultiProto)
+        positionMultiProto = self.parseProtoBuf(PositionMultiProto, protobuf, "positionMultiProtoBuf")
 
         reqId = positionMultiProto.reqId if positionMultiProto.HasField('reqId') else NO_VALID_ID
         account = positionMultiProto.account if positionMultiProto.HasField('account') else ""
@@ -1311,10 +1342,7 @@ class Decoder(Object):
         )
 
     def processSecurityDefinitionOptionParameterMsgProtoBuf(self, protobuf):
-        secDefOptParameterProto = SecDefOptParameterProto()
-        secDefOptParameterProto.ParseFromString(protobuf)
-    
-        self.wrapper.secDefOptParameterProtoBuf(secDefOptParameterProto)
+        secDefOptParameterProto = self.parseProtoBuf(SecDefOptParameterProto, protobuf, "secDefOptParameterProtoBuf")
     
         reqId = secDefOptParameterProto.reqId if secDefOptParameterProto.HasField('reqId') else NO_VALID_ID
         exchange = secDefOptParameterProto.exchange if secDefOptParameterProto.HasField('exchange') else ""
@@ -1339,10 +1367,7 @@ class Decoder(Object):
         self.wrapper.securityDefinitionOptionParameterEnd(reqId)
 
     def processSecurityDefinitionOptionParameterEndMsgProtoBuf(self, protobuf):
-        secDefOptParameterEndProto = SecDefOptParameterEndProto()
-        secDefOptParameterEndProto.ParseFromString(protobuf)
-    
-        self.wrapper.secDefOptParameterEndProtoBuf(secDefOptParameterEndProto)
+        secDefOptParameterEndProto = self.parseProtoBuf(SecDefOptParameterEndProto, protobuf, "secDefOptParameterEndProtoBuf")
     
         reqId = secDefOptParameterEndProto.reqId if secDefOptParameterEndProto.HasField('reqId') else NO_VALID_ID
     
@@ -1363,10 +1388,7 @@ class Decoder(Object):
         self.wrapper.softDollarTiers(reqId, tiers)
 
     def processSoftDollarTiersMsgProtoBuf(self, protobuf):
-        softDollarTiersProto = SoftDollarTiersProto()
-        softDollarTiersProto.ParseFromString(protobuf)
-    
-        self.wrapper.softDollarTiersProtoBuf(softDollarTiersProto)
+        softDollarTiersProto = self.parseProtoBuf(SoftDollarTiersProto, protobuf, "softDollarTiersProtoBuf")
     
         reqId = softDollarTiersProto.reqId if softDollarTiersProto.HasField('reqId') else NO_VALID_ID
     
@@ -1390,10 +1412,7 @@ class Decoder(Object):
         self.wrapper.familyCodes(familyCodes)
 
     def processFamilyCodesMsgProtoBuf(self, protobuf):
-        familyCodesProto = FamilyCodesProto()
-        familyCodesProto.ParseFromString(protobuf)
-    
-        self.wrapper.familyCodesProtoBuf(familyCodesProto)
+        familyCodesProto = self.parseProtoBuf(FamilyCodesProto, protobuf, "familyCodesProtoBuf")
     
         familyCodes = []
         if familyCodesProto.familyCodes:
@@ -1430,10 +1449,7 @@ class Decoder(Object):
 
 
     def processSymbolSamplesMsgProtoBuf(self, protobuf):
-        symbolSamplesProto = SymbolSamplesProto()
-        symbolSamplesProto.ParseFromString(protobuf)
-    
-        self.wrapper.symbolSamplesProtoBuf(symbolSamplesProto)
+        symbolSamplesProto = self.parseProtoBuf(SymbolSamplesProto, protobuf, "symbolSamplesProtoBuf")
     
         reqId = symbolSamplesProto.reqId if symbolSamplesProto.HasField('reqId') else NO_VALID_ID
     
@@ -1472,10 +1488,7 @@ class Decoder(Object):
         self.wrapper.smartComponents(reqId, smartComponentMap)
 
     def processSmartComponentsMsgProtoBuf(self, protobuf):
-        smartComponentsProto = SmartComponentsProto()
-        smartComponentsProto.ParseFromString(protobuf)
-    
-        self.wrapper.smartComponentsProtoBuf(smartComponentsProto)
+        smartComponentsProto = self.parseProtoBuf(SmartComponentsProto, protobuf, "smartComponentsProtoBuf")
     
         reqId = smartComponentsProto.reqId if smartComponentsProto.HasField('reqId') else NO_VALID_ID
     
@@ -1493,10 +1506,7 @@ class Decoder(Object):
         self.wrapper.tickReqParams(tickerId, minTick, bboExchange, snapshotPermissions)
 
     def processTickReqParamsMsgProtoBuf(self, protobuf):
-        tickReqParamsProto = TickReqParamsProto()
-        tickReqParamsProto.ParseFromString(protobuf)
-
-        self.wrapper.tickReqParamsProtoBuf(tickReqParamsProto)
+        tickReqParamsProto = self.parseProtoBuf(TickReqParamsProto, protobuf, "tickReqParamsProtoBuf")
 
         reqId = tickReqParamsProto.reqId if tickReqParamsProto.HasField('reqId') else NO_VALID_ID
         minTick = float(tickReqParamsProto.minTick) if tickReqParamsProto.HasField('minTick') else UNSET_DOUBLE
@@ -1525,10 +1535,7 @@ class Decoder(Object):
         self.wrapper.mktDepthExchanges(depthMktDataDescriptions)
 
     def processMktDepthExchangesMsgProtoBuf(self, protobuf):
-        marketDepthExchangesProto = MarketDepthExchangesProto()
-        marketDepthExchangesProto.ParseFromString(protobuf)
-    
-        self.wrapper.marketDepthExchangesProtoBuf(marketDepthExchangesProto)
+        marketDepthExchangesProto = self.parseProtoBuf(MarketDepthExchangesProto, protobuf, "marketDepthExchangesProtoBuf")
     
         depthMktDataDescriptions = []
         if marketDepthExchangesProto.depthMarketDataDescriptions:
@@ -1543,10 +1550,7 @@ class Decoder(Object):
         self.wrapper.headTimestamp(reqId, headTimestamp)
 
     def processHeadTimestampMsgProtoBuf(self, protobuf):
-        headTimestampProto = HeadTimestampProto()
-        headTimestampProto.ParseFromString(protobuf)
-
-        self.wrapper.headTimestampProtoBuf(headTimestampProto)
+        headTimestampProto = self.parseProtoBuf(HeadTimestampProto, protobuf, "headTimestampProtoBuf")
 
         reqId = headTimestampProto.reqId if headTimestampProto.HasField('reqId') else NO_VALID_ID
         headTimestamp = headTimestampProto.headTimestamp if headTimestampProto.HasField('headTimestamp') else ""
@@ -1565,10 +1569,7 @@ class Decoder(Object):
         )
 
     def processTickNewsMsgProtoBuf(self, protobuf):
-        tickNewsProto = TickNewsProto()
-        tickNewsProto.ParseFromString(protobuf)
-
-        self.wrapper.tickNewsProtoBuf(tickNewsProto)
+        tickNewsProto = self.parseProtoBuf(TickNewsProto, protobuf, "tickNewsProtoBuf")
 
         reqId = tickNewsProto.reqId if tickNewsProto.HasField('reqId') else NO_VALID_ID
         timestamp = tickNewsProto.timestamp if tickNewsProto.HasField('timestamp') else 0
@@ -1592,10 +1593,7 @@ class Decoder(Object):
         self.wrapper.newsProviders(newsProviders)
 
     def processNewsProvidersMsgProtoBuf(self, protobuf):
-        newsProvidersProto = NewsProvidersProto()
-        newsProvidersProto.ParseFromString(protobuf)
-
-        self.wrapper.newsProvidersProtoBuf(newsProvidersProto)
+        newsProvidersProto = self.parseProtoBuf(NewsProvidersProto, protobuf, "newsProvidersProtoBuf")
 
         newsProviders = []
         if newsProvidersProto.newsProviders:
@@ -1614,10 +1612,7 @@ class Decoder(Object):
         self.wrapper.newsArticle(reqId, articleType, articleText)
 
     def processNewsArticleMsgProtoBuf(self, protobuf):
-        newsArticleProto = NewsArticleProto()
-        newsArticleProto.ParseFromString(protobuf)
-
-        self.wrapper.newsArticleProtoBuf(newsArticleProto)
+        newsArticleProto = self.parseProtoBuf(NewsArticleProto, protobuf, "newsArticleProtoBuf")
 
         reqId = newsArticleProto.reqId if newsArticleProto.HasField('reqId') else NO_VALID_ID
         articleType = newsArticleProto.articleType if newsArticleProto.HasField('articleType') else 0
@@ -1634,10 +1629,7 @@ class Decoder(Object):
         self.wrapper.historicalNews(requestId, time, providerCode, articleId, headline)
 
     def processHistoricalNewsMsgProtoBuf(self, protobuf):
-        historicalNewsProto = HistoricalNewsProto()
-        historicalNewsProto.ParseFromString(protobuf)
-
-        self.wrapper.historicalNewsProtoBuf(historicalNewsProto)
+        historicalNewsProto = self.parseProtoBuf(HistoricalNewsProto, protobuf, "historicalNewsProtoBuf")
 
         reqId = historicalNewsProto.reqId if historicalNewsProto.HasField('reqId') else NO_VALID_ID
         time = historicalNewsProto.time if historicalNewsProto.HasField('time') else ""
@@ -1653,10 +1645,7 @@ class Decoder(Object):
         self.wrapper.historicalNewsEnd(reqId, hasMore)
 
     def processHistoricalNewsEndMsgProtoBuf(self, protobuf):
-        historicalNewsEndProto = HistoricalNewsEndProto()
-        historicalNewsEndProto.ParseFromString(protobuf)
-
-        self.wrapper.historicalNewsEndProtoBuf(historicalNewsEndProto)
+        historicalNewsEndProto = self.parseProtoBuf(HistoricalNewsEndProto, protobuf, "historicalNewsEndProtoBuf")
 
         reqId = historicalNewsEndProto.reqId if historicalNewsEndProto.HasField('reqId') else NO_VALID_ID
         hasMore = historicalNewsEndProto.hasMore if historicalNewsEndProto.HasField('hasMore') else False
@@ -1671,23 +1660,20 @@ class Decoder(Object):
         for _ in range(numPoints):
             dataPoint = HistogramData()
             dataPoint.price = decode(float, fields)
-            dataPoint.size = decode(Decimal, fields)
+            dataPoint.size = self.decodeSize(fields)
             histogram.append(dataPoint)
 
         self.wrapper.histogramData(reqId, histogram)
 
     def processHistogramDataMsgProtoBuf(self, protobuf):
-        histogramDataProto = HistogramDataProto()
-        histogramDataProto.ParseFromString(protobuf)
-
-        self.wrapper.histogramDataProtoBuf(histogramDataProto)
+        histogramDataProto = self.parseProtoBuf(HistogramDataProto, protobuf, "histogramDataProtoBuf")
 
         reqId = histogramDataProto.reqId if histogramDataProto.HasField('reqId') else NO_VALID_ID
     
         histogram = []
         if histogramDataProto.histogramDataEntries:
             for histogramDataEntryProto in histogramDataProto.histogramDataEntries:
-                histogramEntry = decodeHistogramDataEntry(histogramDataEntryProto)
+                histogramEntry = decodeHistogramDataEntry(histogramDataEntryProto, self.toSize)
                 histogram.append(histogramEntry)
 
         self.wrapper.histogramData(reqId, histogram)
@@ -1700,10 +1686,7 @@ class Decoder(Object):
         self.wrapper.rerouteMktDataReq(reqId, conId, exchange)
 
     def processRerouteMktDataReqMsgProtoBuf(self, protobuf):
-        rerouteMarketDataRequestProto = RerouteMarketDataRequestProto()
-        rerouteMarketDataRequestProto.ParseFromString(protobuf)
-    
-        self.wrapper.rerouteMarketDataRequestProtoBuf(rerouteMarketDataRequestProto)
+        rerouteMarketDataRequestProto = self.parseProtoBuf(RerouteMarketDataRequestProto, protobuf, "rerouteMarketDataRequestProtoBuf")
     
         reqId = rerouteMarketDataRequestProto.reqId if rerouteMarketDataRequestProto.HasField('reqId') else NO_VALID_ID
         conId = rerouteMarketDataRequestProto.conId if rerouteMarketDataRequestProto.HasField('conId') else 0
@@ -1719,10 +1702,7 @@ class Decoder(Object):
         self.wrapper.rerouteMktDepthReq(reqId, conId, exchange)
 
     def processRerouteMktDepthReqMsgProtoBuf(self, protobuf):
-        rerouteMarketDepthRequestProto = RerouteMarketDepthRequestProto()
-        rerouteMarketDepthRequestProto.ParseFromString(protobuf)
-    
-        self.wrapper.rerouteMarketDepthRequestProtoBuf(rerouteMarketDepthRequestProto)
+        rerouteMarketDepthRequestProto = self.parseProtoBuf(RerouteMarketDepthRequestProto, protobuf, "rerouteMarketDepthRequestProtoBuf")
     
         reqId = rerouteMarketDepthRequestProto.reqId if rerouteMarketDepthRequestProto.HasField('reqId') else NO_VALID_ID
         conId = rerouteMarketDepthRequestProto.conId if rerouteMarketDepthRequestProto.HasField('conId') else 0
@@ -1746,10 +1726,7 @@ class Decoder(Object):
         self.wrapper.marketRule(marketRuleId, priceIncrements)
 
     def processMarketRuleMsgProtoBuf(self, protobuf):
-        marketRuleProto = MarketRuleProto()
-        marketRuleProto.ParseFromString(protobuf)
-    
-        self.wrapper.marketRuleProtoBuf(marketRuleProto)
+        marketRuleProto = self.parseProtoBuf(MarketRuleProto, protobuf, "marketRuleProtoBuf")
     
         marketRuleId = marketRuleProto.marketRuleId if marketRuleProto.HasField('marketRuleId') else 0
     
@@ -1776,10 +1753,7 @@ class Decoder(Object):
         self.wrapper.pnl(reqId, dailyPnL, unrealizedPnL, realizedPnL)
 
     def processPnLMsgProtoBuf(self, protobuf):
-        pnlProto = PnLProto()
-        pnlProto.ParseFromString(protobuf)
-
-        self.wrapper.pnlProtoBuf(pnlProto)
+        pnlProto = self.parseProtoBuf(PnLProto, protobuf, "pnlProtoBuf")
 
         reqId = pnlProto.reqId if pnlProto.HasField('reqId') else NO_VALID_ID
         dailyPnL = pnlProto.dailyPnL if pnlProto.HasField('dailyPnL') else UNSET_DOUBLE
@@ -1806,10 +1780,7 @@ class Decoder(Object):
         self.wrapper.pnlSingle(reqId, pos, dailyPnL, unrealizedPnL, realizedPnL, value)
 
     def processPnLSingleMsgProtoBuf(self, protobuf):
-        pnlSingleProto = PnLSingleProto()
-        pnlSingleProto.ParseFromString(protobuf)
-
-        self.wrapper.pnlSingleProtoBuf(pnlSingleProto)
+        pnlSingleProto = self.parseProtoBuf(PnLSingleProto, protobuf, "pnlSingleProtoBuf")
 
         reqId = pnlSingleProto.reqId if pnlSingleProto.HasField('reqId') else NO_VALID_ID
         pos = Decimal(pnlSingleProto.position) if pnlSingleProto.HasField('position') else UNSET_DECIMAL
@@ -1831,7 +1802,7 @@ class Decoder(Object):
             historicalTick.time = decode(int, fields)
             next(fields)  # for consistency
             historicalTick.price = decode(float, fields)
-            historicalTick.size = decode(Decimal, fields)
+            historicalTick.size = self.decodeSize(fields)
             ticks.append(historicalTick)
 
         done = decode(bool, fields)
@@ -1839,10 +1810,7 @@ class Decoder(Object):
         self.wrapper.historicalTicks(reqId, ticks, done)
 
     def processHistoricalTicksMsgProtoBuf(self, protobuf):
-        historicalTicksProto = HistoricalTicksProto()
-        historicalTicksProto.ParseFromString(protobuf)
-
-        self.wrapper.historicalTicksProtoBuf(historicalTicksProto)
+        historicalTicksProto = self.parseProtoBuf(HistoricalTicksProto, protobuf, "historicalTicksProtoBuf")
 
         reqId = historicalTicksProto.reqId if historicalTicksProto.HasField('reqId') else NO_VALID_ID
         isDone = historicalTicksProto.isDone if historicalTicksProto.HasField('isDone') else False
@@ -1850,7 +1818,7 @@ class Decoder(Object):
         historicalTicks = []
         if historicalTicksProto.historicalTicks:
             for historicalTickProto in historicalTicksProto.historicalTicks:
-                historicalTick = decodeHistoricalTick(historicalTickProto)
+                historicalTick = decodeHistoricalTick(historicalTickProto, self.toSize)
                 historicalTicks.append(historicalTick)
 
         self.wrapper.historicalTicks(reqId, historicalTicks, isDone)
@@ -1871,8 +1839,8 @@ class Decoder(Object):
             historicalTickBidAsk.tickAttribBidAsk = tickAttribBidAsk
             historicalTickBidAsk.priceBid = decode(float, fields)
             historicalTickBidAsk.priceAsk = decode(float, fields)
-            historicalTickBidAsk.sizeBid = decode(Decimal, fields)
-            historicalTickBidAsk.sizeAsk = decode(Decimal, fields)
+            historicalTickBidAsk.sizeBid = self.decodeSize(fields)
+            historicalTickBidAsk.sizeAsk = self.decodeSize(fields)
             ticks.append(historicalTickBidAsk)
 
         done = decode(bool, fields)
@@ -1880,10 +1848,7 @@ class Decoder(Object):
         self.wrapper.historicalTicksBidAsk(reqId, ticks, done)
 
     def processHistoricalTicksBidAskMsgProtoBuf(self, protobuf):
-        historicalTicksBidAskProto = HistoricalTicksBidAskProto()
-        historicalTicksBidAskProto.ParseFromString(protobuf)
-
-        self.wrapper.historicalTicksBidAskProtoBuf(historicalTicksBidAskProto)
+        historicalTicksBidAskProto = self.parseProtoBuf(HistoricalTicksBidAskProto, protobuf, "historicalTicksBidAskProtoBuf")
 
         reqId = historicalTicksBidAskProto.reqId if historicalTicksBidAskProto.HasField('reqId') else NO_VALID_ID
         isDone = historicalTicksBidAskProto.isDone if historicalTicksBidAskProto.HasField('isDone') else False
@@ -1891,7 +1856,7 @@ class Decoder(Object):
         historicalTicksBidAsk = []
         if historicalTicksBidAskProto.historicalTicksBidAsk:
             for historicalTickBidAskProto in historicalTicksBidAskProto.historicalTicksBidAsk:
-                historicalTickBidAsk = decodeHistoricalTickBidAsk(historicalTickBidAskProto)
+                historicalTickBidAsk = decodeHistoricalTickBidAsk(historicalTickBidAskProto, self.toSize)
                 historicalTicksBidAsk.append(historicalTickBidAsk)
 
         self.wrapper.historicalTicksBidAsk(reqId, historicalTicksBidAsk, isDone)
@@ -1911,7 +1876,7 @@ class Decoder(Object):
             tickAttribLast.unreported = mask & 2 != 0
             historicalTickLast.tickAttribLast = tickAttribLast
             historicalTickLast.price = decode(float, fields)
-            historicalTickLast.size = decode(Decimal, fields)
+            historicalTickLast.size = self.decodeSize(fields)
             historicalTickLast.exchange = decode(str, fields)
             historicalTickLast.specialConditions = decode(str, fields)
             ticks.append(historicalTickLast)
@@ -1921,10 +1886,7 @@ class Decoder(Object):
         self.wrapper.historicalTicksLast(reqId, ticks, done)
 
     def processHistoricalTicksLastMsgProtoBuf(self, protobuf):
-        historicalTicksLastProto = HistoricalTicksLastProto()
-        historicalTicksLastProto.ParseFromString(protobuf)
-
-        self.wrapper.historicalTicksLastProtoBuf(historicalTicksLastProto)
+        historicalTicksLastProto = self.parseProtoBuf(HistoricalTicksLastProto, protobuf, "historicalTicksLastProtoBuf")
 
         reqId = historicalTicksLastProto.reqId if historicalTicksLastProto.HasField('reqId') else NO_VALID_ID
         isDone = historicalTicksLastProto.isDone if historicalTicksLastProto.HasField('isDone') else False
@@ -1932,7 +1894,7 @@ class Decoder(Object):
         historicalTicksLast = []
         if historicalTicksLastProto.historicalTicksLast:
             for historicalTickLastProto in historicalTicksLastProto.historicalTicksLast:
-                historicalTickLast = decodeHistoricalTickLast(historicalTickLastProto)
+                historicalTickLast = decodeHistoricalTickLast(historicalTickLastProto, self.toSize)
                 historicalTicksLast.append(historicalTickLast)
 
         self.wrapper.historicalTicksLast(reqId, historicalTicksLast, isDone)
@@ -1948,7 +1910,7 @@ class Decoder(Object):
         elif tickType == 1 or tickType == 2:
             # Last or AllLast
             price = decode(float, fields)
-            size = decode(Decimal, fields)
+            size = self.decodeSize(fields)
             mask = decode(int, fields)
 
             tickAttribLast = TickAttribLast()
@@ -1971,8 +1933,8 @@ class Decoder(Object):
             # BidAsk
             bidPrice = decode(float, fields)
             askPrice = decode(float, fields)
-            bidSize = decode(Decimal, fields)
-            askSize = decode(Decimal, fields)
+            bidSize = self.decodeSize(fields)
+            askSize = self.decodeSize(fields)
             mask = decode(int, fields)
             tickAttribBidAsk = TickAttribBidAsk()
             tickAttribBidAsk.bidPastLow = mask & 1 != 0
@@ -1988,10 +1950,7 @@ class Decoder(Object):
             self.wrapper.tickByTickMidPoint(reqId, time, midPoint)
 
     def processTickByTickMsgProtoBuf(self, protobuf):
-        tickByTickDataProto = TickByTickDataProto()
-        tickByTickDataProto.ParseFromString(protobuf)
-
-        self.wrapper.tickByTickDataProtoBuf(tickByTickDataProto)
+        tickByTickDataProto = self.parseProtoBuf(TickByTickDataProto, protobuf, "tickByTickDataProtoBuf")
 
         reqId = tickByTickDataProto.reqId if tickByTickDataProto.HasField('reqId') else NO_VALID_ID
         tickType = tickByTickDataProto.tickType if tickByTickDataProto.HasField('tickType') else 0
@@ -2002,7 +1961,7 @@ class Decoder(Object):
         elif tickType == 1 or tickType == 2:
             # Last or AllLast
             if tickByTickDataProto.HasField('historicalTickLast'):
-                historicalTickLast = decodeHistoricalTickLast(tickByTickDataProto.historicalTickLast)
+                historicalTickLast = decodeHistoricalTickLast(tickByTickDataProto.historicalTickLast, self.toSize)
                 self.wrapper.tickByTickAllLast(
                     reqId,
                     tickType,
@@ -2016,7 +1975,7 @@ class Decoder(Object):
         elif tickType == 3:
             # BidAsk
             if tickByTickDataProto.HasField('historicalTickBidAsk'):
-                historicalTickBidAsk = decodeHistoricalTickBidAsk(tickByTickDataProto.historicalTickBidAsk)
+                historicalTickBidAsk = decodeHistoricalTickBidAsk(tickByTickDataProto.historicalTickBidAsk, self.toSize)
                 self.wrapper.tickByTickBidAsk(
                     reqId,
                     historicalTickBidAsk.time,
@@ -2029,7 +1988,7 @@ class Decoder(Object):
         elif tickType == 4:
             # MidPoint
             if tickByTickDataProto.HasField('historicalTickMidPoint'):
-                historicalTick = decodeHistoricalTick(tickByTickDataProto.historicalTickMidPoint)
+                historicalTick = decodeHistoricalTick(tickByTickDataProto.historicalTickMidPoint, self.toSize)
                 self.wrapper.tickByTickMidPoint(reqId, historicalTick.time, historicalTick.price)
 
     def processOrderBoundMsg(self, fields):
@@ -2040,10 +1999,7 @@ class Decoder(Object):
         self.wrapper.orderBound(permId, clientId, orderId)
 
     def processOrderBoundMsgProtoBuf(self, protobuf):
-        orderBoundProto = OrderBoundProto()
-        orderBoundProto.ParseFromString(protobuf)
-
-        self.wrapper.orderBoundProtoBuf(orderBoundProto)
+        orderBoundProto = self.parseProtoBuf(OrderBoundProto, protobuf, "orderBoundProtoBuf")
 
         permId = orderBoundProto.permId if orderBoundProto.HasField('permId') else UNSET_LONG
         clientId = orderBoundProto.clientId if orderBoundProto.HasField('clientId') else UNSET_INTEGER
@@ -2059,15 +2015,12 @@ class Decoder(Object):
         operation = decode(int, fields)
         side = decode(int, fields)
         price = decode(float, fields)
-        size = decode(Decimal, fields)
+        size = self.decodeSize(fields)
 
         self.wrapper.updateMktDepth(reqId, position, operation, side, price, size)
 
     def processMarketDepthMsgProtoBuf(self, protobuf):
-        marketDepthProto = MarketDepthProto()
-        marketDepthProto.ParseFromString(protobuf)
-
-        self.wrapper.updateMarketDepthProtoBuf(marketDepthProto)
+        marketDepthProto = self.parseProtoBuf(MarketDepthProto, protobuf, "updateMarketDepthProtoBuf")
 
         reqId = marketDepthProto.reqId if marketDepthProto.HasField('reqId') else NO_VALID_ID
 
@@ -2080,7 +2033,7 @@ class Decoder(Object):
         operation = marketDepthDataProto.operation if marketDepthDataProto.HasField('operation') else UNSET_INTEGER
         side = marketDepthDataProto.side if marketDepthDataProto.HasField('side') else UNSET_INTEGER
         price = marketDepthDataProto.price if marketDepthDataProto.HasField('price') else UNSET_DOUBLE
-        size = Decimal(marketDepthDataProto.size) if marketDepthDataProto.HasField('size') else UNSET_DECIMAL
+        size = self.toSize(marketDepthDataProto.size) if marketDepthDataProto.HasField('size') else self.unsetSize
 
         self.wrapper.updateMktDepth(reqId, position, operation, side, price, size)
 
@@ -2093,7 +2046,7 @@ class Decoder(Object):
         operation = decode(int, fields)
         side = decode(int, fields)
         price = decode(float, fields)
-        size = decode(Decimal, fields)
+        size = self.decodeSize(fields)
         isSmartDepth = False
 
         if self.serverVersion >= MIN_SERVER_VER_SMART_DEPTH:
@@ -2104,10 +2057,7 @@ class Decoder(Object):
         )
 
     def processMarketDepthL2MsgProtoBuf(self, protobuf):
-        marketDepthL2Proto = MarketDepthL2Proto()
-        marketDepthL2Proto.ParseFromString(protobuf)
-
-        self.wrapper.updateMarketDepthL2ProtoBuf(marketDepthL2Proto)
+        marketDepthL2Proto = self.parseProtoBuf(MarketDepthL2Proto, protobuf, "updateMarketDepthL2ProtoBuf")
 
         reqId = marketDepthL2Proto.reqId if marketDepthL2Proto.HasField('reqId') else NO_VALID_ID
 
@@ -2121,7 +2071,7 @@ class Decoder(Object):
         operation = marketDepthDataProto.operation if marketDepthDataProto.HasField('operation') else UNSET_INTEGER
         side = marketDepthDataProto.side if marketDepthDataProto.HasField('side') else UNSET_INTEGER
         price = marketDepthDataProto.price if marketDepthDataProto.HasField('price') else UNSET_DOUBLE
-        size = Decimal(marketDepthDataProto.size) if marketDepthDataProto.HasField('size') else UNSET_DECIMAL
+        size = self.toSize(marketDepthDataProto.size) if marketDepthDataProto.HasField('size') else self.unsetSize
         isSmartDepth = marketDepthDataProto.isSmartDepth if marketDepthDataProto.HasField('isSmartDepth') else False
 
         self.wrapper.updateMktDepthL2(reqId, position, marketMaker, operation, side, price, size, isSmartDepth)
@@ -2207,10 +2157,7 @@ class Decoder(Object):
         self.wrapper.completedOrder(contract, order, orderState)
 
     def processCompletedOrderMsgProtoBuf(self, protobuf):
-        completedOrderProto = CompletedOrderProto()
-        completedOrderProto.ParseFromString(protobuf)
-
-        self.wrapper.completedOrderProtoBuf(completedOrderProto)
+        completedOrderProto = self.parseProtoBuf(CompletedOrderProto, protobuf, "completedOrderProtoBuf")
 
         # decode contract fields
         if not completedOrderProto.HasField('contract'):
@@ -2233,10 +2180,7 @@ class Decoder(Object):
         self.wrapper.completedOrdersEnd()
 
     def processCompletedOrdersEndMsgProtoBuf(self, protobuf):
-        completedOrdersEndProto = CompletedOrdersEndProto()
-        completedOrdersEndProto.ParseFromString(protobuf)
-
-        self.wrapper.completedOrdersEndProtoBuf(completedOrdersEndProto)
+        completedOrdersEndProto = self.parseProtoBuf(CompletedOrdersEndProto, protobuf, "completedOrdersEndProtoBuf")
 
         self.wrapper.completedOrdersEnd()
 
@@ -2247,10 +2191,7 @@ class Decoder(Object):
         self.wrapper.replaceFAEnd(reqId, text)
 
     def processReplaceFAEndMsgProtoBuf(self, protobuf):
-        replaceFAEndProto = ReplaceFAEndProto()
-        replaceFAEndProto.ParseFromString(protobuf)
-    
-        self.wrapper.replaceFAEndProtoBuf(replaceFAEndProto)
+        replaceFAEndProto = self.parseProtoBuf(ReplaceFAEndProto, protobuf, "replaceFAEndProtoBuf")
     
         reqId = replaceFAEndProto.reqId if replaceFAEndProto.HasField('reqId') else NO_VALID_ID
         text = replaceFAEndProto.text if replaceFAEndProto.HasField('text') else ""
@@ -2264,10 +2205,7 @@ class Decoder(Object):
         self.wrapper.wshMetaData(reqId, dataJson)
 
     def processWshMetaDataMsgProtoBuf(self, protobuf):
-        wshMetaDataProto = WshMetaDataProto()
-        wshMetaDataProto.ParseFromString(protobuf)
-
-        self.wrapper.wshMetaDataProtoBuf(wshMetaDataProto)
+        wshMetaDataProto = self.parseProtoBuf(WshMetaDataProto, protobuf, "wshMetaDataProtoBuf")
 
         reqId = wshMetaDataProto.reqId if wshMetaDataProto.HasField('reqId') else NO_VALID_ID
         dataJson = wshMetaDataProto.dataJson if wshMetaDataProto.HasField('dataJson') else ""
@@ -2281,10 +2219,7 @@ class Decoder(Object):
         self.wrapper.wshEventData(reqId, dataJson)
 
     def processWshEventDataMsgProtoBuf(self, protobuf):
-        wshEventDataProto = WshEventDataProto()
-        wshEventDataProto.ParseFromString(protobuf)
-
-        self.wrapper.wshEventDataProtoBuf(wshEventDataProto)
+        wshEventDataProto = self.parseProtoBuf(WshEventDataProto, protobuf, "wshEventDataProtoBuf")
 
         reqId = wshEventDataProto.reqId if wshEventDataProto.HasField('reqId') else NO_VALID_ID
         dataJson = wshEventDataProto.dataJson if wshEventDataProto.HasField('dataJson') else ""
@@ -2312,10 +2247,7 @@ class Decoder(Object):
         )
 
     def processHistoricalScheduleMsgProtoBuf(self, protobuf):
-        historicalScheduleProto = HistoricalScheduleProto()
-        historicalScheduleProto.ParseFromString(protobuf)
-    
-        self.wrapper.historicalScheduleProtoBuf(historicalScheduleProto)
+        historicalScheduleProto = self.parseProtoBuf(HistoricalScheduleProto, protobuf, "historicalScheduleProtoBuf")
     
         reqId = historicalScheduleProto.reqId if historicalScheduleProto.HasField('reqId') else NO_VALID_ID
         startDateTime = historicalScheduleProto.startDateTime if historicalScheduleProto.HasField('startDateTime') else ""
@@ -2340,10 +2272,7 @@ class Decoder(Object):
         self.wrapper.userInfo(reqId, whiteBrandingId)
 
     def processUserInfoMsgProtoBuf(self, protobuf):
-        userInfoProto = UserInfoProto()
-        userInfoProto.ParseFromString(protobuf)
-    
-        self.wrapper.userInfoProtoBuf(userInfoProto)
+        userInfoProto = self.parseProtoBuf(UserInfoProto, protobuf, "userInfoProtoBuf")
     
         reqId = userInfoProto.reqId if userInfoProto.HasField('reqId') else NO_VALID_ID
         whiteBrandingId = userInfoProto.whiteBrandingId if userInfoProto.HasField('whiteBrandingId') else ""
@@ -2356,10 +2285,7 @@ class Decoder(Object):
         self.wrapper.currentTimeInMillis(timeInMillis)
 
     def processCurrentTimeInMillisMsgProtoBuf(self, protobuf):
-        currentTimeInMillisProto = CurrentTimeInMillisProto()
-        currentTimeInMillisProto.ParseFromString(protobuf)
-    
-        self.wrapper.currentTimeInMillisProtoBuf(currentTimeInMillisProto)
+        currentTimeInMillisProto = self.parseProtoBuf(CurrentTimeInMillisProto, protobuf, "currentTimeInMillisProtoBuf")
     
         timeInMillis = currentTimeInMillisProto.currentTimeInMillis if currentTimeInMillisProto.HasField('currentTimeInMillis') else 0
     
@@ -2383,10 +2309,7 @@ class Decoder(Object):
         self.wrapper.error(reqId, errorTime, errorCode, errorString, advancedOrderRejectJson)
 
     def processErrorMsgProtoBuf(self, protobuf):
-        errorMessageProto = ErrorMessageProto()
-        errorMessageProto.ParseFromString(protobuf)
-
-        self.wrapper.errorProtoBuf(errorMessageProto)
+        errorMessageProto = self.parseProtoBuf(ErrorMessageProto, protobuf, "errorProtoBuf")
 
         reqId = errorMessageProto.id if errorMessageProto.HasField('id') else 0
         errorCode = errorMessageProto.errorCode if errorMessageProto.HasField('errorCode') else 0
@@ -2397,10 +2320,7 @@ class Decoder(Object):
         self.wrapper.error(reqId, errorTime, errorCode, errorMsg, advancedOrderRejectJson)
 
     def processTickStringMsgProtoBuf(self, protobuf):
-        tickStringProto = TickStringProto()
-        tickStringProto.ParseFromString(protobuf)
-
-        self.wrapper.tickStringProtoBuf(tickStringProto)
+        tickStringProto = self.parseProtoBuf(TickStringProto, protobuf, "tickStringProtoBuf")
 
         reqId = tickStringProto.reqId if tickStringProto.HasField('reqId') else NO_VALID_ID
         tickType = tickStringProto.tickType if tickStringProto.HasField('tickType') else UNSET_INTEGER
@@ -2410,10 +2330,7 @@ class Decoder(Object):
             self.wrapper.tickString(reqId, tickType, value)
 
     def processTickGenericMsgProtoBuf(self, protobuf):
-        tickGenericProto = TickGenericProto()
-        tickGenericProto.ParseFromString(protobuf)
-
-        self.wrapper.tickGenericProtoBuf(tickGenericProto)
+        tickGenericProto = self.parseProtoBuf(TickGenericProto, protobuf, "tickGenericProtoBuf")
 
         reqId = tickGenericProto.reqId if tickGenericProto.HasField('reqId') else NO_VALID_ID
         tickType = tickGenericProto.tickType if tickGenericProto.HasField('tickType') else UNSET_INTEGER
@@ -2423,20 +2340,14 @@ class Decoder(Object):
             self.wrapper.tickGeneric(reqId, tickType, value)
 
     def processTickSnapshotEndMsgProtoBuf(self, protobuf):
-        tickSnapshotEndProto = TickSnapshotEndProto()
-        tickSnapshotEndProto.ParseFromString(protobuf)
-
-        self.wrapper.tickSnapshotEndProtoBuf(tickSnapshotEndProto)
+        tickSnapshotEndProto = self.parseProtoBuf(TickSnapshotEndProto, protobuf, "tickSnapshotEndProtoBuf")
 
         reqId = tickSnapshotEndProto.reqId if tickSnapshotEndProto.HasField('reqId') else NO_VALID_ID
 
         self.wrapper.tickSnapshotEnd(reqId)
 
     def processAccountValueMsgProtoBuf(self, protobuf):
-        accountValueProto = AccountValueProto()
-        accountValueProto.ParseFromString(protobuf)
-
-        self.wrapper.updateAccountValueProtoBuf(accountValueProto)
+        accountValueProto = self.parseProtoBuf(AccountValueProto, protobuf, "updateAccountValueProtoBuf")
 
         key = accountValueProto.key if accountValueProto.HasField('key') else ""
         value = accountValueProto.value if accountValueProto.HasField('value') else ""
@@ -2446,48 +2357,33 @@ class Decoder(Object):
         self.wrapper.updateAccountValue(key, value, currency, accountName)
 
     def processAcctUpdateTimeMsgProtoBuf(self, protobuf):
-        accountUpdateTimeProto = AccountUpdateTimeProto()
-        accountUpdateTimeProto.ParseFromString(protobuf)
-
-        self.wrapper.updateAccountTimeProtoBuf(accountUpdateTimeProto)
+        accountUpdateTimeProto = self.parseProtoBuf(AccountUpdateTimeProto, protobuf, "updateAccountTimeProtoBuf")
 
         timeStamp = accountUpdateTimeProto.timeStamp if accountUpdateTimeProto.HasField('timeStamp') else ""
 
         self.wrapper.updateAccountTime(timeStamp)
 
     def processAccountDataEndMsgProtoBuf(self, protobuf):
-        accountDataEndProto = AccountDataEndProto()
-        accountDataEndProto.ParseFromString(protobuf)
-
-        self.wrapper.accountDataEndProtoBuf(accountDataEndProto)
+        accountDataEndProto = self.parseProtoBuf(AccountDataEndProto, protobuf, "accountDataEndProtoBuf")
 
         accountName = accountDataEndProto.accountName if accountDataEndProto.HasField('accountName') else ""
 
         self.wrapper.accountDownloadEnd(accountName)
 
     def processManagedAccountsMsgProtoBuf(self, protobuf):
-        managedAccountsProto = ManagedAccountsProto()
-        managedAccountsProto.ParseFromString(protobuf)
-
-        self.wrapper.managedAccountsProtoBuf(managedAccountsProto)
+        managedAccountsProto = self.parseProtoBuf(ManagedAccountsProto, protobuf, "managedAccountsProtoBuf")
 
         accountsList = managedAccountsProto.accountsList if managedAccountsProto.HasField('accountsList') else ""
 
         self.wrapper.managedAccounts(accountsList)
 
     def processPositionEndMsgProtoBuf(self, protobuf):
-        positionEndProto = PositionEndProto()
-        positionEndProto.ParseFromString(protobuf)
-
-        self.wrapper.positionEndProtoBuf(positionEndProto)
+        positionEndProto = self.parseProtoBuf(PositionEndProto, protobuf, "positionEndProtoBuf")
 
         self.wrapper.positionEnd()
 
     def processAccountSummaryMsgProtoBuf(self, protobuf):
-        accountSummaryProto = AccountSummaryProto()
-        accountSummaryProto.ParseFromString(protobuf)
-
-        self.wrapper.accountSummaryProtoBuf(accountSummaryProto)
+        accountSummaryProto = self.parseProtoBuf(AccountSummaryProto, protobuf, "accountSummaryProtoBuf")
 
         reqId = accountSummaryProto.reqId if accountSummaryProto.HasField('reqId') else NO_VALID_ID
         account = accountSummaryProto.account if accountSummaryProto.HasField('account') else ""
@@ -2498,30 +2394,21 @@ class Decoder(Object):
         self.wrapper.accountSummary(reqId, account, tag, value, currency)
 
     def processAccountSummaryEndMsgProtoBuf(self, protobuf):
-        accountSummaryEndProto = AccountSummaryEndProto()
-        accountSummaryEndProto.ParseFromString(protobuf)
-
-        self.wrapper.accountSummaryEndProtoBuf(accountSummaryEndProto)
+        accountSummaryEndProto = self.parseProtoBuf(AccountSummaryEndProto, protobuf, "accountSummaryEndProtoBuf")
 
         reqId = accountSummaryEndProto.reqId if accountSummaryEndProto.HasField('reqId') else NO_VALID_ID
 
         self.wrapper.accountSummaryEnd(reqId)
 
     def processPositionMultiEndMsgProtoBuf(self, protobuf):
-        positionMultiEndProto = PositionMultiEndProto()
-        positionMultiEndProto.ParseFromString(protobuf)
-
-        self.wrapper.positionMultiEndProtoBuf(positionMultiEndProto)
+        positionMultiEndProto = self.parseProtoBuf(PositionMultiEndProto, protobuf, "positionMultiEndProtoBuf")
 
         reqId = positionMultiEndProto.reqId if positionMultiEndProto.HasField('reqId') else NO_VALID_ID
 
         self.wrapper.positionMultiEnd(reqId)
 
     def processAccountUpdateMultiMsgProtoBuf(self, protobuf):
-        accountUpdateMultiProto = AccountUpdateMultiProto()
-        accountUpdateMultiProto.ParseFromString(protobuf)
-
-        self.wrapper.accountUpdateMultiProtoBuf(accountUpdateMultiProto)
+        accountUpdateMultiProto = self.parseProtoBuf(AccountUpdateMultiProto, protobuf, "accountUpdateMultiProtoBuf")
 
         reqId = accountUpdateMultiProto.reqId if accountUpdateMultiProto.HasField('reqId') else NO_VALID_ID
         account = accountUpdateMultiProto.account if accountUpdateMultiProto.HasField('account') else ""
@@ -2533,20 +2420,14 @@ class Decoder(Object):
         self.wrapper.accountUpdateMulti(reqId, account, modelCode, key, value, currency)
 
     def processAccountUpdateMultiEndMsgProtoBuf(self, protobuf):
-        accountUpdateMultiEndProto = AccountUpdateMultiEndProto()
-        accountUpdateMultiEndProto.ParseFromString(protobuf)
-
-        self.wrapper.accountUpdateMultiEndProtoBuf(accountUpdateMultiEndProto)
+        accountUpdateMultiEndProto = self.parseProtoBuf(AccountUpdateMultiEndProto, protobuf, "accountUpdateMultiEndProtoBuf")
 
         reqId = accountUpdateMultiEndProto.reqId if accountUpdateMultiEndProto.HasField('reqId') else NO_VALID_ID
 
         self.wrapper.accountUpdateMultiEnd(reqId)
 
     def processNewsBulletinMsgProtoBuf(self, protobuf):
-        newsBulletinProto = NewsBulletinProto()
-        newsBulletinProto.ParseFromString(protobuf)
-
-        self.wrapper.updateNewsBulletinProtoBuf(newsBulletinProto)
+        newsBulletinProto = self.parseProtoBuf(NewsBulletinProto, protobuf, "updateNewsBulletinProtoBuf")
 
         msgId = newsBulletinProto.newsMsgId if newsBulletinProto.HasField('newsMsgId') else 0
         msgType = newsBulletinProto.newsMsgType if newsBulletinProto.HasField('newsMsgType') else 0
@@ -2556,20 +2437,14 @@ class Decoder(Object):
         self.wrapper.updateNewsBulletin(msgId, msgType, message, originExch)
 
     def processScannerParametersMsgProtoBuf(self, protobuf):
-        scannerParametersProto = ScannerParametersProto()
-        scannerParametersProto.ParseFromString(protobuf)
-
-        self.wrapper.scannerParametersProtoBuf(scannerParametersProto)
+        scannerParametersProto = self.parseProtoBuf(ScannerParametersProto, protobuf, "scannerParametersProtoBuf")
 
         xml = scannerParametersProto.xml if scannerParametersProto.HasField('xml') else ""
 
         self.wrapper.scannerParameters(xml)
 
     def processFundamentalsDataMsgProtoBuf(self, protobuf):
-        fundamentalsDataProto = FundamentalsDataProto()
-        fundamentalsDataProto.ParseFromString(protobuf)
-
-        self.wrapper.fundamentalsDataProtoBuf(fundamentalsDataProto)
+        fundamentalsDataProto = self.parseProtoBuf(FundamentalsDataProto, protobuf, "fundamentalsDataProtoBuf")
 
         reqId = fundamentalsDataProto.reqId if fundamentalsDataProto.HasField('reqId') else NO_VALID_ID
         data = fundamentalsDataProto.data if fundamentalsDataProto.HasField('data') else ""
@@ -2577,10 +2452,7 @@ class Decoder(Object):
         self.wrapper.fundamentalData(reqId, data)
 
     def processReceiveFAMsgProtoBuf(self, protobuf):
-        receiveFAProto = ReceiveFAProto()
-        receiveFAProto.ParseFromString(protobuf)
-    
-        self.wrapper.receiveFAProtoBuf(receiveFAProto)
+        receiveFAProto = self.parseProtoBuf(ReceiveFAProto, protobuf, "receiveFAProtoBuf")
     
         faDataType = receiveFAProto.faDataType if receiveFAProto.HasField('faDataType') else 0
         xml = receiveFAProto.xml if receiveFAProto.HasField('xml') else ""
@@ -2588,40 +2460,28 @@ class Decoder(Object):
         self.wrapper.receiveFA(faDataType, xml)
 
     def processNextValidIdMsgProtoBuf(self, protobuf):
-        nextValidIdProto = NextValidIdProto()
-        nextValidIdProto.ParseFromString(protobuf)
-    
-        self.wrapper.nextValidIdProtoBuf(nextValidIdProto)
+        nextValidIdProto = self.parseProtoBuf(NextValidIdProto, protobuf, "nextValidIdProtoBuf")
     
         orderId = nextValidIdProto.orderId if nextValidIdProto.HasField('orderId') else 0
     
         self.wrapper.nextValidId(orderId)
 
     def processCurrentTimeMsgProtoBuf(self, protobuf):
-        currentTimeProto = CurrentTimeProto()
-        currentTimeProto.ParseFromString(protobuf)
-    
-        self.wrapper.currentTimeProtoBuf(currentTimeProto)
+        currentTimeProto = self.parseProtoBuf(CurrentTimeProto, protobuf, "currentTimeProtoBuf")
     
         time = currentTimeProto.currentTime if currentTimeProto.HasField('currentTime') else 0
     
         self.wrapper.currentTime(time)
 
     def processVerifyMessageApiMsgProtoBuf(self, protobuf):
-        verifyMessageApiProto = VerifyMessageApiProto()
-        verifyMessageApiProto.ParseFromString(protobuf)
-    
-        self.wrapper.verifyMessageApiProtoBuf(verifyMessageApiProto)
+        verifyMessageApiProto = self.parseProtoBuf(VerifyMessageApiProto, protobuf, "verifyMessageApiProtoBuf")
     
         apiData = verifyMessageApiProto.apiData if verifyMessageApiProto.HasField('apiData') else ""
     
         self.wrapper.verifyMessageAPI(apiData)
 
     def processVerifyCompletedMsgProtoBuf(self, protobuf):
-        verifyCompletedProto = VerifyCompletedProto()
-        verifyCompletedProto.ParseFromString(protobuf)
-    
-        self.wrapper.verifyCompletedProtoBuf(verifyCompletedProto)
+        verifyCompletedProto = self.parseProtoBuf(VerifyCompletedProto, protobuf, "verifyCompletedProtoBuf")
     
         isSuccessful = verifyCompletedProto.isSuccessful if verifyCompletedProto.HasField('isSuccessful') else False
         errorText = verifyCompletedProto.errorText if verifyCompletedProto.HasField('errorText') else ""
@@ -2629,10 +2489,7 @@ class Decoder(Object):
         self.wrapper.verifyCompleted(isSuccessful, errorText)
 
     def processDisplayGroupListMsgProtoBuf(self, protobuf):
-        displayGroupListProto = DisplayGroupListProto()
-        displayGroupListProto.ParseFromString(protobuf)
-    
-        self.wrapper.displayGroupListProtoBuf(displayGroupListProto)
+        displayGroupListProto = self.parseProtoBuf(DisplayGroupListProto, protobuf, "displayGroupListProtoBuf")
     
         reqId = displayGroupListProto.reqId if displayGroupListProto.HasField('reqId') else NO_VALID_ID
         groups = displayGroupListProto.groups if displayGroupListProto.HasField('groups') else ""
@@ -2640,10 +2497,7 @@ class Decoder(Object):
         self.wrapper.displayGroupList(reqId, groups)
 
     def processDisplayGroupUpdatedMsgProtoBuf(self, protobuf):
-        displayGroupUpdatedProto = DisplayGroupUpdatedProto()
-        displayGroupUpdatedProto.ParseFromString(protobuf)
-    
-        self.wrapper.displayGroupUpdatedProtoBuf(displayGroupUpdatedProto)
+        displayGroupUpdatedProto = self.parseProtoBuf(DisplayGroupUpdatedProto, protobuf, "displayGroupUpdatedProtoBuf")
     
         reqId = displayGroupUpdatedProto.reqId if displayGroupUpdatedProto.HasField('reqId') else NO_VALID_ID
         contractInfo = displayGroupUpdatedProto.contractInfo if displayGroupUpdatedProto.HasField('contractInfo') else ""
@@ -2651,16 +2505,10 @@ class Decoder(Object):
         self.wrapper.displayGroupUpdated(reqId, contractInfo)
 
     def processConfigResponseProtoBuf(self, protobuf):
-        configResponseProto = ConfigResponseProto()
-        configResponseProto.ParseFromString(protobuf)
-    
-        self.wrapper.configResponseProtoBuf(configResponseProto)
+        configResponseProto = self.parseProtoBuf(ConfigResponseProto, protobuf, "configResponseProtoBuf")
 
     def processUpdateConfigResponseProtoBuf(self, protobuf):
-        updateConfigResponseProto = UpdateConfigResponseProto()
-        updateConfigResponseProto.ParseFromString(protobuf)
-    
-        self.wrapper.updateConfigResponseProtoBuf(updateConfigResponseProto)
+        updateConfigResponseProto = self.parseProtoBuf(UpdateConfigResponseProto, protobuf, "updateConfigResponseProtoBuf")
     
     ######################################################################
 
@@ -2686,6 +2534,36 @@ class Decoder(Object):
             # for (pname, param) in sig.parameters.items():
             #     logger.debug("\tparam %s %s %s", pname, param.name, param.annotation)
 
+    def compileDecodePlans(self):
+        """For every message decoded from the wrapper method signature, binds
+        the wrapper method and one converter per field for the current server
+        version, so that interpretWithPlan() is a plain loop with no
+        introspection. Recompiled when the server version changes."""
+        useUnicode = (
+            self.serverVersion is not None
+            and self.serverVersion >= MIN_SERVER_VER_ENCODE_MSG_ASCII7
+        )
+        toStr = makeStrConverter("unicode-escape" if useUnicode else "UTF-8")
+        # bool and unannotated params are passed on as str, like
+        # interpretWithSignature() does
+        annotation2converter = {int: int, float: float, Decimal: toDecimal}
+
+        decodePlans = {}
+        for msgId, handleInfo in self.msgId2handleInfo.items():
+            if handleInfo.wrapperMeth is None or handleInfo.wrapperParams is None:
+                continue
+            converters = tuple(
+                annotation2converter.get(param.annotation, toStr)
+                for pname, param in handleInfo.wrapperParams.items()
+                if pname != "self"
+            )
+            method = getattr(self.wrapper, handleInfo.wrapperMeth.__name__)
+            decodePlans[msgId] = (method, converters)
+
+        self.decodePlans = decodePlans
+        self.decodePlansVersion = self.serverVersion
+        self.fieldToStr = toStr
+
     def printParams(self):
         for _, handleInfo in self.msgId2handleInfo.items():
             if handleInfo.wrapperMeth is not None:
@@ -2743,11 +2621,42 @@ class Decoder(Object):
         logger.debug("calling %s with %s %s", method, self.wrapper, args)
         method(*args)
 
+    def interpretWithPlan(self, fields, msgId):
+        if self.decodePlansVersion != self.serverVersion:
+            self.compileDecodePlans()
+
+        plan = self.decodePlans.get(msgId)
+        if plan is None:
+            logger.debug("%s: no decode plan for msgId %d", fields, msgId)
+            return
+
+        (method, converters) = plan
+        if len(fields) - 1 != len(converters):
+            logger.error(
+                "diff len fields and params %d %d for fields: %s and method: %s",
+                len(fields),
+                len(converters) + 1,
+                fields,
+                method,
+            )
+            return
+
+        # fields[0] is the message version
+        method(*[convert(field) for (convert, field) in zip(converters, fields[1:])])
+
     def interpret(self, fields, msgId):
         if msgId == 0:
             logger.debug("Unset message id:%d", msgId)
             return
 
+        processFast = self.msgId2processFast.get(msgId)
+        if processFast is not None:
+            (processMeth, nFields) = processFast
+            if len(fields) < nFields:
+                self.badFastMessage(fields)
+            processMeth(self, fields)
+            return
+
         handleInfo = self.msgId2handleInfo.get(msgId, None)
 
         if handleInfo is None:
@@ -2758,7 +2667,7 @@ class Decoder(Object):
         try:
             if handleInfo.wrapperMeth is not None:
                 logger.debug("In interpret(), handleInfo: %s", handleInfo)
-                self.interpretWithSignature(fields, handleInfo)
+                self.interpretWithPlan(fields, msgId)
             elif handleInfo.processMeth is not None:
                 handleInfo.processMeth(self, iter(fields))
         except BadMessage:
@@ -2790,6 +2699,147 @@ class Decoder(Object):
             )
             raise
 
+    ######################################################################
+    # Fast path for the high frequency text messages, see setFastTickDecoding().
+    # The fields are read by index from the tuple; interpret() checks the
+    # minimum field count listed in msgId2processFastAll beforehand.
+
+    def badFastMessage(self, fields):
+        theBadMsg = repr(fields)
+        self.wrapper.error(
+            NO_VALID_ID, currentTimeMillis(), BAD_MESSAGE.code(), BAD_MESSAGE.msg() + theBadMsg
+        )
+        raise BadMessage("no more fields")
+
+    def processTickPriceMsgFast(self, fields):
+        # fields[0] is the message version
+        reqId = int(fields[1] or 0)
+        tickType = int(fields[2] or 0)
+        price = decodeFloatField(fields[3])
+        size = self.decodeSizeField(fields[4])
+        attrMask = int(fields[5] or 0)
+
+        attrib = TickAttrib()
+        if self.serverVersion >= MIN_SERVER_VER_PAST_LIMIT:
+            attrib.canAutoExecute = attrMask & 1 != 0
+            attrib.pastLimit = attrMask & 2 != 0
+            if self.serverVersion >= MIN_SERVER_VER_PRE_OPEN_BID_ASK:
+                attrib.preOpen = attrMask & 4 != 0
+        else:
+            attrib.canAutoExecute = attrMask == 1
+
+        self.wrapper.tickPrice(reqId, tickType, price, attrib)
+
+        sizeTickType = PRICE_TICK_TO_SIZE_TICK.get(tickType)
+        if sizeTickType is not None:
+            self.wrapper.tickSize(reqId, sizeTickType, size)
+
+    def processTickSizeMsgFast(self, fields):
+        sizeTickType = int(fields[2] or 0)
+        if sizeTickType != TickTypeEnum.NOT_SET:
+            self.wrapper.tickSize(int(fields[1] or 0), sizeTickType, self.decodeSizeField(fields[3]))
+
+    def processTickGenericMsgFast(self, fields):
+        if len(fields) != 4:
+            # let the generic path report the malformed message
+            self.interpretWithPlan(fields, IN.TICK_GENERIC)
+            return
+        self.wrapper.tickGeneric(int(fields[1]), int(fields[2]), float(fields[3]))
+
+    def processTickStringMsgFast(self, fields):
+        if len(fields) != 4 or self.decodePlansVersion != self.serverVersion:
+            self.interpretWithPlan(fields, IN.TICK_STRING)
+            return
+        self.wrapper.tickString(int(fields[1]), int(fields[2]), self.fieldToStr(fields[3]))
+
+    def processTickByTickMsgFast(self, fields):
+        reqId = int(fields[0] or 0)
+        tickType = int(fields[1] or 0)
+        time = int(fields[2] or 0)
+
+        if tickType == 1 or tickType == 2:
+            # Last or AllLast
+            if len(fields) < 8:
+                self.badFastMessage(fields)
+            mask = int(fields[5] or 0)
+            tickAttribLast = TickAttribLast()
+            tickAttribLast.pastLimit = mask & 1 != 0
+            tickAttribLast.unreported = mask & 2 != 0
+
+            self.wrapper.tickByTickAllLast(
+                reqId,
+                tickType,
+                time,
+                decodeFloatField(fields[3]),
+                self.decodeSizeField(fields[4]),
+                tickAttribLast,
+                decodeStrField(fields[6]),
+                decodeStrField(fields[7]),
+            )
+        elif tickType == 3:
+            # BidAsk
+            if len(fields) < 8:
+                self.badFastMessage(fields)
+            mask = int(fields[7] or 0)
+            tickAttribBidAsk = TickAttribBidAsk()
+            tickAttribBidAsk.bidPastLow = mask & 1 != 0
+            tickAttribBidAsk.askPastHigh = mask & 2 != 0
+
+            self.wrapper.tickByTickBidAsk(
+                reqId,
+                time,
+                decodeFloatField(fields[3]),
+                decodeFloatField(fields[4]),
+                self.decodeSizeField(fields[5]),
+                self.decodeSizeField(fields[6]),
+                tickAttribBidAsk,
+            )
+        elif tickType == 4:
+            # MidPoint
+            if len(fields) < 4:
+                self.badFastMessage(fields)
+            self.wrapper.tickByTickMidPoint(reqId, time, decodeFloatField(fields[3]))
+
+    def processMarketDepthMsgFast(self, fields):
+        # fields[0] is the message version
+        self.wrapper.updateMktDepth(
+            int(fields[1] or 0),
+            int(fields[2] or 0),
+            int(fields[3] or 0),
+            int(fields[4] or 0),
+            decodeFloatField(fields[5]),
+            self.decodeSizeField(fields[6]),
+        )
+
+    def processMarketDepthL2MsgFast(self, fields):
+        isSmartDepth = False
+        if self.serverVersion >= MIN_SERVER_VER_SMART_DEPTH:
+            if len(fields) < 9:
+                self.badFastMessage(fields)
+            isSmartDepth = int(fields[8] or 0) != 0
+
+        self.wrapper.updateMktDepthL2(
+            int(fields[1] or 0),
+            int(fields[2] or 0),
+            decodeStrField(fields[3]),
+            int(fields[4] or 0),
+            int(fields[5] or 0),
+            decodeFloatField(fields[6]),
+            self.decodeSizeField(fields[7]),
+            isSmartDepth,
+        )
+
+    # msgId: (fast process method, minimum number of fields)
+    msgId2processFastAll = {
+        IN.TICK_PRICE: (processTickPriceMsgFast, 6),
+        IN.TICK_SIZE: (processTickSizeMsgFast, 4),
+        IN.TICK_GENERIC: (processTickGenericMsgFast, 0),
+        IN.TICK_STRING: (processTickStringMsgFast, 0),
+        IN.TICK_BY_TICK: (processTickByTickMsgFast, 3),
+        IN.MARKET_DEPTH: (processMarketDepthMsgFast, 7),
+        IN.MARKET_DEPTH_L2: (processMarketDepthL2MsgFast, 8),
+    }
+
     msgId2handleInfo = {
         IN.TICK_PRICE: HandleInfo(proc=processTickPriceMsg),
         IN.TICK_SIZE: HandleInfo(proc=processTickSizeMsg),
@@ -581,15 +581,15 @@ def setLastTradeDate(lastTradeDateOrContractMonth: str, contract: ContractDetail
             contract.timeZoneId = split[2]
 
 @staticmethod
-def decodeHistoricalTick(historicalTickProto: HistoricalTickProto) -> HistoricalTick:
+def decodeHistoricalTick(historicalTickProto: HistoricalTickProto, toSize=Decimal) -> HistoricalTick:
     historicalTick = HistoricalTick()
     if historicalTickProto.HasField('time'): historicalTick.time = historicalTickProto.time
     if historicalTickProto.HasField('price'): historicalTick.price = historicalTickProto.price
-    if historicalTickProto.HasField('size'): historicalTick.size = Decimal(historicalTickProto.size)
+    if historicalTickProto.HasField('size'): historicalTick.size = toSize(historicalTickProto.size)
     return historicalTick
 
 @staticmethod
-def decodeHistoricalTickBidAsk(historicalTickBidAskProto: HistoricalTickBidAskProto) -> HistoricalTickBidAsk:
+def decodeHistoricalTickBidAsk(historicalTickBidAskProto: HistoricalTickBidAskProto, toSize=Decimal) -> HistoricalTickBidAsk:
     historicalTickBidAsk = HistoricalTickBidAsk()
     if historicalTickBidAskProto.HasField('time'): historicalTickBidAsk.time = historicalTickBidAskProto.time
     
@@ -602,12 +602,12 @@ def decodeHistoricalTickBidAsk(historicalTickBidAskProto: HistoricalTickBidAskPr
     
     if historicalTickBidAskProto.HasField('priceBid'): historicalTickBidAsk.priceBid = historicalTickBidAskProto.priceBid
     if historicalTickBidAskProto.HasField('priceAsk'): historicalTickBidAsk.priceAsk = historicalTickBidAskProto.priceAsk
-    if historicalTickBidAskProto.HasField('sizeBid'): historicalTickBidAsk.sizeBid = Decimal(historicalTickBidAskProto.sizeBid)
-    if historicalTickBidAskProto.HasField('sizeAsk'): historicalTickBidAsk.sizeAsk = Decimal(historicalTickBidAskProto.sizeAsk)
+    if historicalTickBidAskProto.HasField('sizeBid'): historicalTickBidAsk.sizeBid = toSize(historicalTickBidAskProto.sizeBid)
+    if historicalTickBidAskProto.HasField('sizeAsk'): historicalTickBidAsk.sizeAsk = toSize(historicalTickBidAskProto.sizeAsk)
     return historicalTickBidAsk
 
 @staticmethod
-def decodeHistoricalTickLast(historicalTickLastProto: HistoricalTickLastProto) -> HistoricalTickLast:
+def decodeHistoricalTickLast(historicalTickLastProto: HistoricalTickLastProto, toSize=Decimal) -> HistoricalTickLast:
     historicalTickLast = HistoricalTickLast()
     if historicalTickLastProto.HasField('time'): historicalTickLast.time = historicalTickLastProto.time
     
@@ -619,27 +619,27 @@ def decodeHistoricalTickLast(historicalTickLastProto: HistoricalTickLastProto) -
     historicalTickLast.tickAttribLast = tickAttribLast
     
     if historicalTickLastProto.HasField('price'): historicalTickLast.price = historicalTickLastProto.price
-    if historicalTickLastProto.HasField('size'): historicalTickLast.size = Decimal(historicalTickLastProto.size)
+    if historicalTickLastProto.HasField('size'): historicalTickLast.size = toSize(historicalTickLastProto.size)
     if historicalTickLastProto.HasField('exchange'): historicalTickLast.exchange = historicalTickLastProto.exchange
     if historicalTickLastProto.HasField('specialConditions'): historicalTickLast.specialConditions = historicalTickLastProto.specialConditions
     return historicalTickLast
 
 @staticmethod
-def decodeHistogramDataEntry(histogramDataEntryProto: HistogramDataEntryProto) -> HistogramData:
+def decodeHistogramDataEntry(histogramDataEntryProto: HistogramDataEntryProto, toSize=Decimal) -> HistogramData:
     histogramData = HistogramData()
     if histogramDataEntryProto.HasField('price'): histogramData.price = histogramDataEntryProto.price
-    if histogramDataEntryProto.HasField('size'): histogramData.size = Decimal(histogramDataEntryProto.size)
+    if histogramDataEntryProto.HasField('size'): histogramData.size = toSize(histogramDataEntryProto.size)
     return histogramData
 
 @staticmethod
-def decodeHistoricalDataBar(historicalDataBarProto: HistoricalDataBarProto) -> BarData:
+def decodeHistoricalDataBar(historicalDataBarProto: HistoricalDataBarProto, toSize=Decimal) -> BarData:
     bar = BarData()
     if historicalDataBarProto.HasField('date'): bar.date = historicalDataBarProto.date
     if historicalDataBarProto.HasField('open'): bar.open = historicalDataBarProto.open
     if historicalDataBarProto.HasField('high'): bar.high = historicalDataBarProto.high
     if historicalDataBarProto.HasField('low'): bar.low = historicalDataBarProto.low
     if historicalDataBarProto.HasField('close'): bar.close = historicalDataBarProto.close
-    if historicalDataBarProto.HasField('volume'): bar.volume = Decimal(historicalDataBarProto.volume)
+    if historicalDataBarProto.HasField('volume'): bar.volume = toSize(historicalDataBarProto.volume)
     if historicalDataBarProto.HasField('WAP'): bar.wap = Decimal(historicalDataBarProto.WAP)
     if historicalDataBarProto.HasField('barCount'): bar.barCount = historicalDataBarProto.barCount
     return bar
@@ -0,0 +1,192 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Batched hand-off between the EReader thread and the EClient.run() loop, see
+EClient.setBatchedDispatch().
+
+The reader appends every batch of messages framed from one socket read to a
+deque and signals once; the run loop wakes up and drains everything that is
+pending. deque.append()/popleft() are atomic, the only synchronisation is the
+event used for the wake-ups.
+
+When more than maxDepth messages are pending the policy decides what happens
+to the next batch:
+    BLOCK - the reader waits for the run loop to catch up, which in turn
+        lets TCP push back on TWS. Nothing is lost.
+    DROP - the level 1 ticks (TICK_PRICE, TICK_SIZE, TICK_GENERIC,
+        TICK_STRING) of the batch are dropped, everything else is queued.
+    COALESCE - of the level 1 ticks of the batch only the latest one per
+        (message, reqId, tickType) is queued, everything else is queued.
+Market depth, tick-by-tick, order and account messages are never dropped.
+"""
+
+import collections
+import threading
+import time
+
+from ibapi.common import PROTOBUF_MSG_ID
+from ibapi.message import IN
+from ibapi.server_versions import MIN_SERVER_VER_PROTOBUF
+
+from ibapi.protobuf.TickPrice_pb2 import TickPrice as TickPriceProto
+from ibapi.protobuf.TickSize_pb2 import TickSize as TickSizeProto
+from ibapi.protobuf.TickGeneric_pb2 import TickGeneric as TickGenericProto
+from ibapi.protobuf.TickString_pb2 import TickString as TickStringProto
+
+BLOCK = "block"
+DROP = "drop"
+COALESCE = "coalesce"
+POLICIES = (BLOCK, DROP, COALESCE)
+
+DEFAULT_MAX_DEPTH = 100000
+
+LEVEL1_TICKS = frozenset((IN.TICK_PRICE, IN.TICK_SIZE, IN.TICK_GENERIC, IN.TICK_STRING))
+LEVEL1_TICK_PROTOS = {
+    IN.TICK_PRICE: TickPriceProto,
+    IN.TICK_SIZE: TickSizeProto,
+    IN.TICK_GENERIC: TickGenericProto,
+    IN.TICK_STRING: TickStringProto,
+}
+
+
+def level1TickKey(msg: bytes, rawIntMsgId: bool):
+    """(msgId, reqId, tickType) of a level 1 tick message, None for any other
+    message."""
+    if rawIntMsgId:
+        msgId = int.from_bytes(msg[:4], "big")
+        if msgId > PROTOBUF_MSG_ID:
+            proto = LEVEL1_TICK_PROTOS.get(msgId - PROTOBUF_MSG_ID)
+            if proto is None:
+                return None
+            tick = proto.FromString(msg[4:])
+            return (msgId, tick.reqId, tick.tickType)
+        if msgId not in LEVEL1_TICKS:
+            return None
+        fields = msg[4:].split(b"\0", 3)
+        # version, reqId, tickType
+        return (msgId, fields[1], fields[2]) if len(fields) > 3 else None
+
+    fields = msg.split(b"\0", 4)
+    if int(fields[0] or 0) not in LEVEL1_TICKS or len(fields) < 5:
+        return None
+    # msgId, version, reqId, tickType
+    return (int(fields[0]), fields[2], fields[3])
+
+
+class BatchQueue:
+    def __init__(self, serverVersion, maxDepth: int = DEFAULT_MAX_DEPTH, policy: str = BLOCK):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown back-pressure policy {policy!r}")
+        if maxDepth <= 0:
+            raise ValueError(f"invalid max depth {maxDepth}")
+        self.rawIntMsgId = serverVersion >= MIN_SERVER_VER_PROTOBUF
+        self.maxDepth = maxDepth
+        self.policy = policy
+        self.batches = collections.deque()  # (enqueue time, [msg, ...])
+        self.ready = threading.Event()  # set when batches were added
+        self.room = threading.Event()  # set when the run loop drained
+        self.closed = False
+
+        # each counter is written by one thread only
+        self.nPut = 0  # reader
+        self.nDropped = 0  # reader
+        self.nBatches = 0  # reader
+        self.nTaken = 0  # run loop
+        self.nBatchesTaken = 0  # run loop
+        self.maxDepthSeen = 0  # run loop
+        self.lagSum = 0.0  # run loop
+        self.lagMax = 0.0  # run loop
+
+    def __len__(self):
+        return self.nPut - self.nTaken
+
+    def empty(self) -> bool:
+        return self.nPut == self.nTaken
+
+    def qsize(self) -> int:
+        return self.nPut - self.nTaken
+
+    def putBatch(self, msgs: list):
+        """Called by the reader thread with the messages of one socket read."""
+        if not msgs:
+            return
+        if self.nPut - self.nTaken + len(msgs) > self.maxDepth:
+            msgs = self.relieve(msgs)
+            if not msgs:
+                return
+        # counted first, so that the depth never goes negative
+        self.nPut += len(msgs)
+        self.batches.append((time.monotonic(), msgs))
+        self.nBatches += 1
+        self.ready.set()
+
+    def put(self, msg: bytes):
+        self.putBatch([msg])
+
+    def relieve(self, msgs: list) -> list:
+        if self.policy == BLOCK:
+            while not self.closed and self.nPut - self.nTaken >= self.maxDepth:
+                self.room.clear()
+                if self.nPut - self.nTaken < self.maxDepth:
+                    break
+                self.room.wait(0.2)
+            return msgs
+
+        rawIntMsgId = self.rawIntMsgId
+        keys = [level1TickKey(msg, rawIntMsgId) for msg in msgs]
+        if self.policy == DROP:
+            kept = [msg for (msg, key) in zip(msgs, keys) if key is None]
+        else:
+            last = {key: i for (i, key) in enumerate(keys) if key is not None}
+            kept = [msg for (i, (msg, key)) in enumerate(zip(msgs, keys)) if key is None or last[key] == i]
+        self.nDropped += len(msgs) - len(kept)
+        return kept
+
+    def drain(self, timeout: float = None) -> list:
+        """Called by the run loop: waits up to timeout for messages and returns
+        all that are pending, oldest first ([] on timeout)."""
+        if not self.batches:
+            self.ready.wait(timeout)
+        # cleared before draining: a batch added from here on sets it again
+        self.ready.clear()
+
+        now = time.monotonic()
+        depth = self.nPut - self.nTaken
+        msgs = []
+        batches = self.batches
+        while batches:
+            (enqueued, batch) = batches.popleft()
+            lag = now - enqueued
+            self.lagSum += lag
+            if lag > self.lagMax:
+                self.lagMax = lag
+            msgs.extend(batch)
+            self.nBatchesTaken += 1
+
+        if msgs:
+            if depth > self.maxDepthSeen:
+                self.maxDepthSeen = depth
+            self.nTaken += len(msgs)
+            self.room.set()
+        return msgs
+
+    def close(self):
+        """Releases a reader blocked by back-pressure."""
+        self.closed = True
+        self.room.set()
+        self.ready.set()
+
+    def stats(self) -> dict:
+        """depth: messages pending now, maxDepth: most messages pending at a
+        wake-up of the run loop, dropped: messages dropped or coalesced away,
+        lagMean/lagMax: seconds between queueing a batch and draining it."""
+        return {
+            "depth": self.nPut - self.nTaken,
+            "maxDepth": self.maxDepthSeen,
+            "msgs": self.nPut,
+            "batches": self.nBatches,
+            "dropped": self.nDropped,
+            "lagMean": self.lagSum / self.nBatchesTaken if self.nBatchesTaken else 0.0,
+            "lagMax": self.lagMax,
+        }
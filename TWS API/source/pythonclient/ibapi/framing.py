@@ -0,0 +1,112 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Splits the incoming byte stream into size prefixed messages.
+
+The FrameBuffer keeps the bytes received from the socket in one preallocated
+bytearray. The socket reads straight into its free tail (recv_into) and the
+size prefixes are parsed in place, so every message is copied exactly once,
+when it is handed out. This replaces the "buf += data" / comm.read_msg() loop
+which copied the whole remaining buffer again for every message of a burst.
+"""
+
+import logging
+import struct
+
+logger = logging.getLogger(__name__)
+
+SIZE_PREFIX = struct.Struct("!I")
+SIZE_PREFIX_LEN = SIZE_PREFIX.size
+
+DEFAULT_CAPACITY = 1024 * 1024
+MIN_READ_SIZE = 4096
+
+
+class FrameBuffer:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.buf = bytearray(capacity)
+        self.view = memoryview(self.buf)
+        self.start = 0  # first byte not handed out yet
+        self.end = 0  # one past the last received byte
+
+    def __len__(self):
+        return self.end - self.start
+
+    def capacity(self) -> int:
+        return len(self.buf)
+
+    def missing(self) -> int:
+        """Number of bytes still needed to complete the pending message,
+        0 if it is unknown (less than a size prefix is buffered)."""
+        avail = self.end - self.start
+        if avail < SIZE_PREFIX_LEN:
+            return 0
+        (size,) = SIZE_PREFIX.unpack_from(self.buf, self.start)
+        return max(0, SIZE_PREFIX_LEN + size - avail)
+
+    def writable(self, minSize: int = MIN_READ_SIZE) -> memoryview:
+        """Returns the free tail of the buffer, at least minSize bytes long.
+        Fill it and call commit() with the number of bytes written."""
+        if len(self.buf) - self.end < minSize:
+            self._makeRoom(minSize)
+        return self.view[self.end :]
+
+    def commit(self, nBytes: int):
+        self.end += nBytes
+
+    def feed(self, data):
+        """Appends bytes that were received by some other means."""
+        nBytes = len(data)
+        self.writable(nBytes)[:nBytes] = data
+        self.commit(nBytes)
+
+    def recvFrom(self, conn) -> int:
+        """Reads whatever is available on the connection straight into the
+        buffer, at most the connection's adaptive read size (or the rest of
+        the pending message if that is larger). Returns the number of bytes
+        read, 0 on timeout or disconnect."""
+        readSize = max(conn.readSize, self.missing())
+        nRecv = conn.recvMsgInto(self.writable(readSize)[:readSize])
+        self.end += nRecv
+        return nRecv
+
+    def nextMsg(self):
+        """Returns the payload of the next complete message as bytes, or None
+        if more data is needed."""
+        avail = self.end - self.start
+        if avail < SIZE_PREFIX_LEN:
+            return None
+        (size,) = SIZE_PREFIX.unpack_from(self.buf, self.start)
+        if avail - SIZE_PREFIX_LEN < size:
+            return None
+
+        begin = self.start + SIZE_PREFIX_LEN
+        msg = bytes(self.view[begin : begin + size])
+        self.start = begin + size
+        if self.start == self.end:
+            self.start = self.end = 0
+        return msg
+
+    def msgs(self):
+        """Yields every complete message currently buffered."""
+        msg = self.nextMsg()
+        while msg is not None:
+            yield msg
+            msg = self.nextMsg()
+
+    def _makeRoom(self, minSize: int):
+        pending = self.end - self.start
+        needed = pending + minSize
+        if needed > len(self.buf):
+            logger.debug("growing frame buffer %d -> %d", len(self.buf), needed)
+            newBuf = bytearray(max(needed, 2 * len(self.buf)))
+            newBuf[:pending] = self.view[self.start : self.end]
+            self.view.release()
+            self.buf = newBuf
+            self.view = memoryview(self.buf)
+        elif pending:
+            # only the tail of a partial message is moved, never a whole burst
+            self.buf[:pending] = bytes(self.view[self.start : self.end])
+        self.start = 0
+        self.end = pending
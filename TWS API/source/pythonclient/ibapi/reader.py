@@ -11,7 +11,7 @@ remove the size prefix and put the rest in a Queue.
 import logging
 from threading import Thread
 
-from ibapi import comm
+from ibapi.framing import FrameBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -25,24 +25,29 @@ class EReader(Thread):
     def run(self):
         try:
             logger.debug("EReader thread started")
-            buf = b""
+            frames = FrameBuffer()
+            # BatchQueue (see EClient.setBatchedDispatch()) takes the messages
+            # of a whole read at once
+            putBatch = getattr(self.msg_queue, "putBatch", None)
             while self.conn.isConnected():
-                data = self.conn.recvMsg()
-                logger.debug("reader loop, recvd size %d", len(data))
-                buf += data
-
-                while len(buf) > 0:
-                    (size, msg, buf) = comm.read_msg(buf)
-                    # logger.debug("resp %s", buf.decode('ascii'))
-                    logger.debug(
-                        "size:%d msg.size:%d msg:|%s| buf:%s|", size, len(msg), buf, "|"
-                    )
-
-                    if msg:
+                nRecv = frames.recvFrom(self.conn)
+                logger.debug("reader loop, recvd size %d", nRecv)
+
+                tracer = self.conn.tracer
+                if putBatch is not None:
+                    msgs = list(frames.msgs())
+                    if tracer is not None:
+                        for msg in msgs:
+                            tracer.received(msg)
+                    putBatch(msgs)
+                else:
+                    for msg in frames.msgs():
+                        if tracer is not None:
+                            tracer.received(msg)
                         self.msg_queue.put(msg)
-                    else:
-                        logger.debug("more incoming packet(s) are needed ")
-                        break
+
+                if len(frames) > 0:
+                    logger.debug("more incoming packet(s) are needed ")
 
             logger.debug("EReader thread finished")
         except:
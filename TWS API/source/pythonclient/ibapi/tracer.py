@@ -0,0 +1,77 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+Opt-in wire tracer: keeps the last frames sent and received in a ring buffer
+so that they can be inspected or dumped after the fact, e.g. when an order
+is rejected. Recording a frame only appends a (time, direction, bytes) tuple,
+nothing is formatted until records() or format() is called.
+
+    tracer = WireTracer(capacity=10000)
+    client.setWireTracer(tracer)
+    ...
+    for line in tracer.format():
+        print(line)
+"""
+
+import collections
+import datetime
+import time
+
+from ibapi.common import PROTOBUF_MSG_ID
+
+SENT = "SENT"
+RECV = "RECV"
+
+DEFAULT_CAPACITY = 4096
+
+
+class WireTracer:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        # deque.append() is atomic, the reader thread and the sending
+        # threads can record without a lock
+        self.frames = collections.deque(maxlen=capacity)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def capacity(self) -> int:
+        return self.frames.maxlen
+
+    def sent(self, msg: bytes):
+        """msg is the full message, size prefix included, as written to the socket"""
+        self.frames.append((time.time_ns(), SENT, msg))
+
+    def received(self, msg: bytes):
+        """msg is one message without its size prefix, as put on the queue"""
+        self.frames.append((time.time_ns(), RECV, msg))
+
+    def clear(self):
+        self.frames.clear()
+
+    def records(self) -> list:
+        """Snapshot of the buffered frames, oldest first, as
+        (timeNs, direction, payload) tuples. The size prefix of the sent
+        messages is stripped so that both directions look alike."""
+        return [
+            (timeNs, direction, msg[4:] if direction == SENT else msg)
+            for (timeNs, direction, msg) in list(self.frames)
+        ]
+
+    def format(self, rawIntMsgId: bool = False):
+        """Yields one line per buffered frame. Set rawIntMsgId when the
+        server version is >= MIN_SERVER_VER_PROTOBUF, the message id is then
+        a 4 bytes binary int in front of the payload."""
+        for timeNs, direction, payload in self.records():
+            stamp = datetime.datetime.fromtimestamp(timeNs / 1e9).strftime("%H:%M:%S.%f")
+            if rawIntMsgId and len(payload) >= 4:
+                msgId = int.from_bytes(payload[:4], "big")
+                body = payload[4:]
+                if msgId > PROTOBUF_MSG_ID:
+                    yield f"{stamp} {direction} msgId:{msgId - PROTOBUF_MSG_ID} protobuf {body!r}"
+                    continue
+                fields = body.split(b"\0")
+                yield f"{stamp} {direction} msgId:{msgId} {fields[:-1]}"
+            else:
+                fields = payload.split(b"\0")
+                yield f"{stamp} {direction} {fields[:-1]}"
@@ -145,6 +145,69 @@ def decode(the_type, fields, show_unset=False, use_unicode=False):
     return n
 
 
+# Field decoders for the fast path of the high frequency messages: they take
+# the raw field (bytes) and give the same result as decode() with its defaults,
+# without the iterator, the logging and the repeated s.decode() comparisons.
+UNSET_DECIMAL_FIELDS = frozenset(
+    (
+        b"",
+        b"2147483647",
+        b"9223372036854775807",
+        b"1.7976931348623157E308",
+        b"-9223372036854775808",
+    )
+)
+INFINITY_FIELD = INFINITY_STR.encode()
+
+
+def decodeIntField(s: bytes) -> int:
+    return int(s or 0)
+
+
+def decodeFloatField(s: bytes) -> float:
+    if s == INFINITY_FIELD:
+        return DOUBLE_INFINITY
+    return float(s or 0)
+
+
+def decodeDecimalField(s: bytes) -> Decimal:
+    if s in UNSET_DECIMAL_FIELDS:
+        return UNSET_DECIMAL
+    return Decimal(s.decode())
+
+
+def decodeStrField(s: bytes) -> str:
+    return s.decode("UTF-8", errors="backslashreplace")
+
+
+# Size converters for Decoder.setSizeType(): market data sizes and volumes are
+# Decimal by default, float or int on request. The unset sentinels map to the
+# unset value of the chosen type.
+def decodeFloatSizeField(s: bytes) -> float:
+    if s in UNSET_DECIMAL_FIELDS:
+        return UNSET_DOUBLE
+    return float(s)
+
+
+def decodeIntSizeField(s: bytes) -> int:
+    if s in UNSET_DECIMAL_FIELDS:
+        return UNSET_LONG
+    # fractional sizes are truncated
+    return int(float(s))
+
+
+def intSizeFromStr(s: str) -> int:
+    return int(float(s))
+
+
+# sizeType: (text field decoder, protobuf string converter, unset value)
+SIZE_TYPE_CONVERTERS = {
+    Decimal: (decodeDecimalField, Decimal, UNSET_DECIMAL),
+    float: (decodeFloatSizeField, float, UNSET_DOUBLE),
+    int: (decodeIntSizeField, intSizeFromStr, UNSET_LONG),
+}
+
+
 def ExerciseStaticMethods(klass):
     import types
 
@@ -205,6 +268,13 @@ def isPegBestOrder(orderType: str):
     return orderType in ("PEG BEST", "PEGBEST")
 
 
+def log_enabled() -> bool:
+    """Guard for the log_() call sites, so that the caller only builds its
+    current_fn_name() and vars() when they will actually be logged. With
+    INFO off for this logger (the default) that is the only cost."""
+    return logger.isEnabledFor(logging.INFO)
+
+
 def log_(func, params, action):
     if logger.isEnabledFor(logging.INFO):
         if "self" in params:
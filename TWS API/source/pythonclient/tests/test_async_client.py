@@ -0,0 +1,139 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+"""
+
+import asyncio
+import struct
+import unittest
+
+from ibapi import comm
+from ibapi.async_client import AsyncEClient, RequestError
+from ibapi.comm import make_field
+from ibapi.contract import Contract
+from ibapi.message import IN, OUT
+from ibapi.server_versions import MIN_SERVER_VER_PROTOBUF
+from ibapi.wrapper import EWrapper
+
+SERVER_VERSION = MIN_SERVER_VER_PROTOBUF - 1  # text messages both ways
+
+
+class StubTws:
+    """Answers the handshake, START_API, REQ_IDS, REQ_CURRENT_TIME and
+    REQ_CONTRACT_DATA (with an error), ignores everything else."""
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.serve, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.writers = []
+
+    async def stop(self):
+        for writer in self.writers:
+            writer.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    @staticmethod
+    def msg(msgId, *fields) -> bytes:
+        return comm.make_msg(msgId, False, "".join(make_field(f) for f in fields))
+
+    async def serve(self, reader, writer):
+        self.writers.append(writer)
+        await reader.readexactly(4)  # API\0
+        (size,) = struct.unpack("!I", await reader.readexactly(4))
+        await reader.readexactly(size)
+        writer.write(comm.make_initial_msg(make_field(SERVER_VERSION) + make_field("20250102 09:30:00 EST")))
+
+        while True:
+            try:
+                (size,) = struct.unpack("!I", await reader.readexactly(4))
+                fields = comm.read_fields(await reader.readexactly(size))
+            except asyncio.IncompleteReadError:
+                return
+            msgId = int(fields[0])
+            if msgId == OUT.START_API or msgId == OUT.REQ_IDS:
+                writer.write(self.msg(IN.NEXT_VALID_ID, 1, 100))
+            elif msgId == OUT.REQ_CURRENT_TIME:
+                writer.write(self.msg(IN.CURRENT_TIME, 1, 1700000000))
+            elif msgId == OUT.REQ_CONTRACT_DATA:
+                reqId = int(fields[2])
+                writer.write(self.msg(IN.ERR_MSG, reqId, 200, "No security definition has been found", "", 0))
+            await writer.drain()
+
+
+class RecordingWrapper(EWrapper):
+    def __init__(self):
+        EWrapper.__init__(self)
+        self.calls = []
+
+    def connectAck(self):
+        self.calls.append("connectAck")
+
+    def nextValidId(self, orderId: int):
+        self.calls.append(("nextValidId", orderId))
+
+    def currentTime(self, time: int):
+        self.calls.append(("currentTime", time))
+
+    def error(self, reqId, errorTime, errorCode, errorString, advancedOrderRejectJson=""):
+        self.calls.append(("error", reqId, errorCode))
+
+    def connectionClosed(self):
+        self.calls.append("connectionClosed")
+
+
+class AsyncEClientTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tws = StubTws()
+        await self.tws.start()
+        self.wrapper = RecordingWrapper()
+        self.client = AsyncEClient(self.wrapper)
+        await self.client.connectAsync("127.0.0.1", self.tws.port, 0, timeout=5)
+
+    async def asyncTearDown(self):
+        self.client.disconnect()
+        await self.tws.stop()
+
+    async def test_connect(self):
+        self.assertTrue(self.client.isConnected())
+        self.assertEqual(self.client.serverVersion(), SERVER_VERSION)
+        self.assertEqual(await self.client.reqIdsAsync(), 100)
+        self.assertEqual(self.wrapper.calls[:2], ["connectAck", ("nextValidId", 100)])
+
+    async def test_current_time(self):
+        self.assertEqual(await asyncio.wait_for(self.client.reqCurrentTimeAsync(), 5), 1700000000)
+        self.assertIn(("currentTime", 1700000000), self.wrapper.calls)
+
+    async def test_request_error(self):
+        contract = Contract()
+        contract.symbol = "NOPE"
+        with self.assertRaises(RequestError) as cm:
+            await asyncio.wait_for(self.client.reqContractDetailsAsync(7, contract), 5)
+        self.assertEqual((cm.exception.reqId, cm.exception.code), (7, 200))
+        self.assertIn(("error", 7, 200), self.wrapper.calls)
+
+    async def test_timed_out_request_can_be_repeated(self):
+        for _ in range(2):   # the stub never answers historical data
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self.client.reqHistoricalDataAsync(1, Contract(), "", "1 D", "1 min", "TRADES", 1, 1, []),
+                    0.1,
+                )
+            self.assertNotIn(1, self.client.pending)
+        self.assertEqual(await asyncio.wait_for(self.client.reqCurrentTimeAsync(), 5), 1700000000)
+        self.assertEqual(self.client.pending, {})
+
+    async def test_server_disconnect(self):
+        future = asyncio.ensure_future(
+            self.client.reqHistoricalDataAsync(1, Contract(), "", "1 D", "1 min", "TRADES", 1, 1, [])
+        )
+        await asyncio.sleep(0)
+        await self.tws.stop()
+        with self.assertRaises(ConnectionError):
+            await asyncio.wait_for(future, 5)
+        self.assertFalse(self.client.isConnected())
+        self.assertIn("connectionClosed", self.wrapper.calls)
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+BarSeries, the columnar bars of the Trading Strategies indicator library: the container itself
+and the *_value helpers given a BarSeries instead of a list of bars.
+"""
+
+import datetime
+import os
+import random
+import sys
+import unittest
+from collections import namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trading Strategies"))
+
+import Indicators  # noqa: E402
+from Indicators import backend  # noqa: E402
+from Indicators.bar_series import BarSeries, column  # noqa: E402
+
+# the fields of ib_async's BarData
+BarData = namedtuple("BarData", "date open high low close volume average barCount")
+
+
+def make_bars(n, seed=6):
+    rnd = random.Random(seed)
+    bars = []
+    close = 100.0
+    t = datetime.datetime(2025, 3, 3, 9, 30)
+    for _ in range(n):
+        o = close
+        close = max(1.0, o + rnd.gauss(0, 1.2))
+        bars.append(BarData(t, o, max(o, close) + rnd.random(), min(o, close) - rnd.random(),
+                            close, float(rnd.randint(100, 9000)), close, 10))
+        t += datetime.timedelta(minutes=15)
+        if t.hour >= 16:
+            t = (t + datetime.timedelta(days=1)).replace(hour=9, minute=30)
+    return bars
+
+
+class BarSeriesTestCase(unittest.TestCase):
+    bars = make_bars(300)
+
+    def assertRow(self, row, bar):
+        self.assertEqual((row.date, row.open, row.high, row.low, row.close, row.volume),
+                         (bar.date, bar.open, bar.high, bar.low, bar.close, bar.volume))
+
+    def test_container(self):
+        series = BarSeries.from_bars(self.bars)
+        self.assertIs(BarSeries.from_bars(series), series)
+        self.assertEqual(len(series), 300)
+        self.assertTrue(series)
+        self.assertFalse(BarSeries())
+        self.assertRow(series[0], self.bars[0])
+        self.assertRow(series[-1], self.bars[-1])
+        with self.assertRaises(IndexError):
+            series[300]
+        for (row, bar) in zip(series, self.bars):
+            self.assertRow(row, bar)
+        self.assertEqual(list(series.closes), [b.close for b in self.bars])
+        self.assertEqual(series.dates, [b.date for b in self.bars])
+
+    def test_append(self):
+        series = BarSeries.from_bars(self.bars[:100])
+        closes = series.closes
+        for bar in self.bars[100:]:
+            series.append(bar)
+        self.assertEqual(len(series), 300)
+        # the column of a whole series is the live column
+        self.assertEqual(list(closes), [b.close for b in self.bars])
+        series.extend(iter(self.bars[:2]))
+        self.assertRow(series[-1], self.bars[1])
+        self.assertEqual(BarSeries.from_bars([namedtuple("B", "open high low close")(1, 2, 0, 1)])[0].volume, 0.0)
+
+    def test_views(self):
+        series = BarSeries.from_bars(self.bars)
+        view = series[100:200]
+        self.assertEqual(len(view), 100)
+        self.assertRow(view[0], self.bars[100])
+        self.assertRow(view[-1], self.bars[199])
+        self.assertEqual(list(view.highs), [b.high for b in self.bars[100:200]])
+        self.assertEqual(len(view[-2:]), 2)
+        self.assertRow(view[-2:][0], self.bars[198])
+        self.assertEqual(len(series[250:]), 50)
+        self.assertEqual(len(series[:-1]), 299)
+        self.assertEqual(len(series[5:2]), 0)
+        with self.assertRaises(ValueError):
+            series[::2]
+        with self.assertRaises(TypeError):
+            view.append(self.bars[0])
+        # a view keeps its range while the series grows
+        series.append(self.bars[0])
+        self.assertEqual(len(view), 100)
+        self.assertEqual(len(series[:]), 301)
+
+    def test_column(self):
+        series = BarSeries.from_bars(self.bars)
+        for name in ("open", "high", "low", "close", "volume", "date"):
+            self.assertEqual(list(column(series, name)), column(self.bars, name))
+        self.assertEqual(column([namedtuple("B", "close")(1.0)], "volume"), [0.0])
+
+    def test_value_helpers(self):
+        """Every *_value helper returns the same result for a BarSeries as for the list of bars,
+        also for a view and on the forming bar (compared by repr: some results hold NaN)."""
+        names = sorted(n for n in Indicators.__all__ if n.endswith("_value"))
+        series = BarSeries.from_bars(self.bars)
+        for name in names:
+            helper = getattr(Indicators, name).__wrapped__     # bypass the indicator cache
+            for n in (30, 300):
+                for completed in (True, False):
+                    expected = repr(helper(bars=self.bars[:n], completed=completed))
+                    self.assertEqual(repr(helper(bars=series[:n], completed=completed)), expected, name)
+            self.assertEqual(repr(helper(bars=series)), repr(helper(bars=self.bars)), name)
+
+    @unittest.skipUnless(backend.numpy_available(), "NumPy is not installed")
+    def test_numpy_backend(self):
+        from Indicators import numpy_backend
+        series = BarSeries.from_bars(self.bars)
+        line = numpy_backend.ema(series.closes, 10)
+        series.append(self.bars[0])     # the backend must not hold on to the column's buffer
+        self.assertEqual(len(line), 300)
+
+
+if "__main__" == __name__:
+    unittest.main()
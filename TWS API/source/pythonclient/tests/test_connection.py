@@ -0,0 +1,130 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+"""
+
+import socket
+import threading
+import unittest
+
+from ibapi.connection import Connection, MAX_BATCH_SIZE
+
+
+class ConnectionTestCase(unittest.TestCase):
+    def setUp(self):
+        (self.local, self.remote) = socket.socketpair()
+        self.local.settimeout(1)
+        self.conn = Connection("127.0.0.1", 0)
+        self.conn.socket = self.local
+        self.conn.setRecvOptions(minReadSize=1024, maxReadSize=16 * 1024)
+
+    def tearDown(self):
+        self.conn.disconnect()
+        self.remote.close()
+
+    def test_read_size_adapts(self):
+        self.remote.sendall(b"x" * 63 * 1024)
+
+        sizes = []
+        received = 0
+        while received < 63 * 1024:
+            sizes.append(self.conn.readSize)
+            received += len(self.conn.recvMsg())
+
+        self.assertEqual(sizes[:5], [1024, 2048, 4096, 8192, 16384])
+        self.assertEqual(self.conn.readSize, 16 * 1024, "read size is capped")
+
+        self.remote.sendall(b"y")
+        self.assertEqual(self.conn.recvMsg(), b"y")
+        self.assertEqual(self.conn.readSize, 8 * 1024, "read size shrinks back")
+
+    def test_recv_stats(self):
+        self.remote.sendall(b"z" * 3000)
+        self.conn.recvMsg()
+
+        stats = self.conn.recvStats()
+
+        self.assertEqual(stats["bytesRecvd"], 1024)
+        self.assertEqual(stats["recvCalls"], 1)
+        self.assertGreater(stats["bytesPerSec"], 0)
+
+    def test_timeout(self):
+        self.local.settimeout(0.01)
+        self.assertEqual(self.conn.recvMsg(), b"")
+        self.assertTrue(self.conn.isConnected())
+
+    def test_closed(self):
+        self.remote.close()
+        self.assertEqual(self.conn.recvMsg(), b"")
+        self.assertFalse(self.conn.isConnected())
+
+
+class BatchTestCase(unittest.TestCase):
+    def setUp(self):
+        (self.local, self.remote) = socket.socketpair()
+        self.remote.setblocking(False)
+        self.conn = Connection("127.0.0.1", 0)
+        self.conn.socket = self.local
+
+    def tearDown(self):
+        self.conn.disconnect()
+        self.remote.close()
+
+    def pending(self) -> bytes:
+        try:
+            return self.remote.recv(1024 * 1024)
+        except BlockingIOError:
+            return b""
+
+    def test_batch(self):
+        self.conn.startBatch()
+        self.conn.sendMsg(b"a")
+        self.conn.startBatch()
+        self.conn.sendMsg(b"b")
+        self.assertEqual(self.conn.endBatch(), 0, "inner batch does not write")
+        self.conn.sendMsg(b"c")
+        self.assertEqual(self.pending(), b"")
+
+        self.assertEqual(self.conn.endBatch(), 3)
+        self.assertEqual(self.pending(), b"abc")
+
+        self.conn.sendMsg(b"d")
+        self.assertEqual(self.pending(), b"d", "unbatched again")
+
+    def test_batch_is_per_thread(self):
+        self.conn.startBatch()
+        self.conn.sendMsg(b"a")
+        thread = threading.Thread(target=self.conn.sendMsg, args=(b"b",))
+        thread.start()
+        thread.join()
+        self.assertEqual(self.pending(), b"b")
+
+        self.conn.endBatch()
+        self.assertEqual(self.pending(), b"a")
+
+    def test_large_batch_flushes_early(self):
+        msg = b"x" * 1024
+        self.conn.startBatch()
+        for _ in range(MAX_BATCH_SIZE // len(msg)):
+            self.conn.sendMsg(msg)
+        self.assertEqual(len(self.pending()), MAX_BATCH_SIZE)
+        self.assertEqual(self.conn.endBatch(), 0)
+
+    def test_tcp_no_delay(self):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        conn = Connection("127.0.0.1", server.getsockname()[1])
+        conn.setTcpNoDelay(True)
+        try:
+            conn.connect()
+            self.assertTrue(conn.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+            conn.setTcpNoDelay(False)
+            self.assertFalse(conn.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+        finally:
+            conn.disconnect()
+            server.close()
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,311 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+The process-wide market-data hub of the Trading Strategies library: identical history
+requests from several strategy threads sent once, served across a bar boundary never, and
+paced from one shared budget.
+"""
+
+import asyncio
+import datetime
+import os
+import sys
+import threading
+import time
+import unittest
+from collections import namedtuple
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trading Strategies"))
+
+from Indicators import data_hub  # noqa: E402
+from Indicators.data_hub import MarketDataHub, Pacer, PacingScheduler, hist_request  # noqa: E402
+
+Contract = namedtuple("Contract", "conId symbol secType exchange currency lastTradeDateOrContractMonth")
+Bar = namedtuple("Bar", "date open high low close volume")
+
+SOXL = Contract(1, "SOXL", "STK", "SMART", "USD", "")
+SOXL_ON = SOXL._replace(exchange="OVERNIGHT")
+
+
+def make_bars(n):
+    t = datetime.datetime(2025, 3, 3, 9, 30)
+    return [Bar(t + datetime.timedelta(minutes=15 * i), 1.0, 2.0, 0.5, 1.5, 100.0) for i in range(n)]
+
+
+class FakeIB:
+    """The IB calls the hub makes: reqHistoricalData / reqHistoricalDataAsync (slow, counted)
+    and sleep."""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def reqHistoricalData(self, contract, end, duration, bar_size, what, use_rth, fmt, timeout=None):
+        with self.lock:
+            self.requests.append((contract.exchange, duration, bar_size, what, use_rth, timeout))
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("socket disconnect")
+        return make_bars(40)
+
+    async def reqHistoricalDataAsync(self, contract, end, duration, bar_size, what, use_rth, fmt,
+                                     timeout=None):
+        with self.lock:
+            self.requests.append((contract.exchange, duration, bar_size, what, use_rth, timeout))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("socket disconnect")
+        return make_bars(40)
+
+    def sleep(self, secs):
+        time.sleep(secs)
+
+
+class DaysIB(FakeIB):
+    """Bars over several sessions: 15-min bars (4 a day) or daily bars."""
+
+    def reqHistoricalData(self, contract, end, duration, bar_size, what, use_rth, fmt, timeout=None):
+        self.requests.append((contract.exchange, duration, bar_size, what, use_rth, timeout))
+        days = [datetime.date(2025, 3, 3) + datetime.timedelta(days=i) for i in range(40)]
+        if bar_size == "1 day":
+            return [Bar(d, 1.0, 2.0, 0.5, 1.5, 100.0) for d in days]
+        return [Bar(datetime.datetime.combine(d, datetime.time(9, 30)) + datetime.timedelta(minutes=15 * j),
+                    1.0, 2.0, 0.5, 1.5, 100.0) for d in days[:6] for j in range(4)]
+
+
+class FakeClock:
+    """A clock for the pacing scheduler and an ib whose sleep() advances it."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, secs):
+        self.now += secs
+
+
+class ClockedIB(FakeIB):
+    def __init__(self, clock):
+        super().__init__()
+        self.clock = clock
+
+    def sleep(self, secs):
+        self.clock.sleep(secs)
+
+
+class DataHubTestCase(unittest.TestCase):
+    def setUp(self):
+        self.hub = MarketDataHub(min_interval=0.0, ttl=30.0)
+        self.ib = FakeIB()
+
+    def test_identical_requests_sent_once(self):
+        first = self.hub.historical(self.ib, SOXL, "30 D", "15 mins", timeout=20)
+        again = self.hub.historical(FakeIB(), SOXL, "30 D", "15 mins")
+        self.assertEqual(again, first)
+        self.assertIsNot(again, first)          # every caller gets its own list
+        self.assertEqual(len(self.ib.requests), 1)
+        self.assertEqual(self.ib.requests[0][-1], 20)
+        # another venue / bar size / session is another request
+        self.hub.historical(self.ib, SOXL_ON, "30 D", "15 mins")
+        self.hub.historical(self.ib, SOXL, "30 D", "5 mins")
+        self.hub.historical(self.ib, SOXL, "30 D", "15 mins", use_rth=False)
+        self.assertEqual(len(self.ib.requests), 4)
+        s = self.hub.stats()
+        self.assertEqual((s.sent, s.cached, s.joined, s.saved), (4, 1, 0, 1))
+
+    def test_shorter_duration_served(self):
+        self.hub.historical(self.ib, SOXL, "30 D", "15 mins")
+        self.assertEqual(len(self.hub.historical(self.ib, SOXL, "10 D", "15 mins")), 40)
+        # a top-up gets the bars of its own span (back from the last bar)
+        top = self.hub.historical(self.ib, SOXL, "2700 S", "15 mins")
+        self.assertEqual([b.date.strftime("%H:%M") for b in top], ["18:30", "18:45", "19:00", "19:15"])
+        # a longer duration goes out
+        self.hub.historical(self.ib, SOXL, "60 D", "15 mins")
+        self.assertEqual([r[1] for r in self.ib.requests], ["30 D", "60 D"])
+
+    def test_served_cut_to_the_asked_span(self):
+        ib = DaysIB()
+        full = self.hub.historical(ib, SOXL, "30 D", "15 mins")
+        five = self.hub.historical(ib, SOXL, "5 D", "15 mins")
+        self.assertEqual(len(full), 24)
+        self.assertEqual(five, full[4:])                # the last 5 sessions
+        daily = self.hub.historical(ib, SOXL, "60 D", "1 day")
+        self.assertEqual(self.hub.historical(ib, SOXL, "10 D", "1 day"), daily[-10:])
+        self.assertEqual(len(self.hub.historical(ib, SOXL, "2 W", "1 day")), 14)
+        self.assertEqual(len(ib.requests), 2)
+
+    def test_in_flight_request_joined(self):
+        ib = FakeIB(delay=0.3)
+        results = []
+
+        def ask():
+            results.append(self.hub.historical(ib, SOXL, "30 D", "15 mins"))
+
+        threads = [threading.Thread(target=ask) for _ in range(4)]
+        for t in threads:
+            t.start()
+            time.sleep(0.02)
+        for t in threads:
+            t.join()
+        self.assertEqual(len(ib.requests), 1)
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(r == results[0] for r in results))
+        self.assertEqual(self.hub.stats().joined, 3)
+
+    def test_not_served_across_a_bar_boundary(self):
+        clock = [900.0 * 1000 + 890.0]           # 10 s before a 15-min bar close
+        with mock.patch.object(data_hub.time, "time", lambda: clock[0]):
+            self.hub.historical(self.ib, SOXL, "30 D", "15 mins")
+            clock[0] += 5
+            self.hub.historical(self.ib, SOXL, "30 D", "15 mins")
+            self.assertEqual(len(self.ib.requests), 1)
+            clock[0] += 10                       # the bar closed
+            self.hub.historical(self.ib, SOXL, "30 D", "15 mins")
+            self.assertEqual(len(self.ib.requests), 2)
+            clock[0] += 31                       # past the ttl
+            self.hub.historical(self.ib, SOXL, "30 D", "15 mins")
+            self.assertEqual(len(self.ib.requests), 3)
+
+    def test_failures_not_shared(self):
+        with self.assertRaises(ConnectionError):
+            self.hub.historical(FakeIB(fail=True), SOXL, "30 D", "15 mins")
+        self.hub.historical(self.ib, SOXL, "30 D", "15 mins")
+        self.assertEqual(len(self.ib.requests), 1)
+        s = self.hub.stats()
+        self.assertEqual((s.sent, s.failed, s.saved), (1, 1, 0))
+        self.assertIn("1 failed", self.hub.summary())
+
+    def test_shared_pacing_budget(self):
+        pacer = Pacer(0.1)
+        starts = []
+
+        def ask():
+            pacer.acquire(FakeIB())
+            starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=ask) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # four requests from four threads take three intervals, not one
+        self.assertGreaterEqual(max(starts) - min(starts), 0.27)
+
+    def test_async_requests_joined(self):
+        ib = FakeIB(delay=0.2)
+
+        async def ask_all():
+            return await asyncio.gather(
+                *(self.hub.historical_async(ib, c, "30 D", "15 mins")
+                  for c in (SOXL, SOXL, SOXL_ON, SOXL)))
+
+        results = asyncio.run(ask_all())
+        self.assertEqual(len(ib.requests), 2)            # SMART once, OVERNIGHT once
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(len(results[2]), 40)
+        s = self.hub.stats()
+        self.assertEqual((s.sent, s.joined), (2, 2))
+        # and the result is there for a thread asking afterwards
+        self.hub.historical(ib, SOXL, "30 D", "15 mins")
+        self.assertEqual(len(ib.requests), 2)
+
+    def test_async_failure_not_shared(self):
+        async def ask(ib):
+            return await self.hub.historical_async(ib, SOXL, "30 D", "15 mins")
+
+        with self.assertRaises(ConnectionError):
+            asyncio.run(ask(FakeIB(fail=True)))
+        self.assertEqual(len(asyncio.run(ask(self.ib))), 40)
+        self.assertEqual(len(self.ib.requests), 1)
+
+    def test_async_pacing(self):
+        pacer = Pacer(0.1)
+
+        async def ask_all():
+            starts = []
+
+            async def ask():
+                await pacer.acquire_async()
+                starts.append(time.monotonic())
+
+            await asyncio.gather(*(ask() for _ in range(4)))
+            return starts
+
+        starts = asyncio.run(ask_all())
+        self.assertGreaterEqual(max(starts) - min(starts), 0.27)
+
+    def test_scheduler_contract_rules(self):
+        clock = FakeClock()
+        pacer = PacingScheduler(min_interval=0.0, clock=clock)
+        t0 = clock.now
+        pacer.acquire(clock, hist_request(SOXL, "30 D", "15 mins"))
+        pacer.acquire(clock, hist_request(SOXL, "30 D", "15 mins"))      # identical: 15 s
+        self.assertAlmostEqual(clock.now - t0, 15.0)
+        t1 = clock.now
+        for d in ("1 D", "2 D", "3 D", "4 D"):                            # 5 per contract in 2 s
+            pacer.acquire(clock, hist_request(SOXL, d, "15 mins"))
+        self.assertEqual(clock.now, t1)
+        pacer.acquire(clock, hist_request(SOXL_ON, "5 D", "15 mins"))    # another venue: free
+        self.assertEqual(clock.now, t1)
+        pacer.acquire(clock, hist_request(SOXL, "5 D", "15 mins"))       # the 6th waits
+        self.assertAlmostEqual(clock.now - t1, 2.0)
+        s = pacer.stats()
+        self.assertEqual((s.requests, s.delayed), (8, 2))
+        self.assertAlmostEqual(s.max_wait, 15.0)
+        self.assertIn("8 requests, 2 held back", pacer.summary())
+
+    def test_scheduler_small_bar_window(self):
+        clock = FakeClock()
+        pacer = PacingScheduler(min_interval=0.0, window_max=10, priority_reserve=2, clock=clock)
+        t0 = clock.now
+        for i in range(6):
+            pacer.acquire(clock, hist_request(SOXL._replace(conId=100 + i), "1800 S", "5 secs"))
+        pacer.acquire(clock, hist_request(SOXL, "1 D", "1 hour"))         # not a small bar
+        self.assertEqual(clock.now, t0)
+        pacer.acquire(clock, hist_request(SOXL, "1800 S", "5 secs", "BID_ASK"))   # counts 2: 8
+        self.assertEqual(clock.now, t0)
+        pacer.acquire(clock, hist_request(SOXL_ON, "1800 S", "5 secs"), priority=True)
+        self.assertEqual(clock.now, t0)                  # order-critical: uses the reserve
+        pacer.acquire(clock, hist_request(SOXL_ON, "3600 S", "5 secs"))
+        self.assertAlmostEqual(clock.now - t0, 600.0)    # the window has rolled
+        self.assertEqual(pacer.stats().priority, 1)
+
+    def test_scheduler_priority_first(self):
+        clock = FakeClock()
+        pacer = PacingScheduler(min_interval=1.0, clock=clock)
+        pacer.acquire(clock)
+        (urgent, other) = (object(), object())
+        self.assertAlmostEqual(pacer._admit(None, False, None, other), 1.0)
+        self.assertAlmostEqual(pacer._admit(None, True, None, urgent), 1.0)
+        clock.sleep(1.0)
+        self.assertGreater(pacer._admit(None, False, clock.now, other), 0)   # waits its turn
+        self.assertEqual(pacer._admit(None, True, clock.now, urgent), 0.0)
+        clock.sleep(1.0)
+        self.assertEqual(pacer._admit(None, False, clock.now, other), 0.0)
+
+    def test_hub_paces_by_request(self):
+        clock = FakeClock()
+        hub = MarketDataHub(ttl=0.0, pacer=PacingScheduler(min_interval=0.0, clock=clock))
+        ib = ClockedIB(clock)
+        hub.historical(ib, SOXL, "30 D", "15 mins")
+        hub.historical(ib, SOXL, "30 D", "15 mins")       # not reused (ttl 0): sent 15 s later
+        self.assertEqual(len(ib.requests), 2)
+        self.assertAlmostEqual(clock.now - 1000.0, 15.0)
+
+    def test_parsing(self):
+        self.assertEqual(data_hub.bar_seconds("15 mins"), 900)
+        self.assertEqual(data_hub.bar_seconds("1 hour"), 3600)
+        self.assertEqual(data_hub.bar_seconds("1 day"), 86400)
+        self.assertEqual(data_hub.duration_seconds("2700 S"), 2700)
+        self.assertEqual(data_hub.duration_seconds("2 W"), 14 * 86400)
+        self.assertEqual(data_hub.duration_seconds("bogus"), 0)
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,289 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+"""
+
+import unittest
+
+from decimal import Decimal
+
+from ibapi.const import UNSET_DECIMAL, UNSET_DOUBLE, UNSET_LONG
+from ibapi.decoder import Decoder
+from ibapi.message import IN
+from ibapi.protobuf.HistoricalData_pb2 import HistoricalData as HistoricalDataProto
+from ibapi.protobuf.TickPrice_pb2 import TickPrice as TickPriceProto
+from ibapi.protobuf.TickSize_pb2 import TickSize as TickSizeProto
+from ibapi.server_versions import MIN_SERVER_VER_ENCODE_MSG_ASCII7, MAX_CLIENT_VER
+from ibapi.utils import BadMessage
+from ibapi.wrapper import EWrapper
+
+
+class RecordingWrapper(EWrapper):
+    def __init__(self):
+        EWrapper.__init__(self)
+        self.calls = []
+
+    def updateAccountValue(self, key: str, val: str, currency: str, accountName: str):
+        self.calls.append(("updateAccountValue", key, val, currency, accountName))
+
+    def tickGeneric(self, reqId: int, tickType: int, value: float):
+        self.calls.append(("tickGeneric", reqId, tickType, value))
+
+    def nextValidId(self, orderId: int):
+        self.calls.append(("nextValidId", orderId))
+
+
+class DecoderTestCase(unittest.TestCase):
+    msgs = [
+        (IN.ACCT_VALUE, (b"2", b"NetLiquidation", b"100.5", b"USD", b"DU123")),
+        (IN.ACCT_VALUE, (b"2", b"Caf\\xe9", b"", b"", b"DU123")),
+        (IN.TICK_GENERIC, (b"6", b"7", b"49", b"0.25")),
+        (IN.NEXT_VALID_ID, (b"1", b"42")),
+    ]
+
+    def decodeAll(self, serverVersion, withPlan):
+        wrapper = RecordingWrapper()
+        decoder = Decoder(wrapper, serverVersion)
+        for msgId, fields in self.msgs:
+            if withPlan:
+                decoder.interpret(fields, msgId)
+            else:
+                decoder.interpretWithSignature(fields, decoder.msgId2handleInfo[msgId])
+        return wrapper.calls
+
+    def test_plan_matches_signature(self):
+        for serverVersion in (MIN_SERVER_VER_ENCODE_MSG_ASCII7 - 1, MIN_SERVER_VER_ENCODE_MSG_ASCII7):
+            self.assertEqual(
+                self.decodeAll(serverVersion, True), self.decodeAll(serverVersion, False)
+            )
+
+    def test_plan_follows_server_version(self):
+        wrapper = RecordingWrapper()
+        decoder = Decoder(wrapper, None)
+        decoder.serverVersion = MIN_SERVER_VER_ENCODE_MSG_ASCII7
+        decoder.interpret(self.msgs[1][1], IN.ACCT_VALUE)
+
+        self.assertEqual(wrapper.calls[0][1], "Caf\xe9")
+
+    def test_wrong_field_count(self):
+        wrapper = RecordingWrapper()
+        decoder = Decoder(wrapper, MIN_SERVER_VER_ENCODE_MSG_ASCII7)
+        decoder.interpret((b"2", b"NetLiquidation"), IN.ACCT_VALUE)
+
+        self.assertEqual(wrapper.calls, [])
+
+
+class TickRecordingWrapper(EWrapper):
+    def __init__(self):
+        EWrapper.__init__(self)
+        self.calls = []
+
+    def record(self, name, *args):
+        self.calls.append(
+            (name,) + tuple(vars(arg) if hasattr(arg, "__dict__") else arg for arg in args)
+        )
+
+    def tickPrice(self, *args):
+        self.record("tickPrice", *args)
+
+    def tickSize(self, *args):
+        self.record("tickSize", *args)
+
+    def tickGeneric(self, *args):
+        self.record("tickGeneric", *args)
+
+    def tickString(self, *args):
+        self.record("tickString", *args)
+
+    def tickByTickAllLast(self, *args):
+        self.record("tickByTickAllLast", *args)
+
+    def tickByTickBidAsk(self, *args):
+        self.record("tickByTickBidAsk", *args)
+
+    def tickByTickMidPoint(self, *args):
+        self.record("tickByTickMidPoint", *args)
+
+    def updateMktDepth(self, *args):
+        self.record("updateMktDepth", *args)
+
+    def updateMktDepthL2(self, *args):
+        self.record("updateMktDepthL2", *args)
+
+    def error(self, *args):
+        self.record("error", *args[:1] + args[2:])
+
+
+class FastTickDecodingTestCase(unittest.TestCase):
+    msgs = [
+        (IN.TICK_PRICE, (b"6", b"1", b"1", b"101.25", b"300", b"3")),
+        (IN.TICK_PRICE, (b"6", b"1", b"9", b"99.5", b"", b"0")),
+        (IN.TICK_PRICE, (b"6", b"1", b"66", b"Infinity", b"2147483647", b"4")),
+        (IN.TICK_SIZE, (b"6", b"1", b"0", b"1.5")),
+        (IN.TICK_SIZE, (b"6", b"1", b"8", b"9223372036854775807")),
+        (IN.TICK_GENERIC, (b"6", b"1", b"49", b"0")),
+        (IN.TICK_STRING, (b"6", b"1", b"45", b"1700000000")),
+        (IN.TICK_BY_TICK, (b"2", b"1", b"1700000000", b"10.5", b"100", b"2", b"ARCA", b"")),
+        (IN.TICK_BY_TICK, (b"2", b"3", b"1700000000", b"10.5", b"10.6", b"100", b"200", b"1")),
+        (IN.TICK_BY_TICK, (b"2", b"4", b"1700000000", b"10.55")),
+        (IN.MARKET_DEPTH, (b"1", b"3", b"0", b"1", b"1", b"10.5", b"300")),
+        (IN.MARKET_DEPTH_L2, (b"1", b"3", b"0", b"NSDQ", b"1", b"0", b"10.5", b"300", b"1")),
+    ]
+
+    def decodeAll(self, fast, serverVersion=MAX_CLIENT_VER):
+        wrapper = TickRecordingWrapper()
+        decoder = Decoder(wrapper, serverVersion)
+        decoder.setFastTickDecoding(fast)
+        for msgId, fields in self.msgs:
+            decoder.interpret(fields, msgId)
+        return wrapper.calls
+
+    def test_fast_matches_default(self):
+        for serverVersion in (100, MAX_CLIENT_VER):
+            default = self.decodeAll(False, serverVersion)
+            self.assertEqual(self.decodeAll(True, serverVersion), default)
+        self.assertEqual(len(default), 14)
+
+    def test_short_message(self):
+        wrapper = TickRecordingWrapper()
+        decoder = Decoder(wrapper, MAX_CLIENT_VER)
+        decoder.setFastTickDecoding(True)
+
+        with self.assertRaises(BadMessage):
+            decoder.interpret((b"6", b"1", b"1", b"101.25"), IN.TICK_PRICE)
+        with self.assertRaises(BadMessage):
+            decoder.interpret((b"2", b"3", b"1700000000", b"10.5"), IN.TICK_BY_TICK)
+        self.assertEqual([call[0] for call in wrapper.calls], ["error", "error"])
+
+
+class SizeTypeTestCase(unittest.TestCase):
+    msgs = FastTickDecodingTestCase.msgs
+
+    def sizes(self, sizeType, fast):
+        wrapper = TickRecordingWrapper()
+        decoder = Decoder(wrapper, MAX_CLIENT_VER)
+        decoder.setFastTickDecoding(fast)
+        decoder.setSizeType(sizeType)
+        for msgId, fields in self.msgs:
+            decoder.interpret(fields, msgId)
+        return [call[3] for call in wrapper.calls if call[0] == "tickSize"]
+
+    def test_text_sizes(self):
+        expected = {
+            Decimal: [Decimal(300), UNSET_DECIMAL, Decimal("1.5"), UNSET_DECIMAL],
+            float: [300.0, UNSET_DOUBLE, 1.5, UNSET_DOUBLE],
+            int: [300, UNSET_LONG, 1, UNSET_LONG],
+        }
+        for sizeType, sizes in expected.items():
+            for fast in (False, True):
+                decoded = self.sizes(sizeType, fast)
+                self.assertEqual(decoded, sizes)
+                self.assertEqual({type(size) for size in decoded}, {sizeType})
+
+    def test_protobuf_sizes(self):
+        class BarWrapper(TickRecordingWrapper):
+            def historicalData(self, *args):
+                self.record("historicalData", *args)
+
+        tickSizeProto = TickSizeProto(reqId=1, tickType=0, size="250")
+        historicalDataProto = HistoricalDataProto(reqId=2)
+        historicalDataProto.historicalDataBars.add(date="20250102", volume="1200", WAP="10.5")
+        for sizeType in (Decimal, float, int):
+            wrapper = BarWrapper()
+            decoder = Decoder(wrapper, MAX_CLIENT_VER)
+            decoder.setSizeType(sizeType)
+            decoder.processTickSizeMsgProtoBuf(tickSizeProto.SerializeToString())
+            decoder.processHistoricalDataMsgProtoBuf(historicalDataProto.SerializeToString())
+
+            self.assertEqual(wrapper.calls[0], ("tickSize", 1, 0, sizeType("250")))
+            self.assertIs(type(wrapper.calls[0][3]), sizeType)
+            bar = wrapper.calls[1][2]
+            self.assertIs(type(bar["volume"]), sizeType)
+            self.assertEqual(bar["volume"], sizeType("1200"))
+            self.assertEqual(bar["wap"], Decimal("10.5"))
+
+    def test_wap_is_a_price(self):
+        class BarWrapper(TickRecordingWrapper):
+            def realtimeBar(self, *args):
+                self.record("realtimeBar", *args)
+
+        wrapper = BarWrapper()
+        decoder = Decoder(wrapper, MAX_CLIENT_VER)
+        decoder.setSizeType(int)
+        decoder.interpret((b"3", b"7", b"1700000000", b"187.1", b"187.9", b"187.0", b"187.5",
+                           b"1200", b"187.43", b"12"), IN.REAL_TIME_BARS)
+        (volume, wap) = wrapper.calls[0][7:9]
+        self.assertEqual(volume, 1200)
+        self.assertIs(type(volume), int)
+        self.assertEqual(wap, Decimal("187.43"))          # not truncated with int sizes
+
+    def test_unsupported(self):
+        decoder = Decoder(TickRecordingWrapper(), MAX_CLIENT_VER)
+        with self.assertRaises(ValueError):
+            decoder.setSizeType(str)
+        self.assertIs(decoder.sizeType, Decimal)
+
+
+class ProtoBufPoolTestCase(unittest.TestCase):
+    def ticks(self):
+        return [
+            TickPriceProto(reqId=1, tickType=1, price=10.5, size="100", attrMask=2).SerializeToString(),
+            # no size: must not leak from the previous message
+            TickPriceProto(reqId=2, tickType=2, price=10.6).SerializeToString(),
+        ]
+
+    def test_pooled_without_callback(self):
+        wrapper = TickRecordingWrapper()
+        decoder = Decoder(wrapper, MAX_CLIENT_VER)
+        self.assertEqual(decoder.protoBufCallbacks, {})
+        pooled = decoder.protoBufPool[TickPriceProto]
+
+        for tick in self.ticks():
+            self.assertIs(decoder.parseProtoBuf(TickPriceProto, tick, "tickPriceProtoBuf"), pooled)
+        decoder.protoBufPool[TickPriceProto].Clear()
+        for tick in self.ticks():
+            decoder.processTickPriceMsgProtoBuf(tick)
+
+        self.assertEqual(
+            wrapper.calls,
+            [
+                ("tickPrice", 1, 1, 10.5, {"canAutoExecute": False, "pastLimit": True, "preOpen": False}),
+                ("tickSize", 1, 0, Decimal(100)),
+                ("tickPrice", 2, 2, 10.6, {"canAutoExecute": True, "pastLimit": True, "preOpen": True}),
+                ("tickSize", 2, 3, UNSET_DECIMAL),
+            ],
+        )
+
+    def test_fresh_with_callback(self):
+        class ProtoWrapper(TickRecordingWrapper):
+            def tickPriceProtoBuf(self, tickPriceProto):
+                self.calls.append(("tickPriceProtoBuf", tickPriceProto))
+
+        wrapper = ProtoWrapper()
+        decoder = Decoder(wrapper, MAX_CLIENT_VER)
+        self.assertEqual(list(decoder.protoBufCallbacks), ["tickPriceProtoBuf"])
+        for tick in self.ticks():
+            decoder.processTickPriceMsgProtoBuf(tick)
+
+        protos = [call[1] for call in wrapper.calls if call[0] == "tickPriceProtoBuf"]
+        self.assertEqual([(proto.reqId, proto.HasField("size")) for proto in protos], [(1, True), (2, False)])
+        self.assertIsNot(protos[0], decoder.protoBufPool[TickPriceProto])
+
+    def test_delegating_wrapper(self):
+        class Delegating:
+            def __init__(self, wrapper):
+                self.wrapper = wrapper
+
+            def __getattr__(self, name):
+                return getattr(self.wrapper, name)
+
+        class ProtoWrapper(EWrapper):
+            def pnlProtoBuf(self, pnlProto):
+                pass
+
+        self.assertEqual(list(Decoder(Delegating(EWrapper()), MAX_CLIENT_VER).protoBufCallbacks), [])
+        self.assertEqual(list(Decoder(Delegating(ProtoWrapper()), MAX_CLIENT_VER).protoBufCallbacks), ["pnlProtoBuf"])
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+"""
+
+import threading
+import unittest
+
+from ibapi import comm
+from ibapi.client import EClient
+from ibapi.decoder import Decoder
+from ibapi.dispatch import BatchQueue, BLOCK, DROP, COALESCE
+from ibapi.message import IN
+from ibapi.protobuf.TickPrice_pb2 import TickPrice as TickPriceProto
+from ibapi.server_versions import MIN_SERVER_VER_PROTOBUF
+from ibapi.wrapper import EWrapper
+
+TEXT_VERSION = MIN_SERVER_VER_PROTOBUF - 1
+
+
+def textMsg(msgId, *fields) -> bytes:
+    return comm.make_field(msgId).encode() + "".join(comm.make_field(f) for f in fields).encode()
+
+
+def tickSize(reqId, tickType, size) -> bytes:
+    return textMsg(IN.TICK_SIZE, 6, reqId, tickType, size)
+
+
+class BatchQueueTestCase(unittest.TestCase):
+    def test_drain(self):
+        q = BatchQueue(TEXT_VERSION)
+        q.putBatch([b"a", b"b"])
+        q.putBatch([b"c"])
+        self.assertEqual(len(q), 3)
+
+        self.assertEqual(q.drain(0), [b"a", b"b", b"c"])
+        self.assertEqual(q.drain(0), [])
+        stats = q.stats()
+        self.assertEqual((stats["depth"], stats["maxDepth"], stats["msgs"], stats["batches"]), (0, 3, 3, 2))
+        self.assertGreaterEqual(stats["lagMax"], stats["lagMean"])
+
+    def test_drop(self):
+        q = BatchQueue(TEXT_VERSION, maxDepth=2, policy=DROP)
+        q.putBatch([tickSize(1, 0, 100)])
+        order = textMsg(IN.ORDER_STATUS, 1, "Filled")
+        q.putBatch([tickSize(1, 0, 200), order, tickSize(2, 0, 300)])
+
+        self.assertEqual(q.drain(0), [tickSize(1, 0, 100), order])
+        self.assertEqual(q.stats()["dropped"], 2)
+
+    def test_coalesce(self):
+        q = BatchQueue(TEXT_VERSION, maxDepth=1, policy=COALESCE)
+        depth = textMsg(IN.MARKET_DEPTH, 1, 1, 0, 0, 1, 10.5, 100)
+        batch = [tickSize(1, 0, 100), tickSize(1, 3, 5), depth, depth, tickSize(1, 0, 200)]
+        q.putBatch(batch)
+
+        self.assertEqual(q.drain(0), [tickSize(1, 3, 5), depth, depth, tickSize(1, 0, 200)])
+        self.assertEqual(q.stats()["dropped"], 1)
+
+    def test_coalesce_raw_int_msg_id(self):
+        q = BatchQueue(MIN_SERVER_VER_PROTOBUF, maxDepth=1, policy=COALESCE)
+        text = (IN.TICK_SIZE).to_bytes(4, "big") + b"6\x001\x000\x00100\x00"
+        proto = (IN.TICK_PRICE + 200).to_bytes(4, "big") + TickPriceProto(reqId=1, tickType=1, price=1.5).SerializeToString()
+        newerProto = (IN.TICK_PRICE + 200).to_bytes(4, "big") + TickPriceProto(reqId=1, tickType=1, price=1.6).SerializeToString()
+        q.putBatch([text, proto, text, newerProto])
+
+        self.assertEqual(q.drain(0), [text, newerProto])
+
+    def test_block(self):
+        q = BatchQueue(TEXT_VERSION, maxDepth=2, policy=BLOCK)
+        q.putBatch([b"a", b"b"])
+        reader = threading.Thread(target=q.putBatch, args=([b"c"],))
+        reader.start()
+        reader.join(0.3)
+        self.assertTrue(reader.is_alive(), "reader waits for room")
+
+        self.assertEqual(q.drain(0), [b"a", b"b"])
+        reader.join(5)
+        self.assertEqual(q.drain(1), [b"c"])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            BatchQueue(TEXT_VERSION, policy="newest")
+        with self.assertRaises(ValueError):
+            EClient(EWrapper()).setBatchedDispatch(maxDepth=0)
+
+
+class RunBatchedTestCase(unittest.TestCase):
+    class SizeWrapper(EWrapper):
+        def __init__(self):
+            EWrapper.__init__(self)
+            self.sizes = []
+
+        def tickSize(self, reqId, tickType, size):
+            self.sizes.append(int(size))
+
+    def test_run_drains_queue(self):
+        wrapper = self.SizeWrapper()
+        client = EClient(wrapper)
+        client.serverVersion_ = TEXT_VERSION
+        client.decoder = Decoder(wrapper, TEXT_VERSION)
+        client.msg_queue = BatchQueue(TEXT_VERSION)
+        client.msg_queue.putBatch([tickSize(1, 0, 100), tickSize(1, 0, 200)])
+        client.msg_queue.putBatch([tickSize(1, 0, 300)])
+
+        # not connected: run() returns once the queue is empty
+        client.run()
+        self.assertEqual(wrapper.sizes, [100, 200, 300])
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+"""
+
+import unittest
+
+from ibapi import comm
+from ibapi.framing import FrameBuffer
+
+
+class FakeConn:
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.readSize = 4096
+        self.asked = []
+
+    def recvMsgInto(self, buf):
+        self.asked.append(len(buf))
+        if not self.chunks:
+            return 0
+        chunk = self.chunks.pop(0)
+        buf[: len(chunk)] = chunk
+        return len(chunk)
+
+
+class FramingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.texts = [
+            comm.make_field(1) + comm.make_field(i) + comm.make_field("x" * (i % 7))
+            for i in range(200)
+        ]
+        self.stream = b"".join(comm.make_initial_msg(text) for text in self.texts)
+
+    def test_whole_burst(self):
+        frames = FrameBuffer()
+        frames.feed(self.stream)
+
+        msgs = list(frames.msgs())
+
+        self.assertEqual([msg.decode() for msg in msgs], self.texts)
+        self.assertEqual(len(frames), 0, "there should be no remainder")
+
+    def test_split_everywhere(self):
+        # tiny capacity forces compaction and growth on top of the odd split
+        frames = FrameBuffer(capacity=16)
+        msgs = []
+        for i in range(0, len(self.stream), 3):
+            frames.feed(self.stream[i : i + 3])
+            msgs.extend(frames.msgs())
+
+        self.assertEqual([msg.decode() for msg in msgs], self.texts)
+
+    def test_incomplete_msg(self):
+        msg = comm.make_initial_msg("ABCD")
+        frames = FrameBuffer()
+        frames.feed(msg[:6])
+
+        self.assertIsNone(frames.nextMsg())
+        self.assertEqual(frames.missing(), 2)
+
+        frames.feed(msg[6:])
+        self.assertEqual(frames.nextMsg(), b"ABCD")
+
+    def test_recv_from(self):
+        chunks = [self.stream[i : i + 4096] for i in range(0, len(self.stream), 4096)]
+        frames = FrameBuffer(capacity=4096)
+        conn = FakeConn(chunks)
+        msgs = []
+        while frames.recvFrom(conn):
+            msgs.extend(frames.msgs())
+
+        self.assertEqual([msg.decode() for msg in msgs], self.texts)
+
+    def test_recv_from_is_bounded_by_read_size(self):
+        msg = comm.make_initial_msg("y" * 5000)
+        frames = FrameBuffer()
+        conn = FakeConn([msg[:10], msg[10:]])
+        conn.readSize = 1024
+        frames.recvFrom(conn)
+        self.assertEqual(conn.asked, [1024])
+        # the pending message wants more than the read size: read the rest of it
+        frames.recvFrom(conn)
+        self.assertEqual(conn.asked, [1024, len(msg) - 10])
+        self.assertEqual(frames.nextMsg(), b"y" * 5000)
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+The history memo behind the Intraday Equity watchlist builders: identical pulls are sent
+once and shared, failures are not kept, and the rate limiter paces requests by IB's rules.
+The line budget caps the market-data lines of all the strategy threads together.
+"""
+
+import asyncio
+import os
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "Trading Strategies", "Intraday Equity"))
+
+import market_data  # noqa: E402
+from market_data import HistoryMemo, LineBudget, RateLimiter  # noqa: E402
+
+
+class FakeIB:
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.requests = []
+
+    async def reqHistoricalDataAsync(self, contract, end, duration, bar_size, what, use_rth, fmt):
+        self.requests.append((contract.symbol, duration, bar_size))
+        await asyncio.sleep(0.01)
+        if contract.symbol in self.fail:
+            raise RuntimeError("pacing violation")
+        return [SimpleNamespace(close=1.0), SimpleNamespace(close=2.0)]
+
+
+def stock(symbol):
+    return SimpleNamespace(symbol=symbol)
+
+
+class HistoryMemoTestCase(unittest.TestCase):
+    def test_identical_requests_share_one_pull(self):
+        (memo, ib) = (HistoryMemo(), FakeIB())
+        reqs = [(stock("AMD"), "6 D", "1 day"), (stock("AMD"), "6 D", "1 day"),
+                (stock("AMD"), "30 D", "1 day"), (stock("NVDA"), "6 D", "1 day")]
+
+        async def go():
+            await asyncio.gather(*(memo.fetch_async(ib, None, c, d, b) for (c, d, b) in reqs))
+        asyncio.run(go())
+        self.assertEqual(len(ib.requests), 3)
+        self.assertEqual((memo.sent, memo.shared), (3, 1))
+        bars = memo.get(memo.key(stock("AMD"), "6 D", "1 day"))
+        self.assertEqual([b.close for b in bars], [1.0, 2.0])
+        bars.clear()                                       # callers get a copy
+        self.assertEqual(len(memo.get(memo.key(stock("AMD"), "6 D", "1 day"))), 2)
+        asyncio.run(memo.fetch_async(ib, None, stock("AMD"), "6 D", "1 day"))
+        self.assertEqual(len(ib.requests), 3)              # still fresh: not sent again
+        self.assertIsNone(memo.get(memo.key(stock("AMD"), "6 D", "1 day", use_rth=False)))
+
+    def test_failures_are_not_kept(self):
+        (memo, ib) = (HistoryMemo(), FakeIB(fail={"TSLA"}))
+        logged = []
+        asyncio.run(memo.fetch_async(ib, None, stock("TSLA"), "6 D", "1 day", log=logged.append))
+        self.assertEqual(len(logged), 1)
+        self.assertIsNone(memo.get(memo.key(stock("TSLA"), "6 D", "1 day")))
+        ib.fail.clear()
+        asyncio.run(memo.fetch_async(ib, None, stock("TSLA"), "6 D", "1 day"))
+        self.assertIsNotNone(memo.get(memo.key(stock("TSLA"), "6 D", "1 day")))
+        self.assertEqual(len(ib.requests), 2)
+
+    def test_intraday_bars_expire_sooner(self):
+        (memo, ib) = (HistoryMemo(ttl=900, intraday_ttl=60), FakeIB())
+        asyncio.run(memo.fetch_async(ib, None, stock("AMD"), "1 D", "5 mins"))
+        asyncio.run(memo.fetch_async(ib, None, stock("AMD"), "6 D", "1 day"))
+        later = time.monotonic() + 120
+        with mock.patch.object(market_data.time, "monotonic", lambda: later):
+            self.assertIsNone(memo.get(memo.key(stock("AMD"), "1 D", "5 mins")))
+            self.assertIsNotNone(memo.get(memo.key(stock("AMD"), "6 D", "1 day")))
+
+    def test_repeat_within_max_age_served_in_the_same_bar(self):
+        memo = HistoryMemo()
+        key = memo.key(stock("AMD"), "1 D", "5 mins")
+        memo.put(memo.key(stock("AMD"), "6 D", "1 day"), [])
+        self.assertIsNone(memo.get(memo.key(stock("AMD"), "6 D", "1 day")))  # empty: not kept
+        wall = 1_700_000_200.0                                 # 100 s into a 5-min bar
+        with mock.patch.object(market_data.time, "time", lambda: wall):
+            memo.put(key, [SimpleNamespace(close=1.0)])
+        (mono, now) = (time.monotonic(), [wall + 10])
+        with mock.patch.object(market_data.time, "time", lambda: now[0]):
+            self.assertEqual(len(memo.get(key, max_age=15)), 1)
+            with mock.patch.object(market_data.time, "monotonic", lambda: mono + 20):
+                self.assertIsNone(memo.get(key, max_age=15))   # older than the window
+                self.assertIsNotNone(memo.get(key))            # still within intraday_ttl
+            now[0] = wall + 205                                # a new 5-min bar has opened
+            self.assertIsNone(memo.get(key, max_age=15))
+
+    def test_acquire_waits_on_the_ib_loop(self):
+        now = [1000.0]
+        waits = []
+
+        class LoopIB:
+            def sleep(self, secs):
+                waits.append(secs)
+                now[0] += secs
+
+        rate = RateLimiter(min_interval=0.0, clock=lambda: now[0])
+        key = HistoryMemo.key(stock("AMD"), "6 D", "1 day")
+        with mock.patch.object(time, "sleep", side_effect=AssertionError("thread blocked")):
+            rate.acquire(key, ib=LoopIB())
+            rate.acquire(key, ib=LoopIB())
+        self.assertAlmostEqual(sum(waits), 15.0)
+
+    def test_async_acquire_paces_concurrent_requests(self):
+        rate = RateLimiter(min_interval=0.05)
+        stamps = []
+
+        async def one():
+            await rate.acquire_async()
+            stamps.append(time.monotonic())
+
+        async def go():
+            await asyncio.gather(*(one() for _ in range(4)))
+        asyncio.run(go())
+        stamps.sort()
+        gaps = [b - a for a, b in zip(stamps, stamps[1:])]
+        self.assertTrue(all(g >= 0.04 for g in gaps), gaps)
+
+    def test_rate_limiter_ib_rules(self):
+        now = [1000.0]
+
+        def sleep(secs):
+            now[0] += secs
+
+        rate = RateLimiter(min_interval=0.0, window_max=4, priority_reserve=1,
+                           clock=lambda: now[0])
+        key = HistoryMemo.key
+        with mock.patch.object(time, "sleep", sleep):
+            rate.acquire(key(stock("AMD"), "6 D", "1 day"))
+            rate.acquire(key(stock("NVDA"), "6 D", "1 day"))
+            self.assertEqual(now[0], 1000.0)                 # independent pulls: no spacing
+            rate.acquire(key(stock("AMD"), "6 D", "1 day"))  # identical: 15 s
+            self.assertAlmostEqual(now[0], 1015.0)
+            for d in ("1800 S", "3600 S", "7200 S"):          # 30-sec bars: window of 4, 1 kept
+                rate.acquire(key(stock("AMD"), d, "30 secs", use_rth=False), priority=d == "7200 S")
+            self.assertAlmostEqual(now[0], 1015.0)
+            rate.acquire(key(stock("TSLA"), "1800 S", "30 secs"))
+            self.assertAlmostEqual(now[0], 1615.0)
+        st = rate.stats()
+        self.assertEqual((st.requests, st.delayed, st.priority), (7, 2, 1))
+        self.assertIn("1 order-critical", rate.summary())
+
+
+class LineBudgetTestCase(unittest.TestCase):
+    def test_tickers_and_streams_share_the_cap(self):
+        lines = LineBudget(cap=4, stream_cap=2)
+        self.assertTrue(lines.claim("ORB", "bars", "AMD"))
+        self.assertTrue(lines.claim("NR7", "bars", "AMD"))    # another connection: another line
+        self.assertFalse(lines.claim("ORB", "bars", "NVDA"))  # stream cap
+        self.assertTrue(lines.claim("ORB", "ticker", "NVDA"))
+        self.assertTrue(lines.claim("NR7", "ticker", "AMD"))
+        self.assertFalse(lines.claim("NR7", "ticker", "TSLA"))  # line cap
+        self.assertTrue(lines.claim("ORB", "bars", "AMD"))    # re-open after a reconnect
+        self.assertTrue(lines.claim("PDH", "ticker", "TSLA", force=True))
+        self.assertEqual((lines.used(), lines.used("bars")), (5, 2))
+        lines.release("ORB", "bars", "AMD")
+        lines.release("NR7")
+        self.assertEqual((lines.used(), lines.used("ticker")), (2, 2))
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+The indicator-result cache of the Trading Strategies indicator library: hits on a repeat
+*_value call, misses on a new or updated bar, LRU eviction and the bypasses.
+"""
+
+import datetime
+import importlib
+import os
+import sys
+import unittest
+from collections import namedtuple
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trading Strategies"))
+
+from Indicators import adx_value, killzone_value, macd_value, rsi_value  # noqa: E402
+from Indicators.bar_series import BarSeries  # noqa: E402
+from Indicators.cache import IndicatorCache, cached, indicator_cache  # noqa: E402
+
+# the module, not the rsi() function the momentum package re-exports under the same name
+rsi_module = importlib.import_module("Indicators.momentum.rsi")
+
+BarData = namedtuple("BarData", "date open high low close volume")
+
+
+def make_bars(n):
+    bars = []
+    t = datetime.datetime(2025, 3, 3, 9, 30)
+    for i in range(n):
+        c = 100.0 + (i % 17) - (i % 5) * 0.7
+        bars.append(BarData(t, c - 0.2, c + 1.0, c - 1.0, c, 1000.0 + i))
+        t += datetime.timedelta(minutes=15)
+    return bars
+
+
+class IndicatorCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.saved = indicator_cache.maxsize
+        indicator_cache.configure(maxsize=64)
+        indicator_cache.clear()
+        self.bars = make_bars(120)
+
+    def tearDown(self):
+        indicator_cache.maxsize = self.saved
+        indicator_cache.clear()
+
+    def test_repeat_call_hits(self):
+        first = adx_value(symbol="SOXL", bar_size="15 mins", period=14, bars=self.bars)
+        again = adx_value(symbol="SOXL", bar_size="15 mins", period=14, bars=list(self.bars))
+        self.assertIs(again, first)
+        # another params / symbol / helper is another entry
+        adx_value(symbol="SOXL", bar_size="15 mins", period=10, bars=self.bars)
+        adx_value(symbol="TQQQ", bar_size="15 mins", period=14, bars=self.bars)
+        rsi_value(symbol="SOXL", bar_size="15 mins", period=14, bars=self.bars)
+        st = indicator_cache.stats()
+        self.assertEqual((st.hits, st.misses, st.size), (1, 4, 4))
+        self.assertAlmostEqual(st.hit_rate, 0.2)
+
+    def test_series_changes_miss(self):
+        series = BarSeries.from_bars(self.bars)
+        first = macd_value(symbol="SOXL", bars=series)
+        self.assertEqual(macd_value(symbol="SOXL", bars=series), first)
+        # the forming bar updates in place: same count and time, another close
+        last = self.bars[-1]
+        moved = self.bars[:-1] + [last._replace(close=last.close + 5.0)]
+        macd_value(symbol="SOXL", bars=moved, completed=False)
+        self.assertNotEqual(macd_value(symbol="SOXL", bars=moved, completed=False),
+                            macd_value.__wrapped__(symbol="SOXL", bars=self.bars, completed=False))
+        # a new bar
+        series.append(last._replace(date=last.date + datetime.timedelta(minutes=15)))
+        self.assertNotEqual(macd_value(symbol="SOXL", bars=series).time, first.time)
+        st = indicator_cache.stats()
+        self.assertEqual((st.hits, st.misses), (2, 3))
+
+    def test_session_is_part_of_the_key(self):
+        rth = BarSeries.from_bars(self.bars, session="RTH")
+        rsi_value(symbol="SOXL", bars=rth)
+        rsi_value(symbol="SOXL", bars=BarSeries.from_bars(self.bars, session="ETH"))
+        rsi_value(symbol="SOXL", bars=rth[:])              # a view keeps its label
+        st = indicator_cache.stats()
+        self.assertEqual((st.hits, st.misses), (1, 2))
+        self.assertEqual(BarSeries.from_bars(rth, session="ETH").session, "ETH")
+        self.assertEqual(rth.session, "RTH")
+
+    def test_computed_once(self):
+        calls = []
+        real = rsi_module.rsi
+
+        def counting(*args):
+            calls.append(1)
+            return real(*args)
+
+        with mock.patch.object(rsi_module, "rsi", counting):
+            for _ in range(3):
+                rsi_value(symbol="SOXL", period=14, bars=self.bars)
+        self.assertEqual(len(calls), 1)
+
+    def test_bypass(self):
+        # unhashable params and a disabled cache compute every time
+        zones = [("NY AM", datetime.time(9, 30), datetime.time(11, 0))]
+        self.assertEqual(killzone_value(bars=self.bars, zones=zones),
+                         killzone_value(bars=self.bars, zones=zones))
+        indicator_cache.configure(maxsize=0)
+        rsi_value(symbol="SOXL", bars=self.bars)
+        rsi_value(symbol="SOXL", bars=self.bars)
+        st = indicator_cache.stats()
+        self.assertEqual((st.hits, st.size), (0, 0))
+
+    def test_lru_eviction(self):
+        cache = IndicatorCache(maxsize=2)
+        cache.store("a", 1)
+        cache.store("b", 2)
+        self.assertEqual(cache.lookup("a"), (True, 1))     # "a" is now the most recent
+        cache.store("c", 3)
+        self.assertEqual(cache.lookup("b"), (False, None))
+        self.assertEqual(cache.lookup("a"), (True, 1))
+        cache.configure(maxsize=1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.lookup("a"), (True, 1))
+
+    def test_decorator(self):
+        calls = []
+
+        @cached
+        def demo_value(symbol=None, bar_size="15 mins", *, scale=1.0, ib=None, bars=None):
+            calls.append(1)
+            return bars[-1].close * scale
+
+        self.assertEqual(demo_value.__name__, "demo_value")
+        self.assertEqual(demo_value("X", bars=self.bars, scale=2.0),
+                         demo_value("X", bars=self.bars, scale=2.0))
+        self.assertEqual(len(calls), 1)
+        with self.assertRaises(TypeError):
+            demo_value("X", bars=None)          # no bars: the helper itself runs (and fails)
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+The streaming *State classes of the Trading Strategies indicator library against the batch
+functions and the *_value helpers, bar for bar.
+"""
+
+import os
+import random
+import sys
+import unittest
+from collections import namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trading Strategies"))
+
+from Indicators.dema import DEMAState, dema, dema_value  # noqa: E402
+from Indicators.momentum.macd import MACDState, macd, macd_value  # noqa: E402
+from Indicators.momentum.rsi import RSIState, rsi, rsi_value  # noqa: E402
+from Indicators.moving_average import EMAState, RMAState, SMAState, ema, rma, sma  # noqa: E402
+from Indicators.trend.adx import ADXState, adx, adx_value  # noqa: E402
+from Indicators.trend.choppiness import ChopState, choppiness, choppiness_value  # noqa: E402
+from Indicators.trend.supertrend import SupertrendState, supertrend, supertrend_value  # noqa: E402
+from Indicators.volatility.atr import ATRState, atr, atr_value  # noqa: E402
+
+Bar = namedtuple("Bar", "open high low close date")
+
+
+def make_bars(n, seed=3):
+    rnd = random.Random(seed)
+    bars = []
+    close = 100.0
+    for i in range(n):
+        o = close
+        close = max(1.0, o + rnd.gauss(0, 1.5))
+        if i % 50 == 25:
+            close = o  # flat bars: zero changes and ranges
+            bars.append(Bar(o, o, o, o, i))
+            continue
+        bars.append(Bar(o, max(o, close) + rnd.random(), min(o, close) - rnd.random(), close, i))
+    return bars
+
+
+class IndicatorStateTestCase(unittest.TestCase):
+    bars = make_bars(400)
+    highs = [b.high for b in bars]
+    lows = [b.low for b in bars]
+    closes = [b.close for b in bars]
+
+    def assertSeries(self, state, update, expected, places=None):
+        for i, bar in enumerate(self.bars):
+            value = update(state, bar)
+            if places is None or expected[i] is None:
+                self.assertEqual(value, expected[i], f"bar {i}")
+            else:
+                self.assertAlmostEqual(value, expected[i], places, f"bar {i}")
+
+    def assertResults(self, state, helper, places=None):
+        """state.result() after each bar equals helper(bars=...) over the bars up to that one
+        plus a forming bar, which completed=True skips."""
+        for i, bar in enumerate(self.bars):
+            state.update(bar)
+            expected = helper(bars=self.bars[: i + 1] + [bar])
+            result = state.result()
+            if places is None or expected is None or result is None:
+                self.assertEqual(result, expected, f"bar {i}")
+            else:
+                for field, value in vars(expected).items():
+                    if isinstance(value, float):
+                        self.assertAlmostEqual(getattr(result, field), value, places, f"bar {i} {field}")
+                    else:
+                        self.assertEqual(getattr(result, field), value, f"bar {i} {field}")
+
+    def test_moving_averages(self):
+        for period in (1, 5, 20):
+            for (cls, batch) in ((SMAState, sma), (EMAState, ema), (RMAState, rma)):
+                state = cls(period)
+                self.assertEqual([state.update(c) for c in self.closes], batch(self.closes, period))
+
+    def test_supertrend(self):
+        (trend, line) = supertrend(self.highs, self.lows, self.closes, 10, 3.0)
+        state = SupertrendState(10, 3.0)
+        for i, bar in enumerate(self.bars):
+            state.update(bar)
+            self.assertEqual((state.trend, state.line), (trend[i], line[i]), f"bar {i}")
+        self.assertResults(SupertrendState(10, 3.0), lambda bars: supertrend_value(bars=bars))
+
+    def test_dema(self):
+        self.assertSeries(DEMAState(20), DEMAState.update, dema(self.closes, 20))
+        self.assertResults(DEMAState(20), lambda bars: dema_value(bars=bars, period=20))
+
+    def test_adx(self):
+        (pdi, mdi, ax) = adx(self.highs, self.lows, self.closes, 14)
+        state = ADXState(14)
+        for i, bar in enumerate(self.bars):
+            state.update(bar)
+            self.assertEqual((state.plus_di, state.minus_di, state.value), (pdi[i], mdi[i], ax[i]), f"bar {i}")
+        self.assertResults(ADXState(14), lambda bars: adx_value(bars=bars, period=14))
+
+    def test_rsi(self):
+        self.assertSeries(RSIState(14), RSIState.update, rsi(self.closes, 14))
+        self.assertResults(RSIState(14), lambda bars: rsi_value(bars=bars, period=14))
+
+    def test_macd(self):
+        (_, _, hist) = macd(self.closes)
+        self.assertSeries(MACDState(), MACDState.update, hist)
+        self.assertResults(MACDState(), lambda bars: macd_value(bars=bars))
+
+    def test_choppiness(self):
+        self.assertSeries(ChopState(14), ChopState.update, choppiness(self.highs, self.lows, self.closes, 14), 9)
+        self.assertResults(ChopState(14), lambda bars: choppiness_value(bars=bars, period=14), 9)
+
+    def test_atr(self):
+        self.assertSeries(ATRState(14), ATRState.update, atr(self.highs, self.lows, self.closes, 14))
+        self.assertResults(ATRState(14), lambda bars: atr_value(bars=bars, period=14))
+
+    def test_seed(self):
+        history = self.bars[:300]
+        state = SupertrendState().seed(history)
+        for bar in self.bars[300:]:
+            state.update(bar)
+        (trend, line) = supertrend(self.highs, self.lows, self.closes)
+        self.assertEqual((state.trend, state.line), (trend[-1], line[-1]))
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+The live intraday bar builder of the Intraday Equity bots: 1-min / 5-min bars seeded from
+history and kept current from 5-second real-time bars.
+"""
+
+import datetime
+import os
+import sys
+import unittest
+from collections import namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "Trading Strategies", "Intraday Equity"))
+
+from live_bars import ET, LiveBars, bar_size_seconds  # noqa: E402
+
+BarData = namedtuple("BarData", "date open high low close volume")
+UTC = datetime.timezone.utc
+
+
+def at(hhmm, sec=0):
+    (h, m) = map(int, hhmm.split(":"))
+    return datetime.datetime(2025, 3, 3, h, m, sec, tzinfo=ET)
+
+
+def rt_bars(start, n, price=100.0):
+    """n 5-second bars from `start` (UTC, as IB stamps them), each +0.01 and 10 shares."""
+    out = []
+    for i in range(n):
+        p = price + 0.01 * i
+        t = (start + datetime.timedelta(seconds=5 * i)).astimezone(UTC)
+        out.append((t, p, p + 0.05, p - 0.05, p + 0.02, 10))
+    return out
+
+
+class LiveBarsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.now = [0.0]
+        self.live = LiveBars(stale_after=30, clock=lambda: self.now[0])
+        # 09:30 .. 09:41 1-min history, the 09:41 bar forming (pulled at 09:41:20)
+        self.seed = [BarData(at("09:30") + datetime.timedelta(minutes=i), 100.0 + i, 101.0 + i,
+                             99.0 + i, 100.5 + i, 1000.0) for i in range(12)]
+
+    def test_seed_aggregates_five_minute_bars(self):
+        self.live.seed("AMD", self.seed, at("09:41", 20))
+        one = self.live.bars("AMD", "1 min")
+        self.assertEqual([(b.date, b.open, b.high, b.low, b.close, b.volume) for b in one],
+                         [tuple(b) for b in self.seed])
+        five = self.live.bars("AMD", "5 mins")
+        self.assertEqual([b.date.strftime("%H:%M") for b in five], ["09:30", "09:35", "09:40"])
+        b = five[0]
+        self.assertEqual((b.open, b.high, b.low, b.close, b.volume), (100.0, 105.0, 99.0, 104.5, 5000.0))
+        self.assertEqual(five[-1].volume, 2000.0)        # the forming bar so far
+
+    def test_real_time_bars_extend_the_bars(self):
+        self.live.seed("AMD", self.seed, at("09:41", 20))
+        # 09:41:15 .. 09:43:10: the first bar is covered by the history, the rest are new
+        for args in rt_bars(at("09:41", 15), 24):
+            self.live.update("AMD", *args)
+        one = self.live.bars("AMD", "1 min")
+        self.assertEqual([b.date.strftime("%H:%M") for b in one[-3:]], ["09:41", "09:42", "09:43"])
+        self.assertEqual(one[-3].volume, 1000.0 + 8 * 10)   # 09:41:20 .. 09:41:55
+        self.assertEqual(one[-3].open, 111.0)                # kept from the history
+        self.assertEqual(one[-2].volume, 12 * 10)
+        self.assertEqual(one[-1].date.tzinfo, ET)
+        five = self.live.bars("AMD", "5 mins")
+        self.assertEqual(len(five), 3)
+        self.assertEqual(five[-1].volume, 2000.0 + 23 * 10)
+        self.assertAlmostEqual(five[-1].close, 100.0 + 0.01 * 23 + 0.02)
+
+    def test_bars_received_before_the_seed_are_replayed(self):
+        self.live.track("AMD")
+        for args in rt_bars(at("09:41", 10), 6):             # 09:41:10 .. 09:41:35
+            self.live.update("AMD", *args)
+        self.assertIsNone(self.live.bars("AMD", "1 min"))    # not seeded yet
+        self.live.seed("AMD", self.seed, at("09:41", 20))
+        self.assertEqual(self.live.bars("AMD", "1 min")[-1].volume, 1000.0 + 4 * 10)
+
+    def test_stale_or_unknown(self):
+        self.live.seed("AMD", self.seed, at("09:41", 20))
+        self.assertIsNone(self.live.bars("NVDA", "1 min"))
+        self.assertIsNone(self.live.bars("AMD", "1 hour"))
+        self.now[0] = 31.0
+        self.assertIsNone(self.live.bars("AMD", "1 min"))    # quiet stream -> pull instead
+        self.live.update("AMD", *rt_bars(at("09:41", 30), 1)[0])
+        self.assertIsNotNone(self.live.bars("AMD", "1 min"))
+        self.live.update("TSLA", *rt_bars(at("09:41", 30), 1)[0])   # untracked: ignored
+        self.assertNotIn("TSLA", self.live)
+
+    def test_naive_history(self):
+        naive = [b._replace(date=b.date.replace(tzinfo=None)) for b in self.seed]
+        self.live.seed("AMD", naive, at("09:41", 20))
+        for args in rt_bars(at("09:42"), 2):
+            self.live.update("AMD", *args)
+        last = self.live.bars("AMD", "1 min")[-1]
+        self.assertEqual(last.date, datetime.datetime(2025, 3, 3, 9, 42))
+
+    def test_bar_size_seconds(self):
+        self.assertEqual(bar_size_seconds("1 min"), 60)
+        self.assertEqual(bar_size_seconds("5 mins"), 300)
+        self.assertEqual(bar_size_seconds("1 day"), 0)
+
+
+if "__main__" == __name__:
+    unittest.main()
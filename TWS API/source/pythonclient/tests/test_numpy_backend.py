@@ -0,0 +1,146 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+The NumPy backend of the Trading Strategies indicator library against the pure-Python
+functions, and the backend selection.
+"""
+
+import datetime
+import math
+import os
+import random
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trading Strategies"))
+
+from Indicators import backend  # noqa: E402
+
+TOLERANCE = 1e-9
+
+
+def make_bars(n, seed=8):
+    rnd = random.Random(seed)
+    (highs, lows, closes, volumes, days) = ([], [], [], [], [])
+    close = 100.0
+    day = datetime.date(2025, 1, 2)
+    for i in range(n):
+        o = close
+        close = max(1.0, o + rnd.gauss(0, 1.5))
+        if i % 60 == 30:
+            close = o  # flat bars: zero changes, ranges and true ranges
+            (h, l) = (o, o)
+        else:
+            (h, l) = (max(o, close) + rnd.random(), min(o, close) - rnd.random())
+        if i % 78 == 0:
+            day += datetime.timedelta(days=1)
+        highs.append(h)
+        lows.append(l)
+        closes.append(close)
+        volumes.append(None if i % 97 == 5 else float(rnd.randint(0, 5000)))
+        days.append(day)
+    return highs, lows, closes, volumes, days
+
+
+@unittest.skipUnless(backend.numpy_available(), "NumPy is not installed")
+class NumpyBackendTestCase(unittest.TestCase):
+    (highs, lows, closes, volumes, days) = make_bars(3000)
+
+    @classmethod
+    def setUpClass(cls):
+        from Indicators import numpy_backend
+        cls.python = backend._python_impl()
+        cls.numpy = numpy_backend
+
+    def assertParity(self, name, *args):
+        expected = getattr(self.python, name)(*args)
+        actual = getattr(self.numpy, name)(*args)
+        if not isinstance(expected, tuple):
+            (expected, actual) = ((expected,), (actual,))
+        self.assertEqual(len(actual), len(expected), name)
+        for (k, (exp, act)) in enumerate(zip(expected, actual)):
+            self.assertEqual(len(act), len(exp), f"{name}{args[-1:]} series {k}")
+            mismatches = [(i, e, a) for (i, (e, a)) in enumerate(zip(exp, act.tolist()))
+                          if (not math.isnan(a) if e is None
+                              else not abs(a - e) <= TOLERANCE * max(1.0, abs(e)))]
+            self.assertEqual(mismatches[:1], [], f"{name}{args[-1:]} series {k}: (index, python, numpy)")
+
+    def test_moving_averages(self):
+        for name in ("sma", "ema", "rma", "dema"):
+            for period in (0, 1, 2, 14, 200, 5000):
+                self.assertParity(name, self.closes, period)
+
+    def test_volatility(self):
+        self.assertParity("true_range", self.highs, self.lows, self.closes)
+        for period in (1, 14, 50):
+            self.assertParity("atr", self.highs, self.lows, self.closes, period)
+        for length in (1, 20, 100):
+            self.assertParity("bollinger_bands", self.closes, length, 2.0)
+
+    def test_trend(self):
+        for (period, mult) in ((1, 1.0), (10, 3.0), (30, 2.0)):
+            self.assertParity("supertrend", self.highs, self.lows, self.closes, period, mult)
+        for period in (1, 2, 14, 50, 2999, 3000):
+            self.assertParity("adx", self.highs, self.lows, self.closes, period)
+        for period in (1, 2, 14, 50, 3000):
+            self.assertParity("choppiness", self.highs, self.lows, self.closes, period)
+
+    def test_momentum(self):
+        for period in (1, 2, 14, 100, 3000):
+            self.assertParity("rsi", self.closes, period)
+        self.assertParity("macd", self.closes, 12, 26, 9)
+        self.assertParity("macd", self.closes, 3, 10, 16)
+
+    def test_volume(self):
+        self.assertParity("vwap", self.highs, self.lows, self.closes, self.volumes, None)
+        self.assertParity("vwap", self.highs, self.lows, self.closes, self.volumes, self.days)
+        self.assertParity("obv", self.closes, self.volumes)
+
+    def test_flat_series(self):
+        flat = [5.0] * 100
+        for name in ("rsi", "sma", "ema"):
+            self.assertParity(name, flat, 14)
+        self.assertParity("adx", flat, flat, flat, 14)
+        self.assertParity("choppiness", flat, flat, flat, 14)
+
+    def test_short_series(self):
+        for n in (0, 1, 2, 15):
+            (highs, lows, closes) = (self.highs[:n], self.lows[:n], self.closes[:n])
+            self.assertParity("rsi", closes, 14)
+            self.assertParity("atr", highs, lows, closes, 14)
+            self.assertParity("adx", highs, lows, closes, 14)
+            self.assertParity("obv", closes, self.volumes[:n])
+
+
+class BackendSelectionTestCase(unittest.TestCase):
+    def tearDown(self):
+        backend.set_backend(os.environ.get(backend.ENV_VAR, "python"))
+
+    def test_python(self):
+        self.assertEqual(backend.set_backend("python"), "python")
+        self.assertEqual(backend.get_backend(), "python")
+        self.assertEqual(backend.sma([1.0, 2.0, 3.0], 2), [None, 1.5, 2.5])
+
+    @unittest.skipUnless(backend.numpy_available(), "NumPy is not installed")
+    def test_numpy(self):
+        for name in ("numpy", "auto", " NumPy "):
+            self.assertEqual(backend.set_backend(name), "numpy")
+        self.assertEqual(backend.sma([1.0, 2.0, 3.0], 2).tolist()[1:], [1.5, 2.5])
+
+    def test_fallback(self):
+        with mock.patch.object(backend, "numpy_available", return_value=False):
+            self.assertEqual(backend.set_backend("numpy"), "python")
+            self.assertEqual(backend.set_backend("auto"), "python")
+        self.assertEqual(backend.rsi([1.0] * 5, 14), [None] * 5)
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            backend.set_backend("cython")
+        with self.assertRaises(AttributeError):
+            backend.stochastic  # noqa: B018
+
+
+if "__main__" == __name__:
+    unittest.main()
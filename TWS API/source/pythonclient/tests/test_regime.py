@@ -0,0 +1,83 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+The shared market-regime service of the Intraday Equity bots: the snapshot's gate, and the
+refresh from streaming tickers with history pulls only for what the stream lacks.
+"""
+
+import datetime
+import math
+import os
+import sys
+import unittest
+from collections import namedtuple
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "Trading Strategies", "Intraday Equity"))
+
+import calendar_util as cal  # noqa: E402
+import regime  # noqa: E402
+from regime import RegimeService, RegimeSnapshot  # noqa: E402
+
+Bar = namedtuple("Bar", "date open high low close volume")
+
+
+class FakeIB:
+    def __init__(self, closes):
+        self.closes = closes                  # symbol -> last 5-min close
+        self.requests = []
+
+    def reqHistoricalData(self, contract, end, duration, bar_size, what, use_rth, fmt):
+        self.requests.append(contract.symbol)
+        t = datetime.datetime(2025, 3, 3, 9, 30)
+        return [Bar(t, 500.0, 501.0, 499.0, 500.5, 1000),
+                Bar(t + datetime.timedelta(minutes=5), 500.5, 501.0, 499.0,
+                    self.closes[contract.symbol], 1000)]
+
+
+class RegimeTestCase(unittest.TestCase):
+    def test_snapshot_gate(self):
+        snap = RegimeSnapshot(spy_open=500.0, spy_last=496.0, vix=22.0, as_of=1.0)
+        self.assertAlmostEqual(snap.spy_change, -0.008)
+        self.assertFalse(snap.allows(0.005))
+        self.assertTrue(snap.allows(0.01))
+        self.assertFalse(snap.allows(0.01, vix_max=20))
+        self.assertTrue(RegimeSnapshot().allows(0.005, vix_max=20))   # nothing known: no block
+        self.assertFalse(RegimeSnapshot().fresh(60))
+        with mock.patch.object(regime.time, "monotonic", lambda: 100.0):
+            self.assertTrue(RegimeSnapshot(as_of=50.0).fresh(60))
+            self.assertFalse(RegimeSnapshot(as_of=30.0).fresh(60))
+
+    def test_refresh(self):
+        svc = RegimeService({}, 121, log=lambda m: None, fallback_sec=60)
+        svc.ib = FakeIB({"SPY": 497.0, "VIX": 31.0})
+        (svc._spy, svc._vix) = (SimpleNamespace(symbol="SPY"), SimpleNamespace(symbol="VIX"))
+        svc._tk_spy = SimpleNamespace(last=498.0, marketPrice=lambda: 498.0, close=501.0)
+        svc._tk_vix = SimpleNamespace(last=math.nan, marketPrice=lambda: math.nan, close=None)
+        after_open = cal.session_open() + datetime.timedelta(minutes=10)
+        clock = [1000.0]
+        with mock.patch.object(regime.cal, "now_et", lambda: after_open), \
+                mock.patch.object(regime.time, "monotonic", lambda: clock[0]):
+            svc.refresh()
+            snap = svc.snapshot
+            self.assertEqual((snap.spy_open, snap.spy_last, snap.vix), (500.0, 498.0, 31.0))
+            self.assertEqual(snap.sources, {"spy_open": "hist", "spy_last": "stream", "vix": "hist"})
+            self.assertEqual(svc.ib.requests, ["SPY", "VIX"])
+            # the open is kept and VIX is not pulled again within fallback_sec
+            clock[0] += 5
+            svc._tk_spy.last = 496.0
+            svc.refresh()
+            self.assertEqual(svc.ib.requests, ["SPY", "VIX"])
+            self.assertEqual((svc.snapshot.spy_last, svc.snapshot.vix), (496.0, 31.0))
+            self.assertFalse(svc.snapshot.allows(0.005, vix_max=35))
+            clock[0] += 60
+            svc.refresh()
+            self.assertEqual(svc.ib.requests, ["SPY", "VIX", "VIX"])
+        self.assertIsNot(svc.snapshot, snap)        # replaced whole, never mutated
+
+
+if "__main__" == __name__:
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+The rolling window kernels of the Trading Strategies indicator library against the
+reduction of a slice per bar they replace.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Trading Strategies"))
+
+from Indicators.momentum.stochastic import stoch_rsi, stochastic  # noqa: E402
+from Indicators.momentum.rsi import rsi  # noqa: E402
+from Indicators.moving_average import hma  # noqa: E402
+from Indicators.rolling import (RollingMax, RollingMin, rolling_linreg, rolling_max,  # noqa: E402
+                                rolling_mean, rolling_min, rolling_stdev, rolling_sum,
+                                rolling_wma)
+from Indicators.volatility.donchian_channels import donchian_channels  # noqa: E402
+
+
+def sliced(values, period, extreme):
+    out = [None] * len(values)
+    for i in range(period - 1, len(values)):
+        window = values[i - period + 1 : i + 1]
+        if period > 0 and None not in window:
+            out[i] = extreme(window)
+    return out
+
+
+def stdev(window):
+    m = sum(window) / len(window)
+    return (sum((x - m) ** 2 for x in window) / len(window)) ** 0.5
+
+
+def wma(window):
+    return sum(y * (k + 1) for k, y in enumerate(window)) / (len(window) * (len(window) + 1) / 2.0)
+
+
+def linreg(window):
+    L = len(window)
+    sum_x = sum(range(L))
+    sum_xx = sum(x * x for x in range(L))
+    sum_y = sum(window)
+    sum_xy = sum(x * y for x, y in enumerate(window))
+    denom = L * sum_xx - sum_x * sum_x
+    slope = (L * sum_xy - sum_x * sum_y) / denom if denom else 0.0
+    return (sum_y - slope * sum_x) / L + slope * (L - 1)
+
+
+def make_values(n, seed=11):
+    rnd = random.Random(seed)
+    # rounded so that the windows hold ties
+    return [round(rnd.gauss(100, 5)) for _ in range(n)]
+
+
+def make_prices(n, seed=4):
+    rnd = random.Random(seed)
+    # a drifting price level with flat stretches, long enough for rounding to build up
+    prices = []
+    for i in range(n):
+        level = 1000.0 + (i // 500) * 5.0
+        prices.append(level if i % 500 < 40 else level + i * 0.01 + rnd.gauss(0, 2.0))
+    return prices
+
+
+class RollingTestCase(unittest.TestCase):
+    values = make_values(1000)
+    gappy = [None] * 20 + values[:400] + [None] + values[400:800]
+
+    def test_batch(self):
+        for values in (self.values, self.gappy):
+            for period in (0, 1, 2, 14, 52, 2000):
+                self.assertEqual(rolling_max(values, period), sliced(values, period, max), period)
+                self.assertEqual(rolling_min(values, period), sliced(values, period, min), period)
+
+    def test_streaming(self):
+        for values in (self.values, self.gappy):
+            for period in (0, 1, 5, 50):
+                (highest, lowest) = (RollingMax(period), RollingMin(period))
+                self.assertEqual([highest.update(v) for v in values], rolling_max(values, period))
+                self.assertEqual([lowest.update(v) for v in values], rolling_min(values, period))
+
+    def test_ported_indicators(self):
+        highs = [v + 1 for v in self.values]
+        lows = [v - 1 for v in self.values]
+        (_, upper, lower) = donchian_channels(highs, lows, 20)
+        self.assertEqual(upper, sliced(highs, 20, max))
+        self.assertEqual(lower, sliced(lows, 20, min))
+
+        (k, _) = stochastic(highs, lows, self.values, 14, 1, 3)
+        (hh, ll) = (sliced(highs, 14, max), sliced(lows, 14, min))
+        for i in range(13, len(k)):
+            rng = hh[i] - ll[i]
+            self.assertEqual(k[i], 100.0 * (self.values[i] - ll[i]) / rng if rng else 0.0)
+
+        # the RSI warmup (None) must not reach into the stochastic window
+        (k, _) = stoch_rsi(self.values, 14, 14, 1, 3)
+        r = rsi(self.values, 14)
+        self.assertEqual(k.index(next(v for v in k if v is not None)), r.index(next(v for v in r if v is not None)) + 13)
+
+
+class RollingStatsTestCase(unittest.TestCase):
+    values = make_prices(20000)
+    gappy = [None] * 7 + values[:300] + [None] + values[300:600]
+
+    def assertClose(self, actual, expected, msg=None):
+        self.assertEqual(len(actual), len(expected), msg)
+        for i, (a, e) in enumerate(zip(actual, expected)):
+            if e is None:
+                self.assertIsNone(a, f"{msg} index {i}")
+            else:
+                self.assertAlmostEqual(a, e, delta=1e-9 * max(1.0, abs(e)), msg=f"{msg} index {i}")
+
+    def test_kernels(self):
+        for (kernel, reduce) in ((rolling_sum, sum), (rolling_mean, lambda w: sum(w) / len(w)),
+                                 (rolling_stdev, stdev), (rolling_wma, wma),
+                                 (rolling_linreg, linreg)):
+            for values in (self.values[:3000], self.gappy):
+                for period in (0, 1, 2, 20, 200, 5000):
+                    self.assertClose(kernel(values, period), sliced(values, period, reduce),
+                                     f"{kernel.__name__} period {period}")
+
+    def test_long_series(self):
+        # the running sums are rebuilt every period bars, so the error stays bounded
+        for kernel, reduce in ((rolling_stdev, stdev), (rolling_linreg, linreg)):
+            out = kernel(self.values, 20)
+            for i in range(len(self.values) - 200, len(self.values)):
+                self.assertAlmostEqual(out[i], reduce(self.values[i - 19 : i + 1]), delta=1e-9)
+        flat = rolling_stdev(self.values, 20)
+        for i in range(len(self.values) - 500 + 19, len(self.values) - 500 + 40):
+            self.assertLess(flat[i], 1e-9)
+
+    def test_hma(self):
+        out = hma(self.values[:500], 16)
+        w = sliced(self.values[:500], 8, wma)
+        f = sliced(self.values[:500], 16, wma)
+        diff = [None if a is None or b is None else 2.0 * a - b for a, b in zip(w, f)]
+        self.assertClose(out, sliced(diff, 4, wma), "hma")
+
+
+if "__main__" == __name__:
+    unittest.main()
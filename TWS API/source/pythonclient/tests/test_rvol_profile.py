@@ -0,0 +1,125 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+
+The time-of-day volume profiles behind the Intraday Equity RVOL: the profile lookup gives
+the same relative volume as regrouping the lookback bars on every call, and the day cache
+they are kept in.
+"""
+
+import datetime
+import os
+import random
+import sys
+import tempfile
+import unittest
+from collections import defaultdict, namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "Trading Strategies", "Intraday Equity"))
+
+from market_data import DailyCache, cumulative_volume, profile_baseline, rvol_profile  # noqa: E402
+
+BarData = namedtuple("BarData", "date open high low close volume")
+
+
+def make_bars(days=8, start="04:00", end="16:00", seed=7):
+    """5-min bars over `days` weekdays ending 2025-03-14; a day off and a thin day mixed in."""
+    rng = random.Random(seed)
+    (h0, m0), (h1, m1) = (map(int, start.split(":")), map(int, end.split(":")))
+    bars = []
+    d = datetime.date(2025, 3, 14) - datetime.timedelta(days=days + 3)
+    while d <= datetime.date(2025, 3, 14):
+        if d.weekday() < 5 and d != datetime.date(2025, 3, 10):
+            t = datetime.datetime(d.year, d.month, d.day, h0, m0)
+            while (t.hour, t.minute) < (h1, m1):
+                thin = d == datetime.date(2025, 3, 11) and t.hour < 9
+                bars.append(BarData(t, 1, 1, 1, 1, 0 if thin else rng.randint(0, 5000)))
+                t += datetime.timedelta(minutes=5)
+        d += datetime.timedelta(days=1)
+    return bars
+
+
+def rvol_by_regrouping(bars, ref_dt, premarket, vol_scale=1):
+    """The per-call computation the profiles replace."""
+    by_day = defaultdict(float)
+    ref_minute = ref_dt.hour * 60 + ref_dt.minute
+    today_key = ref_dt.strftime("%Y%m%d")
+    for b in bars:
+        t = b.date
+        day = t.strftime("%Y%m%d")
+        minute = t.hour * 60 + t.minute
+        if premarket and minute >= 9 * 60 + 30:
+            continue
+        if minute + 5 <= ref_minute:
+            by_day[day] += float(b.volume) * vol_scale
+    today_vol = by_day.pop(today_key, 0.0)
+    prior = [v for d, v in by_day.items() if v > 0]
+    baseline = sum(prior) / len(prior) if prior else 0.0
+    return today_vol / baseline if baseline > 0 else None
+
+
+def rvol_by_profile(bars, ref_dt, premarket, vol_scale=1):
+    today = ref_dt.strftime("%Y%m%d")
+    ref_minute = ref_dt.hour * 60 + ref_dt.minute
+    baseline = profile_baseline(rvol_profile(bars, today, premarket, vol_scale), ref_minute)
+    if baseline <= 0:
+        return None
+    return cumulative_volume(bars, today, ref_minute, premarket, vol_scale) / baseline
+
+
+class RvolProfileTestCase(unittest.TestCase):
+    def test_same_rvol_as_regrouping(self):
+        bars = make_bars()
+        for premarket in (False, True):
+            for hhmm in ("04:00", "04:05", "06:17", "09:30", "09:33", "10:00", "12:45", "15:59"):
+                ref = datetime.datetime(2025, 3, 14, *map(int, hhmm.split(":")))
+                (want, got) = (rvol_by_regrouping(bars, ref, premarket, 2),
+                               rvol_by_profile(bars, ref, premarket, 2))
+                if want is None:
+                    self.assertIsNone(got, (premarket, hhmm))
+                else:
+                    self.assertAlmostEqual(got, want, places=4, msg=(premarket, hhmm))
+
+    def test_profile_shape(self):
+        bars = make_bars(start="09:30")
+        prof = rvol_profile(bars, "20250314")
+        (start, cum) = (prof["start"], prof["cum"])
+        self.assertEqual(start, 114)                      # 09:30-09:35: the first RTH bucket
+        self.assertLessEqual(len(cum), 192 - 114)         # only the session is kept
+        self.assertGreater(cum[0], 0.0)
+        self.assertTrue(all(a <= b for a, b in zip(cum, cum[1:])))
+        self.assertEqual(profile_baseline(prof, 0), 0.0)
+        self.assertEqual(profile_baseline(prof, 9 * 60 + 34), 0.0)   # first bucket still forming
+        self.assertEqual(profile_baseline(prof, 9 * 60 + 35), cum[0])
+        self.assertEqual(profile_baseline(prof, 24 * 60 + 5), cum[-1])
+        # a full-day list (an older day cache) reads the same
+        full = [0.0] * start + cum + [cum[-1]] * (24 * 12 - start - len(cum))
+        for m in (9 * 60 + 34, 9 * 60 + 35, 12 * 60, 24 * 60 + 5):
+            self.assertEqual(profile_baseline(full, m), profile_baseline(prof, m))
+
+    def test_cumulative_volume_is_todays(self):
+        bars = make_bars(start="09:30")
+        today = [b for b in bars if b.date.date() == datetime.date(2025, 3, 14)]
+        self.assertEqual(cumulative_volume(bars, "20250314", 9 * 60 + 45),
+                         sum(b.volume for b in today[:3]))
+        self.assertEqual(cumulative_volume(bars, "20250315", 12 * 60), 0.0)
+
+
+class DailyCacheTestCase(unittest.TestCase):
+    def test_put_persists_compactly(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "cache_20250314.json")
+            cache = DailyCache(path, "20250314")
+            cache.put("adv:AMD", 1.5e7)
+            cache.put("rvolprof:rth:AMD:20", rvol_profile(make_bars(start="09:30"), "20250314"))
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+            self.assertNotIn("\n", text)
+            again = DailyCache(path, "20250314")
+            self.assertEqual(again.get("adv:AMD"), 1.5e7)
+            self.assertEqual(again.get("rvolprof:rth:AMD:20")["start"], 114)
+
+
+if "__main__" == __name__:
+    unittest.main()
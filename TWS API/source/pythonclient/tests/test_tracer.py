@@ -0,0 +1,85 @@
+"""
+Copyright (C) 2025 Interactive Brokers LLC. All rights reserved. This code is subject to the terms
+ and conditions of the IB API Non-Commercial License or the IB API Commercial License, as applicable.
+"""
+
+import logging
+import socket
+import unittest
+
+from ibapi import comm
+from ibapi.client import EClient
+from ibapi.connection import Connection
+from ibapi.message import OUT
+from ibapi.tracer import WireTracer, SENT, RECV
+from ibapi.utils import log_enabled
+from ibapi.wrapper import EWrapper
+
+
+class WireTracerTestCase(unittest.TestCase):
+    def test_ring_buffer(self):
+        tracer = WireTracer(capacity=3)
+        for i in range(5):
+            tracer.received(comm.make_field(i).encode())
+
+        self.assertEqual(len(tracer), 3)
+        self.assertEqual([payload for (_, _, payload) in tracer.records()], [b"2\0", b"3\0", b"4\0"])
+
+    def test_sent_by_connection(self):
+        (local, remote) = socket.socketpair()
+        conn = Connection("127.0.0.1", 0)
+        conn.socket = local
+        conn.tracer = WireTracer()
+        msg = comm.make_msg(OUT.REQ_CURRENT_TIME, False, comm.make_field(1))
+        try:
+            conn.sendMsg(msg)
+            self.assertEqual(remote.recv(1024), msg)
+        finally:
+            conn.disconnect()
+            remote.close()
+
+        ((_, direction, payload),) = conn.tracer.records()
+        self.assertEqual(direction, SENT)
+        self.assertEqual(payload, b"49\x001\x00")
+        self.assertTrue(next(conn.tracer.format()).endswith("SENT [b'49', b'1']"))
+
+    def test_format_raw_int_msg_id(self):
+        tracer = WireTracer()
+        tracer.received((4).to_bytes(4, "big") + b"2\x00-1\x00")
+        tracer.received((204).to_bytes(4, "big") + b"\x08\x01")
+
+        lines = list(tracer.format(rawIntMsgId=True))
+        self.assertTrue(lines[0].endswith("RECV msgId:4 [b'2', b'-1']"))
+        self.assertTrue(lines[1].endswith(f"{RECV} msgId:4 protobuf b'\\x08\\x01'"))
+
+
+class LogGuardTestCase(unittest.TestCase):
+    class RecordingClient(EClient):
+        def __init__(self):
+            EClient.__init__(self, EWrapper())
+            self.serverVersion_ = 100  # text messages, not connected
+            self.logged = []
+
+        def logRequest(self, fnName, fnParams):
+            self.logged.append(fnName)
+
+    def test_requests_logged_only_when_enabled(self):
+        utilsLogger = logging.getLogger("ibapi.utils")
+        level = utilsLogger.level
+        client = self.RecordingClient()
+        try:
+            utilsLogger.setLevel(logging.WARNING)
+            self.assertFalse(log_enabled())
+            client.reqCurrentTime()
+            self.assertEqual(client.logged, [])
+
+            utilsLogger.setLevel(logging.INFO)
+            self.assertTrue(log_enabled())
+            client.reqCurrentTime()
+            self.assertEqual(client.logged, ["reqCurrentTime"])
+        finally:
+            utilsLogger.setLevel(level)
+
+
+if "__main__" == __name__:
+    unittest.main()